@@ -0,0 +1,42 @@
+"""Add content-addressed embedding cache table.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from pgvector.sqlalchemy import Vector
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: str | None = "0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create embedding_cache table."""
+    op.create_table(
+        "embedding_cache",
+        sa.Column("model", sa.String(100), nullable=False),
+        sa.Column("dimension", sa.Integer(), nullable=False),
+        sa.Column("text_hash", sa.String(64), nullable=False),
+        # Unconstrained vector so entries for other models/dimensions can coexist
+        sa.Column("embedding", Vector(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.PrimaryKeyConstraint("model", "dimension", "text_hash"),
+    )
+
+
+def downgrade() -> None:
+    """Drop embedding_cache table."""
+    op.drop_table("embedding_cache")
@@ -0,0 +1,30 @@
+"""Add content fingerprint to documents for incremental ingestion.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: str | None = "0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add content_fingerprint column to documents."""
+    op.add_column(
+        "documents",
+        sa.Column("content_fingerprint", sa.String(64), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Remove content_fingerprint column."""
+    op.drop_column("documents", "content_fingerprint")
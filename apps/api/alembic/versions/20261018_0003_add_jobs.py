@@ -0,0 +1,65 @@
+"""Add background jobs table.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: str | None = "0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create jobs table."""
+    op.create_table(
+        "jobs",
+        sa.Column("job_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "case_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("cases.case_id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("job_type", sa.String(20), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="queued"),
+        sa.Column(
+            "params_json",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+        sa.Column(
+            "progress_json",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+        sa.Column("documents_total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("documents_done", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("result_json", postgresql.JSONB(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("idx_jobs_case_created", "jobs", ["case_id", "created_at"])
+
+
+def downgrade() -> None:
+    """Drop jobs table."""
+    op.drop_index("idx_jobs_case_created", table_name="jobs")
+    op.drop_table("jobs")
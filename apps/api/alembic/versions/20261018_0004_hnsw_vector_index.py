@@ -0,0 +1,46 @@
+"""Replace the IVFFlat chunk embedding index with HNSW.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+
+The IVFFlat index from infra/postgres/init.sql used a fixed lists = 100,
+which is too coarse for small cases and too fine for large ones, and it
+was built before any rows existed. HNSW needs no training data and its
+build parameters come from HNSW_M / HNSW_EF_CONSTRUCTION.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+from src.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: str | None = "0007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Build the HNSW index without blocking chunk writes."""
+    m = int(settings.hnsw_m)
+    ef_construction = int(settings.hnsw_ef_construction)
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_chunks_embedding")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_embedding_hnsw "
+            "ON doc_chunks USING hnsw (embedding vector_cosine_ops) "
+            f"WITH (m = {m}, ef_construction = {ef_construction})"
+        )
+
+
+def downgrade() -> None:
+    """Restore the original IVFFlat index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_chunks_embedding_hnsw")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_embedding "
+            "ON doc_chunks USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100)"
+        )
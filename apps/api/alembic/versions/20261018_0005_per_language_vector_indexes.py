@@ -0,0 +1,59 @@
+"""Scope chunk vector search to one case and language.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+
+Every search filters by case and language. The global HNSW index returned
+neighbours from every case and language that were then filtered away, so
+recall and latency degraded as cases were added. This replaces it with:
+
+- one partial HNSW index per supported language, so approximate search of
+  large cases never walks other languages' vectors.
+
+Exact search of small cases uses the existing (case_id, language) index
+idx_chunks_case_lang.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+from src.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = "0009"
+down_revision: str | None = "0008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+LANGUAGES = ("en", "es")
+
+
+def upgrade() -> None:
+    """Build the per-language indexes, then drop the global HNSW index."""
+    m = int(settings.hnsw_m)
+    ef_construction = int(settings.hnsw_ef_construction)
+    with op.get_context().autocommit_block():
+        for language in LANGUAGES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_embedding_hnsw_{language} "
+                "ON doc_chunks USING hnsw (embedding vector_cosine_ops) "
+                f"WITH (m = {m}, ef_construction = {ef_construction}) "
+                f"WHERE language = '{language}'"
+            )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_chunks_embedding_hnsw")
+
+
+def downgrade() -> None:
+    """Restore the global HNSW index."""
+    m = int(settings.hnsw_m)
+    ef_construction = int(settings.hnsw_ef_construction)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_embedding_hnsw "
+            "ON doc_chunks USING hnsw (embedding vector_cosine_ops) "
+            f"WITH (m = {m}, ef_construction = {ef_construction})"
+        )
+        for language in LANGUAGES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS idx_chunks_embedding_hnsw_{language}")
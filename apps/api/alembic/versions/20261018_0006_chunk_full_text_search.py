@@ -0,0 +1,48 @@
+"""Add full-text search over chunk text.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18
+
+doc_chunks.text_search is a stored tsvector generated with the text search
+configuration of the chunk's language, with one partial GIN index per
+supported language for keyword and hybrid search.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0010"
+down_revision: str | None = "0009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+LANGUAGES = ("en", "es")
+TEXT_SEARCH_EXPRESSION = (
+    "to_tsvector(CASE language WHEN 'en' THEN 'english'::regconfig "
+    "WHEN 'es' THEN 'spanish'::regconfig ELSE 'simple'::regconfig END, text)"
+)
+
+
+def upgrade() -> None:
+    """Add the generated tsvector column and its per-language GIN indexes."""
+    op.execute(
+        "ALTER TABLE doc_chunks ADD COLUMN IF NOT EXISTS text_search tsvector "
+        f"GENERATED ALWAYS AS ({TEXT_SEARCH_EXPRESSION}) STORED"
+    )
+    with op.get_context().autocommit_block():
+        for language in LANGUAGES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_text_search_{language} "
+                f"ON doc_chunks USING gin (text_search) WHERE language = '{language}'"
+            )
+
+
+def downgrade() -> None:
+    """Drop the full-text search column and indexes."""
+    with op.get_context().autocommit_block():
+        for language in LANGUAGES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS idx_chunks_text_search_{language}")
+    op.execute("ALTER TABLE doc_chunks DROP COLUMN IF EXISTS text_search")
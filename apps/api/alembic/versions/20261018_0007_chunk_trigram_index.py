@@ -0,0 +1,52 @@
+"""Add a pg_trgm index on chunk text for the keyword fallback.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18
+
+The keyword fallback used while the embedding provider is unavailable
+matched terms with ILIKE '%term%', which no btree index can serve. With
+pg_trgm, the fallback matches terms with the word similarity operator
+through this GIN index instead.
+
+pg_trgm ships with the Postgres contrib modules but is not present on every
+server, so the migration is a no-op where the extension is unavailable; the
+search service detects this and keeps using ILIKE.
+"""
+
+import logging
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0011"
+down_revision: str | None = "0010"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def upgrade() -> None:
+    """Enable pg_trgm (when available) and index chunk text with it."""
+    available = op.get_bind().scalar(
+        sa.text("SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')")
+    )
+    if not available:
+        logger.warning("pg_trgm is not available; skipping the chunk trigram index")
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chunks_text_trgm "
+            "ON doc_chunks USING gin (text gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the trigram index (the extension is left installed)."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_chunks_text_trgm")
@@ -0,0 +1,40 @@
+"""Index mentions and authored documents by case and entity.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18
+
+Entity listing counts each entity's authored documents and mentions with
+one GROUP BY per case. These indexes let both aggregates read only the
+case's rows (as index-only scans) instead of every mention and document.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0012"
+down_revision: str | None = "0011"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the (case_id, entity) indexes."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_mentions_case_entity "
+            "ON mentions (case_id, entity_id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_case_author "
+            "ON documents (case_id, author_entity_id)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the (case_id, entity) indexes."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_documents_case_author")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_mentions_case_entity")
@@ -0,0 +1,50 @@
+"""Index documents for keyset pagination on (ts, doc_id).
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-18
+
+Document listing pages by (ts, doc_id) descending, optionally filtered by
+doc_type. These indexes serve both the order and the row-comparison seek,
+and replace the (case_id, ts) and (case_id, doc_type) indexes they extend.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0013"
+down_revision: str | None = "0012"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the keyset indexes and drop the ones they cover."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_case_ts_doc "
+            "ON documents (case_id, ts, doc_id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_case_type_ts_doc "
+            "ON documents (case_id, doc_type, ts, doc_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_documents_case_ts")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_documents_type")
+
+
+def downgrade() -> None:
+    """Restore the (case_id, ts) and (case_id, doc_type) indexes."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_case_ts "
+            "ON documents (case_id, ts)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_type "
+            "ON documents (case_id, doc_type)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_documents_case_type_ts_doc")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_documents_case_ts_doc")
@@ -0,0 +1,57 @@
+"""Add conversations table for ARIA chat history.
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0014"
+down_revision: str | None = "0013"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create conversations table."""
+    op.create_table(
+        "conversations",
+        sa.Column("conversation_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "case_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("cases.case_id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "messages_json",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default=sa.text("'[]'::jsonb"),
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+    )
+    op.create_index("idx_conversations_case", "conversations", ["case_id"])
+
+
+def downgrade() -> None:
+    """Drop conversations table."""
+    op.drop_index("idx_conversations_case", table_name="conversations")
+    op.drop_table("conversations")
@@ -0,0 +1,30 @@
+"""Record the embedding model of each ingested document.
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0015"
+down_revision: str | None = "0014"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add embedding_key column to documents."""
+    op.add_column(
+        "documents",
+        sa.Column("embedding_key", sa.String(128), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Remove embedding_key column."""
+    op.drop_column("documents", "embedding_key")
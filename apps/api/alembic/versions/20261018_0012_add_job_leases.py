@@ -0,0 +1,29 @@
+"""Add worker ownership and heartbeat to background jobs.
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0016"
+down_revision: str | None = "0015"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add worker_id and heartbeat_at columns to jobs."""
+    op.add_column("jobs", sa.Column("worker_id", sa.String(128), nullable=True))
+    op.add_column("jobs", sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove worker_id and heartbeat_at columns."""
+    op.drop_column("jobs", "heartbeat_at")
+    op.drop_column("jobs", "worker_id")
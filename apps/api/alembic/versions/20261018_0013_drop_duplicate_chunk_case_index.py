@@ -0,0 +1,30 @@
+"""Drop the duplicate (case_id, language) chunk index.
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-18
+
+idx_chunks_case_language duplicated idx_chunks_case_lang from the language
+support migration. Migration 0009 no longer creates it; this removes it from
+databases that already ran the earlier version.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0017"
+down_revision: str | None = "0016"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Drop idx_chunks_case_language."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_chunks_case_language")
+
+
+def downgrade() -> None:
+    """Nothing to restore: idx_chunks_case_lang covers the same columns."""
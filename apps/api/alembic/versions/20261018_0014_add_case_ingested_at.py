@@ -0,0 +1,27 @@
+"""Record when each case was last ingested.
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0018"
+down_revision: str | None = "0017"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add ingested_at column to cases."""
+    op.add_column("cases", sa.Column("ingested_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove ingested_at column."""
+    op.drop_column("cases", "ingested_at")
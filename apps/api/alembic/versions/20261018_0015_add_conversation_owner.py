@@ -0,0 +1,38 @@
+"""Record which user owns each ARIA conversation.
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0019"
+down_revision: str | None = "0018"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add user_id column to conversations."""
+    op.add_column(
+        "conversations",
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.user_id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+    )
+    op.create_index("idx_conversations_user", "conversations", ["user_id"])
+
+
+def downgrade() -> None:
+    """Remove user_id column."""
+    op.drop_index("idx_conversations_user", table_name="conversations")
+    op.drop_column("conversations", "user_id")
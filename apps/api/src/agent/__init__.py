@@ -1,22 +1,33 @@
 """ARIA agent module."""
 
-from src.agent.graph import create_aria_graph, get_system_message
+from src.agent.graph import (
+    clear_aria_graph_cache,
+    create_aria_graph,
+    get_aria_graph,
+    get_system_message,
+)
 from src.agent.prompts import ARIA_SYSTEM_PROMPT
 from src.agent.state import ARIAState
 from src.agent.tools import (
-    create_get_document_tool,
-    create_get_entity_tool,
-    create_graph_query_tool,
-    create_search_docs_tool,
+    ToolContext,
+    get_aria_tools,
+    get_document_tool,
+    get_entity_tool,
+    graph_query_tool,
+    search_docs_tool,
 )
 
 __all__ = [
     "ARIA_SYSTEM_PROMPT",
     "ARIAState",
+    "ToolContext",
+    "clear_aria_graph_cache",
     "create_aria_graph",
-    "create_get_document_tool",
-    "create_get_entity_tool",
-    "create_graph_query_tool",
-    "create_search_docs_tool",
+    "get_aria_graph",
+    "get_aria_tools",
+    "get_document_tool",
+    "get_entity_tool",
     "get_system_message",
+    "graph_query_tool",
+    "search_docs_tool",
 ]
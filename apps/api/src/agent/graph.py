@@ -14,6 +14,7 @@ from langgraph.prebuilt import ToolNode
 from src.agent.prompts import get_system_message
 from src.agent.state import ARIAState
 from src.config import settings
+from src.services.provider_governor import get_provider_governor
 
 
 def _normalize_messages_for_provider(messages: list[BaseMessage]) -> list[BaseMessage]:
@@ -33,8 +34,14 @@ def _normalize_messages_for_provider(messages: list[BaseMessage]) -> list[BaseMe
     return normalized
 
 
-def _create_chat_llm(provider: str, model_name: str | None, temperature: float) -> ChatOpenAI:
-    """Create configured chat LLM client for a specific provider."""
+# Shared across requests. Keys hold every setting that shapes the object, so a
+# changed API key or model builds a new client instead of reusing a stale one.
+_llm_cache: dict[tuple[Any, ...], ChatOpenAI] = {}
+_graph_cache: dict[tuple[Any, ...], CompiledStateGraph[Any]] = {}
+
+
+def _chat_llm_kwargs(provider: str, model_name: str | None, temperature: float) -> dict[str, Any]:
+    """ChatOpenAI arguments for a specific provider."""
     llm_model = model_name or settings.provider_model_name(provider)
     kwargs: dict[str, Any] = {
         "model_name": llm_model,
@@ -51,8 +58,24 @@ def _create_chat_llm(provider: str, model_name: str | None, temperature: float)
         kwargs["openai_api_key"] = api_key
     if api_base:
         kwargs["openai_api_base"] = api_base
+    return kwargs
+
+
+def _create_chat_llm(provider: str, model_name: str | None, temperature: float) -> ChatOpenAI:
+    """Create configured chat LLM client for a specific provider."""
+    return ChatOpenAI(**_chat_llm_kwargs(provider, model_name, temperature))
 
-    return ChatOpenAI(**kwargs)
+
+def get_chat_llm(provider: str, model_name: str | None, temperature: float) -> ChatOpenAI:
+    """Get the shared chat LLM client for a provider, creating it on first use.
+
+    Reusing the client keeps its HTTP connection pool to the provider warm.
+    """
+    key = tuple(sorted(_chat_llm_kwargs(provider, model_name, temperature).items()))
+    llm = _llm_cache.get(key)
+    if llm is None:
+        llm = _llm_cache[key] = ChatOpenAI(**dict(key))
+    return llm
 
 
 def create_aria_graph(
@@ -60,6 +83,8 @@ def create_aria_graph(
     model_name: str | None = None,
     temperature: float = 0.3,
     provider: str | None = None,
+    *,
+    llm: ChatOpenAI | None = None,
 ) -> CompiledStateGraph[Any]:
     """Create the ARIA agent graph.
 
@@ -68,13 +93,15 @@ def create_aria_graph(
         model_name: Model override (defaults to configured provider model)
         temperature: LLM temperature (default: 0.3)
         provider: Provider override ("openai" | "deepseek")
+        llm: Client to use instead of creating one from the settings
 
     Returns:
         Compiled StateGraph
     """
     # Initialize LLM with tools
     selected_provider = settings.normalized_provider(provider)
-    llm = _create_chat_llm(selected_provider, model_name, temperature)
+    if llm is None:
+        llm = _create_chat_llm(selected_provider, model_name, temperature)
     llm_with_tools = llm.bind_tools(list(tools))
 
     async def call_model(state: ARIAState) -> dict[str, list[BaseMessage]]:
@@ -82,7 +109,8 @@ def create_aria_graph(
         messages = state["messages"]
         if selected_provider == "deepseek":
             messages = _normalize_messages_for_provider(messages)
-        response = await llm_with_tools.ainvoke(messages)
+        async with get_provider_governor(selected_provider).slot():
+            response = await llm_with_tools.ainvoke(messages)
         return {"messages": [response]}
 
     def should_continue(state: ARIAState) -> Literal["tools", "__end__"]:
@@ -112,5 +140,48 @@ def create_aria_graph(
     return cast("CompiledStateGraph[Any]", graph.compile())
 
 
+def get_aria_graph(
+    tools: Sequence[BaseTool],
+    model_name: str | None = None,
+    temperature: float = 0.3,
+    provider: str | None = None,
+) -> CompiledStateGraph[Any]:
+    """Get a compiled ARIA graph, compiling it on first use.
+
+    Graphs are cached per provider, LLM settings and tool names, so the tools
+    must not capture request state: pass the shared tools from
+    ``src.agent.tools`` and supply the case through the run config (see
+    ``ToolContext``).
+
+    Args:
+        tools: Sequence of tools available to the agent
+        model_name: Model override (defaults to configured provider model)
+        temperature: LLM temperature (default: 0.3)
+        provider: Provider override ("openai" | "deepseek")
+
+    Returns:
+        Compiled StateGraph
+    """
+    selected_provider = settings.normalized_provider(provider)
+    llm_key = tuple(sorted(_chat_llm_kwargs(selected_provider, model_name, temperature).items()))
+    key = (selected_provider, llm_key, tuple(tool.name for tool in tools))
+    graph = _graph_cache.get(key)
+    if graph is None:
+        graph = _graph_cache[key] = create_aria_graph(
+            tools,
+            model_name,
+            temperature,
+            selected_provider,
+            llm=get_chat_llm(selected_provider, model_name, temperature),
+        )
+    return graph
+
+
+def clear_aria_graph_cache() -> None:
+    """Drop cached graphs and LLM clients so they are rebuilt on next use."""
+    _graph_cache.clear()
+    _llm_cache.clear()
+
+
 # Re-export get_system_message from prompts for backward compatibility
-__all__ = ["create_aria_graph", "get_system_message"]
+__all__ = ["clear_aria_graph_cache", "create_aria_graph", "get_aria_graph", "get_system_message"]
@@ -0,0 +1,118 @@
+"""Token-budgeted compaction of ARIA conversation history."""
+
+import json
+from collections.abc import Sequence
+from typing import Any
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
+
+from src.services.chunking_service import estimate_tokens
+
+# Longest string and list kept in a summarized tool result
+SUMMARY_TEXT_CHARS = 160
+SUMMARY_LIST_ITEMS = 5
+
+
+def message_tokens(message: BaseMessage) -> int:
+    """Estimated prompt tokens for a message, including its tool calls."""
+    content = message.content if isinstance(message.content, str) else json.dumps(message.content)
+    tokens = estimate_tokens(content)
+    if isinstance(message, AIMessage) and message.tool_calls:
+        tokens += estimate_tokens(json.dumps(message.tool_calls, default=str))
+    return tokens
+
+
+def history_tokens(messages: Sequence[BaseMessage]) -> int:
+    """Estimated prompt tokens for a list of messages."""
+    return sum(message_tokens(message) for message in messages)
+
+
+def split_turns(messages: Sequence[BaseMessage]) -> list[list[BaseMessage]]:
+    """Split a conversation into turns, each starting at a user message.
+
+    A turn holds the user message and everything the agent produced for it
+    (tool calls, tool results, answer), so dropping whole turns never leaves
+    a tool call without its result. System messages are not part of any turn.
+    """
+    turns: list[list[BaseMessage]] = []
+    for message in messages:
+        if isinstance(message, SystemMessage):
+            continue
+        if isinstance(message, HumanMessage) or not turns:
+            turns.append([])
+        turns[-1].append(message)
+    return turns
+
+
+def _summarize_value(value: Any) -> Any:
+    """Shorten long strings and lists in a tool result, keeping IDs and keys."""
+    if isinstance(value, str) and len(value) > SUMMARY_TEXT_CHARS:
+        return value[:SUMMARY_TEXT_CHARS] + "..."
+    if isinstance(value, list):
+        return [_summarize_value(item) for item in value[:SUMMARY_LIST_ITEMS]]
+    if isinstance(value, dict):
+        return {key: _summarize_value(item) for key, item in value.items()}
+    return value
+
+
+def summarize_tool_message(message: ToolMessage) -> ToolMessage:
+    """Summarized copy of a tool result.
+
+    JSON results keep their structure and every ID, so the agent can refer to
+    (or re-fetch) a document from an earlier turn, but long texts and result
+    lists are cut down. Summarizing an already summarized result is a no-op.
+    """
+    content = message.content
+    if not isinstance(content, str):
+        content = json.dumps(content, default=str)
+    try:
+        summary = json.dumps(_summarize_value(json.loads(content)), default=str)
+    except json.JSONDecodeError:
+        summary = _summarize_value(content)
+    return message.model_copy(update={"content": summary})
+
+
+def _summarize_turn(turn: list[BaseMessage]) -> list[BaseMessage]:
+    return [
+        summarize_tool_message(message) if isinstance(message, ToolMessage) else message
+        for message in turn
+    ]
+
+
+def compact_history(
+    messages: Sequence[BaseMessage],
+    max_tokens: int,
+    recent_turns: int,
+) -> list[BaseMessage]:
+    """Fit a conversation into a prompt token budget.
+
+    The last ``recent_turns`` turns are kept verbatim and tool results in
+    older turns are summarized. While the history is over ``max_tokens`` the
+    oldest turns are dropped; if the recent turns alone are still over
+    budget their tool results are summarized too, and then the oldest of
+    them dropped, always keeping the latest turn.
+
+    Args:
+        messages: Conversation messages (system messages are removed)
+        max_tokens: Estimated prompt token budget for the history
+        recent_turns: Number of latest turns kept verbatim
+
+    Returns:
+        Compacted messages, oldest first
+    """
+    turns = split_turns(messages)
+    split = max(len(turns) - max(recent_turns, 1), 0)
+    older = [_summarize_turn(turn) for turn in turns[:split]]
+    recent = turns[split:]
+
+    def total() -> int:
+        return sum(history_tokens(turn) for turn in older + recent)
+
+    while older and total() > max_tokens:
+        older.pop(0)
+    if total() > max_tokens:
+        recent = [_summarize_turn(turn) for turn in recent]
+    while len(recent) > 1 and total() > max_tokens:
+        recent.pop(0)
+
+    return [message for turn in older + recent for message in turn]
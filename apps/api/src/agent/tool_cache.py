@@ -0,0 +1,137 @@
+"""Per-conversation memoization of ARIA tool results."""
+
+import json
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import Any, TypeVar
+from uuid import UUID
+
+from src.config import settings
+
+T = TypeVar("T")
+ToolCacheKey = tuple[UUID, str, str]
+
+
+@dataclass
+class ToolResultCacheStats:
+    """Counters for the tool result cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ToolResultCache:
+    """Process-wide LRU cache of tool results with a TTL.
+
+    Entries are keyed by (conversation ID, tool name, arguments), so a
+    ``get_document``/``get_entity``/``search_docs`` call repeated in a later
+    turn of the same conversation is answered without touching the database.
+    Case data does not change while a conversation is running; the TTL bounds
+    how long a result can outlive a re-ingest.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.max_entries = max(max_entries, 0)
+        self.ttl_seconds = ttl_seconds
+        self.stats = ToolResultCacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[ToolCacheKey, tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(conversation_id: UUID, tool: str, args: Mapping[str, Any]) -> ToolCacheKey:
+        """Cache key for a tool call (argument order does not matter)."""
+        return (conversation_id, tool, json.dumps(args, sort_keys=True, default=str))
+
+    def get(self, conversation_id: UUID, tool: str, args: Mapping[str, Any]) -> Any | None:
+        """Return a cached result, or None on miss/expiry."""
+        key = self.key(conversation_id, tool, args)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl_seconds > 0 and now - entry[0] >= self.ttl_seconds:
+                del self._entries[key]
+                self.stats.expirations += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def set(self, conversation_id: UUID, tool: str, args: Mapping[str, Any], result: Any) -> None:
+        """Cache a result, evicting least recently used entries beyond capacity."""
+        if self.max_entries == 0:
+            return
+        key = self.key(conversation_id, tool, args)
+        with self._lock:
+            self._entries[key] = (self._clock(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    async def get_or_call(
+        self,
+        conversation_id: UUID,
+        tool: str,
+        args: Mapping[str, Any],
+        call: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Return the cached result of a tool call, running it on a miss.
+
+        Exceptions are not cached.
+        """
+        cached = self.get(conversation_id, tool, args)
+        if cached is not None:
+            return cached  # type: ignore[no-any-return]
+        result = await call()
+        self.set(conversation_id, tool, args, result)
+        return result
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+_tool_result_cache: ToolResultCache | None = None
+
+
+def get_tool_result_cache() -> ToolResultCache | None:
+    """Get the process-wide tool result cache (None when disabled)."""
+    global _tool_result_cache
+    if settings.agent_tool_cache_max_entries <= 0:
+        return None
+    if _tool_result_cache is None:
+        _tool_result_cache = ToolResultCache(
+            max_entries=settings.agent_tool_cache_max_entries,
+            ttl_seconds=settings.agent_tool_cache_ttl_seconds,
+        )
+    return _tool_result_cache
+
+
+def reset_tool_result_cache() -> None:
+    """Drop the process-wide tool result cache so it is rebuilt on next use."""
+    global _tool_result_cache
+    _tool_result_cache = None
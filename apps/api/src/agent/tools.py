@@ -1,16 +1,79 @@
-"""ARIA agent tools wrapping existing services."""
+"""ARIA agent tools wrapping existing services.
 
-from typing import Any
+The tools are module-level singletons so a compiled agent graph can be shared
+across requests. Everything request-specific (case, language, conversation)
+travels in the run config as a ToolContext.
+
+The agent runs the tool calls of one turn concurrently, so each call opens its
+own database (and Neo4j) session rather than sharing the request's, and
+results are memoized per conversation.
+"""
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
 from uuid import UUID
 
-from langchain_core.tools import StructuredTool
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool, StructuredTool
+from neo4j import AsyncDriver
 from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from src.agent.tool_cache import ToolResultCache
 from src.services.document_service import DocumentService
+from src.services.embedding_service import EmbeddingService
 from src.services.entity_service import EntityService
 from src.services.graph_service import GraphService
 from src.services.search_service import SearchService
 
+T = TypeVar("T")
+
+TOOL_CONTEXT_KEY = "aria_tool_context"
+
+
+@dataclass(frozen=True)
+class ToolContext:
+    """Request-specific state the ARIA tools read from the run config."""
+
+    case_id: UUID
+    session_maker: async_sessionmaker[AsyncSession]
+    embedding_service: EmbeddingService
+    neo4j_driver: AsyncDriver | None = None
+    language: str = "en"
+    conversation_id: UUID | None = None
+    cache: ToolResultCache | None = None
+
+    def as_config(self) -> RunnableConfig:
+        """Run config that makes this context available to the tools."""
+        return {"configurable": {TOOL_CONTEXT_KEY: self}}
+
+    async def memoized(
+        self, tool: str, args: dict[str, Any], call: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Run a tool call through the conversation's result cache, if any.
+
+        The case is part of the cached arguments, so a conversation ID reused
+        on another case never gets results that skipped that case's checks.
+        """
+        if self.cache is None or self.conversation_id is None:
+            return await call()
+        scoped_args = {**args, "case_id": str(self.case_id)}
+        return await self.cache.get_or_call(self.conversation_id, tool, scoped_args, call)
+
+
+def get_tool_context(config: RunnableConfig) -> ToolContext:
+    """Get the ToolContext of the current run.
+
+    Raises:
+        RuntimeError: If the graph was invoked without a ToolContext
+    """
+    context = config.get("configurable", {}).get(TOOL_CONTEXT_KEY)
+    if not isinstance(context, ToolContext):
+        msg = "ARIA tools require a ToolContext in the run config"
+        raise RuntimeError(msg)
+    return context
+
 
 class SearchDocsInput(BaseModel):
     """Input schema for search_docs tool."""
@@ -41,33 +104,24 @@ class GraphQueryInput(BaseModel):
     target_id: str | None = Field(default=None, description="Target entity ID for path queries")
 
 
-def create_search_docs_tool(
-    search_service: SearchService,
-    case_id: UUID,
-    language: str = "en",
-) -> StructuredTool:
-    """Create search_docs tool bound to a specific case and language.
+async def search_docs(query: str, config: RunnableConfig, k: int = 6) -> list[dict[str, Any]]:
+    """Search documents of the context's case using semantic similarity.
 
     Args:
-        search_service: SearchService instance
-        case_id: Case ID to search within
-        language: Language to filter results (default "en")
+        query: Natural language search query
+        config: Run config carrying the ToolContext
+        k: Number of results (default 6, max 20)
 
     Returns:
-        StructuredTool for semantic search
+        List of chunks with doc_id, chunk_id, text, score
     """
+    context = get_tool_context(config)
 
-    async def search_docs(query: str, k: int = 6) -> list[dict[str, Any]]:
-        """Search documents using semantic similarity.
-
-        Args:
-            query: Natural language search query
-            k: Number of results (default 6, max 20)
-
-        Returns:
-            List of chunks with doc_id, chunk_id, text, score
-        """
-        results = await search_service.search(case_id, query, k=k, language=language)
+    async def search() -> list[dict[str, Any]]:
+        async with context.session_maker() as db:
+            results = await SearchService(db, context.embedding_service).search(
+                context.case_id, query, k=k, language=context.language
+            )
         return [
             {
                 "doc_id": str(r.doc_id),
@@ -80,52 +134,46 @@ def create_search_docs_tool(
             for r in results
         ]
 
-    return StructuredTool.from_function(
-        func=search_docs,
-        coroutine=search_docs,
-        name="search_docs",
-        description=(
-            "Search documents using semantic similarity. "
-            "Returns relevant text chunks with their doc_ids and scores."
-        ),
-        args_schema=SearchDocsInput,
-    )
+    args = {"query": query, "k": k, "language": context.language}
+    return await context.memoized("search_docs", args, search)
 
 
-def create_get_document_tool(
-    document_service: DocumentService,
-    case_id: UUID,
-) -> StructuredTool:
-    """Create get_document tool bound to a specific case.
+search_docs_tool = StructuredTool.from_function(
+    func=search_docs,
+    coroutine=search_docs,
+    name="search_docs",
+    description=(
+        "Search documents using semantic similarity. "
+        "Returns relevant text chunks with their doc_ids and scores."
+    ),
+    args_schema=SearchDocsInput,
+)
+
+
+async def get_document(doc_id: str, config: RunnableConfig) -> dict[str, Any]:
+    """Get full document content by ID.
 
     Args:
-        document_service: DocumentService instance
-        case_id: Case ID for validation
+        doc_id: UUID of the document
+        config: Run config carrying the ToolContext
 
     Returns:
-        StructuredTool for document retrieval
+        Document with subject, body, type, timestamp, author
     """
-
-    async def get_document(doc_id: str) -> dict[str, Any]:
-        """Get full document content by ID.
-
-        Args:
-            doc_id: UUID of the document
-
-        Returns:
-            Document with subject, body, type, timestamp, author
-        """
-        try:
-            uuid_id = UUID(doc_id)
-        except ValueError:
-            return {"error": f"Invalid document ID: {doc_id}"}
-
-        doc = await document_service.get_by_id(uuid_id)
+    context = get_tool_context(config)
+    try:
+        uuid_id = UUID(doc_id)
+    except ValueError:
+        return {"error": f"Invalid document ID: {doc_id}"}
+
+    async def fetch() -> dict[str, Any]:
+        async with context.session_maker() as db:
+            doc = await DocumentService(db).get_by_id(uuid_id)
         if not doc:
             return {"error": f"Document not found: {doc_id}"}
 
         # Verify case ownership
-        if doc.case_id != case_id:
+        if doc.case_id != context.case_id:
             return {"error": "Document does not belong to this case"}
 
         return {
@@ -137,52 +185,45 @@ def create_get_document_tool(
             "author_id": str(doc.author_entity_id) if doc.author_entity_id else None,
         }
 
-    return StructuredTool.from_function(
-        func=get_document,
-        coroutine=get_document,
-        name="get_document",
-        description=(
-            "Retrieve full document content by ID. "
-            "Use this to read the complete text of a document found via search."
-        ),
-        args_schema=GetDocumentInput,
-    )
+    return await context.memoized("get_document", {"doc_id": str(uuid_id)}, fetch)
 
 
-def create_get_entity_tool(
-    entity_service: EntityService,
-    case_id: UUID,
-) -> StructuredTool:
-    """Create get_entity tool bound to a specific case.
+get_document_tool = StructuredTool.from_function(
+    func=get_document,
+    coroutine=get_document,
+    name="get_document",
+    description=(
+        "Retrieve full document content by ID. "
+        "Use this to read the complete text of a document found via search."
+    ),
+    args_schema=GetDocumentInput,
+)
+
+
+async def get_entity(entity_id: str, config: RunnableConfig) -> dict[str, Any]:
+    """Get entity details by ID.
 
     Args:
-        entity_service: EntityService instance
-        case_id: Case ID for validation
+        entity_id: UUID of the entity
+        config: Run config carrying the ToolContext
 
     Returns:
-        StructuredTool for entity retrieval
+        Entity with name, type, attributes
     """
-
-    async def get_entity(entity_id: str) -> dict[str, Any]:
-        """Get entity details by ID.
-
-        Args:
-            entity_id: UUID of the entity
-
-        Returns:
-            Entity with name, type, attributes
-        """
-        try:
-            uuid_id = UUID(entity_id)
-        except ValueError:
-            return {"error": f"Invalid entity ID: {entity_id}"}
-
-        entity = await entity_service.get_by_id(uuid_id)
+    context = get_tool_context(config)
+    try:
+        uuid_id = UUID(entity_id)
+    except ValueError:
+        return {"error": f"Invalid entity ID: {entity_id}"}
+
+    async def fetch() -> dict[str, Any]:
+        async with context.session_maker() as db:
+            entity = await EntityService(db).get_by_id(uuid_id)
         if not entity:
             return {"error": f"Entity not found: {entity_id}"}
 
         # Verify case ownership
-        if entity.case_id != case_id:
+        if entity.case_id != context.case_id:
             return {"error": "Entity does not belong to this case"}
 
         return {
@@ -192,131 +233,160 @@ def create_get_entity_tool(
             "attributes": entity.attrs_json or {},
         }
 
-    return StructuredTool.from_function(
-        func=get_entity,
-        coroutine=get_entity,
-        name="get_entity",
-        description=(
-            "Get details about a person or organization by ID. Returns name, type, and attributes."
-        ),
-        args_schema=GetEntityInput,
-    )
+    return await context.memoized("get_entity", {"entity_id": str(uuid_id)}, fetch)
 
 
-def create_graph_query_tool(
-    graph_service: GraphService,
-    case_id: UUID,
-) -> StructuredTool:
-    """Create graph_query tool bound to a specific case.
+get_entity_tool = StructuredTool.from_function(
+    func=get_entity,
+    coroutine=get_entity,
+    name="get_entity",
+    description=(
+        "Get details about a person or organization by ID. Returns name, type, and attributes."
+    ),
+    args_schema=GetEntityInput,
+)
+
+
+async def graph_query(
+    query_type: str,
+    config: RunnableConfig,
+    entity_id: str | None = None,
+    target_id: str | None = None,
+) -> dict[str, Any]:
+    """Query the knowledge graph of the context's case.
 
     Args:
-        graph_service: GraphService instance
-        case_id: Case ID
+        query_type: One of 'neighbors', 'path', 'hubs'
+        config: Run config carrying the ToolContext
+        entity_id: Source entity for neighbors/path
+        target_id: Target entity for path query
 
     Returns:
-        StructuredTool for graph queries
+        Graph data (nodes, edges, or hub list)
     """
+    context = get_tool_context(config)
+    driver = context.neo4j_driver
+    if driver is None:
+        return {"error": "The knowledge graph is not available"}
 
-    async def graph_query(
-        query_type: str,
-        entity_id: str | None = None,
-        target_id: str | None = None,
-    ) -> dict[str, Any]:
-        """Query the knowledge graph.
+    async def query() -> dict[str, Any]:
+        async with context.session_maker() as db, driver.session() as neo4j:
+            return await _query_graph(
+                GraphService(neo4j, db), context.case_id, query_type, entity_id, target_id
+            )
 
-        Args:
-            query_type: One of 'neighbors', 'path', 'hubs'
-            entity_id: Source entity for neighbors/path
-            target_id: Target entity for path query
+    args = {"query_type": query_type, "entity_id": entity_id, "target_id": target_id}
+    return await context.memoized("graph_query", args, query)
 
-        Returns:
-            Graph data (nodes, edges, or hub list)
-        """
-        if query_type == "hubs":
-            hubs = await graph_service.query_hubs(case_id, limit=10)
-            return {
-                "query_type": "hubs",
-                "hubs": [
-                    {
-                        "entity_id": str(h.entity_id),
-                        "name": h.name,
-                        "entity_type": h.entity_type,
-                        "degree": h.degree,
-                    }
-                    for h in hubs
-                ],
-            }
 
-        if not entity_id:
-            return {"error": "entity_id is required for neighbors and path queries"}
+async def _query_graph(
+    graph_service: GraphService,
+    case_id: UUID,
+    query_type: str,
+    entity_id: str | None,
+    target_id: str | None,
+) -> dict[str, Any]:
+    if query_type == "hubs":
+        hubs = await graph_service.query_hubs(case_id, limit=10)
+        return {
+            "query_type": "hubs",
+            "hubs": [
+                {
+                    "entity_id": str(h.entity_id),
+                    "name": h.name,
+                    "entity_type": h.entity_type,
+                    "degree": h.degree,
+                }
+                for h in hubs
+            ],
+        }
+
+    if not entity_id:
+        return {"error": "entity_id is required for neighbors and path queries"}
+
+    try:
+        entity_uuid = UUID(entity_id)
+    except ValueError:
+        return {"error": f"Invalid entity ID: {entity_id}"}
+
+    if query_type == "neighbors":
+        nodes, edges = await graph_service.query_neighbors(case_id, entity_uuid)
+        return {
+            "query_type": "neighbors",
+            "nodes": [
+                {
+                    "entity_id": str(n.entity_id),
+                    "name": n.name,
+                    "entity_type": n.entity_type,
+                }
+                for n in nodes
+            ],
+            "edges": [
+                {
+                    "source": str(e.source_id),
+                    "target": str(e.target_id),
+                    "type": e.relationship_type,
+                }
+                for e in edges
+            ],
+        }
+
+    if query_type == "path":
+        if not target_id:
+            return {"error": "target_id is required for path queries"}
 
         try:
-            entity_uuid = UUID(entity_id)
+            target_uuid = UUID(target_id)
         except ValueError:
-            return {"error": f"Invalid entity ID: {entity_id}"}
-
-        if query_type == "neighbors":
-            nodes, edges = await graph_service.query_neighbors(case_id, entity_uuid)
-            return {
-                "query_type": "neighbors",
-                "nodes": [
-                    {
-                        "entity_id": str(n.entity_id),
-                        "name": n.name,
-                        "entity_type": n.entity_type,
-                    }
-                    for n in nodes
-                ],
-                "edges": [
-                    {
-                        "source": str(e.source_id),
-                        "target": str(e.target_id),
-                        "type": e.relationship_type,
-                    }
-                    for e in edges
-                ],
-            }
+            return {"error": f"Invalid target ID: {target_id}"}
 
-        if query_type == "path":
-            if not target_id:
-                return {"error": "target_id is required for path queries"}
-
-            try:
-                target_uuid = UUID(target_id)
-            except ValueError:
-                return {"error": f"Invalid target ID: {target_id}"}
-
-            path = await graph_service.query_path(case_id, entity_uuid, target_uuid)
-            return {
-                "query_type": "path",
-                "found": path.found,
-                "length": path.length,
-                "nodes": [
-                    {
-                        "entity_id": str(n.entity_id),
-                        "name": n.name,
-                        "entity_type": n.entity_type,
-                    }
-                    for n in path.nodes
-                ],
-                "edges": [
-                    {
-                        "source": str(e.source_id),
-                        "target": str(e.target_id),
-                        "type": e.relationship_type,
-                    }
-                    for e in path.edges
-                ],
-            }
+        path = await graph_service.query_path(case_id, entity_uuid, target_uuid)
+        return {
+            "query_type": "path",
+            "found": path.found,
+            "length": path.length,
+            "nodes": [
+                {
+                    "entity_id": str(n.entity_id),
+                    "name": n.name,
+                    "entity_type": n.entity_type,
+                }
+                for n in path.nodes
+            ],
+            "edges": [
+                {
+                    "source": str(e.source_id),
+                    "target": str(e.target_id),
+                    "type": e.relationship_type,
+                }
+                for e in path.edges
+            ],
+        }
 
-        return {"error": f"Unknown query_type: {query_type}. Use 'neighbors', 'path', or 'hubs'."}
+    return {"error": f"Unknown query_type: {query_type}. Use 'neighbors', 'path', or 'hubs'."}
 
-    return StructuredTool.from_function(
-        func=graph_query,
-        coroutine=graph_query,
-        name="graph_query",
-        description="Query the knowledge graph to explore relationships. "
-        "Use 'hubs' to find important entities, 'neighbors' to see connections, "
-        "or 'path' to find how two entities are connected.",
-        args_schema=GraphQueryInput,
-    )
+
+graph_query_tool = StructuredTool.from_function(
+    func=graph_query,
+    coroutine=graph_query,
+    name="graph_query",
+    description="Query the knowledge graph to explore relationships. "
+    "Use 'hubs' to find important entities, 'neighbors' to see connections, "
+    "or 'path' to find how two entities are connected.",
+    args_schema=GraphQueryInput,
+)
+
+
+def get_aria_tools(*, include_graph: bool) -> list[BaseTool]:
+    """Tools offered to the agent.
+
+    Args:
+        include_graph: Whether to offer graph_query (requires Neo4j)
+
+    Returns:
+        List of shared tool instances
+    """
+    tools: list[BaseTool] = [search_docs_tool, get_document_tool, get_entity_tool]
+    if include_graph:
+        tools.append(graph_query_tool)
+    return tools
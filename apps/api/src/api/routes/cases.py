@@ -27,6 +27,7 @@ from src.schemas.submission import (
     SubmissionRequest,
     SubmissionResponse,
 )
+from src.services.case_service import CaseService
 from src.services.graph_service import GraphService
 from src.services.ingestion_service import IngestionService
 
@@ -770,36 +771,23 @@ async def list_cases(
     count_result = await db.execute(select(func.count(Case.case_id)))
     total = count_result.scalar() or 0
 
-    # Get cases with document and entity counts
-    result = await db.execute(
-        select(Case).order_by(Case.created_at.desc()).offset(skip).limit(limit)
-    )
-    cases = list(result.scalars().all())
-
-    # Get counts for each case
-    case_responses = []
-    for case in cases:
-        doc_count_result = await db.execute(
-            select(func.count(Document.doc_id)).where(Document.case_id == case.case_id)
-        )
-        entity_count_result = await db.execute(
-            select(func.count(Entity.entity_id)).where(Entity.case_id == case.case_id)
-        )
-
-        case_responses.append(
-            CaseResponse(
-                case_id=case.case_id,
-                title=case.title,
-                scenario_type=case.scenario_type,
-                difficulty=case.difficulty,
-                language=case.language,
-                seed=case.seed,
-                created_at=case.created_at,
-                updated_at=case.updated_at,
-                document_count=doc_count_result.scalar() or 0,
-                entity_count=entity_count_result.scalar() or 0,
-            )
+    # Get the page with document and entity counts in one query
+    cases = await CaseService(db).list_with_counts(skip, limit)
+    case_responses = [
+        CaseResponse(
+            case_id=case.case_id,
+            title=case.title,
+            scenario_type=case.scenario_type,
+            difficulty=case.difficulty,
+            language=case.language,
+            seed=case.seed,
+            created_at=case.created_at,
+            updated_at=case.updated_at,
+            document_count=document_count,
+            entity_count=entity_count,
         )
+        for case, document_count, entity_count in cases
+    ]
 
     return CaseListResponse(cases=case_responses, total=total)
 
@@ -1,12 +1,14 @@
 """Chat API routes for ARIA agent."""
 
+import json
 import logging
-from asyncio import TimeoutError as AsyncTimeoutError
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from openai import APIError as OpenAIAPIError
 from openai import AuthenticationError as OpenAIAuthenticationError
 from openai import RateLimitError as OpenAIRateLimitError
@@ -16,15 +18,21 @@ from src.config import settings
 from src.dependencies import DbSession, OptionalUser
 from src.models.player import PlayerState
 from src.models.user import User
-from src.schemas.chat import ChatRequest, ChatResponse, HintRequest, HintResponse
+from src.schemas.chat import (
+    ChatRequest,
+    ChatResponse,
+    ChatStreamEvent,
+    HintRequest,
+    HintResponse,
+)
 from src.services.agent_service import AgentService
 from src.services.case_service import CaseService
-from src.services.rate_limiter import SlidingWindowRateLimiter
+from src.services.provider_governor import ProviderUnavailableError
+from src.services.rate_limiter import get_rate_limiter
 
 router = APIRouter(tags=["chat"])
 MAX_HINTS = 4
 logger = logging.getLogger(__name__)
-rate_limiter = SlidingWindowRateLimiter()
 
 
 def _rate_limit_key(
@@ -38,7 +46,7 @@ def _rate_limit_key(
     return f"{scope}:{subject}{case_segment}"
 
 
-def _enforce_rate_limit(
+async def _enforce_rate_limit(
     *,
     key: str,
     limit: int,
@@ -50,8 +58,9 @@ def _enforce_rate_limit(
     if limit <= 0 or window_seconds <= 0:
         return
 
-    if not rate_limiter.allow(key, limit, window_seconds):
-        retry_after = rate_limiter.retry_after_seconds(key, window_seconds)
+    decision = await get_rate_limiter().hit(key, limit, window_seconds)
+    if not decision.allowed:
+        retry_after = decision.retry_after_seconds
         response.headers["Retry-After"] = str(retry_after)
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -60,12 +69,71 @@ def _enforce_rate_limit(
         )
 
     response.headers["X-RateLimit-Limit"] = str(limit)
-    response.headers["X-RateLimit-Remaining"] = str(
-        rate_limiter.remaining(key, limit, window_seconds)
-    )
+    response.headers["X-RateLimit-Remaining"] = str(decision.remaining)
     response.headers["X-RateLimit-Window"] = str(window_seconds)
 
 
+def _provider_error(exc: Exception) -> HTTPException:
+    """Map an AI provider failure to the HTTP error reported to the client."""
+    if isinstance(exc, OpenAIAuthenticationError):
+        logger.warning("AI provider authentication failed: %s", exc)
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=(
+                "AI provider authentication failed. "
+                "Check provider API key settings in apps/api/.env and restart the backend."
+            ),
+        )
+    if isinstance(exc, OpenAIRateLimitError):
+        logger.warning("AI provider rate-limited chat request: %s", exc)
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="AI provider is temporarily rate-limited. Please retry in a moment.",
+        )
+    if isinstance(exc, ProviderUnavailableError):
+        logger.warning("AI provider skipped while its circuit breaker is open: %s", exc)
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="AI provider is temporarily unavailable. Please retry in a moment.",
+        )
+    if isinstance(exc, TimeoutError):
+        logger.warning("AI provider request timed out")
+        return HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="AI provider timed out. Please retry in a moment.",
+        )
+    logger.error("AI provider request failed", exc_info=exc)
+    return HTTPException(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        detail="AI provider request failed. Please retry in a moment.",
+    )
+
+
+def _format_sse(event: ChatStreamEvent) -> str:
+    """Serialize a chat stream event in text/event-stream framing."""
+    return f"event: {event.event}\ndata: {json.dumps(event.data, default=str)}\n\n"
+
+
+async def _sse_stream(events: AsyncIterator[ChatStreamEvent]) -> AsyncIterator[str]:
+    """Format chat stream events, reporting provider failures as an error event."""
+    try:
+        async for event in events:
+            yield _format_sse(event)
+    except (
+        TimeoutError,
+        OpenAIAuthenticationError,
+        OpenAIAPIError,
+        ProviderUnavailableError,
+    ) as exc:
+        error = _provider_error(exc)
+        yield _format_sse(
+            ChatStreamEvent(
+                event="error",
+                data={"status_code": error.status_code, "detail": error.detail},
+            )
+        )
+
+
 def _collect_case_hints(ground_truth: dict[str, Any]) -> list[str]:
     """Flatten case hints from ground truth into a simple ordered list."""
     hints_block = ground_truth.get("hints", {})
@@ -140,7 +208,7 @@ async def chat_with_aria(
         )
 
     chat_rate_key = _rate_limit_key("chat", request_context, current_user, case_id)
-    _enforce_rate_limit(
+    await _enforce_rate_limit(
         key=chat_rate_key,
         limit=settings.chat_rate_limit_requests,
         window_seconds=settings.chat_rate_limit_window_seconds,
@@ -149,38 +217,89 @@ async def chat_with_aria(
     )
 
     # Initialize agent service
-    agent_service = AgentService(db=db, neo4j=None)
+    agent_service = AgentService(db=db, neo4j_driver=None)
 
     try:
         # Process chat message with language
-        return await agent_service.chat(case_id, request, language=language)
-    except OpenAIAuthenticationError as exc:
-        logger.warning("AI provider authentication failed: %s", exc)
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=(
-                "AI provider authentication failed. "
-                "Check provider API key settings in apps/api/.env and restart the backend."
-            ),
-        ) from exc
-    except OpenAIRateLimitError as exc:
-        logger.warning("AI provider rate-limited chat request: %s", exc)
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="AI provider is temporarily rate-limited. Please retry in a moment.",
-        ) from exc
-    except AsyncTimeoutError as exc:
-        logger.warning("AI provider request timed out")
-        raise HTTPException(
-            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-            detail="AI provider timed out. Please retry in a moment.",
-        ) from exc
-    except OpenAIAPIError as exc:
-        logger.exception("AI provider request failed")
+        return await agent_service.chat(
+            case_id,
+            request,
+            language=language,
+            user_id=current_user.user_id if current_user else None,
+        )
+    except (
+        TimeoutError,
+        OpenAIAuthenticationError,
+        OpenAIAPIError,
+        ProviderUnavailableError,
+    ) as exc:
+        raise _provider_error(exc) from exc
+
+
+@router.post(
+    "/cases/{case_id}/chat/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def stream_chat_with_aria(
+    case_id: UUID,
+    request: ChatRequest,
+    db: DbSession,
+    request_context: Request,
+    response: Response,
+    current_user: OptionalUser,
+    language: str = Query(default="en", pattern=r"^[a-z]{2}$"),
+) -> StreamingResponse:
+    """Send a message to ARIA agent and stream the answer as server-sent events.
+
+    Emits ``start`` immediately, then ``token``, ``tool_start``, ``tool_end``
+    and ``citation`` events while the agent works, and a final ``done`` event
+    carrying the same payload as ``POST /cases/{case_id}/chat``. Provider
+    failures after the stream has begun are sent as an ``error`` event.
+    Requests count against the same rate limit as the non-streaming endpoint.
+
+    Args:
+        case_id: Case ID to investigate
+        request: Chat request with user message
+        db: Database session
+        language: Response language (ISO 639-1 code, default "en")
+
+    Returns:
+        text/event-stream response
+    """
+    case_service = CaseService(db)
+    case = await case_service.get_by_id(case_id)
+    if not case:
         raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="AI provider request failed. Please retry in a moment.",
-        ) from exc
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Case not found: {case_id}",
+        )
+
+    chat_rate_key = _rate_limit_key("chat", request_context, current_user, case_id)
+    await _enforce_rate_limit(
+        key=chat_rate_key,
+        limit=settings.chat_rate_limit_requests,
+        window_seconds=settings.chat_rate_limit_window_seconds,
+        response=response,
+        detail="Too many chat requests. Please wait a moment and try again.",
+    )
+
+    agent_service = AgentService(db=db, neo4j_driver=None)
+    events = agent_service.stream_chat(
+        case_id,
+        request,
+        language=language,
+        user_id=current_user.user_id if current_user else None,
+    )
+    headers = {
+        name: value for name, value in response.headers.items() if name.startswith("x-ratelimit-")
+    }
+    return StreamingResponse(
+        _sse_stream(events),
+        media_type="text/event-stream",
+        # Disable proxy buffering so each event reaches the client as it is sent
+        headers={**headers, "Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.post(
@@ -218,7 +337,7 @@ async def request_hint(
         )
 
     hint_rate_key = _rate_limit_key("hint", request_context, current_user, case_id)
-    _enforce_rate_limit(
+    await _enforce_rate_limit(
         key=hint_rate_key,
         limit=settings.hint_rate_limit_requests,
         window_seconds=settings.hint_rate_limit_window_seconds,
@@ -11,9 +11,15 @@ from src.schemas.document import (
     DocumentCreate,
     DocumentListResponse,
     DocumentResponse,
+    DocumentSummary,
     DocumentWithChunks,
 )
-from src.services.document_service import DocumentService
+from src.services.document_service import (
+    DocumentService,
+    DocumentView,
+    decode_cursor,
+    encode_cursor,
+)
 
 router = APIRouter()
 
@@ -25,34 +31,73 @@ async def list_documents(
     skip: int = 0,
     limit: int = 50,
     doc_type: DocType | None = None,
+    cursor: str | None = None,
+    view: DocumentView = DocumentView.full,
 ) -> DocumentListResponse:
-    """List documents for a case with pagination."""
+    """List documents for a case, newest first.
+
+    Pass the previous response's ``next_cursor`` as ``cursor`` to fetch the
+    next page by keyset instead of ``skip``. ``view=summary`` returns a body
+    snippet instead of the body and metadata, for inbox-style listings.
+    """
     service = DocumentService(db)
 
-    documents = await service.list_by_case(case_id, skip, limit, doc_type)
+    after = None
+    if cursor is not None:
+        if skip:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Use either skip or cursor, not both",
+            )
+        try:
+            after = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            ) from e
+
+    documents = await service.list_by_case(case_id, skip, limit, doc_type, after=after, view=view)
     total = await service.count_by_case(case_id, doc_type)
+    next_cursor = encode_cursor(documents[-1][0]) if limit > 0 and len(documents) == limit else None
 
-    # Get chunk counts for each document
-    doc_responses = []
-    for doc in documents:
-        chunk_count = await service.get_chunk_count(doc.doc_id)
-        doc_responses.append(
-            DocumentResponse(
+    if view is DocumentView.summary:
+        summaries = [
+            DocumentSummary(
                 doc_id=doc.doc_id,
                 case_id=doc.case_id,
                 doc_type=doc.doc_type,
                 ts=doc.ts,
-                author_entity_id=doc.author_entity_id,
                 subject=doc.subject,
-                body=doc.body,
-                metadata_json=doc.metadata_json,
+                author_entity_id=doc.author_entity_id,
+                language=doc.language,
+                snippet=doc.snippet or "",
                 created_at=doc.created_at,
                 updated_at=doc.updated_at,
                 chunk_count=chunk_count,
             )
+            for doc, chunk_count in documents
+        ]
+        return DocumentListResponse(documents=summaries, total=total, next_cursor=next_cursor)
+
+    doc_responses = [
+        DocumentResponse(
+            doc_id=doc.doc_id,
+            case_id=doc.case_id,
+            doc_type=doc.doc_type,
+            ts=doc.ts,
+            author_entity_id=doc.author_entity_id,
+            subject=doc.subject,
+            body=doc.body,
+            metadata_json=doc.metadata_json,
+            created_at=doc.created_at,
+            updated_at=doc.updated_at,
+            chunk_count=chunk_count,
         )
+        for doc, chunk_count in documents
+    ]
 
-    return DocumentListResponse(documents=doc_responses, total=total)
+    return DocumentListResponse(documents=doc_responses, total=total, next_cursor=next_cursor)
 
 
 @router.get("/{doc_id}", response_model=DocumentResponse)
@@ -27,27 +27,23 @@ async def list_entities(
     """List entities for a case with pagination."""
     service = EntityService(db)
 
-    entities = await service.list_by_case(case_id, skip, limit, entity_type)
+    entities = await service.list_with_counts(case_id, skip, limit, entity_type)
     total = await service.count_by_case(case_id, entity_type)
 
-    # Get document counts for each entity
-    entity_responses = []
-    for entity in entities:
-        doc_count = await service.get_document_count(entity.entity_id)
-        mention_count = await service.get_mention_count(entity.entity_id)
-        entity_responses.append(
-            EntityResponse(
-                entity_id=entity.entity_id,
-                case_id=entity.case_id,
-                entity_type=entity.entity_type,
-                name=entity.name,
-                attrs_json=entity.attrs_json,
-                created_at=entity.created_at,
-                updated_at=entity.updated_at,
-                document_count=doc_count,
-                mention_count=mention_count,
-            )
+    entity_responses = [
+        EntityResponse(
+            entity_id=entity.entity_id,
+            case_id=entity.case_id,
+            entity_type=entity.entity_type,
+            name=entity.name,
+            attrs_json=entity.attrs_json,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+            document_count=doc_count,
+            mention_count=mention_count,
         )
+        for entity, doc_count, mention_count in entities
+    ]
 
     return EntityListResponse(entities=entity_responses, total=total)
 
@@ -27,27 +27,34 @@ async def sync_case_to_graph(
     case_id: UUID,
     db: DbSession,
     neo4j: Neo4jSession,
+    *,
+    full: bool = False,
 ) -> SyncResponse:
     """Sync case entities and documents to Neo4j knowledge graph.
 
     This creates nodes for all entities and documents, and SENT relationships
-    between authors and their documents.
+    between authors and their documents. Only nodes and edges that changed
+    since the last sync are written, unless a full rebuild is requested.
 
     Args:
         case_id: Case ID to sync
         db: PostgreSQL session
         neo4j: Neo4j session
+        full: Clear and rebuild the case graph
 
     Returns:
-        SyncResponse with counts of created nodes and relationships
+        SyncResponse with counts of written and deleted nodes and relationships
     """
     service = GraphService(neo4j, db)
-    result = await service.sync_case(case_id)
+    result = await service.sync_case(case_id, full=full)
 
     return SyncResponse(
         case_id=result.case_id,
         nodes_created=result.nodes_created,
         relationships_created=result.relationships_created,
+        nodes_deleted=result.nodes_deleted,
+        relationships_deleted=result.relationships_deleted,
+        nodes_unchanged=result.nodes_unchanged,
     )
 
 
@@ -3,12 +3,16 @@
 from typing import Literal
 
 from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from sqlalchemy import text
 
+from src.agent.tool_cache import get_tool_result_cache
 from src.config import settings
 from src.db.neo4j import verify_neo4j_connection
 from src.dependencies import DbSession
+from src.services.embedding_cache import get_embedding_cache, get_query_embedding_cache
+from src.services.provider_governor import EMBEDDINGS, BreakerState, get_provider_governor
+from src.services.response_cache import get_response_cache
 
 router = APIRouter()
 
@@ -27,12 +31,44 @@ class DependencyStatus(BaseModel):
     detail: str | None = None
 
 
+class CircuitBreakerStatus(BaseModel):
+    """Circuit breaker and call limits for one outbound provider."""
+
+    state: Literal["closed", "open", "half_open"]
+    consecutive_failures: int
+    times_opened: int
+    in_flight: int
+    max_concurrency: int
+    requests_per_minute: float
+
+
 class DependencyHealthResponse(BaseModel):
     """Aggregated dependency health response."""
 
     status: Literal["healthy", "degraded"]
     version: str
     dependencies: dict[str, DependencyStatus]
+    breakers: dict[str, CircuitBreakerStatus] = Field(default_factory=dict)
+
+
+class CacheStats(BaseModel):
+    """Hit/miss counters for one cache."""
+
+    enabled: bool
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    hit_rate: float = 0.0
+    evictions: int | None = None
+    expirations: int | None = None
+    entries: int | None = None
+    size_bytes: int | None = None
+
+
+class CacheHealthResponse(BaseModel):
+    """Cache statistics for the current API process."""
+
+    caches: dict[str, CacheStats]
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -66,11 +102,17 @@ async def dependency_health_check(db: DbSession) -> DependencyHealthResponse:
     llm_key = settings.provider_api_key(primary_provider).strip()
     llm_detail = f"{primary_provider}:{settings.provider_model_name(primary_provider)}"
     fallback_provider = settings.llm_fallback_provider.strip().lower()
-    if (
+    has_fallback = bool(
         fallback_provider
         and fallback_provider != primary_provider
         and settings.provider_is_configured(fallback_provider)
-    ):
+    )
+    breakers = _breaker_statuses(
+        [primary_provider, fallback_provider, EMBEDDINGS]
+        if has_fallback
+        else [primary_provider, EMBEDDINGS]
+    )
+    if has_fallback:
         llm_detail = (
             f"{llm_detail} (fallback: {fallback_provider}:"
             f"{settings.provider_model_name(fallback_provider)})"
@@ -87,6 +129,12 @@ async def dependency_health_check(db: DbSession) -> DependencyHealthResponse:
             detail="Configure OPENAI_API_KEY or DEEPSEEK_API_KEY",
         )
     )
+    if llm_key and breakers[primary_provider].state == BreakerState.open:
+        routing = "chat uses the fallback provider" if has_fallback else "chat is unavailable"
+        dependencies["llm"] = DependencyStatus(
+            status="degraded",
+            detail=f"{llm_detail}; circuit open, {routing}",
+        )
 
     embedding_key = settings.resolved_embedding_api_key.strip()
     dependencies["embeddings"] = (
@@ -98,6 +146,12 @@ async def dependency_health_check(db: DbSession) -> DependencyHealthResponse:
         )
     )
 
+    if embedding_key and breakers[EMBEDDINGS].state == BreakerState.open:
+        dependencies["embeddings"] = DependencyStatus(
+            status="degraded",
+            detail=f"{settings.embedding_model}; circuit open, search uses keywords",
+        )
+
     overall_status: Literal["healthy", "degraded"] = (
         "healthy" if all(dep.status == "ok" for dep in dependencies.values()) else "degraded"
     )
@@ -106,6 +160,91 @@ async def dependency_health_check(db: DbSession) -> DependencyHealthResponse:
         status=overall_status,
         version="0.1.0",
         dependencies=dependencies,
+        breakers=breakers,
+    )
+
+
+def _breaker_statuses(names: list[str]) -> dict[str, CircuitBreakerStatus]:
+    """Circuit breaker state of the outbound call governors by provider name."""
+    statuses: dict[str, CircuitBreakerStatus] = {}
+    for name in names:
+        snapshot = get_provider_governor(name).status()
+        statuses[name] = CircuitBreakerStatus(
+            state=snapshot.state.value,
+            consecutive_failures=snapshot.consecutive_failures,
+            times_opened=snapshot.times_opened,
+            in_flight=snapshot.in_flight,
+            max_concurrency=snapshot.max_concurrency,
+            requests_per_minute=snapshot.requests_per_minute,
+        )
+    return statuses
+
+
+@router.get("/health/caches", response_model=CacheHealthResponse)
+async def cache_health_check() -> CacheHealthResponse:
+    """Report in-process cache counters (provider calls and latency saved)."""
+    embedding_cache = get_embedding_cache()
+    embeddings = (
+        CacheStats(
+            enabled=True,
+            hits=embedding_cache.stats.hits,
+            misses=embedding_cache.stats.misses,
+            writes=embedding_cache.stats.writes,
+            hit_rate=round(embedding_cache.stats.hit_rate, 4),
+        )
+        if embedding_cache
+        else CacheStats(enabled=False)
+    )
+    query_cache = get_query_embedding_cache()
+    query_embeddings = (
+        CacheStats(
+            enabled=True,
+            hits=query_cache.stats.hits,
+            misses=query_cache.stats.misses,
+            hit_rate=round(query_cache.stats.hit_rate, 4),
+            evictions=query_cache.stats.evictions,
+            expirations=query_cache.stats.expirations,
+            entries=len(query_cache),
+            size_bytes=query_cache.size_bytes,
+        )
+        if query_cache
+        else CacheStats(enabled=False)
+    )
+    tool_cache = get_tool_result_cache()
+    agent_tools = (
+        CacheStats(
+            enabled=True,
+            hits=tool_cache.stats.hits,
+            misses=tool_cache.stats.misses,
+            hit_rate=round(tool_cache.stats.hit_rate, 4),
+            evictions=tool_cache.stats.evictions,
+            expirations=tool_cache.stats.expirations,
+            entries=len(tool_cache),
+        )
+        if tool_cache
+        else CacheStats(enabled=False)
+    )
+    response_cache = get_response_cache()
+    chat_responses = (
+        CacheStats(
+            enabled=True,
+            hits=response_cache.stats.hits,
+            misses=response_cache.stats.misses,
+            hit_rate=round(response_cache.stats.hit_rate, 4),
+            evictions=response_cache.stats.evictions,
+            expirations=response_cache.stats.expirations,
+            entries=len(response_cache),
+        )
+        if response_cache
+        else CacheStats(enabled=False)
+    )
+    return CacheHealthResponse(
+        caches={
+            "embeddings": embeddings,
+            "query_embeddings": query_embeddings,
+            "agent_tools": agent_tools,
+            "chat_responses": chat_responses,
+        }
     )
 
 
@@ -0,0 +1,73 @@
+"""Background job endpoints."""
+
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, status
+
+from src.dependencies import DbSession
+from src.schemas.job import JobCreateRequest, JobResponse
+from src.services.job_service import JobService
+
+router = APIRouter()
+
+
+@router.post(
+    "/cases/{case_id}/jobs",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def create_job(
+    case_id: UUID,
+    request: JobCreateRequest,
+    db: DbSession,
+) -> JobResponse:
+    """Enqueue an ingest or graph-sync job for a case.
+
+    Args:
+        case_id: Case ID
+        request: Job type and parameters
+        db: Database session
+
+    Returns:
+        JobResponse for the queued job
+    """
+    service = JobService(db)
+    try:
+        job = await service.enqueue(
+            case_id,
+            request.job_type,
+            request.model_dump(exclude={"job_type"}),
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+
+    return JobResponse.model_validate(job)
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: UUID, db: DbSession) -> JobResponse:
+    """Get job status with per-document progress.
+
+    Args:
+        job_id: Job ID
+        db: Database session
+
+    Returns:
+        JobResponse
+
+    Raises:
+        HTTPException: If job not found
+    """
+    service = JobService(db)
+    job = await service.get_job(job_id)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found",
+        )
+
+    return JobResponse.model_validate(job)
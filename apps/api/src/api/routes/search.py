@@ -5,8 +5,9 @@ from uuid import UUID
 from fastapi import APIRouter, HTTPException, status
 
 from src.dependencies import DbSession
+from src.models.job import JobType
+from src.schemas.job import JobResponse
 from src.schemas.search import (
-    CaseIngestionResponse,
     DocumentIngestionResponse,
     IngestionRequest,
     SearchRequest,
@@ -14,6 +15,7 @@ from src.schemas.search import (
     SearchResultItem,
 )
 from src.services.ingestion_service import IngestionService
+from src.services.job_service import JobService
 from src.services.search_service import SearchService
 
 router = APIRouter()
@@ -25,15 +27,15 @@ async def search_documents(
     request: SearchRequest,
     db: DbSession,
 ) -> SearchResponse:
-    """Perform semantic search over case documents.
+    """Perform semantic, keyword or hybrid search over case documents.
 
     Args:
         case_id: Case ID to search within
-        request: Search parameters (query, k, doc_types, min_score)
+        request: Search parameters (query, k, doc_types, min_score, mode)
         db: Database session
 
     Returns:
-        SearchResponse with matching chunks sorted by similarity
+        SearchResponse with matching chunks sorted by relevance
     """
     service = SearchService(db)
 
@@ -44,6 +46,8 @@ async def search_documents(
         doc_types=request.doc_types,
         min_score=request.min_score,
         language=request.language,
+        ef_search=request.ef_search,
+        mode=request.mode,
     )
 
     return SearchResponse(
@@ -68,17 +72,19 @@ async def search_documents(
 
 @router.post(
     "/ingest",
-    response_model=CaseIngestionResponse,
+    response_model=JobResponse,
     status_code=status.HTTP_202_ACCEPTED,
 )
 async def ingest_case(
     case_id: UUID,
     db: DbSession,
     request: IngestionRequest | None = None,
-) -> CaseIngestionResponse:
-    """Ingest all documents in a case for RAG.
+) -> JobResponse:
+    """Enqueue ingestion of all documents in a case for RAG.
 
-    Chunks all documents, generates embeddings, and stores in database.
+    Chunking, embedding and storage run on the background job workers.
+    Documents unchanged since their last ingestion are skipped unless
+    ``force`` is set. Poll ``GET /api/jobs/{job_id}`` for progress.
 
     Args:
         case_id: Case ID to ingest
@@ -86,22 +92,20 @@ async def ingest_case(
         request: Optional ingestion parameters
 
     Returns:
-        CaseIngestionResponse with processing counts
+        JobResponse for the queued ingest job
     """
-    generate_embeddings = request.generate_embeddings if request else True
+    request = request or IngestionRequest()
 
-    service = IngestionService(db)
-    result = await service.ingest_case(
-        case_id=case_id,
-        generate_embeddings=generate_embeddings,
-    )
+    service = JobService(db)
+    try:
+        job = await service.enqueue(case_id, JobType.ingest, request.model_dump())
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
 
-    return CaseIngestionResponse(
-        case_id=result.case_id,
-        documents_processed=result.documents_processed,
-        total_chunks=result.total_chunks,
-        total_embeddings=result.total_embeddings,
-    )
+    return JobResponse.model_validate(job)
 
 
 @router.post(
@@ -49,10 +49,17 @@ class Settings(BaseSettings):
     neo4j_uri: str = Field(default="bolt://localhost:7687")
     neo4j_user: str = Field(default="neo4j")
     neo4j_password: str = Field(default="detective_graph")
+    graph_sync_batch_size: int = Field(default=1000)  # rows per UNWIND write transaction
 
     # Redis
     redis_url: str = Field(default="redis://localhost:6379")
 
+    # Background jobs
+    job_queue_backend: str = Field(default="memory")  # memory | redis
+    job_worker_concurrency: int = Field(default=2)
+    job_heartbeat_seconds: float = Field(default=15.0)
+    job_lease_seconds: int = Field(default=120)  # running jobs without a heartbeat are recovered
+
     # LLM
     llm_provider: str = Field(default="openai")
     openai_api_key: str = Field(default="")
@@ -64,18 +71,62 @@ class Settings(BaseSettings):
     llm_fallback_provider: str = Field(default="")
     llm_request_timeout_seconds: float = Field(default=40.0)
     llm_max_retries: int = Field(default=2)
+    # Outbound provider calls: LLM concurrency and rate limits (0 = unlimited) and
+    # a circuit breaker that opens after consecutive failures (0 disables it)
+    llm_max_concurrency: int = Field(default=16)
+    llm_requests_per_minute: float = Field(default=500.0)
+    provider_breaker_failure_threshold: int = Field(default=5)
+    provider_breaker_reset_seconds: float = Field(default=30.0)
+    # Per-conversation memoization of agent tool results (0 disables)
+    agent_tool_cache_max_entries: int = Field(default=5000)
+    agent_tool_cache_ttl_seconds: float = Field(default=1800.0)
+    # Stored conversation history sent with follow-up turns (0 tokens disables)
+    chat_history_max_tokens: int = Field(default=6000)
+    chat_history_recent_turns: int = Field(default=2)
+    # Answers to opening questions reused for near-duplicate questions (0 disables)
+    chat_response_cache_max_entries: int = Field(default=2000)
+    chat_response_cache_ttl_seconds: float = Field(default=86400.0)
+    chat_response_cache_similarity: float = Field(default=0.95)
 
     # Embeddings (OpenAI-compatible endpoint)
     embedding_api_key: str = Field(default="")
     embedding_api_base: str | None = Field(default=None)
     embedding_model: str = Field(default="text-embedding-3-small")
     embedding_dimension: int = Field(default=1536)
+    embedding_cache_backend: str = Field(default="memory")  # memory | postgres | none
+    embedding_cache_max_entries: int = Field(default=20000)
+    query_embedding_cache_max_bytes: int = Field(default=64 * 1024 * 1024)  # 0 disables
+    query_embedding_cache_ttl_seconds: float = Field(default=3600.0)
+    embedding_batch_size: int = Field(default=128)
+    embedding_batch_max_tokens: int = Field(default=60000)
+    embedding_max_concurrency: int = Field(default=4)
+    # Process-wide limits on all embedding calls (0 = unlimited)
+    embedding_provider_max_concurrency: int = Field(default=16)
+    embedding_requests_per_minute: float = Field(default=3000.0)
+    chunk_bulk_write_threshold: int = Field(default=500)  # rows; 0 disables COPY
+
+    # Vector index (pgvector ANN)
+    hnsw_m: int = Field(default=16)
+    hnsw_ef_construction: int = Field(default=64)
+    hnsw_ef_search: int = Field(default=40)  # raised to k when smaller
+    # Keep scanning until k rows pass the case filter: "relaxed_order" | "strict_order"
+    # | "" (off). Needs pgvector >= 0.8; older versions ignore the setting.
+    hnsw_iterative_scan: str = Field(default="relaxed_order")
+    # Cases with at most this many chunks per language skip the ANN index (0 = always ANN)
+    vector_exact_search_max_chunks: int = Field(default=20000)
+
+    # Hybrid (vector + full-text) search
+    search_hybrid_candidates: int = Field(default=20)  # per retriever, before fusion
+    search_rrf_k: int = Field(default=60)
+    keyword_trigram_threshold: float = Field(default=0.5)  # pg_trgm word similarity
 
     # API throttling
     chat_rate_limit_requests: int = Field(default=20)
     chat_rate_limit_window_seconds: int = Field(default=60)
     hint_rate_limit_requests: int = Field(default=10)
     hint_rate_limit_window_seconds: int = Field(default=60)
+    rate_limit_backend: str = Field(default="memory")  # memory | redis
+    rate_limit_max_keys: int = Field(default=100_000)  # memory backend only
 
     # CORS
     cors_origins_str: str = Field(
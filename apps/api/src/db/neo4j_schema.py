@@ -0,0 +1,66 @@
+"""Neo4j schema bootstrap: constraints and indexes used by graph queries."""
+
+import logging
+
+from neo4j import AsyncDriver
+
+from src.models.document import EntityType
+
+logger = logging.getLogger(__name__)
+
+# Label shared by every entity node, next to its type label (Person, Org, ...)
+ENTITY_LABEL = "Entity"
+DOCUMENT_LABEL = "Document"
+# Type labels GraphService gives entity nodes (Person, Org, ...)
+ENTITY_TYPE_LABELS = tuple(entity_type.value.capitalize() for entity_type in EntityType)
+
+GRAPH_SCHEMA_STATEMENTS = (
+    # Label entity nodes written before the shared label existed, so the
+    # constraint below covers them and MERGE on :Entity finds them. Only the
+    # entity type labels are scanned, not every node in the graph.
+    f"""
+    MATCH (n:{"|".join(f"`{label}`" for label in ENTITY_TYPE_LABELS)})
+    WHERE n.entity_id IS NOT NULL AND NOT n:{ENTITY_LABEL}
+    SET n:{ENTITY_LABEL}
+    """,
+    f"""
+    CREATE CONSTRAINT entity_id_unique IF NOT EXISTS
+    FOR (e:{ENTITY_LABEL}) REQUIRE e.entity_id IS UNIQUE
+    """,
+    f"""
+    CREATE CONSTRAINT document_id_unique IF NOT EXISTS
+    FOR (d:{DOCUMENT_LABEL}) REQUIRE d.doc_id IS UNIQUE
+    """,
+    f"""
+    CREATE INDEX entity_case_id IF NOT EXISTS
+    FOR (e:{ENTITY_LABEL}) ON (e.case_id)
+    """,
+    f"""
+    CREATE INDEX document_case_id IF NOT EXISTS
+    FOR (d:{DOCUMENT_LABEL}) ON (d.case_id)
+    """,
+)
+
+
+async def ensure_graph_schema(driver: AsyncDriver) -> bool:
+    """Create the graph constraints and indexes if they do not exist.
+
+    Every statement is idempotent, so this runs on each startup. A Neo4j
+    outage is logged rather than raised: the API serves non-graph routes
+    without Neo4j, and the schema is applied on the next startup.
+
+    Args:
+        driver: Neo4j async driver
+
+    Returns:
+        True if the schema is in place
+    """
+    try:
+        async with driver.session() as session:
+            for statement in GRAPH_SCHEMA_STATEMENTS:
+                result = await session.run(statement)
+                await result.consume()
+    except Exception as exc:
+        logger.warning("Could not apply Neo4j graph schema: %s", exc)
+        return False
+    return True
@@ -6,18 +6,25 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.api.routes import auth, cases, chat, documents, entities, graph, health, search
+from src.api.routes import auth, cases, chat, documents, entities, graph, health, jobs, search
 from src.config import settings
 from src.db.neo4j import close_neo4j_driver, get_neo4j_driver
+from src.db.neo4j_schema import ensure_graph_schema
+from src.services.job_service import get_job_workers
+from src.services.rate_limiter import close_rate_limiter
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager."""
-    # Startup - initialize Neo4j connection
-    await get_neo4j_driver()
+    # Startup - initialize Neo4j connection and schema, and background job workers
+    await ensure_graph_schema(await get_neo4j_driver())
+    workers = get_job_workers()
+    await workers.start()
     yield
-    # Shutdown - close Neo4j connection
+    # Shutdown - stop job workers, close rate limiter and Neo4j connections
+    await workers.stop()
+    await close_rate_limiter()
     await close_neo4j_driver()
 
 
@@ -46,3 +53,4 @@ app.include_router(entities.router, prefix="/api/cases/{case_id}/entities", tags
 app.include_router(search.router, prefix="/api/cases/{case_id}", tags=["search"])
 app.include_router(graph.router, prefix="/api/cases/{case_id}", tags=["graph"])
 app.include_router(chat.router, prefix="/api", tags=["chat"])
+app.include_router(jobs.router, prefix="/api", tags=["jobs"])
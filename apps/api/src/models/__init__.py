@@ -2,18 +2,26 @@
 
 from src.models.base import Base
 from src.models.case import Case, ScenarioType
+from src.models.conversation import Conversation
 from src.models.document import DocChunk, DocType, Document, Entity, EntityType, Mention
+from src.models.embedding_cache import EmbeddingCacheEntry
+from src.models.job import Job, JobStatus, JobType
 from src.models.player import PlayerState, Submission
 from src.models.user import User
 
 __all__ = [
     "Base",
     "Case",
+    "Conversation",
     "DocChunk",
     "DocType",
     "Document",
+    "EmbeddingCacheEntry",
     "Entity",
     "EntityType",
+    "Job",
+    "JobStatus",
+    "JobType",
     "Mention",
     "PlayerState",
     "ScenarioType",
@@ -1,10 +1,11 @@
 """Case model."""
 
+from datetime import datetime
 from enum import Enum as PyEnum
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from sqlalchemy import CheckConstraint, Enum, Integer, String, Text
+from sqlalchemy import CheckConstraint, DateTime, Enum, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -48,6 +49,8 @@ class Case(Base, TimestampMixin):
     language: Mapped[str] = mapped_column(String(5), nullable=False, default="en")
     briefing: Mapped[str] = mapped_column(Text, nullable=False, default="")
     ground_truth_json: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    # Last (re-)ingestion of any of the case's documents; versions cached chat answers
+    ingested_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Relationships
     documents: Mapped[list["Document"]] = relationship(
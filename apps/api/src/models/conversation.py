@@ -0,0 +1,52 @@
+"""ARIA conversation history model."""
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class Conversation(Base):
+    """Compacted message history of an ARIA conversation about a case."""
+
+    __tablename__ = "conversations"
+    __table_args__ = (
+        Index("idx_conversations_case", "case_id"),
+        Index("idx_conversations_user", "user_id"),
+    )
+
+    conversation_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    case_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("cases.case_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    # Player who owns the conversation; None for anonymous chats
+    user_id: Mapped[UUID | None] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("users.user_id", ondelete="CASCADE"),
+        nullable=True,
+    )
+    # LangChain messages serialized with messages_to_dict, oldest first
+    messages_json: Mapped[list[dict[str, Any]]] = mapped_column(JSONB, nullable=False, default=list)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<Conversation {self.conversation_id} ({len(self.messages_json)} messages)>"
@@ -6,10 +6,10 @@ from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Computed, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from src.models.base import Base, TimestampMixin
 
@@ -17,6 +17,14 @@ if TYPE_CHECKING:
     from src.models.case import Case
 
 
+# Postgres text search configuration per chunk language; others use "simple"
+TEXT_SEARCH_CONFIGS = {"en": "english", "es": "spanish"}
+TEXT_SEARCH_EXPRESSION = (
+    "to_tsvector(CASE language WHEN 'en' THEN 'english'::regconfig "
+    "WHEN 'es' THEN 'spanish'::regconfig ELSE 'simple'::regconfig END, text)"
+)
+
+
 class EntityType(PyEnum):
     """Valid entity types."""
 
@@ -106,6 +114,12 @@ class Document(Base, TimestampMixin):
     body: Mapped[str] = mapped_column(Text, nullable=False)
     language: Mapped[str] = mapped_column(String(5), nullable=False, default="en")
     metadata_json: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
+    # Fingerprint of the content + chunk config last ingested (None = never ingested)
+    content_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # Embedding model/dimension of the stored chunk vectors (None = no embeddings)
+    embedding_key: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    # Start of the body computed by the database; only loaded by summary listings
+    snippet: Mapped[str | None] = query_expression()
 
     # Relationships
     case: Mapped["Case"] = relationship("Case", back_populates="documents")
@@ -150,6 +164,11 @@ class DocChunk(Base):
     embedding: Mapped[list[float] | None] = mapped_column(Vector(1536), nullable=True)
     language: Mapped[str] = mapped_column(String(5), nullable=False, default="en")
     meta_json: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
+    text_search: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(TEXT_SEARCH_EXPRESSION, persisted=True),
+        deferred=True,
+    )
 
     # Relationships
     document: Mapped[Document] = relationship("Document", back_populates="chunks")
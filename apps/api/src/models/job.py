@@ -0,0 +1,74 @@
+"""Background job model."""
+
+from datetime import UTC, datetime
+from enum import Enum as PyEnum
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class JobType(PyEnum):
+    """Kinds of background jobs."""
+
+    ingest = "ingest"
+    graph_sync = "graph_sync"
+
+
+class JobStatus(PyEnum):
+    """Lifecycle states of a background job."""
+
+    queued = "queued"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+
+
+class Job(Base):
+    """A queued or executed background job for a case."""
+
+    __tablename__ = "jobs"
+    __table_args__ = (Index("idx_jobs_case_created", "case_id", "created_at"),)
+
+    job_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    case_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("cases.case_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    job_type: Mapped[JobType] = mapped_column(
+        Enum(JobType, name="job_type", native_enum=False, length=20),
+        nullable=False,
+    )
+    status: Mapped[JobStatus] = mapped_column(
+        Enum(JobStatus, name="job_status", native_enum=False, length=20),
+        nullable=False,
+        default=JobStatus.queued,
+    )
+    params_json: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
+    # Per-document stage keyed by doc_id (ingest jobs only)
+    progress_json: Mapped[dict[str, str]] = mapped_column(JSONB, nullable=False, default=dict)
+    documents_total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    documents_done: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    result_json: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Worker running the job and its last heartbeat; a stale heartbeat means
+    # the worker died and the job may be recovered
+    worker_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<Job {self.job_type.value} {self.job_id} ({self.status.value})>"
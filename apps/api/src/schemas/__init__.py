@@ -37,8 +37,8 @@ from src.schemas.graph import (
     PathResponse,
     SyncResponse,
 )
+from src.schemas.job import JobCreateRequest, JobResponse
 from src.schemas.search import (
-    CaseIngestionResponse,
     DocumentIngestionResponse,
     IngestionRequest,
     SearchRequest,
@@ -61,7 +61,6 @@ from src.schemas.user import (
 
 __all__ = [
     "CaseCreate",
-    "CaseIngestionResponse",
     "CaseListResponse",
     "CaseResponse",
     "ChatMessage",
@@ -86,6 +85,8 @@ __all__ = [
     "HubResponse",
     "HubsListResponse",
     "IngestionRequest",
+    "JobCreateRequest",
+    "JobResponse",
     "NeighborsResponse",
     "PathRequest",
     "PathResponse",
@@ -1,6 +1,7 @@
 """Chat schemas for ARIA agent."""
 
 from datetime import UTC, datetime
+from typing import Any, Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -40,6 +41,19 @@ class ChatResponse(BaseModel):
     suggested_actions: list[str] = Field(default_factory=list)
 
 
+class ChatStreamEvent(BaseModel):
+    """One server-sent event of a streamed ARIA response.
+
+    ``start`` carries the conversation ID, ``token`` a piece of answer text,
+    ``tool_start``/``tool_end`` bracket each tool call, ``citation`` a newly
+    cited document, ``done`` the complete ChatResponse and ``error`` a
+    failure after the stream began.
+    """
+
+    event: Literal["start", "token", "tool_start", "tool_end", "citation", "done", "error"]
+    data: dict[str, Any] = Field(default_factory=dict)
+
+
 class HintRequest(BaseModel):
     """Request for a hint."""
 
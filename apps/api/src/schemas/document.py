@@ -53,6 +53,24 @@ class DocumentResponse(DocumentBase):
     model_config = {"from_attributes": True}
 
 
+class DocumentSummary(BaseModel):
+    """Document listing entry without body or metadata (``view=summary``)."""
+
+    doc_id: UUID
+    case_id: UUID
+    doc_type: DocType
+    ts: datetime
+    subject: str | None = None
+    author_entity_id: UUID | None = None
+    language: str = "en"
+    snippet: str = ""
+    created_at: datetime
+    updated_at: datetime
+    chunk_count: int = 0
+
+    model_config = {"from_attributes": True}
+
+
 class DocumentWithChunks(DocumentResponse):
     """Document with its chunks (for detailed view)."""
 
@@ -62,5 +80,7 @@ class DocumentWithChunks(DocumentResponse):
 class DocumentListResponse(BaseModel):
     """Paginated document list."""
 
-    documents: list[DocumentResponse]
+    documents: list[DocumentResponse] | list[DocumentSummary]
     total: int
+    # Keyset cursor for the next page (None on the last page)
+    next_cursor: str | None = None
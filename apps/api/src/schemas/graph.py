@@ -74,6 +74,9 @@ class SyncResponse(BaseModel):
     case_id: UUID
     nodes_created: int
     relationships_created: int
+    nodes_deleted: int = 0
+    relationships_deleted: int = 0
+    nodes_unchanged: int = 0
     status: str = "completed"
 
 
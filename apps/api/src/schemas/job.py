@@ -0,0 +1,40 @@
+"""Background job schemas."""
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.models.job import JobStatus, JobType
+
+
+class JobCreateRequest(BaseModel):
+    """Request schema for enqueuing a background job."""
+
+    job_type: JobType
+    generate_embeddings: bool = Field(default=True)
+    force: bool = Field(default=False, description="Re-ingest unchanged documents too")
+    full: bool = Field(default=False, description="Graph sync: clear and rebuild the case graph")
+
+
+class JobResponse(BaseModel):
+    """Background job state and progress."""
+
+    job_id: UUID
+    case_id: UUID
+    job_type: JobType
+    status: JobStatus
+    params_json: dict[str, Any] = Field(default_factory=dict)
+    progress_json: dict[str, str] = Field(
+        default_factory=dict, description="Ingestion stage per document ID"
+    )
+    documents_total: int = 0
+    documents_done: int = 0
+    result_json: dict[str, Any] | None = None
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    model_config = {"from_attributes": True}
@@ -1,6 +1,7 @@
 """Search schemas for RAG endpoints."""
 
 from datetime import datetime
+from enum import StrEnum
 from typing import Any
 from uuid import UUID
 
@@ -9,6 +10,14 @@ from pydantic import BaseModel, Field
 from src.models.document import DocType
 
 
+class SearchMode(StrEnum):
+    """Retrieval strategy for SearchService.search."""
+
+    vector = "vector"
+    keyword = "keyword"
+    hybrid = "hybrid"
+
+
 class SearchRequest(BaseModel):
     """Request schema for semantic search."""
 
@@ -17,6 +26,11 @@ class SearchRequest(BaseModel):
     doc_types: list[DocType] | None = None
     min_score: float = Field(default=0.0, ge=0.0, le=1.0)
     language: str = Field(default="en", pattern=r"^[a-z]{2}$")
+    ef_search: int | None = Field(default=None, ge=1, le=1000)
+    mode: SearchMode = Field(
+        default=SearchMode.vector,
+        description="vector (semantic), keyword (full-text) or hybrid (both, rank-fused)",
+    )
 
 
 class SearchResultItem(BaseModel):
@@ -47,6 +61,7 @@ class IngestionRequest(BaseModel):
     """Request schema for document ingestion."""
 
     generate_embeddings: bool = Field(default=True)
+    force: bool = Field(default=False, description="Re-ingest unchanged documents too")
 
 
 class DocumentIngestionResponse(BaseModel):
@@ -55,12 +70,3 @@ class DocumentIngestionResponse(BaseModel):
     doc_id: UUID
     chunks_created: int
     embeddings_generated: int
-
-
-class CaseIngestionResponse(BaseModel):
-    """Response schema for case-wide ingestion."""
-
-    case_id: UUID
-    documents_processed: int
-    total_chunks: int
-    total_embeddings: int
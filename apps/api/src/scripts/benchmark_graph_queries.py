@@ -0,0 +1,286 @@
+"""Benchmark graph path/neighbor queries with and without label-indexed lookups.
+
+Usage:
+    cd apps/api
+    uv run python -m src.scripts.benchmark_graph_queries --nodes 100000 --cases 100
+
+Loads a synthetic graph (entities and documents spread over many cases) into
+Neo4j, applies the graph schema, and times ``GraphService.query_path`` and
+``GraphService.query_neighbors`` against the previous unlabelled Cypher, which
+cannot use the :Entity constraint index and scans every node. The synthetic
+nodes are deleted afterwards; only use a development database.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
+from uuid import UUID
+
+from neo4j import AsyncSession as Neo4jAsyncSession
+
+from src.config import settings
+from src.db.neo4j import close_neo4j_driver, get_neo4j_driver
+from src.db.neo4j_schema import ensure_graph_schema
+from src.db.session import async_engine, async_session_maker
+from src.scripts.benchmark_vector_index import percentile
+from src.services.graph_service import GraphService
+
+ENTITY_TYPES = ("Person", "Org", "Account")
+
+# Queries as written before nodes carried the shared :Entity label
+LEGACY_PATH_QUERY = """
+MATCH (a {entity_id: $from_id, case_id: $case_id})
+MATCH (b {entity_id: $to_id, case_id: $case_id})
+MATCH path = shortestPath((a)-[*..6]-(b))
+WHERE ALL(n IN nodes(path) WHERE n.entity_id IS NOT NULL)
+RETURN path
+"""
+
+LEGACY_NEIGHBORS_QUERY = """
+MATCH (e {entity_id: $entity_id, case_id: $case_id})
+MATCH (e)-[r*1..1]-(neighbor)
+WHERE neighbor.case_id = $case_id
+RETURN DISTINCT neighbor, r
+"""
+
+
+@dataclass
+class SyntheticCase:
+    """Rows for one synthetic case graph."""
+
+    case_id: str
+    entities: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    documents: list[dict[str, Any]] = field(default_factory=list)
+    edges: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def entity_ids(self) -> list[str]:
+        """IDs of every entity in the case."""
+        return [row["entity_id"] for rows in self.entities.values() for row in rows]
+
+
+@dataclass
+class QueryResult:
+    """Latency of one query variant."""
+
+    query: str
+    variant: str
+    p50_ms: float
+    p95_ms: float
+
+
+def generate_graph(
+    nodes: int, cases: int, *, degree: int = 3, document_ratio: float = 0.2, seed: int = 42
+) -> list[SyntheticCase]:
+    """Generate a synthetic multi-case graph of roughly ``nodes`` nodes.
+
+    Each case gets an equal share of nodes; ``document_ratio`` of them are
+    documents and the rest entities linked by ``degree`` random edges each.
+    """
+    rng = random.Random(seed)  # noqa: S311 - reproducible test data
+    per_case = max(nodes // max(cases, 1), 2)
+    documents_per_case = int(per_case * document_ratio)
+    entities_per_case = max(per_case - documents_per_case, 2)
+
+    def new_id() -> str:
+        return str(UUID(int=rng.getrandbits(128), version=4))
+
+    graph = []
+    for _ in range(cases):
+        case = SyntheticCase(case_id=new_id())
+        ids = []
+        for index in range(entities_per_case):
+            label = ENTITY_TYPES[index % len(ENTITY_TYPES)]
+            entity_id = new_id()
+            ids.append(entity_id)
+            case.entities.setdefault(label, []).append(
+                {"entity_id": entity_id, "name": f"{label} {index}"}
+            )
+        for entity_id in ids:
+            for target_id in rng.sample(ids, min(degree, len(ids))):
+                if target_id != entity_id:
+                    case.edges.append({"source_id": entity_id, "target_id": target_id})
+        case.documents = [
+            {"doc_id": new_id(), "author_id": rng.choice(ids)} for _ in range(documents_per_case)
+        ]
+        graph.append(case)
+    return graph
+
+
+async def _run(session: Neo4jAsyncSession, query: str, **params: Any) -> None:
+    result = await session.run(query, **params)
+    await result.consume()
+
+
+async def load_graph(session: Neo4jAsyncSession, graph: Sequence[SyntheticCase]) -> None:
+    """Write the synthetic graph with batched UNWIND statements."""
+    batch_size = max(settings.graph_sync_batch_size, 1)
+
+    async def write(query: str, rows: list[dict[str, Any]], **params: Any) -> None:
+        for start in range(0, len(rows), batch_size):
+            await _run(session, query, rows=rows[start : start + batch_size], **params)
+
+    for case in graph:
+        for label, rows in case.entities.items():
+            await write(
+                f"""
+                UNWIND $rows AS row
+                CREATE (e:Entity:{label} {{entity_id: row.entity_id, case_id: $case_id,
+                  name: row.name, entity_type: '{label.lower()}'}})
+                """,
+                rows,
+                case_id=case.case_id,
+            )
+        await write(
+            """
+            UNWIND $rows AS row
+            MATCH (a:Entity {entity_id: row.source_id})
+            MATCH (b:Entity {entity_id: row.target_id})
+            CREATE (a)-[:CO_OCCURS {count: 1}]->(b)
+            """,
+            case.edges,
+        )
+        await write(
+            """
+            UNWIND $rows AS row
+            MATCH (p:Entity {entity_id: row.author_id})
+            CREATE (p)-[:SENT]->(:Document {doc_id: row.doc_id, case_id: $case_id})
+            """,
+            case.documents,
+            case_id=case.case_id,
+        )
+
+
+async def delete_graph(session: Neo4jAsyncSession, graph: Sequence[SyntheticCase]) -> None:
+    """Delete the synthetic cases."""
+    for case in graph:
+        for label in ("Entity", "Document"):
+            await _run(
+                session,
+                f"MATCH (n:{label} {{case_id: $case_id}}) DETACH DELETE n",
+                case_id=case.case_id,
+            )
+
+
+async def time_queries(
+    variant: str,
+    query: str,
+    calls: Sequence[Callable[[], Awaitable[Any]]],
+) -> QueryResult:
+    """Time a sequence of query calls."""
+    latencies = []
+    for call in calls:
+        start = time.perf_counter()
+        await call()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return QueryResult(
+        query=query,
+        variant=variant,
+        p50_ms=percentile(latencies, 50),
+        p95_ms=percentile(latencies, 95),
+    )
+
+
+def sample_queries(
+    graph: Sequence[SyntheticCase], queries: int, *, seed: int = 7
+) -> list[tuple[str, str, str]]:
+    """Pick (case_id, from_id, to_id) triples within random cases."""
+    rng = random.Random(seed)  # noqa: S311 - reproducible test data
+    triples = []
+    for _ in range(queries):
+        case = rng.choice(graph)
+        from_id, to_id = rng.sample(case.entity_ids, 2)
+        triples.append((case.case_id, from_id, to_id))
+    return triples
+
+
+async def run_benchmark(
+    session: Neo4jAsyncSession,
+    service: GraphService,
+    samples: Sequence[tuple[str, str, str]],
+) -> list[QueryResult]:
+    """Time the legacy and current path and neighbor queries."""
+
+    async def legacy(query: str, **params: Any) -> None:
+        result = await session.run(query, **params)
+        _ = [record async for record in result]
+
+    legacy_variant = "legacy (unlabelled)"
+    indexed_variant = "GraphService (:Entity index)"
+    return [
+        await time_queries(
+            legacy_variant,
+            "query_path",
+            [
+                partial(legacy, LEGACY_PATH_QUERY, case_id=c, from_id=a, to_id=b)
+                for c, a, b in samples
+            ],
+        ),
+        await time_queries(
+            indexed_variant,
+            "query_path",
+            [partial(service.query_path, UUID(c), UUID(a), UUID(b)) for c, a, b in samples],
+        ),
+        await time_queries(
+            legacy_variant,
+            "query_neighbors",
+            [
+                partial(legacy, LEGACY_NEIGHBORS_QUERY, case_id=c, entity_id=a)
+                for c, a, _ in samples
+            ],
+        ),
+        await time_queries(
+            indexed_variant,
+            "query_neighbors",
+            [partial(service.query_neighbors, UUID(c), UUID(a)) for c, a, _ in samples],
+        ),
+    ]
+
+
+def format_results(results: Sequence[QueryResult], nodes: int, cases: int) -> str:
+    """Render benchmark results as a Markdown table."""
+    lines = [
+        f"{nodes} nodes across {cases} cases",
+        "",
+        "| query | variant | p50 ms | p95 ms |",
+        "|---|---|---|---|",
+    ]
+    lines.extend(f"| {r.query} | {r.variant} | {r.p50_ms:.2f} | {r.p95_ms:.2f} |" for r in results)
+    return "\n".join(lines)
+
+
+async def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--nodes", type=int, default=100000)
+    parser.add_argument("--cases", type=int, default=100)
+    parser.add_argument("--degree", type=int, default=3)
+    parser.add_argument("--queries", type=int, default=100)
+    args = parser.parse_args()
+
+    graph = generate_graph(args.nodes, args.cases, degree=args.degree)
+    samples = sample_queries(graph, args.queries)
+    driver = await get_neo4j_driver()
+    try:
+        if not await ensure_graph_schema(driver):
+            parser.error("could not apply the Neo4j graph schema")
+        async with driver.session() as session, async_session_maker() as db:
+            try:
+                await load_graph(session, graph)
+                results = await run_benchmark(session, GraphService(session, db), samples)
+            finally:
+                await delete_graph(session, graph)
+    finally:
+        await close_neo4j_driver()
+        await async_engine.dispose()
+
+    print(format_results(results, args.nodes, args.cases))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,175 @@
+"""Benchmark search modes for relevance and latency on a case's documents.
+
+Usage:
+    cd apps/api
+    uv run python -m src.scripts.benchmark_hybrid_search --case-id <uuid>
+
+Compares the ILIKE keyword fallback with the keyword (full-text), vector and
+hybrid modes. By default every document subject in the case is used as a
+query whose relevant document is the document itself; pass --queries with a
+JSONL file of {"query": ..., "doc_ids": [...]} lines for labelled queries.
+The case must be ingested (with embeddings for the vector and hybrid modes).
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.session import async_engine, async_session_maker
+from src.models.document import Document
+from src.schemas.search import SearchMode
+from src.scripts.benchmark_vector_index import percentile
+from src.services.search_service import SearchResult, SearchService
+
+FALLBACK = "ilike-fallback"
+MODES = (FALLBACK, *(mode.value for mode in SearchMode))
+
+SearchFn = Callable[[str], Awaitable[list[SearchResult]]]
+
+
+@dataclass
+class LabelledQuery:
+    """A query and the documents that answer it."""
+
+    query: str
+    doc_ids: set[UUID]
+
+
+@dataclass
+class ModeResult:
+    """Relevance and latency of one search mode."""
+
+    mode: str
+    hit_rate: float
+    mrr: float
+    p50_ms: float
+    p95_ms: float
+
+
+def reciprocal_rank(relevant: set[UUID], results: Sequence[SearchResult]) -> float:
+    """1 / rank of the first result from a relevant document (0 if none)."""
+    for rank, result in enumerate(results, start=1):
+        if result.doc_id in relevant:
+            return 1 / rank
+    return 0.0
+
+
+async def evaluate(mode: str, search: SearchFn, queries: Sequence[LabelledQuery]) -> ModeResult:
+    """Run every query through one search function."""
+    ranks: list[float] = []
+    latencies: list[float] = []
+    for labelled in queries:
+        start = time.perf_counter()
+        results = await search(labelled.query)
+        latencies.append((time.perf_counter() - start) * 1000)
+        ranks.append(reciprocal_rank(labelled.doc_ids, results))
+
+    count = max(len(queries), 1)
+    return ModeResult(
+        mode=mode,
+        hit_rate=sum(1 for r in ranks if r > 0) / count,
+        mrr=sum(ranks) / count,
+        p50_ms=percentile(latencies, 50),
+        p95_ms=percentile(latencies, 95),
+    )
+
+
+def search_function(
+    service: SearchService, mode: str, case_id: UUID, k: int, language: str
+) -> SearchFn:
+    """Bind a search mode to a case."""
+
+    async def run(query: str) -> list[SearchResult]:
+        if mode == FALLBACK:
+            return await service._keyword_search(
+                case_id, query, k=k, doc_types=None, min_score=0.0, language=language
+            )
+        return await service.search(case_id, query, k=k, language=language, mode=SearchMode(mode))
+
+    return run
+
+
+async def subject_queries(db: AsyncSession, case_id: UUID, language: str) -> list[LabelledQuery]:
+    """Use each document subject as a query for its own document."""
+    result = await db.execute(
+        select(Document.doc_id, Document.subject).where(
+            Document.case_id == case_id,
+            Document.language == language,
+            Document.subject.isnot(None),
+        )
+    )
+    return [LabelledQuery(row.subject, {row.doc_id}) for row in result if row.subject.strip()]
+
+
+def load_queries(path: Path) -> list[LabelledQuery]:
+    """Load labelled queries from a JSONL file."""
+    queries = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line.strip():
+            item = json.loads(line)
+            queries.append(LabelledQuery(item["query"], {UUID(d) for d in item["doc_ids"]}))
+    return queries
+
+
+def format_results(results: Sequence[ModeResult], k: int, queries: int) -> str:
+    """Render benchmark results as a Markdown table."""
+    lines = [
+        f"{queries} queries, k={k}",
+        "",
+        f"| mode | hit@{k} | MRR | p50 ms | p95 ms |",
+        "|---|---|---|---|---|",
+    ]
+    lines.extend(
+        f"| {r.mode} | {r.hit_rate:.3f} | {r.mrr:.3f} | {r.p50_ms:.2f} | {r.p95_ms:.2f} |"
+        for r in results
+    )
+    return "\n".join(lines)
+
+
+async def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--case-id", type=UUID, required=True)
+    parser.add_argument("--language", default="en")
+    parser.add_argument("-k", type=int, default=6)
+    parser.add_argument("--queries", type=Path, help="JSONL file of labelled queries")
+    parser.add_argument("--modes", default=",".join(MODES), help=f"Subset of {', '.join(MODES)}")
+    args = parser.parse_args()
+
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    unknown = set(modes) - set(MODES)
+    if unknown:
+        parser.error(f"unknown modes: {', '.join(sorted(unknown))}")
+
+    try:
+        async with async_session_maker() as db:
+            queries = (
+                load_queries(args.queries)
+                if args.queries
+                else await subject_queries(db, args.case_id, args.language)
+            )
+            service = SearchService(db)
+            results = [
+                await evaluate(
+                    mode,
+                    search_function(service, mode, args.case_id, args.k, args.language),
+                    queries,
+                )
+                for mode in modes
+            ]
+    finally:
+        await async_engine.dispose()
+
+    print(format_results(results, args.k, len(queries)))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,240 @@
+"""Benchmark pgvector index types for chunk search (recall@k and latency).
+
+Usage:
+    cd apps/api
+    uv run python -m src.scripts.benchmark_vector_index --rows 20000 --dim 256
+
+Vectors are loaded into a temporary table inside a transaction that is rolled
+back afterwards, so the benchmark never touches case data. Recall is measured
+against an exact (sequential scan) search over the same table.
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from src.config import settings
+
+TABLE = "bench_chunks"
+
+
+@dataclass
+class BenchmarkResult:
+    """Recall and latency for one index configuration."""
+
+    index: str
+    setting: str
+    recall: float
+    p50_ms: float
+    p95_ms: float
+    build_seconds: float = 0.0
+
+
+def recall_at_k(expected: Sequence[int], actual: Sequence[int]) -> float:
+    """Fraction of the exact top-k neighbours returned by the ANN search."""
+    if not expected:
+        return 1.0
+    return len(set(expected) & set(actual)) / len(expected)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of a sample."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def _vector_literal(values: Sequence[float]) -> str:
+    return "[" + ",".join(f"{v:.6f}" for v in values) + "]"
+
+
+def generate_vectors(
+    rows: int, dim: int, *, clusters: int = 50, seed: int = 42
+) -> tuple[list[str], random.Random]:
+    """Generate clustered vectors (closer to real embeddings than uniform noise)."""
+    rng = random.Random(seed)  # noqa: S311 - reproducible test data
+    centers = [[rng.gauss(0, 1) for _ in range(dim)] for _ in range(clusters)]
+    vectors = [
+        _vector_literal([c + rng.gauss(0, 0.3) for c in centers[i % clusters]]) for i in range(rows)
+    ]
+    return vectors, rng
+
+
+async def _load(conn: AsyncConnection, vectors: list[str], dim: int) -> None:
+    await conn.execute(
+        text(f"CREATE TEMP TABLE {TABLE} (id serial PRIMARY KEY, embedding vector({dim}))")
+    )
+    await conn.execute(
+        text(f"INSERT INTO {TABLE} (embedding) VALUES (CAST(:embedding AS vector))"),  # noqa: S608
+        [{"embedding": v} for v in vectors],
+    )
+    await conn.execute(text(f"ANALYZE {TABLE}"))
+
+
+async def _run_queries(
+    conn: AsyncConnection, queries: list[str], k: int
+) -> tuple[list[list[int]], list[float]]:
+    stmt = text(
+        f"SELECT id FROM {TABLE} ORDER BY embedding <=> CAST(:query AS vector) LIMIT :k"  # noqa: S608
+    )
+    neighbours: list[list[int]] = []
+    latencies: list[float] = []
+    for query in queries:
+        start = time.perf_counter()
+        result = await conn.execute(stmt, {"query": query, "k": k})
+        neighbours.append([row.id for row in result])
+        latencies.append((time.perf_counter() - start) * 1000)
+    return neighbours, latencies
+
+
+def _summarize(
+    index: str,
+    setting: str,
+    exact: list[list[int]],
+    found: list[list[int]],
+    latencies: list[float],
+    build_seconds: float = 0.0,
+) -> BenchmarkResult:
+    recall = sum(recall_at_k(e, f) for e, f in zip(exact, found, strict=True)) / len(exact)
+    return BenchmarkResult(
+        index=index,
+        setting=setting,
+        recall=recall,
+        p50_ms=percentile(latencies, 50),
+        p95_ms=percentile(latencies, 95),
+        build_seconds=build_seconds,
+    )
+
+
+async def run_benchmark(
+    conn: AsyncConnection,
+    *,
+    rows: int,
+    dim: int,
+    queries: int,
+    k: int,
+    lists: int,
+    probes_values: Sequence[int],
+    ef_search_values: Sequence[int],
+) -> list[BenchmarkResult]:
+    """Benchmark exact, IVFFlat and HNSW search on a scratch table.
+
+    The caller owns the transaction and should roll it back afterwards.
+    """
+    vectors, rng = generate_vectors(rows, dim)
+    await _load(conn, vectors, dim)
+    query_vectors = [
+        _vector_literal([float(x) + rng.gauss(0, 0.1) for x in v.strip("[]").split(",")])
+        for v in rng.sample(vectors, min(queries, rows))
+    ]
+
+    exact, latencies = await _run_queries(conn, query_vectors, k)
+    results = [_summarize("exact", "seq scan", exact, exact, latencies)]
+
+    await conn.execute(text("SET LOCAL enable_seqscan = off"))
+
+    start = time.perf_counter()
+    await conn.execute(
+        text(
+            f"CREATE INDEX bench_ivfflat ON {TABLE} "
+            f"USING ivfflat (embedding vector_cosine_ops) WITH (lists = {int(lists)})"
+        )
+    )
+    build = time.perf_counter() - start
+    for probes in probes_values:
+        await conn.execute(text(f"SET LOCAL ivfflat.probes = {int(probes)}"))
+        found, latencies = await _run_queries(conn, query_vectors, k)
+        results.append(
+            _summarize("ivfflat", f"lists={lists} probes={probes}", exact, found, latencies, build)
+        )
+    await conn.execute(text("DROP INDEX bench_ivfflat"))
+
+    start = time.perf_counter()
+    await conn.execute(
+        text(
+            f"CREATE INDEX bench_hnsw ON {TABLE} USING hnsw (embedding vector_cosine_ops) "
+            f"WITH (m = {int(settings.hnsw_m)}, "
+            f"ef_construction = {int(settings.hnsw_ef_construction)})"
+        )
+    )
+    build = time.perf_counter() - start
+    for ef_search in ef_search_values:
+        await conn.execute(text(f"SET LOCAL hnsw.ef_search = {int(max(ef_search, k))}"))
+        found, latencies = await _run_queries(conn, query_vectors, k)
+        results.append(
+            _summarize(
+                "hnsw",
+                f"m={settings.hnsw_m} ef_search={max(ef_search, k)}",
+                exact,
+                found,
+                latencies,
+                build,
+            )
+        )
+    await conn.execute(text("DROP INDEX bench_hnsw"))
+
+    return results
+
+
+def format_results(results: Sequence[BenchmarkResult], k: int) -> str:
+    """Render benchmark results as a Markdown table."""
+    lines = [
+        f"| index | setting | recall@{k} | p50 ms | p95 ms | build s |",
+        "|---|---|---|---|---|---|",
+    ]
+    lines.extend(
+        f"| {r.index} | {r.setting} | {r.recall:.3f} | {r.p50_ms:.2f} | {r.p95_ms:.2f} "
+        f"| {r.build_seconds:.2f} |"
+        for r in results
+    )
+    return "\n".join(lines)
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+async def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=settings.embedding_dimension)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=6)
+    parser.add_argument("--lists", type=int, default=100)
+    parser.add_argument("--probes", type=_int_list, default=[1, 10, 20])
+    parser.add_argument("--ef-search", type=_int_list, default=[20, 40, 100])
+    args = parser.parse_args()
+
+    engine = create_async_engine(settings.database_url)
+    try:
+        async with engine.connect() as conn:
+            results = await run_benchmark(
+                conn,
+                rows=args.rows,
+                dim=args.dim,
+                queries=args.queries,
+                k=args.k,
+                lists=args.lists,
+                probes_values=args.probes,
+                ef_search_values=args.ef_search,
+            )
+            await conn.rollback()
+    finally:
+        await engine.dispose()
+
+    print(f"{args.rows} vectors x {args.dim} dims, {args.queries} queries\n")
+    print(format_results(results, args.k))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -3,6 +3,7 @@
 from src.services.auth_service import AuthService
 from src.services.case_service import CaseService
 from src.services.chunking_service import ChunkingService
+from src.services.conversation_service import ConversationService
 from src.services.document_service import DocumentService
 from src.services.embedding_service import EmbeddingService
 from src.services.entity_service import EntityService
@@ -14,6 +15,7 @@ __all__ = [
     "AuthService",
     "CaseService",
     "ChunkingService",
+    "ConversationService",
     "DocumentService",
     "EmbeddingService",
     "EntityService",
@@ -1,31 +1,40 @@
 """Agent service for orchestrating ARIA agent."""
 
 import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing
 from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID, uuid4
 
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
-from neo4j import AsyncSession as Neo4jAsyncSession
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from neo4j import AsyncDriver
 from openai import APIError as OpenAIAPIError
 from openai import AuthenticationError as OpenAIAuthenticationError
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from src.agent.graph import create_aria_graph, get_system_message
-from src.agent.tools import (
-    create_get_document_tool,
-    create_get_entity_tool,
-    create_graph_query_tool,
-    create_search_docs_tool,
-)
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.agent.graph import get_aria_graph, get_system_message
+from src.agent.tool_cache import get_tool_result_cache
+from src.agent.tools import ToolContext, get_aria_tools
 from src.config import settings
-from src.schemas.chat import ChatRequest, ChatResponse, Citation
-from src.services.document_service import DocumentService
+from src.models import Case
+from src.schemas.chat import ChatRequest, ChatResponse, ChatStreamEvent, Citation
+from src.services.conversation_service import ConversationService
+from src.services.embedding_cache import normalize_query
 from src.services.embedding_service import EmbeddingService
-from src.services.entity_service import EntityService
-from src.services.graph_service import GraphService
-from src.services.search_service import SearchService
+from src.services.provider_governor import ProviderUnavailableError, get_provider_governor
+from src.services.response_cache import ResponseCache, get_response_cache
 
 if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableConfig
+    from langgraph.graph.state import CompiledStateGraph
+
     from src.agent.state import ARIAState
 
 
@@ -35,25 +44,29 @@ class AgentService:
     def __init__(
         self,
         db: AsyncSession,
-        neo4j: Neo4jAsyncSession | None = None,
+        neo4j_driver: AsyncDriver | None = None,
         embedding_service: EmbeddingService | None = None,
+        session_maker: async_sessionmaker[AsyncSession] | None = None,
     ) -> None:
         """Initialize agent service.
 
         Args:
             db: PostgreSQL database session
-            neo4j: Optional Neo4j session for graph queries
+            neo4j_driver: Optional Neo4j driver; graph tool calls open their own sessions
             embedding_service: Optional embedding service (creates default if None)
+            session_maker: Session factory for agent tools, which run
+                concurrently and so cannot share ``db`` (defaults to the app pool)
         """
+        if session_maker is None:
+            from src.db.session import async_session_maker
+
+            session_maker = async_session_maker
+
         self.db = db
-        self.neo4j = neo4j
+        self.neo4j_driver = neo4j_driver
         self.embedding_service = embedding_service or EmbeddingService()
-
-        # Initialize services
-        self.search_service = SearchService(db, self.embedding_service)
-        self.document_service = DocumentService(db)
-        self.entity_service = EntityService(db)
-        self.graph_service = GraphService(neo4j, db) if neo4j else None
+        self.session_maker = session_maker
+        self.conversations = ConversationService(db)
 
     async def chat(
         self,
@@ -61,69 +74,63 @@ class AgentService:
         request: ChatRequest,
         hint_budget: int = 3,
         language: str = "en",
+        user_id: UUID | None = None,
     ) -> ChatResponse:
         """Process a chat message and return ARIA's response.
 
+        When the request names an existing conversation, its stored history
+        is sent ahead of the message, and the turn is added to it afterwards.
+        The opening question of a conversation is first looked up in the
+        response cache, and a near-duplicate of an earlier question about
+        the case is answered from there without calling the model.
+
         Args:
             case_id: Case ID being investigated
             request: Chat request with user message
             hint_budget: Remaining hints for this session
             language: Language for response and search (default "en")
+            user_id: Player asking; conversations are private to their owner
 
         Returns:
             ChatResponse with agent message and citations
         """
-        # Create tools bound to this case and language
-        tools = [
-            create_search_docs_tool(self.search_service, case_id, language=language),
-            create_get_document_tool(self.document_service, case_id),
-            create_get_entity_tool(self.entity_service, case_id),
-        ]
-
-        # Add graph tool if Neo4j is available
-        if self.graph_service:
-            tools.append(create_graph_query_tool(self.graph_service, case_id))
-
-        def build_initial_state() -> "ARIAState":
-            return cast(
-                "ARIAState",
-                {
-                    "case_id": case_id,
-                    "language": language,
-                    "messages": [
-                        SystemMessage(content=get_system_message(language)),
-                        HumanMessage(content=request.message),
-                    ],
-                    "retrieved_chunks": [],
-                    "citations": [],
-                    "hint_budget": hint_budget,
-                },
+        tools = get_aria_tools(include_graph=self.neo4j_driver is not None)
+        conversation_id = request.conversation_id or uuid4()
+        config = self._tool_context(case_id, language, conversation_id).as_config()
+        history = await self._load_history(case_id, request, user_id)
+        initial_state = self._build_initial_state(case_id, request, hint_budget, language, history)
+        question_embedding = await self._question_embedding(initial_state)
+        ingest_version = await self._ingest_version(case_id, question_embedding)
+        cached = self._cached_response(initial_state, question_embedding, ingest_version)
+        if cached is not None:
+            await self._save_turn(
+                conversation_id, initial_state, [AIMessage(content=cached.message)], user_id
             )
-
-        primary_provider = settings.normalized_provider()
-        provider_order = [primary_provider]
-        fallback_provider = settings.llm_fallback_provider.strip().lower()
-        if (
-            fallback_provider
-            and fallback_provider != primary_provider
-            and settings.provider_is_configured(fallback_provider)
-        ):
-            provider_order.append(fallback_provider)
+            return cached.model_copy(update={"conversation_id": conversation_id})
 
         result: dict[str, Any] | None = None
+        answered_by = ""
         last_error: Exception | None = None
         timeout_seconds = max(settings.llm_request_timeout_seconds, 0.0)
 
-        for provider in provider_order:
+        for provider in self._provider_order():
             try:
-                agent = create_aria_graph(tools, provider=provider)
-                initial_state = build_initial_state()
+                agent = get_aria_graph(tools, provider=provider)
                 if timeout_seconds > 0:
-                    result = await asyncio.wait_for(agent.ainvoke(initial_state), timeout_seconds)
+                    result = await asyncio.wait_for(
+                        agent.ainvoke(initial_state, config), timeout_seconds
+                    )
                 else:
-                    result = await agent.ainvoke(initial_state)
+                    result = await agent.ainvoke(initial_state, config)
+                answered_by = provider
                 break
-            except (OpenAIAuthenticationError, OpenAIAPIError, asyncio.TimeoutError) as exc:
+            except (
+                TimeoutError,
+                OpenAIAuthenticationError,
+                OpenAIAPIError,
+                ProviderUnavailableError,
+            ) as exc:
+                self._record_timeout(provider, exc)
                 last_error = exc
                 continue
 
@@ -132,9 +139,375 @@ class AgentService:
                 raise last_error
             raise RuntimeError("ARIA agent failed without an explicit provider error")
 
+        turn = await self._save_turn(conversation_id, initial_state, result["messages"], user_id)
+        response = self._build_response(turn, conversation_id)
+        self._cache_response(
+            initial_state, answered_by, question_embedding, ingest_version, turn, response
+        )
+        return response
+
+    async def stream_chat(
+        self,
+        case_id: UUID,
+        request: ChatRequest,
+        hint_budget: int = 3,
+        language: str = "en",
+        user_id: UUID | None = None,
+    ) -> AsyncIterator[ChatStreamEvent]:
+        """Process a chat message, yielding ARIA's response as it is produced.
+
+        A ``start`` event is yielded before the model is called, followed by
+        answer tokens, tool call starts/ends and citations as the agent loop
+        runs, and a final ``done`` event with the same payload ``chat``
+        returns. A provider that fails before producing any output is
+        replaced by the fallback provider, as in ``chat``; once output has
+        been streamed the error is raised. A cached answer is sent as its
+        citations, a single token event and ``done``.
+
+        Args:
+            case_id: Case ID being investigated
+            request: Chat request with user message
+            hint_budget: Remaining hints for this session
+            language: Language for response and search (default "en")
+            user_id: Player asking; conversations are private to their owner
+
+        Yields:
+            ChatStreamEvent items
+
+        Raises:
+            TimeoutError: If the agent produces no event within the
+                LLM request timeout
+        """
+        conversation_id = request.conversation_id or uuid4()
+        yield ChatStreamEvent(event="start", data={"conversation_id": str(conversation_id)})
+
+        tools = get_aria_tools(include_graph=self.neo4j_driver is not None)
+        config = self._tool_context(case_id, language, conversation_id).as_config()
+        history = await self._load_history(case_id, request, user_id)
+        initial_state = self._build_initial_state(case_id, request, hint_budget, language, history)
+        question_embedding = await self._question_embedding(initial_state)
+        ingest_version = await self._ingest_version(case_id, question_embedding)
+        cached = self._cached_response(initial_state, question_embedding, ingest_version)
+        if cached is not None:
+            await self._save_turn(
+                conversation_id, initial_state, [AIMessage(content=cached.message)], user_id
+            )
+            response = cached.model_copy(update={"conversation_id": conversation_id})
+            for citation in response.citations:
+                yield ChatStreamEvent(event="citation", data=citation.model_dump(mode="json"))
+            yield ChatStreamEvent(event="token", data={"content": response.message})
+            yield ChatStreamEvent(event="done", data=response.model_dump(mode="json"))
+            return
+
+        last_error: Exception | None = None
+
+        for provider in self._provider_order():
+            agent = get_aria_graph(tools, provider=provider)
+            streamed = False
+            try:
+                async for event in self._stream_agent_events(
+                    agent,
+                    initial_state,
+                    config,
+                    conversation_id,
+                    provider,
+                    question_embedding,
+                    ingest_version,
+                    user_id,
+                ):
+                    streamed = True
+                    yield event
+            except (
+                TimeoutError,
+                OpenAIAuthenticationError,
+                OpenAIAPIError,
+                ProviderUnavailableError,
+            ) as exc:
+                self._record_timeout(provider, exc)
+                if streamed:
+                    raise
+                last_error = exc
+                continue
+            return
+
+        if last_error:
+            raise last_error
+        raise RuntimeError("ARIA agent failed without an explicit provider error")
+
+    async def _stream_agent_events(
+        self,
+        agent: "CompiledStateGraph[Any]",
+        initial_state: "ARIAState",
+        config: "RunnableConfig",
+        conversation_id: UUID,
+        provider: str,
+        question_embedding: list[float] | None,
+        ingest_version: str,
+        user_id: UUID | None,
+    ) -> AsyncIterator[ChatStreamEvent]:
+        """Translate LangGraph ``astream_events`` into chat stream events.
+
+        Args:
+            agent: Compiled ARIA graph
+            initial_state: State to run the graph from
+            config: Run config carrying the tool context
+            conversation_id: Conversation ID for the final response
+            provider: Provider running the graph
+            question_embedding: Embedding the answer is cached under, if any
+            ingest_version: Case ingest version the answer is cached under
+            user_id: Player who owns the conversation
+
+        Yields:
+            ChatStreamEvent items, ending with ``done``
+        """
+        timeout_seconds = max(settings.llm_request_timeout_seconds, 0.0)
+        seen_doc_ids: set[str] = set()
+        final_messages: list[Any] | None = None
+
+        stream = cast(
+            "AsyncGenerator[dict[str, Any], None]",
+            agent.astream_events(initial_state, config, version="v2"),
+        )
+        async with aclosing(stream) as events:
+            while True:
+                try:
+                    if timeout_seconds > 0:
+                        event = await asyncio.wait_for(anext(events), timeout_seconds)
+                    else:
+                        event = await anext(events)
+                except StopAsyncIteration:
+                    break
+
+                kind = event["event"]
+                data = event["data"]
+                if kind == "on_chat_model_stream":
+                    # Only the agent node's model writes the answer
+                    if event["metadata"].get("langgraph_node") != "agent":
+                        continue
+                    content = getattr(data.get("chunk"), "content", None)
+                    if isinstance(content, str) and content:
+                        yield ChatStreamEvent(event="token", data={"content": content})
+                elif kind == "on_tool_start":
+                    yield ChatStreamEvent(
+                        event="tool_start",
+                        data={
+                            "run_id": event["run_id"],
+                            "name": event["name"],
+                            "input": data.get("input"),
+                        },
+                    )
+                elif kind == "on_tool_end":
+                    yield ChatStreamEvent(
+                        event="tool_end", data={"run_id": event["run_id"], "name": event["name"]}
+                    )
+                    for citation in self._extract_citations([data.get("output")], seen_doc_ids):
+                        yield ChatStreamEvent(
+                            event="citation", data=citation.model_dump(mode="json")
+                        )
+                elif kind == "on_chain_end" and not event.get("parent_ids"):
+                    output = data.get("output")
+                    if isinstance(output, dict):
+                        final_messages = output.get("messages")
+
+        turn = await self._save_turn(conversation_id, initial_state, final_messages or [], user_id)
+        response = self._build_response(turn, conversation_id)
+        self._cache_response(
+            initial_state, provider, question_embedding, ingest_version, turn, response
+        )
+        yield ChatStreamEvent(event="done", data=response.model_dump(mode="json"))
+
+    def _tool_context(self, case_id: UUID, language: str, conversation_id: UUID) -> ToolContext:
+        """Bind the agent tools to a case, language and conversation.
+
+        Args:
+            case_id: Case ID being investigated
+            language: Language for search
+            conversation_id: Conversation whose tool results are memoized
+
+        Returns:
+            ToolContext passed to the graph through the run config
+        """
+        return ToolContext(
+            case_id=case_id,
+            session_maker=self.session_maker,
+            embedding_service=self.embedding_service,
+            neo4j_driver=self.neo4j_driver,
+            language=language,
+            conversation_id=conversation_id,
+            cache=get_tool_result_cache(),
+        )
+
+    async def _load_history(
+        self, case_id: UUID, request: ChatRequest, user_id: UUID | None
+    ) -> list[BaseMessage]:
+        """Stored history of the request's conversation (empty for a new one)."""
+        if request.conversation_id is None:
+            return []
+        return await self.conversations.load_history(request.conversation_id, case_id, user_id)
+
+    async def _save_turn(
+        self,
+        conversation_id: UUID,
+        initial_state: "ARIAState",
+        messages: list[Any],
+        user_id: UUID | None,
+    ) -> list[Any]:
+        """Store the conversation with its latest turn appended.
+
+        Args:
+            conversation_id: Conversation ID
+            initial_state: Graph input (system prompt, history, user message)
+            messages: Final graph messages
+            user_id: Player who owns the conversation
+
+        Returns:
+            The messages produced for the latest user message
+        """
+        turn = self._latest_turn(messages)
+        await self.conversations.save_history(
+            conversation_id,
+            initial_state["case_id"],
+            [*initial_state["messages"][1:], *turn],
+            user_id,
+        )
+        return turn
+
+    async def _question_embedding(self, initial_state: "ARIAState") -> list[float] | None:
+        """Embedding of an opening question for the response cache.
+
+        Returns:
+            The normalized question's embedding, or None if the cache is
+            disabled, the conversation has history (follow-ups depend on it)
+            or the embedding provider is unavailable
+        """
+        messages = initial_state["messages"]
+        if get_response_cache() is None or len(messages) > 2:
+            return None
+        question = messages[-1].content
+        try:
+            return await self.embedding_service.embed_query(normalize_query(str(question)))
+        except (OpenAIAPIError, ProviderUnavailableError):
+            return None
+
+    async def _ingest_version(self, case_id: UUID, question_embedding: list[float] | None) -> str:
+        """Version of the case's ingested content that cached answers are scoped to.
+
+        Only looked up when the question can be answered from the cache.
+        """
+        if question_embedding is None:
+            return ""
+        result = await self.db.execute(select(Case.ingested_at).where(Case.case_id == case_id))
+        ingested_at = result.scalar_one_or_none()
+        return ingested_at.isoformat() if ingested_at is not None else ""
+
+    def _cached_response(
+        self,
+        initial_state: "ARIAState",
+        question_embedding: list[float] | None,
+        ingest_version: str,
+    ) -> ChatResponse | None:
+        """Cached answer from the primary provider to a near-duplicate question."""
+        cache = get_response_cache()
+        if cache is None or question_embedding is None:
+            return None
+        scope = ResponseCache.scope(
+            initial_state["case_id"],
+            initial_state["language"],
+            self._provider_order()[0],
+            ingest_version,
+        )
+        return cache.get(scope, question_embedding)
+
+    def _cache_response(
+        self,
+        initial_state: "ARIAState",
+        provider: str,
+        question_embedding: list[float] | None,
+        ingest_version: str,
+        turn: list[Any],
+        response: ChatResponse,
+    ) -> None:
+        """Cache the answer to an opening question (only if the model answered)."""
+        cache = get_response_cache()
+        if cache is None or question_embedding is None or not self._get_last_ai_message(turn):
+            return
+        scope = ResponseCache.scope(
+            initial_state["case_id"], initial_state["language"], provider, ingest_version
+        )
+        question = str(initial_state["messages"][-1].content)
+        cache.set(scope, question, question_embedding, response)
+
+    def _latest_turn(self, messages: list[Any]) -> list[Any]:
+        """Messages after the last user message (all of them if there is none)."""
+        for index in range(len(messages) - 1, -1, -1):
+            if isinstance(messages[index], HumanMessage):
+                return messages[index + 1 :]
+        return messages
+
+    def _build_initial_state(
+        self,
+        case_id: UUID,
+        request: ChatRequest,
+        hint_budget: int,
+        language: str,
+        history: list[BaseMessage] | None = None,
+    ) -> "ARIAState":
+        """Build the graph input for a chat message."""
+        return cast(
+            "ARIAState",
+            {
+                "case_id": case_id,
+                "language": language,
+                "messages": [
+                    SystemMessage(content=get_system_message(language)),
+                    *(history or []),
+                    HumanMessage(content=request.message),
+                ],
+                "retrieved_chunks": [],
+                "citations": [],
+                "hint_budget": hint_budget,
+            },
+        )
+
+    def _provider_order(self) -> list[str]:
+        """Providers to try in order: the primary, then a configured fallback.
+
+        A provider whose circuit breaker is open is moved last, so while the
+        primary is failing requests go straight to the fallback.
+        """
+        primary_provider = settings.normalized_provider()
+        provider_order = [primary_provider]
+        fallback_provider = settings.llm_fallback_provider.strip().lower()
+        if (
+            fallback_provider
+            and fallback_provider != primary_provider
+            and settings.provider_is_configured(fallback_provider)
+        ):
+            provider_order.append(fallback_provider)
+        return sorted(provider_order, key=lambda p: not get_provider_governor(p).available)
+
+    def _record_timeout(self, provider: str, exc: Exception) -> None:
+        """Count a timed-out agent run against the provider's circuit breaker.
+
+        Other provider errors are recorded where the model is called; a
+        timeout cancels that call instead.
+        """
+        if isinstance(exc, TimeoutError):
+            get_provider_governor(provider).breaker.record_failure()
+
+    def _build_response(self, messages: list[Any], conversation_id: UUID) -> ChatResponse:
+        """Build the chat response from the final conversation messages.
+
+        Args:
+            messages: Final graph messages
+            conversation_id: Conversation ID
+
+        Returns:
+            ChatResponse with agent message and citations
+        """
         # Extract response and citations
-        last_message = self._get_last_ai_message(result["messages"])
-        citations = self._extract_citations(result["messages"])
+        last_message = self._get_last_ai_message(messages)
+        citations = self._extract_citations(messages)
 
         # Get content as string
         content = "I could not process your request."
@@ -145,8 +518,8 @@ class AgentService:
         return ChatResponse(
             message=content,
             citations=citations,
-            conversation_id=request.conversation_id or uuid4(),
-            suggested_actions=self._suggest_next_actions(result["messages"]),
+            conversation_id=conversation_id,
+            suggested_actions=self._suggest_next_actions(messages),
         )
 
     def _get_last_ai_message(self, messages: list[Any]) -> AIMessage | None:
@@ -163,17 +536,22 @@ class AgentService:
                 return msg
         return None
 
-    def _extract_citations(self, messages: list[Any]) -> list[Citation]:
+    def _extract_citations(
+        self, messages: list[Any], seen_doc_ids: set[str] | None = None
+    ) -> list[Citation]:
         """Extract citations from tool call results.
 
         Args:
             messages: List of conversation messages
+            seen_doc_ids: Doc IDs already cited, updated in place (for
+                incremental extraction)
 
         Returns:
             List of Citation objects
         """
         citations: list[Citation] = []
-        seen_doc_ids: set[str] = set()
+        if seen_doc_ids is None:
+            seen_doc_ids = set()
 
         for msg in messages:
             if isinstance(msg, ToolMessage):
@@ -242,7 +620,7 @@ class AgentService:
         if "search_docs" not in tools_used:
             suggestions.append("Try searching for specific keywords or topics")
 
-        if "graph_query" not in tools_used and self.graph_service:
+        if "graph_query" not in tools_used and self.neo4j_driver:
             suggestions.append("Explore entity relationships in the knowledge graph")
 
         if "get_entity" not in tools_used:
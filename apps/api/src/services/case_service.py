@@ -2,10 +2,11 @@
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.case import Case
+from src.models.document import Document, Entity
 from src.schemas.case import CaseCreate
 
 
@@ -32,6 +33,40 @@ class CaseService:
         )
         return list(result.scalars().all())
 
+    async def list_with_counts(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> list[tuple[Case, int, int]]:
+        """List a page of cases with their document and entity counts.
+
+        The counts are correlated subqueries in the select list, which
+        PostgreSQL evaluates after ORDER BY/LIMIT, so one query counts only
+        the cases on the page (via the case_id indexes).
+
+        Returns:
+            (case, document_count, entity_count) tuples, newest first
+        """
+        document_count = (
+            select(func.count(Document.doc_id))
+            .where(Document.case_id == Case.case_id)
+            .correlate(Case)
+            .scalar_subquery()
+        )
+        entity_count = (
+            select(func.count(Entity.entity_id))
+            .where(Entity.case_id == Case.case_id)
+            .correlate(Case)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            select(Case, document_count, entity_count)
+            .order_by(Case.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return [(case, documents, entities) for case, documents, entities in result.all()]
+
     async def create(self, data: CaseCreate) -> Case:
         """Create a new case."""
         case = Case(
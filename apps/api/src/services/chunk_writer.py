@@ -0,0 +1,135 @@
+"""Bulk persistence of document chunks."""
+
+import json
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from pgvector import Vector
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.models.document import DocChunk
+
+logger = logging.getLogger(__name__)
+
+# Columns written by COPY; chunk_id is filled by its server default.
+COPY_COLUMNS = (
+    "doc_id",
+    "case_id",
+    "chunk_index",
+    "text",
+    "embedding",
+    "language",
+    "meta_json",
+)
+
+
+@dataclass
+class ChunkRow:
+    """Plain chunk payload, written without instantiating ORM objects."""
+
+    doc_id: UUID
+    case_id: UUID
+    chunk_index: int
+    text: str
+    embedding: list[float] | None
+    language: str
+    meta_json: dict[str, Any] = field(default_factory=dict)
+
+    def to_record(self) -> tuple[Any, ...]:
+        """Return the row as a COPY record aligned with ``COPY_COLUMNS``."""
+        return (
+            self.doc_id,
+            self.case_id,
+            self.chunk_index,
+            self.text,
+            self.embedding,
+            self.language,
+            json.dumps(self.meta_json),
+        )
+
+    def to_model(self) -> DocChunk:
+        """Return the row as a DocChunk ORM instance."""
+        return DocChunk(
+            doc_id=self.doc_id,
+            case_id=self.case_id,
+            chunk_index=self.chunk_index,
+            text=self.text,
+            embedding=self.embedding,
+            language=self.language,
+            meta_json=self.meta_json,
+        )
+
+
+class ChunkWriter:
+    """Write chunk rows through the session's transaction.
+
+    Batches at or above ``bulk_threshold`` rows are streamed with asyncpg's
+    binary COPY protocol; smaller batches (and non-asyncpg connections) use
+    the ORM ``add_all`` + ``flush`` path.
+    """
+
+    def __init__(self, db: AsyncSession, bulk_threshold: int | None = None) -> None:
+        """Initialize chunk writer.
+
+        Args:
+            db: Database session whose transaction receives the rows
+            bulk_threshold: Minimum rows for the COPY path (0 disables it)
+        """
+        self.db = db
+        self.bulk_threshold = (
+            settings.chunk_bulk_write_threshold if bulk_threshold is None else bulk_threshold
+        )
+
+    async def write(self, rows: Sequence[ChunkRow]) -> int:
+        """Persist chunk rows.
+
+        Args:
+            rows: Chunks to insert
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+        if 0 < self.bulk_threshold <= len(rows) and await self._copy(rows):
+            return len(rows)
+
+        self.db.add_all([row.to_model() for row in rows])
+        await self.db.flush()
+        return len(rows)
+
+    async def _copy(self, rows: Sequence[ChunkRow]) -> bool:
+        """Stream rows with COPY, returning False if the driver does not support it."""
+        connection = await self.db.connection()
+        raw = await connection.get_raw_connection()
+        driver_connection = raw.driver_connection
+        if driver_connection is None or not hasattr(driver_connection, "copy_records_to_table"):
+            return False
+
+        # Pending ORM changes (e.g. deletes of replaced chunks) must reach the
+        # server before the COPY runs on the same connection.
+        await self.db.flush()
+
+        # The binary vector codec is only installed for the duration of the
+        # COPY: SQLAlchemy's pgvector type binds vectors as text on this
+        # pooled connection and must keep seeing the default codec.
+        await driver_connection.set_type_codec(
+            "vector",
+            encoder=lambda value: Vector(value).to_binary(),
+            decoder=Vector.from_binary,
+            format="binary",
+        )
+        try:
+            await driver_connection.copy_records_to_table(
+                DocChunk.__tablename__,
+                records=[row.to_record() for row in rows],
+                columns=COPY_COLUMNS,
+            )
+        finally:
+            await driver_connection.reset_type_codec("vector")
+        logger.debug("Copied %d chunks into %s", len(rows), DocChunk.__tablename__)
+        return True
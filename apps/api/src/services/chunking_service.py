@@ -25,6 +25,11 @@ class ChunkResult:
     meta_json: dict[str, str | int | None]
 
 
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token) for budgeting text."""
+    return max(1, (len(text) + 3) // 4)
+
+
 class ChunkingService:
     """Service for chunking documents into smaller pieces for RAG."""
 
@@ -38,6 +43,12 @@ class ChunkingService:
             length_function=len,
         )
 
+    @property
+    def config_key(self) -> str:
+        """Stable identifier of the chunking configuration (used in ingestion fingerprints)."""
+        config = self.config
+        return f"{config.chunk_size}:{config.chunk_overlap}:{config.separators!r}"
+
     def chunk_document(self, doc: Document) -> list[ChunkResult]:
         """Split a document into chunks with metadata.
 
@@ -0,0 +1,109 @@
+"""Persistent ARIA conversation history."""
+
+from collections.abc import Sequence
+from uuid import UUID
+
+from langchain_core.messages import BaseMessage, messages_from_dict, messages_to_dict
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.agent.memory import compact_history
+from src.config import settings
+from src.models import Conversation
+
+
+class ConversationService:
+    """Loads and stores the compacted message history of ARIA conversations.
+
+    Histories are compacted to ``chat_history_max_tokens`` when saved, so a
+    follow-up turn carries the previous answers and (summarized) tool results
+    without re-running the searches that produced them.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """Initialize conversation service.
+
+        Args:
+            db: Database session
+        """
+        self.db = db
+
+    @property
+    def enabled(self) -> bool:
+        """Whether conversation history is kept at all."""
+        return settings.chat_history_max_tokens > 0
+
+    async def load_history(
+        self,
+        conversation_id: UUID,
+        case_id: UUID,
+        user_id: UUID | None = None,
+    ) -> list[BaseMessage]:
+        """Get the stored history of a conversation.
+
+        Args:
+            conversation_id: Conversation ID
+            case_id: Case the conversation must belong to
+            user_id: User the conversation must belong to (None for anonymous)
+
+        Returns:
+            Messages oldest first; empty for unknown conversations and for
+            conversations about another case or owned by someone else
+        """
+        if not self.enabled:
+            return []
+        result = await self.db.execute(
+            select(Conversation.messages_json).where(
+                Conversation.conversation_id == conversation_id,
+                Conversation.case_id == case_id,
+                Conversation.user_id.is_not_distinct_from(user_id),
+            )
+        )
+        stored = result.scalar_one_or_none()
+        return messages_from_dict(stored) if stored else []
+
+    async def save_history(
+        self,
+        conversation_id: UUID,
+        case_id: UUID,
+        messages: Sequence[BaseMessage],
+        user_id: UUID | None = None,
+    ) -> list[BaseMessage]:
+        """Compact and store the history of a conversation, then commit.
+
+        A conversation ID already used for another case or by another user
+        is left untouched.
+
+        Args:
+            conversation_id: Conversation ID
+            case_id: Case being investigated
+            messages: Full history including the latest turn
+            user_id: User having the conversation (None for anonymous)
+
+        Returns:
+            The compacted messages that were stored
+        """
+        if not self.enabled:
+            return []
+        compacted = compact_history(
+            messages,
+            max_tokens=settings.chat_history_max_tokens,
+            recent_turns=settings.chat_history_recent_turns,
+        )
+        messages_json = messages_to_dict(compacted)
+        stmt = insert(Conversation).values(
+            conversation_id=conversation_id,
+            case_id=case_id,
+            user_id=user_id,
+            messages_json=messages_json,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Conversation.conversation_id],
+            set_={"messages_json": stmt.excluded.messages_json, "updated_at": func.now()},
+            where=(Conversation.case_id == case_id)
+            & Conversation.user_id.is_not_distinct_from(user_id),
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
+        return compacted
@@ -1,14 +1,68 @@
 """Document service for business logic."""
 
+import base64
+import binascii
+from datetime import datetime
+from enum import StrEnum
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload, with_expression
 
 from src.models.document import DocChunk, DocType, Document
 from src.schemas.document import DocumentCreate
 
+# Characters of body text returned as a document's snippet
+SNIPPET_LENGTH = 200
+
+# Columns loaded for the summary view
+SUMMARY_COLUMNS = (
+    Document.doc_id,
+    Document.case_id,
+    Document.doc_type,
+    Document.ts,
+    Document.author_entity_id,
+    Document.subject,
+    Document.language,
+    Document.created_at,
+    Document.updated_at,
+)
+
+
+class DocumentView(StrEnum):
+    """How much of each document a listing returns."""
+
+    full = "full"
+    summary = "summary"
+
+
+def _snippet_expression() -> ColumnElement[str]:
+    """Whitespace-collapsed start of the body, computed by the database."""
+    head = func.left(Document.body, SNIPPET_LENGTH * 2)
+    return func.left(func.btrim(func.regexp_replace(head, r"\s+", " ", "g")), SNIPPET_LENGTH)
+
+
+def encode_cursor(document: Document) -> str:
+    """Opaque keyset cursor for the page after ``document``."""
+    key = f"{document.ts.isoformat()}|{document.doc_id}"
+    return base64.urlsafe_b64encode(key.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor from ``encode_cursor`` into its (ts, doc_id) key.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        key = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        ts, doc_id = key.split("|")
+        return datetime.fromisoformat(ts), UUID(doc_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        msg = "Invalid cursor"
+        raise ValueError(msg) from e
+
 
 class DocumentService:
     """Service for document-related operations."""
@@ -35,16 +89,59 @@ class DocumentService:
         skip: int = 0,
         limit: int = 50,
         doc_type: DocType | None = None,
-    ) -> list[Document]:
-        """List documents for a case with pagination."""
-        stmt = select(Document).where(Document.case_id == case_id)
+        *,
+        after: tuple[datetime, UUID] | None = None,
+        view: DocumentView = DocumentView.full,
+    ) -> list[tuple[Document, int]]:
+        """List a page of documents for a case with their chunk counts.
+
+        Documents are ordered newest first by (ts, doc_id). Passing the last
+        row's key as ``after`` seeks straight to the next page through the
+        (case_id[, doc_type], ts, doc_id) indexes, so deep pages cost the
+        same as the first; ``skip`` still works but scans the skipped rows.
+        Chunk counts are grouped over the page's documents only and joined
+        in the same query.
+
+        The summary view loads only the listing columns plus a snippet of
+        the body cut by the database, leaving ``body`` and ``metadata_json``
+        unloaded (accessing them afterwards is an error in async code).
+
+        Returns:
+            (document, chunk_count) tuples
+        """
+        stmt = select(Document.doc_id, Document.ts).where(Document.case_id == case_id)
 
         if doc_type is not None:
             stmt = stmt.where(Document.doc_type == doc_type)
-
-        stmt = stmt.order_by(Document.ts.desc()).offset(skip).limit(limit)
-        result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        if after is not None:
+            stmt = stmt.where(tuple_(Document.ts, Document.doc_id) < tuple_(*after))
+
+        page = (
+            stmt.order_by(Document.ts.desc(), Document.doc_id.desc())
+            .offset(skip)
+            .limit(limit)
+            .cte("page")
+        )
+        chunk_counts = (
+            select(DocChunk.doc_id, func.count().label("chunk_count"))
+            .where(DocChunk.doc_id.in_(select(page.c.doc_id)))
+            .group_by(DocChunk.doc_id)
+            .subquery("chunk_counts")
+        )
+        query = (
+            select(Document, func.coalesce(chunk_counts.c.chunk_count, 0))
+            .join(page, page.c.doc_id == Document.doc_id)
+            .outerjoin(chunk_counts, chunk_counts.c.doc_id == Document.doc_id)
+            .order_by(page.c.ts.desc(), page.c.doc_id.desc())
+        )
+        if view is DocumentView.summary:
+            query = query.options(
+                load_only(*SUMMARY_COLUMNS),
+                with_expression(Document.snippet, _snippet_expression()),
+            ).execution_options(populate_existing=True)
+
+        result = await self.db.execute(query)
+        return [(document, chunk_count) for document, chunk_count in result.all()]
 
     async def count_by_case(
         self,
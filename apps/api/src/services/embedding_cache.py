@@ -0,0 +1,372 @@
+"""Content-addressed embedding cache with pluggable backends."""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import Protocol
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.models.embedding_cache import EmbeddingCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+def hash_text(text: str) -> str:
+    """Return the sha256 hex digest used as the content address of a text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Hit/miss counters for an embedding cache."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class EmbeddingCacheBackend(Protocol):
+    """Storage backend for content-addressed embeddings."""
+
+    name: str
+
+    async def get_many(
+        self, model: str, dimension: int, text_hashes: Sequence[str]
+    ) -> dict[str, list[float]]:
+        """Return cached embeddings for the given hashes (missing hashes are omitted)."""
+        ...
+
+    async def set_many(self, model: str, dimension: int, items: dict[str, list[float]]) -> None:
+        """Store embeddings keyed by text hash."""
+        ...
+
+
+class InMemoryEmbeddingCacheBackend:
+    """Bounded in-process LRU backend."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self.max_entries = max(max_entries, 0)
+        self._entries: OrderedDict[tuple[str, int, str], list[float]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_many(
+        self, model: str, dimension: int, text_hashes: Sequence[str]
+    ) -> dict[str, list[float]]:
+        """Return cached embeddings and mark them as recently used."""
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for text_hash in text_hashes:
+                key = (model, dimension, text_hash)
+                embedding = self._entries.get(key)
+                if embedding is not None:
+                    self._entries.move_to_end(key)
+                    found[text_hash] = embedding
+        return found
+
+    async def set_many(self, model: str, dimension: int, items: dict[str, list[float]]) -> None:
+        """Store embeddings, evicting least recently used entries beyond capacity."""
+        if self.max_entries == 0:
+            return
+        with self._lock:
+            for text_hash, embedding in items.items():
+                key = (model, dimension, text_hash)
+                self._entries[key] = embedding
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class PostgresEmbeddingCacheBackend:
+    """Persistent backend stored in the ``embedding_cache`` table.
+
+    Uses its own short-lived sessions so cache reads/writes never join (or
+    roll back with) the caller's ingestion transaction.
+    """
+
+    name = "postgres"
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession]) -> None:
+        self.session_maker = session_maker
+
+    async def get_many(
+        self, model: str, dimension: int, text_hashes: Sequence[str]
+    ) -> dict[str, list[float]]:
+        """Return persisted embeddings for the given hashes."""
+        if not text_hashes:
+            return {}
+        try:
+            async with self.session_maker() as session:
+                result = await session.execute(
+                    select(EmbeddingCacheEntry.text_hash, EmbeddingCacheEntry.embedding).where(
+                        EmbeddingCacheEntry.model == model,
+                        EmbeddingCacheEntry.dimension == dimension,
+                        EmbeddingCacheEntry.text_hash.in_(list(text_hashes)),
+                    )
+                )
+                return {row.text_hash: list(row.embedding) for row in result.all()}
+        except Exception as exc:
+            logger.warning("Embedding cache lookup failed: %s", exc)
+            return {}
+
+    async def set_many(self, model: str, dimension: int, items: dict[str, list[float]]) -> None:
+        """Persist embeddings, ignoring rows that already exist."""
+        if not items:
+            return
+        stmt = insert(EmbeddingCacheEntry).values(
+            [
+                {
+                    "model": model,
+                    "dimension": dimension,
+                    "text_hash": text_hash,
+                    "embedding": embedding,
+                }
+                for text_hash, embedding in items.items()
+            ]
+        )
+        try:
+            async with self.session_maker() as session:
+                await session.execute(stmt.on_conflict_do_nothing())
+                await session.commit()
+        except Exception as exc:
+            logger.warning("Embedding cache write failed: %s", exc)
+
+
+class EmbeddingCache:
+    """Read-through cache over an ordered list of backends (fastest first).
+
+    Hits found in a slower backend are promoted into the faster ones.
+    """
+
+    def __init__(self, backends: Sequence[EmbeddingCacheBackend]) -> None:
+        self.backends = list(backends)
+        self.stats = EmbeddingCacheStats()
+
+    async def get_many(
+        self, model: str, dimension: int, texts: Sequence[str]
+    ) -> list[list[float] | None]:
+        """Look up embeddings for texts, returning None for each miss.
+
+        Args:
+            model: Embedding model name
+            dimension: Embedding dimension
+            texts: Texts to look up
+
+        Returns:
+            List aligned with ``texts`` containing cached vectors or None
+        """
+        hashes = [hash_text(text) for text in texts]
+        pending = list(dict.fromkeys(hashes))
+        found: dict[str, list[float]] = {}
+
+        for position, backend in enumerate(self.backends):
+            if not pending:
+                break
+            backend_hits = await backend.get_many(model, dimension, pending)
+            if not backend_hits:
+                continue
+            found.update(backend_hits)
+            pending = [text_hash for text_hash in pending if text_hash not in backend_hits]
+            for faster in self.backends[:position]:
+                await faster.set_many(model, dimension, backend_hits)
+
+        results = [found.get(text_hash) for text_hash in hashes]
+        hits = sum(1 for embedding in results if embedding is not None)
+        self.stats.hits += hits
+        self.stats.misses += len(results) - hits
+        return results
+
+    async def set_many(
+        self,
+        model: str,
+        dimension: int,
+        texts: Sequence[str],
+        embeddings: Sequence[list[float]],
+    ) -> None:
+        """Store embeddings for texts in every backend."""
+        items = {
+            hash_text(text): embedding for text, embedding in zip(texts, embeddings, strict=True)
+        }
+        if not items:
+            return
+        for backend in self.backends:
+            await backend.set_many(model, dimension, items)
+        self.stats.writes += len(items)
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters."""
+        self.stats = EmbeddingCacheStats()
+
+
+def normalize_query(query: str) -> str:
+    """Normalize query text for cache lookups (case and whitespace insensitive)."""
+    return " ".join(query.lower().split())
+
+
+@dataclass
+class QueryEmbeddingCacheStats:
+    """Counters for the query embedding cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class QueryEmbeddingCache:
+    """Process-wide LRU cache for query embeddings with TTL and a byte budget.
+
+    Entries are keyed by (model, normalized query). Size is accounted as the
+    float64 payload of each vector (1536 floats = 12 KiB per entry).
+    """
+
+    BYTES_PER_FLOAT = 8
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.max_bytes = max(max_bytes, 0)
+        self.ttl_seconds = ttl_seconds
+        self.stats = QueryEmbeddingCacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str], tuple[float, list[float]]] = OrderedDict()
+        self._size_bytes = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate bytes held by cached vectors."""
+        return self._size_bytes
+
+    def get(self, model: str, query: str) -> list[float] | None:
+        """Return a cached query embedding, or None on miss/expiry."""
+        key = (model, normalize_query(query))
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl_seconds > 0 and now - entry[0] >= self.ttl_seconds:
+                self._remove(key)
+                self.stats.expirations += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def set(self, model: str, query: str, embedding: list[float]) -> None:
+        """Cache a query embedding, evicting LRU entries beyond the byte budget."""
+        entry_size = len(embedding) * self.BYTES_PER_FLOAT
+        if entry_size > self.max_bytes:
+            return
+        key = (model, normalize_query(query))
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (self._clock(), embedding)
+            self._size_bytes += entry_size
+            while self._size_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def _remove(self, key: tuple[str, str]) -> None:
+        _, embedding = self._entries.pop(key)
+        self._size_bytes -= len(embedding) * self.BYTES_PER_FLOAT
+
+
+_embedding_cache: EmbeddingCache | None = None
+_query_embedding_cache: QueryEmbeddingCache | None = None
+
+
+def build_embedding_cache(backend: str | None = None) -> EmbeddingCache | None:
+    """Build an embedding cache for a configured backend name.
+
+    Args:
+        backend: "memory", "postgres" (memory in front of Postgres) or "none"
+
+    Returns:
+        EmbeddingCache, or None when caching is disabled
+    """
+    selected = (backend or settings.embedding_cache_backend).strip().lower()
+    if selected in {"", "none", "off"}:
+        return None
+
+    backends: list[EmbeddingCacheBackend] = [
+        InMemoryEmbeddingCacheBackend(max_entries=settings.embedding_cache_max_entries)
+    ]
+    if selected == "postgres":
+        from src.db.session import async_session_maker
+
+        backends.append(PostgresEmbeddingCacheBackend(async_session_maker))
+    return EmbeddingCache(backends)
+
+
+def get_embedding_cache() -> EmbeddingCache | None:
+    """Get the process-wide embedding cache (None when disabled)."""
+    global _embedding_cache
+    if _embedding_cache is None:
+        _embedding_cache = build_embedding_cache()
+    return _embedding_cache
+
+
+def get_query_embedding_cache() -> QueryEmbeddingCache | None:
+    """Get the process-wide query embedding cache (None when disabled)."""
+    global _query_embedding_cache
+    if settings.query_embedding_cache_max_bytes <= 0:
+        return None
+    if _query_embedding_cache is None:
+        _query_embedding_cache = QueryEmbeddingCache(
+            max_bytes=settings.query_embedding_cache_max_bytes,
+            ttl_seconds=settings.query_embedding_cache_ttl_seconds,
+        )
+    return _query_embedding_cache
+
+
+def reset_embedding_cache() -> None:
+    """Drop the process-wide embedding caches so they are rebuilt on next use."""
+    global _embedding_cache, _query_embedding_cache
+    _embedding_cache = None
+    _query_embedding_cache = None
@@ -4,13 +4,29 @@ from langchain_openai import OpenAIEmbeddings
 from pydantic import SecretStr
 
 from src.config import settings
+from src.services.embedding_cache import (
+    EmbeddingCache,
+    QueryEmbeddingCache,
+    get_embedding_cache,
+    get_query_embedding_cache,
+)
+from src.services.provider_governor import EMBEDDINGS, get_provider_governor
 
 
 class EmbeddingService:
     """Service for generating text embeddings using OpenAI."""
 
-    def __init__(self) -> None:
-        """Initialize embedding service with an OpenAI-compatible client."""
+    def __init__(
+        self,
+        cache: EmbeddingCache | None = None,
+        query_cache: QueryEmbeddingCache | None = None,
+    ) -> None:
+        """Initialize embedding service with an OpenAI-compatible client.
+
+        Args:
+            cache: Optional document embedding cache (uses the shared process cache if None)
+            query_cache: Optional query embedding cache (uses the shared process cache if None)
+        """
         api_key = (
             SecretStr(settings.resolved_embedding_api_key)
             if settings.resolved_embedding_api_key
@@ -22,11 +38,16 @@ class EmbeddingService:
             openai_api_key=api_key,
             openai_api_base=settings.resolved_embedding_api_base,
         )
+        self.model = settings.embedding_model
         self.dimension = settings.embedding_dimension
+        self.cache = cache if cache is not None else get_embedding_cache()
+        self.query_cache = query_cache if query_cache is not None else get_query_embedding_cache()
 
     async def embed_texts(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings for multiple texts.
 
+        Only texts missing from the embedding cache are sent to the provider.
+
         Args:
             texts: List of texts to embed
 
@@ -35,18 +56,54 @@ class EmbeddingService:
         """
         if not texts:
             return []
-        return await self.embedder.aembed_documents(texts)
+        if self.cache is None:
+            return await self._embed_documents(texts)
+
+        cached = await self.cache.get_many(self.model, self.dimension, texts)
+        missing = list(
+            dict.fromkeys(text for text, hit in zip(texts, cached, strict=True) if hit is None)
+        )
+        fresh: dict[str, list[float]] = {}
+        if missing:
+            embeddings = await self._embed_documents(missing)
+            await self.cache.set_many(self.model, self.dimension, missing, embeddings)
+            fresh = dict(zip(missing, embeddings, strict=True))
+
+        return [
+            hit if hit is not None else fresh[text] for text, hit in zip(texts, cached, strict=True)
+        ]
 
     async def embed_query(self, query: str) -> list[float]:
         """Generate embedding for a search query.
 
+        Repeated queries (after case/whitespace normalization) are served from
+        the query embedding cache until their TTL expires.
+
         Args:
             query: Search query text
 
         Returns:
             Embedding vector as list of floats
         """
-        return await self.embedder.aembed_query(query)
+        if self.query_cache is None:
+            return await self._embed_query(query)
+
+        cached = self.query_cache.get(self.model, query)
+        if cached is not None:
+            return cached
+        embedding = await self._embed_query(query)
+        self.query_cache.set(self.model, query, embedding)
+        return embedding
+
+    async def _embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Call the provider for document embeddings under the shared call limits."""
+        async with get_provider_governor(EMBEDDINGS).slot():
+            return await self.embedder.aembed_documents(texts)
+
+    async def _embed_query(self, query: str) -> list[float]:
+        """Call the provider for a query embedding under the shared call limits."""
+        async with get_provider_governor(EMBEDDINGS).slot():
+            return await self.embedder.aembed_query(query)
 
 
 def get_embedding_service() -> EmbeddingService:
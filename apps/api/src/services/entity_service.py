@@ -38,6 +38,51 @@ class EntityService:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_with_counts(
+        self,
+        case_id: UUID,
+        skip: int = 0,
+        limit: int = 50,
+        entity_type: EntityType | None = None,
+    ) -> list[tuple[Entity, int, int]]:
+        """List a page of entities with their document and mention counts.
+
+        Both counts come from one GROUP BY per case joined onto the page, so
+        a single query serves any page size.
+
+        Returns:
+            (entity, document_count, mention_count) tuples ordered by name
+        """
+        document_counts = (
+            select(Document.author_entity_id.label("entity_id"), func.count().label("count"))
+            .where(Document.case_id == case_id, Document.author_entity_id.isnot(None))
+            .group_by(Document.author_entity_id)
+            .subquery("document_counts")
+        )
+        mention_counts = (
+            select(Mention.entity_id, func.count().label("count"))
+            .where(Mention.case_id == case_id)
+            .group_by(Mention.entity_id)
+            .subquery("mention_counts")
+        )
+        stmt = (
+            select(
+                Entity,
+                func.coalesce(document_counts.c.count, 0),
+                func.coalesce(mention_counts.c.count, 0),
+            )
+            .outerjoin(document_counts, document_counts.c.entity_id == Entity.entity_id)
+            .outerjoin(mention_counts, mention_counts.c.entity_id == Entity.entity_id)
+            .where(Entity.case_id == case_id)
+        )
+
+        if entity_type is not None:
+            stmt = stmt.where(Entity.entity_type == entity_type)
+
+        stmt = stmt.order_by(Entity.name).offset(skip).limit(limit)
+        result = await self.db.execute(stmt)
+        return [(entity, documents, mentions) for entity, documents, mentions in result.all()]
+
     async def count_by_case(
         self,
         case_id: UUID,
@@ -1,6 +1,10 @@
 """Graph service for Neo4j knowledge graph operations."""
 
-from dataclasses import dataclass
+import hashlib
+import json
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from itertools import combinations
 from typing import Any
 from uuid import UUID
@@ -9,6 +13,8 @@ from neo4j import AsyncSession as Neo4jAsyncSession
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
+from src.db.neo4j_schema import DOCUMENT_LABEL, ENTITY_LABEL
 from src.models import Document, Entity
 from src.schemas.graph import (
     GraphEdge,
@@ -17,6 +23,12 @@ from src.schemas.graph import (
     HubResponse,
     PathResponse,
 )
+from src.services.mention_extractor import MentionExtractor
+
+# Entity-to-entity relationship types written by sync (others map to MENTIONS)
+ENTITY_RELATIONSHIP_TYPES = frozenset({"SENT", "MENTIONS", "CO_OCCURS"})
+
+EdgeKey = tuple[str, str, str]
 
 
 @dataclass
@@ -26,6 +38,53 @@ class SyncResult:
     case_id: UUID
     nodes_created: int
     relationships_created: int
+    nodes_deleted: int = 0
+    relationships_deleted: int = 0
+    nodes_unchanged: int = 0
+
+
+@dataclass
+class GraphState:
+    """Nodes and entity edges of a case graph, keyed by ID, with sync hashes."""
+
+    entities: dict[str, dict[str, Any]] = field(default_factory=dict)
+    documents: dict[str, dict[str, Any]] = field(default_factory=dict)
+    edges: dict[EdgeKey, dict[str, Any]] = field(default_factory=dict)
+
+
+@dataclass
+class EntityLookup:
+    """A case's entities indexed for resolving metadata and text references."""
+
+    by_email: dict[str, UUID]
+    by_name: dict[str, UUID]
+    emails: MentionExtractor
+    names: MentionExtractor
+    mentions: MentionExtractor
+
+    @classmethod
+    def build(cls, entities: Sequence[Entity]) -> "EntityLookup":
+        """Index entities by exact email/name and compile their matchers."""
+        by_email: dict[str, UUID] = {}
+        by_name: dict[str, UUID] = {}
+        for entity in entities:
+            by_name[entity.name.strip().lower()] = entity.entity_id
+            email = entity.attrs_json.get("email") if isinstance(entity.attrs_json, dict) else None
+            if isinstance(email, str) and email.strip():
+                by_email[email.strip().lower()] = entity.entity_id
+        return cls(
+            by_email=by_email,
+            by_name=by_name,
+            emails=MentionExtractor((email, eid) for email, eid in by_email.items()),
+            names=MentionExtractor((name, eid) for name, eid in by_name.items()),
+            mentions=MentionExtractor.from_entities(entities),
+        )
+
+
+def sync_hash(row: dict[str, Any]) -> str:
+    """Fingerprint the properties sync writes for a node or edge."""
+    payload = json.dumps(row, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
 class GraphService:
@@ -41,158 +100,105 @@ class GraphService:
         self.neo4j = neo4j
         self.db = db
 
-    async def sync_case(self, case_id: UUID) -> SyncResult:
+    async def sync_case(self, case_id: UUID, *, full: bool = False) -> SyncResult:
         """Sync all entities and documents from a case to Neo4j.
 
+        The graph that PostgreSQL implies is computed first and compared
+        with the ``sync_hash`` fingerprints stored on the case's nodes and
+        entity edges, so only new or changed nodes and edges are written and
+        stale ones deleted. Readers never see a half-empty graph.
+
         Args:
             case_id: Case ID to sync
+            full: Clear the case graph and rebuild it from scratch
 
         Returns:
-            SyncResult with counts
+            SyncResult with counts (nodes_created counts entity nodes written)
         """
-        # Clear existing case data
-        await self._clear_case_graph(case_id)
-
-        # Sync entities
-        nodes_created = await self._sync_entities(case_id)
-
-        # Sync documents and relationships
-        relationships_created = await self._sync_documents(case_id)
-
-        return SyncResult(
-            case_id=case_id,
-            nodes_created=nodes_created,
-            relationships_created=relationships_created,
-        )
+        desired = await self._build_graph_state(case_id)
+        if full:
+            await self._clear_case_graph(case_id)
+            current = GraphState()
+        else:
+            current = await self._load_graph_state(case_id)
+        return await self._apply_graph_diff(case_id, desired, current)
 
     async def _clear_case_graph(self, case_id: UUID) -> None:
         """Clear all nodes and relationships for a case."""
-        query = """
-        MATCH (n {case_id: $case_id})
-        DETACH DELETE n
-        """
-        await self.neo4j.run(query, case_id=str(case_id))
-
-    async def _sync_entities(self, case_id: UUID) -> int:
-        """Sync entities from PostgreSQL to Neo4j.
-
-        Returns:
-            Number of nodes created
-        """
-        result = await self.db.execute(select(Entity).where(Entity.case_id == case_id))
-        entities = list(result.scalars().all())
-
-        nodes_created = 0
-        for entity in entities:
-            # Create node with appropriate label based on entity type
-            label = entity.entity_type.value.capitalize()
+        for label in (ENTITY_LABEL, DOCUMENT_LABEL):
             query = f"""
-            MERGE (e:{label} {{entity_id: $entity_id, case_id: $case_id}})
-            SET e.name = $name, e.entity_type = $entity_type
-            SET e += $attrs
-            RETURN e
+            MATCH (n:{label} {{case_id: $case_id}})
+            DETACH DELETE n
             """
-            await self.neo4j.run(
-                query,
-                entity_id=str(entity.entity_id),
-                case_id=str(case_id),
-                name=entity.name,
-                entity_type=entity.entity_type.value,
-                attrs=entity.attrs_json or {},
-            )
-            nodes_created += 1
-
-        return nodes_created
+            result = await self.neo4j.run(query, case_id=str(case_id))
+            await result.consume()
 
-    async def _sync_documents(self, case_id: UUID) -> int:
-        """Sync documents and infer relationship edges from content/metadata.
+    async def _build_graph_state(self, case_id: UUID) -> GraphState:
+        """Compute the case graph from PostgreSQL.
 
-        Returns:
-            Number of relationships created
+        Relationship edges are inferred from document content/metadata; an
+        edge inferred from several documents carries the document count and
+        the latest document's details.
         """
-        result = await self.db.execute(select(Document).where(Document.case_id == case_id))
-        documents = list(result.scalars().all())
         entity_result = await self.db.execute(select(Entity).where(Entity.case_id == case_id))
         entities = list(entity_result.scalars().all())
+        result = await self.db.execute(select(Document).where(Document.case_id == case_id))
+        documents = list(result.scalars().all())
 
-        entities_by_email: dict[str, UUID] = {}
-        entities_by_name: dict[str, UUID] = {}
+        state = GraphState()
         for entity in entities:
-            entities_by_name[entity.name.strip().lower()] = entity.entity_id
-            email = entity.attrs_json.get("email") if isinstance(entity.attrs_json, dict) else None
-            if isinstance(email, str) and email.strip():
-                entities_by_email[email.strip().lower()] = entity.entity_id
+            row: dict[str, Any] = {
+                "entity_id": str(entity.entity_id),
+                # Node label is based on entity type
+                "label": entity.entity_type.value.capitalize(),
+                "name": entity.name,
+                "entity_type": entity.entity_type.value,
+                "attrs": entity.attrs_json or {},
+            }
+            row["sync_hash"] = sync_hash(row)
+            state.entities[row["entity_id"]] = row
+
+        # Compiled once per case; every document is then scanned in one pass.
+        lookup = EntityLookup.build(entities)
 
         # Infer identifier mappings like P1/O2 from metadata that includes direct email/name hints.
         code_to_entity: dict[str, UUID] = {}
         for doc in documents:
             metadata = doc.metadata_json if isinstance(doc.metadata_json, dict) else {}
-            self._learn_code_mapping(metadata, code_to_entity, entities_by_email, entities_by_name)
+            self._learn_code_mapping(metadata, code_to_entity, lookup)
 
-        relationships_created = 0
         for doc in documents:
-            # Create Document node
-            query = """
-            MERGE (d:Document {doc_id: $doc_id, case_id: $case_id})
-            SET d.doc_type = $doc_type, d.subject = $subject, d.ts = $ts
-            RETURN d
-            """
-            await self.neo4j.run(
-                query,
-                doc_id=str(doc.doc_id),
-                case_id=str(case_id),
-                doc_type=doc.doc_type.value,
-                subject=doc.subject or "",
-                ts=doc.ts.isoformat() if doc.ts else "",
-            )
+            doc_row: dict[str, Any] = {
+                "doc_id": str(doc.doc_id),
+                "doc_type": doc.doc_type.value,
+                "subject": doc.subject or "",
+                "ts": doc.ts.isoformat() if doc.ts else "",
+                "author_id": str(doc.author_entity_id) if doc.author_entity_id else None,
+            }
+            doc_row["sync_hash"] = sync_hash(doc_row)
+            state.documents[doc_row["doc_id"]] = doc_row
 
             metadata = doc.metadata_json if isinstance(doc.metadata_json, dict) else {}
             metadata_entities = self._extract_entities_from_metadata(
-                metadata,
-                code_to_entity,
-                entities_by_email,
-                entities_by_name,
+                metadata, code_to_entity, lookup
             )
-            text_entities = self._extract_entities_from_text(doc, entities)
+            text_entities = self._extract_entities_from_text(doc, lookup.mentions)
             participants = set(metadata_entities).union(text_entities)
             if doc.author_entity_id:
                 participants.add(doc.author_entity_id)
 
             inferred_relationships: set[tuple[UUID, UUID, str]] = set()
 
-            # Create SENT relationship if author exists
             if doc.author_entity_id:
-                rel_query = """
-                MATCH (p {entity_id: $author_id, case_id: $case_id})
-                MATCH (d:Document {doc_id: $doc_id, case_id: $case_id})
-                MERGE (p)-[r:SENT]->(d)
-                SET r.ts = $ts
-                RETURN r
-                """
-                await self.neo4j.run(
-                    rel_query,
-                    author_id=str(doc.author_entity_id),
-                    doc_id=str(doc.doc_id),
-                    case_id=str(case_id),
-                    ts=doc.ts.isoformat() if doc.ts else "",
-                )
-                relationships_created += 1
-
                 for participant in participants:
                     if participant != doc.author_entity_id:
                         inferred_relationships.add((doc.author_entity_id, participant, "MENTIONS"))
 
             sender_id = doc.author_entity_id or self._resolve_code_or_reference(
-                metadata.get("from_entity"),
-                code_to_entity,
-                entities_by_email,
-                entities_by_name,
+                metadata.get("from_entity"), code_to_entity, lookup
             )
             recipient_id = self._resolve_code_or_reference(
-                metadata.get("to_entity") or metadata.get("to"),
-                code_to_entity,
-                entities_by_email,
-                entities_by_name,
+                metadata.get("to_entity") or metadata.get("to"), code_to_entity, lookup
             )
             if sender_id and recipient_id and sender_id != recipient_id:
                 inferred_relationships.add((sender_id, recipient_id, "SENT"))
@@ -203,16 +209,207 @@ class GraphService:
                     inferred_relationships.add((source_id, target_id, "CO_OCCURS"))
 
             for source_id, target_id, relationship_type in inferred_relationships:
-                await self._merge_entity_relationship(
-                    case_id=case_id,
-                    source_id=source_id,
-                    target_id=target_id,
-                    relationship_type=relationship_type,
-                    doc=doc,
-                )
-                relationships_created += 1
+                self._add_entity_edge(state.edges, source_id, target_id, relationship_type, doc)
+
+        for edge in state.edges.values():
+            edge["sync_hash"] = sync_hash(edge)
+        return state
+
+    async def _load_graph_state(self, case_id: UUID) -> GraphState:
+        """Read node IDs, labels and sync hashes of the case graph from Neo4j."""
+        state = GraphState()
+        node_result = await self.neo4j.run(
+            f"""
+            MATCH (n:{ENTITY_LABEL} {{case_id: $case_id}})
+            RETURN n.entity_id AS entity_id, null AS doc_id,
+                   [label IN labels(n) WHERE label <> '{ENTITY_LABEL}'] AS labels,
+                   n.sync_hash AS sync_hash
+            UNION ALL
+            MATCH (n:{DOCUMENT_LABEL} {{case_id: $case_id}})
+            RETURN null AS entity_id, n.doc_id AS doc_id,
+                   labels(n) AS labels, n.sync_hash AS sync_hash
+            """,
+            case_id=str(case_id),
+        )
+        async for record in node_result:
+            if record["entity_id"] is not None:
+                labels = record["labels"] or []
+                state.entities[record["entity_id"]] = {
+                    "label": labels[0] if labels else None,
+                    "sync_hash": record["sync_hash"],
+                }
+            elif record["doc_id"] is not None:
+                state.documents[record["doc_id"]] = {"sync_hash": record["sync_hash"]}
+
+        edge_result = await self.neo4j.run(
+            f"""
+            MATCH (a:{ENTITY_LABEL} {{case_id: $case_id}})-[r]->(b:{ENTITY_LABEL})
+            WHERE b.case_id = $case_id
+            RETURN a.entity_id AS source_id, b.entity_id AS target_id,
+                   type(r) AS type, r.sync_hash AS sync_hash
+            """,
+            case_id=str(case_id),
+        )
+        async for record in edge_result:
+            key = (record["source_id"], record["target_id"], record["type"])
+            state.edges[key] = {"sync_hash": record["sync_hash"]}
+        return state
+
+    async def _apply_graph_diff(
+        self, case_id: UUID, desired: GraphState, current: GraphState
+    ) -> SyncResult:
+        """Write the nodes and edges that differ between two graph states."""
+        # Entities whose type changed are recreated under their new label.
+        removed_entities = {
+            entity_id
+            for entity_id, stored in current.entities.items()
+            if entity_id not in desired.entities
+            or stored.get("label") != desired.entities[entity_id]["label"]
+        }
+        entity_upserts = [
+            row
+            for entity_id, row in desired.entities.items()
+            if entity_id in removed_entities
+            or current.entities.get(entity_id, {}).get("sync_hash") != row["sync_hash"]
+        ]
+        removed_documents = set(current.documents) - set(desired.documents)
+        # Documents whose author node is recreated lose their SENT edge with it.
+        document_upserts = [
+            row
+            for doc_id, row in desired.documents.items()
+            if row["author_id"] in removed_entities
+            or current.documents.get(doc_id, {}).get("sync_hash") != row["sync_hash"]
+        ]
+        # Edges touching removed entities disappear with DETACH DELETE.
+        current_edges = {
+            key: stored
+            for key, stored in current.edges.items()
+            if key[0] not in removed_entities and key[1] not in removed_entities
+        }
+        stale_edges = [key for key in current_edges if key not in desired.edges]
+        edge_upserts = [
+            row
+            for key, row in desired.edges.items()
+            if current_edges.get(key, {}).get("sync_hash") != row["sync_hash"]
+        ]
 
-        return relationships_created
+        await self._delete_nodes(case_id, ENTITY_LABEL, "entity_id", sorted(removed_entities))
+        await self._delete_nodes(case_id, DOCUMENT_LABEL, "doc_id", sorted(removed_documents))
+        await self._write_entities(case_id, entity_upserts)
+        sent_created = await self._write_documents(case_id, document_upserts)
+        await self._write_batches(
+            f"""
+            UNWIND $rows AS row
+            MATCH (a:{ENTITY_LABEL} {{entity_id: row.source_id, case_id: $case_id}})
+                  -[r]->(b:{ENTITY_LABEL} {{entity_id: row.target_id, case_id: $case_id}})
+            WHERE type(r) = row.type
+            DELETE r
+            """,
+            [
+                {"source_id": source, "target_id": target, "type": rel_type}
+                for source, target, rel_type in stale_edges
+            ],
+            case_id=str(case_id),
+        )
+        await self._write_entity_edges(case_id, edge_upserts)
+
+        written = len(entity_upserts) + len(document_upserts)
+        return SyncResult(
+            case_id=case_id,
+            nodes_created=len(entity_upserts),
+            relationships_created=sent_created + len(edge_upserts),
+            nodes_deleted=len(removed_entities) + len(removed_documents),
+            relationships_deleted=len(stale_edges),
+            nodes_unchanged=len(desired.entities) + len(desired.documents) - written,
+        )
+
+    async def _delete_nodes(self, case_id: UUID, label: str, key: str, ids: Sequence[str]) -> None:
+        """Detach-delete case nodes by entity_id or doc_id."""
+        await self._write_batches(
+            f"""
+            UNWIND $rows AS row
+            MATCH (n:{label} {{{key}: row.id, case_id: $case_id}})
+            DETACH DELETE n
+            """,
+            [{"id": node_id} for node_id in ids],
+            case_id=str(case_id),
+        )
+
+    async def _write_entities(self, case_id: UUID, rows: Sequence[dict[str, Any]]) -> None:
+        """Upsert entity nodes with one batched UNWIND MERGE per type label.
+
+        Nodes are merged on the uniquely constrained ``:Entity(entity_id)``
+        and carry their type label (Person, Org, ...) alongside it. The
+        property map is replaced rather than merged, so attributes removed
+        from ``attrs_json`` disappear from the node.
+        """
+        rows_by_label: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            rows_by_label[row["label"]].append(row)
+
+        for label, label_rows in rows_by_label.items():
+            query = f"""
+            UNWIND $rows AS row
+            MERGE (e:{ENTITY_LABEL} {{entity_id: row.entity_id}})
+            SET e = row.attrs
+            SET e:{label}, e.entity_id = row.entity_id, e.case_id = $case_id
+            SET e.name = row.name, e.entity_type = row.entity_type,
+              e.sync_hash = row.sync_hash
+            """
+            await self._write_batches(query, label_rows, case_id=str(case_id))
+
+    async def _write_documents(self, case_id: UUID, rows: Sequence[dict[str, Any]]) -> int:
+        """Upsert document nodes and their author SENT edges.
+
+        Returns:
+            Number of SENT edges written
+        """
+        await self._write_batches(
+            f"""
+            UNWIND $rows AS row
+            MERGE (d:{DOCUMENT_LABEL} {{doc_id: row.doc_id}})
+            SET d.case_id = $case_id
+            SET d.doc_type = row.doc_type, d.subject = row.subject, d.ts = row.ts,
+              d.sync_hash = row.sync_hash
+            WITH d
+            OPTIONAL MATCH ()-[old:SENT]->(d)
+            DELETE old
+            """,
+            rows,
+            case_id=str(case_id),
+        )
+        sent_rows = [row for row in rows if row["author_id"]]
+        await self._write_batches(
+            f"""
+            UNWIND $rows AS row
+            MATCH (p:{ENTITY_LABEL} {{entity_id: row.author_id, case_id: $case_id}})
+            MATCH (d:{DOCUMENT_LABEL} {{doc_id: row.doc_id, case_id: $case_id}})
+            MERGE (p)-[r:SENT]->(d)
+            SET r.ts = row.ts
+            """,
+            sent_rows,
+            case_id=str(case_id),
+        )
+        return len(sent_rows)
+
+    async def _write_batches(
+        self,
+        query: str,
+        rows: Sequence[dict[str, Any]],
+        **params: Any,
+    ) -> None:
+        """Run an ``UNWIND $rows`` write once per batch of rows.
+
+        Each batch is its own auto-commit transaction of at most
+        ``graph_sync_batch_size`` rows, so memory on the Neo4j side stays
+        bounded while round trips drop from one per row to one per batch.
+        """
+        batch_size = max(settings.graph_sync_batch_size, 1)
+        for start in range(0, len(rows), batch_size):
+            result = await self.neo4j.run(
+                query, rows=list(rows[start : start + batch_size]), **params
+            )
+            await result.consume()
 
     def _normalize_code(self, value: Any) -> str | None:
         """Normalize code-like IDs (e.g. P1, O2) from metadata."""
@@ -221,44 +418,37 @@ class GraphService:
         code = value.strip().upper()
         return code or None
 
-    def _resolve_entity_reference(
-        self,
-        reference: Any,
-        entities_by_email: dict[str, UUID],
-        entities_by_name: dict[str, UUID],
-    ) -> UUID | None:
+    def _resolve_entity_reference(self, reference: Any, lookup: EntityLookup) -> UUID | None:
         """Resolve an entity UUID from mixed metadata values (email/name/list/dict)."""
         if isinstance(reference, str):
             values = [part.strip().lower() for part in reference.replace(";", ",").split(",")]
             for value in values:
                 if not value:
                     continue
-                if value in entities_by_email:
-                    return entities_by_email[value]
-                if value in entities_by_name:
-                    return entities_by_name[value]
+                if value in lookup.by_email:
+                    return lookup.by_email[value]
+                if value in lookup.by_name:
+                    return lookup.by_name[value]
                 if "<" in value and ">" in value:
                     bracketed = value.split("<", 1)[1].split(">", 1)[0].strip()
-                    if bracketed in entities_by_email:
-                        return entities_by_email[bracketed]
-                for email, entity_id in entities_by_email.items():
-                    if email in value:
-                        return entity_id
-                for name, entity_id in entities_by_name.items():
-                    if name in value:
-                        return entity_id
+                    if bracketed in lookup.by_email:
+                        return lookup.by_email[bracketed]
+                # Emails embedded in the value win over names.
+                resolved = lookup.emails.first_match(value) or lookup.names.first_match(value)
+                if resolved is not None:
+                    return resolved
             return None
 
         if isinstance(reference, list):
             for item in reference:
-                resolved = self._resolve_entity_reference(item, entities_by_email, entities_by_name)
+                resolved = self._resolve_entity_reference(item, lookup)
                 if resolved is not None:
                     return resolved
             return None
 
         if isinstance(reference, dict):
             for item in reference.values():
-                resolved = self._resolve_entity_reference(item, entities_by_email, entities_by_name)
+                resolved = self._resolve_entity_reference(item, lookup)
                 if resolved is not None:
                     return resolved
 
@@ -268,21 +458,19 @@ class GraphService:
         self,
         value: Any,
         code_to_entity: dict[str, UUID],
-        entities_by_email: dict[str, UUID],
-        entities_by_name: dict[str, UUID],
+        lookup: EntityLookup,
     ) -> UUID | None:
         """Resolve from metadata code mapping first, fallback to direct lookup."""
         code = self._normalize_code(value)
         if code and code in code_to_entity:
             return code_to_entity[code]
-        return self._resolve_entity_reference(value, entities_by_email, entities_by_name)
+        return self._resolve_entity_reference(value, lookup)
 
     def _learn_code_mapping(
         self,
         metadata: dict[str, Any],
         code_to_entity: dict[str, UUID],
-        entities_by_email: dict[str, UUID],
-        entities_by_name: dict[str, UUID],
+        lookup: EntityLookup,
     ) -> None:
         """Learn mappings like P1->entity_id from metadata with direct hints."""
         mapping_pairs = (
@@ -294,11 +482,7 @@ class GraphService:
             code = self._normalize_code(metadata.get(code_key))
             if not code or code in code_to_entity:
                 continue
-            resolved = self._resolve_entity_reference(
-                metadata.get(reference_key),
-                entities_by_email,
-                entities_by_name,
-            )
+            resolved = self._resolve_entity_reference(metadata.get(reference_key), lookup)
             if resolved is not None:
                 code_to_entity[code] = resolved
 
@@ -306,8 +490,7 @@ class GraphService:
         self,
         metadata: dict[str, Any],
         code_to_entity: dict[str, UUID],
-        entities_by_email: dict[str, UUID],
-        entities_by_name: dict[str, UUID],
+        lookup: EntityLookup,
     ) -> set[UUID]:
         """Extract participant entity IDs from document metadata."""
         participant_fields = (
@@ -324,74 +507,66 @@ class GraphService:
             "vendor_entity",
         )
         participants: set[UUID] = set()
-        for field in participant_fields:
+        for field_name in participant_fields:
             resolved = self._resolve_code_or_reference(
-                metadata.get(field),
-                code_to_entity,
-                entities_by_email,
-                entities_by_name,
+                metadata.get(field_name), code_to_entity, lookup
             )
             if resolved is not None:
                 participants.add(resolved)
         return participants
 
-    def _extract_entities_from_text(self, doc: Document, entities: list[Entity]) -> set[UUID]:
-        """Extract entity references found in subject/body text."""
-        searchable = " ".join(part for part in (doc.subject or "", doc.body) if part).lower()
-        if not searchable:
-            return set()
-
-        participants: set[UUID] = set()
-        for entity in entities:
-            name = entity.name.strip().lower()
-            if name and name in searchable:
-                participants.add(entity.entity_id)
-                continue
+    def _extract_entities_from_text(self, doc: Document, extractor: MentionExtractor) -> set[UUID]:
+        """Extract entities whose name or email appears in subject/body text."""
+        return extractor.find_entities(doc.subject or "", doc.body or "")
 
-            email = entity.attrs_json.get("email") if isinstance(entity.attrs_json, dict) else None
-            if isinstance(email, str) and email.strip().lower() in searchable:
-                participants.add(entity.entity_id)
-
-        return participants
-
-    async def _merge_entity_relationship(
+    def _add_entity_edge(
         self,
-        case_id: UUID,
+        edges: dict[EdgeKey, dict[str, Any]],
         source_id: UUID,
         target_id: UUID,
         relationship_type: str,
         doc: Document,
     ) -> None:
-        """Create or update an entity-to-entity relationship edge."""
+        """Count one document's occurrence of an entity-to-entity edge."""
         if source_id == target_id:
             return
 
-        allowed_types = {"SENT", "MENTIONS", "CO_OCCURS"}
-        rel_type = relationship_type if relationship_type in allowed_types else "MENTIONS"
-
-        query = f"""
-        MATCH (a {{entity_id: $source_id, case_id: $case_id}})
-        MATCH (b {{entity_id: $target_id, case_id: $case_id}})
-        MERGE (a)-[r:{rel_type}]->(b)
-        ON CREATE SET r.count = 1,
-          r.last_doc_id = $doc_id,
-          r.last_doc_type = $doc_type,
-          r.last_ts = $ts
-        ON MATCH SET r.count = coalesce(r.count, 0) + 1,
-          r.last_doc_id = $doc_id,
-          r.last_doc_type = $doc_type,
-          r.last_ts = $ts
-        RETURN r
-        """
-        await self.neo4j.run(
-            query,
-            source_id=str(source_id),
-            target_id=str(target_id),
-            case_id=str(case_id),
-            doc_id=str(doc.doc_id),
-            doc_type=doc.doc_type.value,
-            ts=doc.ts.isoformat() if doc.ts else "",
+        rel_type = (
+            relationship_type if relationship_type in ENTITY_RELATIONSHIP_TYPES else "MENTIONS"
         )
+        key = (str(source_id), str(target_id), rel_type)
+        edge = edges.get(key)
+        if edge is None:
+            edge = edges[key] = {
+                "source_id": key[0],
+                "target_id": key[1],
+                "type": rel_type,
+                "count": 0,
+            }
+        edge["count"] += 1
+        edge["last_doc_id"] = str(doc.doc_id)
+        edge["last_doc_type"] = doc.doc_type.value
+        edge["last_ts"] = doc.ts.isoformat() if doc.ts else ""
+
+    async def _write_entity_edges(self, case_id: UUID, rows: Sequence[dict[str, Any]]) -> None:
+        """Upsert entity-to-entity edges, one batched write per type."""
+        rows_by_type: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            rows_by_type[row["type"]].append(row)
+
+        for rel_type, type_rows in rows_by_type.items():
+            query = f"""
+            UNWIND $rows AS row
+            MATCH (a:{ENTITY_LABEL} {{entity_id: row.source_id, case_id: $case_id}})
+            MATCH (b:{ENTITY_LABEL} {{entity_id: row.target_id, case_id: $case_id}})
+            MERGE (a)-[r:{rel_type}]->(b)
+            SET r.count = row.count,
+              r.last_doc_id = row.last_doc_id,
+              r.last_doc_type = row.last_doc_type,
+              r.last_ts = row.last_ts,
+              r.sync_hash = row.sync_hash
+            """
+            await self._write_batches(query, type_rows, case_id=str(case_id))
 
     async def query_path(
         self, case_id: UUID, from_id: UUID, to_id: UUID, max_depth: int = 6
@@ -408,10 +583,10 @@ class GraphService:
             PathResponse with nodes and edges
         """
         query = f"""
-        MATCH (a {{entity_id: $from_id, case_id: $case_id}})
-        MATCH (b {{entity_id: $to_id, case_id: $case_id}})
+        MATCH (a:{ENTITY_LABEL} {{entity_id: $from_id, case_id: $case_id}})
+        MATCH (b:{ENTITY_LABEL} {{entity_id: $to_id, case_id: $case_id}})
         MATCH path = shortestPath((a)-[*..{max_depth}]-(b))
-        WHERE ALL(n IN nodes(path) WHERE n.entity_id IS NOT NULL)
+        WHERE ALL(n IN nodes(path) WHERE n:{ENTITY_LABEL})
         RETURN path
         """
         result = await self.neo4j.run(
@@ -465,7 +640,7 @@ class GraphService:
             Tuple of (nodes, edges)
         """
         query = f"""
-        MATCH (e {{entity_id: $entity_id, case_id: $case_id}})
+        MATCH (e:{ENTITY_LABEL} {{entity_id: $entity_id, case_id: $case_id}})
         MATCH (e)-[r*1..{depth}]-(neighbor)
         WHERE neighbor.case_id = $case_id
         RETURN DISTINCT neighbor, r,
@@ -576,9 +751,8 @@ class GraphService:
         Returns:
             List of HubResponse ordered by degree
         """
-        query = """
-        MATCH (e {case_id: $case_id})-[r]-()
-        WHERE e.entity_type IS NOT NULL
+        query = f"""
+        MATCH (e:{ENTITY_LABEL} {{case_id: $case_id}})-[r]-()
         WITH e, count(r) as degree
         ORDER BY degree DESC
         LIMIT $limit
@@ -612,19 +786,26 @@ class GraphService:
             GraphStatsResponse with stats
         """
         # Count nodes by type
-        node_query = """
-        MATCH (n {case_id: $case_id})
-        RETURN labels(n)[0] as label, count(n) as count
+        node_query = f"""
+        MATCH (n:{ENTITY_LABEL} {{case_id: $case_id}})
+        UNWIND [label IN labels(n) WHERE label <> '{ENTITY_LABEL}'] AS label
+        RETURN label, count(*) as count
+        UNION ALL
+        MATCH (n:{DOCUMENT_LABEL} {{case_id: $case_id}})
+        RETURN '{DOCUMENT_LABEL}' as label, count(n) as count
         """
         node_result = await self.neo4j.run(node_query, case_id=str(case_id))
         node_records = [record async for record in node_result]
 
-        node_types: dict[str, int] = {r["label"]: r["count"] for r in node_records if r["label"]}
+        node_types: dict[str, int] = {
+            r["label"]: r["count"] for r in node_records if r["label"] and r["count"]
+        }
         total_nodes = sum(node_types.values())
 
         # Count relationships by type
-        rel_query = """
-        MATCH (a {case_id: $case_id})-[r]->(b {case_id: $case_id})
+        rel_query = f"""
+        MATCH (a:{ENTITY_LABEL} {{case_id: $case_id}})-[r]->(b)
+        WHERE b.case_id = $case_id
         RETURN type(r) as type, count(r) as count
         """
         rel_result = await self.neo4j.run(rel_query, case_id=str(case_id))
@@ -1,14 +1,28 @@
 """Ingestion service for processing and indexing documents."""
 
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import Text, any_, bindparam, delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.document import DocChunk, Document
-from src.services.chunking_service import ChunkingService
+from src.config import settings
+from src.models.case import Case
+from src.models.document import DocChunk, Document, Entity, Mention
+from src.services.chunk_writer import ChunkRow, ChunkWriter
+from src.services.chunking_service import ChunkingService, ChunkResult, estimate_tokens
 from src.services.embedding_service import EmbeddingService
+from src.services.mention_extractor import MentionExtractor
+from src.services.response_cache import invalidate_case_responses
+
+# Called with the documents that reached a stage ("skipped", "chunked",
+# "embedded" or "written") during case ingestion.
+IngestionProgressCallback = Callable[[Sequence[UUID], str], Awaitable[None]]
 
 
 @dataclass
@@ -18,6 +32,7 @@ class IngestionResult:
     doc_id: UUID
     chunks_created: int
     embeddings_generated: int
+    mentions_indexed: int = 0
 
 
 @dataclass
@@ -28,6 +43,71 @@ class CaseIngestionResult:
     documents_processed: int
     total_chunks: int
     total_embeddings: int
+    documents_skipped: int = 0
+    embeddings_reused: int = 0
+    mentions_indexed: int = 0
+
+
+def pack_embedding_batches(
+    texts: Sequence[str],
+    *,
+    max_items: int,
+    max_tokens: int,
+) -> list[list[int]]:
+    """Group text indices into provider-sized batches.
+
+    A batch is closed when adding the next text would exceed either the item
+    count or the estimated token budget. A single text larger than the token
+    budget still gets its own batch.
+
+    Args:
+        texts: Texts to embed
+        max_items: Maximum texts per batch
+        max_tokens: Maximum estimated tokens per batch
+
+    Returns:
+        List of batches, each a list of indices into ``texts``
+    """
+    max_items = max(max_items, 1)
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+
+    for index, text in enumerate(texts):
+        tokens = estimate_tokens(text)
+        if current and (len(current) >= max_items or current_tokens + tokens > max_tokens):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(index)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def document_fingerprint(doc: Document, chunk_config_key: str, embedding_key: str) -> str:
+    """Fingerprint everything that determines a document's stored chunks.
+
+    Args:
+        doc: Document being ingested
+        chunk_config_key: Identifier of the chunking configuration
+        embedding_key: Embedding model/dimension, or a marker when embeddings are skipped
+
+    Returns:
+        sha256 hex digest
+    """
+    parts = (
+        doc.subject or "",
+        doc.body,
+        doc.language,
+        doc.doc_type.value,
+        doc.ts.isoformat() if doc.ts else "",
+        chunk_config_key,
+        embedding_key,
+    )
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
 
 
 class IngestionService:
@@ -35,8 +115,9 @@ class IngestionService:
 
     Orchestrates:
     1. Document chunking
-    2. Embedding generation
-    3. Storage in database with pgvector
+    2. Embedding generation (batched, with bounded concurrency)
+    3. Storage in database with pgvector (bulk COPY for large batches)
+    4. Entity mention indexing (one automaton pass per document)
     """
 
     def __init__(
@@ -44,6 +125,7 @@ class IngestionService:
         db: AsyncSession,
         chunking: ChunkingService | None = None,
         embedding: EmbeddingService | None = None,
+        writer: ChunkWriter | None = None,
     ) -> None:
         """Initialize ingestion service.
 
@@ -51,10 +133,12 @@ class IngestionService:
             db: Database session
             chunking: Optional chunking service (creates default if None)
             embedding: Optional embedding service (creates default if None)
+            writer: Optional chunk writer (creates default if None)
         """
         self.db = db
         self.chunking = chunking or ChunkingService()
         self.embedding = embedding or EmbeddingService()
+        self.writer = writer or ChunkWriter(db)
 
     async def ingest_document(
         self, doc_id: UUID, *, generate_embeddings: bool = True
@@ -79,57 +163,72 @@ class IngestionService:
             msg = f"Document {doc_id} not found"
             raise ValueError(msg)
 
-        # Delete existing chunks for this document
-        await self.db.execute(delete(DocChunk).where(DocChunk.doc_id == doc_id))
-
         # Generate chunks
         chunk_results = self.chunking.chunk_document(doc)
 
+        # Generate embeddings before touching stored chunks so a provider
+        # failure leaves the previous index intact.
+        embeddings: list[list[float] | None] = [None] * len(chunk_results)
+        embeddings_generated = 0
+        if generate_embeddings and chunk_results:
+            texts = [c.text for c in chunk_results]
+            reusable = await self._load_reusable_embeddings([doc_id], texts)
+            embeddings_generated, _ = await self._fill_embeddings(texts, embeddings, reusable)
+
+        # Replace existing chunks for this document
+        await self.db.execute(delete(DocChunk).where(DocChunk.doc_id == doc_id))
+        doc.content_fingerprint = self._fingerprint(doc, generate_embeddings=generate_embeddings)
+        doc.embedding_key = self._embedding_key() if generate_embeddings else None
+        mentions_indexed, _ = await self.index_mentions(doc.case_id, [doc], doc_id=doc_id)
+        await self._mark_ingested(doc.case_id)
+
         if not chunk_results:
+            await self.db.flush()
             return IngestionResult(
                 doc_id=doc_id,
                 chunks_created=0,
                 embeddings_generated=0,
+                mentions_indexed=mentions_indexed,
             )
 
-        # Generate embeddings if requested
-        embeddings: list[list[float]] = []
-        if generate_embeddings:
-            texts = [c.text for c in chunk_results]
-            embeddings = await self.embedding.embed_texts(texts)
-
-        # Create DocChunk records
-        chunks = []
-        for i, chunk_result in enumerate(chunk_results):
-            embedding = embeddings[i] if embeddings else None
-            chunk = DocChunk(
-                doc_id=doc_id,
-                case_id=doc.case_id,
-                chunk_index=chunk_result.chunk_index,
-                text=chunk_result.text,
-                embedding=embedding,
-                language=doc.language,  # Inherit language from document
-                meta_json=chunk_result.meta_json,
-            )
-            chunks.append(chunk)
-
-        self.db.add_all(chunks)
-        await self.db.flush()
+        chunks_created = await self.writer.write(
+            [
+                self._build_chunk(doc, chunk_result, embeddings[i])
+                for i, chunk_result in enumerate(chunk_results)
+            ]
+        )
 
         return IngestionResult(
             doc_id=doc_id,
-            chunks_created=len(chunks),
-            embeddings_generated=len(embeddings),
+            chunks_created=chunks_created,
+            embeddings_generated=embeddings_generated,
+            mentions_indexed=mentions_indexed,
         )
 
     async def ingest_case(
-        self, case_id: UUID, *, generate_embeddings: bool = True
+        self,
+        case_id: UUID,
+        *,
+        generate_embeddings: bool = True,
+        force: bool = False,
+        progress: IngestionProgressCallback | None = None,
     ) -> CaseIngestionResult:
         """Ingest all documents in a case.
 
+        Documents whose content fingerprint is unchanged since the last
+        ingestion are skipped. Changed documents are chunked up front, chunk
+        texts are packed into provider-sized batches embedded concurrently
+        (reusing stored embeddings for unchanged chunk texts), and the
+        resulting chunks are written back in one bulk write. Entity mentions
+        are re-indexed for every document, since they also depend on the
+        case's entities. If any document or mention changed, cached chat
+        answers about the case are dropped.
+
         Args:
             case_id: ID of the case to ingest
             generate_embeddings: Whether to generate embeddings (default True)
+            force: Re-ingest every document even if its fingerprint is unchanged
+            progress: Optional callback notified as documents reach each stage
 
         Returns:
             CaseIngestionResult with aggregate counts
@@ -140,21 +239,245 @@ class IngestionService:
         )
         documents = list(result.scalars().all())
 
-        total_chunks = 0
-        total_embeddings = 0
-
-        for doc in documents:
-            ingestion_result = await self.ingest_document(
-                doc.doc_id, generate_embeddings=generate_embeddings
+        fingerprints = {
+            doc.doc_id: self._fingerprint(doc, generate_embeddings=generate_embeddings)
+            for doc in documents
+        }
+        changed = [
+            doc for doc in documents if force or doc.content_fingerprint != fingerprints[doc.doc_id]
+        ]
+        changed_ids = [doc.doc_id for doc in changed]
+
+        async def report(doc_ids: Sequence[UUID], stage: str) -> None:
+            if progress is not None and doc_ids:
+                await progress(doc_ids, stage)
+
+        changed_set = set(changed_ids)
+        await report([doc.doc_id for doc in documents if doc.doc_id not in changed_set], "skipped")
+
+        planned: list[tuple[Document, ChunkResult]] = [
+            (doc, chunk_result)
+            for doc in changed
+            for chunk_result in self.chunking.chunk_document(doc)
+        ]
+        await report(changed_ids, "chunked")
+
+        embeddings: list[list[float] | None] = [None] * len(planned)
+        embeddings_generated = 0
+        embeddings_reused = 0
+        if generate_embeddings and planned:
+            texts = [c.text for _, c in planned]
+            reusable = await self._load_reusable_embeddings(changed_ids, texts)
+            embeddings_generated, embeddings_reused = await self._fill_embeddings(
+                texts, embeddings, reusable
             )
-            total_chunks += ingestion_result.chunks_created
-            total_embeddings += ingestion_result.embeddings_generated
+            await report(changed_ids, "embedded")
+
+        if changed_ids:
+            await self.db.execute(delete(DocChunk).where(DocChunk.doc_id.in_(changed_ids)))
+
+        embedding_key = self._embedding_key() if generate_embeddings else None
+        for doc in changed:
+            doc.content_fingerprint = fingerprints[doc.doc_id]
+            doc.embedding_key = embedding_key
+        total_chunks = await self.writer.write(
+            [
+                self._build_chunk(doc, chunk_result, embeddings[i])
+                for i, (doc, chunk_result) in enumerate(planned)
+            ]
+        )
+        if changed and not total_chunks:
+            await self.db.flush()
+        mentions_indexed, mentions_removed = await self.index_mentions(case_id, documents)
+        if changed or mentions_indexed or mentions_removed:
+            await self._mark_ingested(case_id)
+        await report(changed_ids, "written")
 
         return CaseIngestionResult(
             case_id=case_id,
             documents_processed=len(documents),
             total_chunks=total_chunks,
-            total_embeddings=total_embeddings,
+            total_embeddings=embeddings_generated,
+            documents_skipped=len(documents) - len(changed),
+            embeddings_reused=embeddings_reused,
+            mentions_indexed=mentions_indexed,
+        )
+
+    async def index_mentions(
+        self,
+        case_id: UUID,
+        documents: Sequence[Document],
+        *,
+        doc_id: UUID | None = None,
+    ) -> tuple[int, int]:
+        """Bring the ``mentions`` rows of documents in line with the case's entities.
+
+        One extractor is compiled for the case and each document body is
+        scanned once. Stored mentions are diffed against the result, so only
+        new spans are inserted (in one bulk INSERT) and stale ones deleted;
+        re-ingesting an unchanged case writes nothing.
+
+        Args:
+            case_id: Case whose entities are matched
+            documents: Documents to index
+            doc_id: Limit the stored mentions compared to one document
+
+        Returns:
+            Numbers of mention rows inserted and deleted
+        """
+        result = await self.db.execute(select(Entity).where(Entity.case_id == case_id))
+        extractor = MentionExtractor.from_entities(result.scalars().all())
+        desired = {
+            (row["doc_id"], row["entity_id"], row["span_start"], row["span_end"]): row
+            for doc in documents
+            for row in extractor.mention_rows(doc)
+        }
+
+        stmt = select(
+            Mention.mention_id,
+            Mention.doc_id,
+            Mention.entity_id,
+            Mention.span_start,
+            Mention.span_end,
+        ).where(Mention.case_id == case_id)
+        if doc_id is not None:
+            stmt = stmt.where(Mention.doc_id == doc_id)
+        stored = {
+            (row.doc_id, row.entity_id, row.span_start, row.span_end): row.mention_id
+            for row in (await self.db.execute(stmt)).all()
+        }
+
+        stale = [mention_id for key, mention_id in stored.items() if key not in desired]
+        if stale:
+            # One array parameter, however many mentions are stale
+            stale_ids = bindparam("stale_ids", stale, type_=ARRAY(PGUUID(as_uuid=True)))
+            await self.db.execute(delete(Mention).where(Mention.mention_id == any_(stale_ids)))
+        new_rows = [row for key, row in desired.items() if key not in stored]
+        if new_rows:
+            await self.db.execute(insert(Mention), new_rows)
+        return len(new_rows), len(stale)
+
+    async def _mark_ingested(self, case_id: UUID) -> None:
+        """Record a new ingestion of the case and drop cached chat answers about it.
+
+        Cached answers may cite the previous chunks. They are dropped from
+        this process's cache, and ``cases.ingested_at`` is part of the cache
+        scope, so other processes stop serving them once this commits.
+        """
+        await self.db.execute(
+            update(Case).where(Case.case_id == case_id).values(ingested_at=func.now())
+        )
+        invalidate_case_responses(case_id)
+
+    def _fingerprint(self, doc: Document, *, generate_embeddings: bool) -> str:
+        """Fingerprint a document against the current chunking/embedding setup."""
+        embedding_key = self._embedding_key() if generate_embeddings else "no-embeddings"
+        return document_fingerprint(doc, str(self.chunking.config_key), embedding_key)
+
+    @staticmethod
+    def _embedding_key() -> str:
+        """Identifier of the configured embedding model and dimension."""
+        return f"{settings.embedding_model}:{settings.embedding_dimension}"
+
+    async def _load_reusable_embeddings(
+        self, doc_ids: list[UUID], texts: Sequence[str]
+    ) -> dict[str, list[float]]:
+        """Load stored embeddings of the given documents keyed by chunk text.
+
+        Only vectors of chunks whose text is about to be embedded are read
+        (one per text), rather than every stored vector of the documents.
+        Only documents embedded with the configured model and dimension are
+        considered, so a model change re-embeds every chunk.
+        """
+        if not doc_ids or not texts:
+            return {}
+        needed = bindparam("needed_texts", sorted(set(texts)), type_=ARRAY(Text))
+        result = await self.db.execute(
+            select(DocChunk.text, DocChunk.embedding)
+            .distinct(DocChunk.text)
+            .join(Document, Document.doc_id == DocChunk.doc_id)
+            .where(
+                DocChunk.doc_id.in_(doc_ids),
+                DocChunk.text == any_(needed),
+                DocChunk.embedding.isnot(None),
+                Document.embedding_key == self._embedding_key(),
+            )
+        )
+        return {row.text: list(row.embedding) for row in result.all()}
+
+    async def _fill_embeddings(
+        self,
+        texts: list[str],
+        embeddings: list[list[float] | None],
+        reusable: dict[str, list[float]],
+    ) -> tuple[int, int]:
+        """Fill ``embeddings`` in place, reusing stored vectors for unchanged texts.
+
+        Returns:
+            Tuple of (embeddings generated, embeddings reused)
+        """
+        missing: list[int] = []
+        for index, text in enumerate(texts):
+            stored = reusable.get(text)
+            if stored is not None:
+                embeddings[index] = stored
+            else:
+                missing.append(index)
+
+        if missing:
+            vectors = await self._embed_in_batches([texts[i] for i in missing])
+            for index, vector in zip(missing, vectors, strict=True):
+                embeddings[index] = vector
+
+        return len(missing), len(texts) - len(missing)
+
+    async def _embed_in_batches(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts in packed batches with bounded provider concurrency.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embeddings aligned with ``texts``
+        """
+        batches = pack_embedding_batches(
+            texts,
+            max_items=settings.embedding_batch_size,
+            max_tokens=settings.embedding_batch_max_tokens,
+        )
+        semaphore = asyncio.Semaphore(max(settings.embedding_max_concurrency, 1))
+        embeddings: list[list[float]] = [[] for _ in texts]
+
+        async def embed_batch(batch: list[int]) -> None:
+            async with semaphore:
+                vectors = await self.embedding.embed_texts([texts[i] for i in batch])
+            for index, vector in zip(batch, vectors, strict=True):
+                embeddings[index] = vector
+
+        tasks = [asyncio.create_task(embed_batch(batch)) for batch in batches]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return embeddings
+
+    def _build_chunk(
+        self,
+        doc: Document,
+        chunk_result: ChunkResult,
+        embedding: list[float] | None,
+    ) -> ChunkRow:
+        """Create a chunk row for a chunking result."""
+        return ChunkRow(
+            doc_id=doc.doc_id,
+            case_id=doc.case_id,
+            chunk_index=chunk_result.chunk_index,
+            text=chunk_result.text,
+            embedding=embedding,
+            language=doc.language,  # Inherit language from document
+            meta_json=chunk_result.meta_json,
         )
 
     async def delete_document_chunks(self, doc_id: UUID) -> int:
@@ -0,0 +1,480 @@
+"""Background job queue and worker pool for ingestion and graph sync."""
+
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import asdict
+from datetime import UTC, datetime, timedelta
+from typing import Any, Protocol
+from uuid import UUID, uuid4
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.db.neo4j import get_neo4j_driver
+from src.models import Case, Document, Job, JobStatus, JobType
+from src.services.graph_service import GraphService
+from src.services.ingestion_service import IngestionService
+
+logger = logging.getLogger(__name__)
+
+# Ingestion stages after which a document needs no further work in the job
+DOCUMENT_DONE_STAGES = frozenset({"skipped", "written"})
+
+
+class JobQueue(Protocol):
+    """FIFO transport of job IDs from the API to the workers."""
+
+    name: str
+
+    async def put(self, job_id: UUID) -> None:
+        """Enqueue a job ID."""
+        ...
+
+    async def get(self) -> UUID:
+        """Wait for and return the next job ID."""
+        ...
+
+    async def close(self) -> None:
+        """Release queue resources."""
+        ...
+
+
+class InMemoryJobQueue:
+    """Process-local queue; jobs are recovered from the database on restart."""
+
+    name = "memory"
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue[UUID] = asyncio.Queue()
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+    async def put(self, job_id: UUID) -> None:
+        """Enqueue a job ID."""
+        self._queue.put_nowait(job_id)
+
+    async def get(self) -> UUID:
+        """Wait for and return the next job ID."""
+        return await self._queue.get()
+
+    async def close(self) -> None:
+        """Nothing to release."""
+
+
+class RedisJobQueue:
+    """Redis list shared by every API process (LPUSH / BRPOP)."""
+
+    name = "redis"
+
+    def __init__(self, url: str, key: str = "office_detective:jobs", poll_seconds: int = 1) -> None:
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            msg = "JOB_QUEUE_BACKEND=redis requires the 'redis' package"
+            raise RuntimeError(msg) from e
+
+        self.key = key
+        self.poll_seconds = poll_seconds
+        self._client = redis_asyncio.from_url(url)
+
+    async def put(self, job_id: UUID) -> None:
+        """Enqueue a job ID."""
+        await self._client.lpush(self.key, str(job_id))
+
+    async def get(self) -> UUID:
+        """Wait for and return the next job ID."""
+        while True:
+            item = await self._client.brpop([self.key], timeout=self.poll_seconds)
+            if item is not None:
+                _, value = item
+                return UUID(value.decode() if isinstance(value, bytes) else value)
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self._client.aclose()
+
+
+def build_job_queue(backend: str | None = None) -> JobQueue:
+    """Build the job queue for a configured backend name.
+
+    Args:
+        backend: "memory" or "redis" (defaults to settings.job_queue_backend)
+
+    Returns:
+        JobQueue instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    selected = (backend or settings.job_queue_backend).strip().lower()
+    if selected == "memory":
+        return InMemoryJobQueue()
+    if selected == "redis":
+        return RedisJobQueue(settings.redis_url)
+    msg = f"Unknown job queue backend: {selected}"
+    raise ValueError(msg)
+
+
+class JobService:
+    """Service for creating and reading background jobs."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        """Initialize job service.
+
+        Args:
+            db: Database session
+        """
+        self.db = db
+
+    async def enqueue(
+        self,
+        case_id: UUID,
+        job_type: JobType,
+        params: dict[str, Any] | None = None,
+    ) -> Job:
+        """Persist a queued job and hand it to the worker pool.
+
+        The job row is committed before it is enqueued so a worker in any
+        process can claim it.
+
+        Args:
+            case_id: Case the job operates on
+            job_type: Kind of job
+            params: Job parameters (e.g. generate_embeddings, force)
+
+        Returns:
+            The queued Job
+
+        Raises:
+            ValueError: If case not found
+        """
+        if await self.db.get(Case, case_id) is None:
+            msg = f"Case {case_id} not found"
+            raise ValueError(msg)
+
+        job = Job(case_id=case_id, job_type=job_type, params_json=params or {})
+        self.db.add(job)
+        await self.db.commit()
+        await get_job_workers().submit(job.job_id)
+        return job
+
+    async def get_job(self, job_id: UUID) -> Job | None:
+        """Get a job by ID.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Job or None if not found
+        """
+        result = await self.db.execute(select(Job).where(Job.job_id == job_id))
+        return result.scalar_one_or_none()
+
+
+class JobProgress:
+    """Ingestion progress callback that persists per-document stages.
+
+    Writes go through their own short sessions so progress is visible while
+    the ingestion transaction is still open.
+    """
+
+    def __init__(
+        self,
+        job_id: UUID,
+        session_maker: async_sessionmaker[AsyncSession],
+        doc_ids: Sequence[UUID],
+    ) -> None:
+        self.job_id = job_id
+        self.session_maker = session_maker
+        self.stages: dict[str, str] = {str(doc_id): "queued" for doc_id in doc_ids}
+
+    @property
+    def documents_done(self) -> int:
+        """Number of documents that need no further work."""
+        return sum(1 for stage in self.stages.values() if stage in DOCUMENT_DONE_STAGES)
+
+    async def __call__(self, doc_ids: Sequence[UUID], stage: str) -> None:
+        """Record that documents reached a stage."""
+        for doc_id in doc_ids:
+            self.stages[str(doc_id)] = stage
+        await self.save()
+
+    async def save(self) -> None:
+        """Persist the current stages."""
+        async with self.session_maker() as session:
+            await session.execute(
+                update(Job)
+                .where(Job.job_id == self.job_id)
+                .values(
+                    progress_json=dict(self.stages),
+                    documents_total=len(self.stages),
+                    documents_done=self.documents_done,
+                )
+            )
+            await session.commit()
+
+
+JobHandler = Callable[[Job], Awaitable[dict[str, Any]]]
+
+
+class JobWorkerPool:
+    """Asyncio workers that claim queued jobs and run them."""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        session_maker: async_sessionmaker[AsyncSession],
+        concurrency: int = 2,
+    ) -> None:
+        """Initialize worker pool.
+
+        Args:
+            queue: Queue delivering job IDs
+            session_maker: Session factory for job state and job work
+            concurrency: Number of worker tasks
+        """
+        self.queue = queue
+        self.session_maker = session_maker
+        self.concurrency = max(concurrency, 1)
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._tasks: list[asyncio.Task[None]] = []
+        self._idle: set[asyncio.Task[Any] | None] = set()
+        self._stopping = False
+        self._handlers: dict[JobType, JobHandler] = {
+            JobType.ingest: self._run_ingest,
+            JobType.graph_sync: self._run_graph_sync,
+        }
+
+    @property
+    def running(self) -> bool:
+        """Whether worker tasks are active."""
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """Recover abandoned jobs and start the workers."""
+        if self._tasks:
+            return
+        await self.recover()
+        self._stopping = False
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+
+    async def stop(self) -> None:
+        """Stop the workers and close the queue.
+
+        Idle workers are cancelled; busy workers finish their current job
+        first so no job is interrupted mid-transaction.
+        """
+        self._stopping = True
+        for task in list(self._idle):
+            if task is not None:
+                task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        await self.queue.close()
+
+    async def submit(self, job_id: UUID) -> None:
+        """Enqueue a persisted job."""
+        await self.queue.put(job_id)
+
+    async def recover(self) -> int:
+        """Re-enqueue jobs abandoned by workers that died.
+
+        Running jobs whose heartbeat is older than ``job_lease_seconds`` go
+        back to queued; jobs still heartbeating belong to a live worker (in
+        this or another process) and are left alone. Queued jobs are
+        re-enqueued too: with the in-memory queue all of them, as they were
+        lost with the previous process's queue; with Redis those queued for
+        longer than the lease, whose ID may have been popped by a worker
+        that died before claiming it. A duplicate delivery is ignored at
+        claim time.
+
+        Returns:
+            Number of jobs re-enqueued
+        """
+        stale_before = datetime.now(UTC) - timedelta(seconds=settings.job_lease_seconds)
+        async with self.session_maker() as session:
+            result = await session.execute(
+                update(Job)
+                .where(
+                    Job.status == JobStatus.running,
+                    (Job.heartbeat_at.is_(None)) | (Job.heartbeat_at < stale_before),
+                )
+                .values(status=JobStatus.queued, worker_id=None, heartbeat_at=None)
+                .returning(Job.job_id)
+            )
+            reclaimed = list(result.scalars().all())
+            queued = (
+                select(Job.job_id).where(Job.status == JobStatus.queued).order_by(Job.created_at)
+            )
+            if not isinstance(self.queue, InMemoryJobQueue):
+                queued = queued.where(Job.created_at < stale_before)
+            result = await session.execute(queued)
+            job_ids = list(dict.fromkeys([*reclaimed, *result.scalars().all()]))
+            await session.commit()
+
+        for job_id in job_ids:
+            await self.queue.put(job_id)
+        return len(job_ids)
+
+    async def run_job(self, job_id: UUID) -> None:
+        """Claim and execute a job, recording its outcome.
+
+        A job is only run if it is still queued, so duplicate deliveries are
+        ignored.
+
+        Args:
+            job_id: Job ID
+        """
+        job = await self._claim(job_id)
+        if job is None:
+            return
+
+        heartbeat = asyncio.create_task(self._heartbeat(job_id), name=f"job-heartbeat-{job_id}")
+        try:
+            result = await self._handlers[job.job_type](job)
+        except Exception as exc:
+            logger.exception("Job %s (%s) failed", job_id, job.job_type.value)
+            await self._finish(job_id, JobStatus.failed, error=str(exc) or type(exc).__name__)
+        else:
+            await self._finish(job_id, JobStatus.succeeded, result=result)
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+
+    async def _worker(self) -> None:
+        task = asyncio.current_task()
+        while not self._stopping:
+            self._idle.add(task)
+            try:
+                job_id = await self.queue.get()
+            finally:
+                self._idle.discard(task)
+            try:
+                await self.run_job(job_id)
+            except Exception:
+                logger.exception("Worker could not process job %s", job_id)
+
+    async def _heartbeat(self, job_id: UUID) -> None:
+        """Keep the lease on a running job fresh until cancelled."""
+        while True:
+            await asyncio.sleep(settings.job_heartbeat_seconds)
+            try:
+                async with self.session_maker() as session:
+                    await session.execute(
+                        update(Job)
+                        .where(
+                            Job.job_id == job_id,
+                            Job.worker_id == self.worker_id,
+                            Job.status == JobStatus.running,
+                        )
+                        .values(heartbeat_at=datetime.now(UTC))
+                    )
+                    await session.commit()
+            except Exception:
+                logger.warning("Could not refresh heartbeat of job %s", job_id, exc_info=True)
+
+    async def _claim(self, job_id: UUID) -> Job | None:
+        now = datetime.now(UTC)
+        async with self.session_maker() as session:
+            result = await session.execute(
+                update(Job)
+                .where(Job.job_id == job_id, Job.status == JobStatus.queued)
+                .values(
+                    status=JobStatus.running,
+                    started_at=now,
+                    worker_id=self.worker_id,
+                    heartbeat_at=now,
+                )
+                .returning(Job)
+            )
+            job = result.scalar_one_or_none()
+            if job is not None:
+                session.expunge(job)
+            await session.commit()
+            return job
+
+    async def _finish(
+        self,
+        job_id: UUID,
+        status: JobStatus,
+        *,
+        result: dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> None:
+        values: dict[str, Any] = {
+            "status": status,
+            "finished_at": datetime.now(UTC),
+            "result_json": result,
+            "error": error,
+        }
+        if status is JobStatus.succeeded:
+            values["documents_done"] = Job.documents_total
+        async with self.session_maker() as session:
+            await session.execute(update(Job).where(Job.job_id == job_id).values(**values))
+            await session.commit()
+
+    async def _run_ingest(self, job: Job) -> dict[str, Any]:
+        async with self.session_maker() as db:
+            result = await db.execute(
+                select(Document.doc_id).where(Document.case_id == job.case_id)
+            )
+            progress = JobProgress(job.job_id, self.session_maker, list(result.scalars().all()))
+            await progress.save()
+
+            ingestion = await IngestionService(db).ingest_case(
+                job.case_id,
+                generate_embeddings=bool(job.params_json.get("generate_embeddings", True)),
+                force=bool(job.params_json.get("force", False)),
+                progress=progress,
+            )
+            await db.commit()
+
+        summary = asdict(ingestion)
+        summary["case_id"] = str(ingestion.case_id)
+        return summary
+
+    async def _run_graph_sync(self, job: Job) -> dict[str, Any]:
+        driver = await get_neo4j_driver()
+        async with self.session_maker() as db, driver.session() as neo4j:
+            sync = await GraphService(neo4j, db).sync_case(
+                job.case_id, full=bool(job.params_json.get("full", False))
+            )
+
+        summary = asdict(sync)
+        summary["case_id"] = str(sync.case_id)
+        return summary
+
+
+_workers: JobWorkerPool | None = None
+
+
+def get_job_workers() -> JobWorkerPool:
+    """Get the process-wide job worker pool."""
+    global _workers
+    if _workers is None:
+        from src.db.session import async_session_maker
+
+        _workers = JobWorkerPool(
+            build_job_queue(),
+            async_session_maker,
+            concurrency=settings.job_worker_concurrency,
+        )
+    return _workers
+
+
+def reset_job_workers() -> None:
+    """Drop the process-wide worker pool so it is rebuilt on next use."""
+    global _workers
+    _workers = None
@@ -0,0 +1,158 @@
+"""Entity mention extraction with an Aho-Corasick automaton."""
+
+from collections import deque
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from src.models.document import Document, Entity
+
+
+@dataclass(frozen=True)
+class MentionSpan:
+    """An entity name or email found in a text."""
+
+    entity_id: UUID
+    span_start: int
+    span_end: int
+    mention_text: str
+
+
+def entity_patterns(entities: Iterable[Entity]) -> list[tuple[str, UUID]]:
+    """Names and emails that identify each entity in text."""
+    patterns = []
+    for entity in entities:
+        patterns.append((entity.name, entity.entity_id))
+        email = entity.attrs_json.get("email") if isinstance(entity.attrs_json, dict) else None
+        if isinstance(email, str):
+            patterns.append((email, entity.entity_id))
+    return patterns
+
+
+def select_longest(spans: Sequence[MentionSpan]) -> list[MentionSpan]:
+    """Keep the leftmost-longest non-overlapping spans.
+
+    A span shared by several entities (e.g. two people with the same name) is
+    kept for each of them.
+    """
+    chosen: list[MentionSpan] = []
+    last_end = 0
+    for span in sorted(spans, key=lambda s: (s.span_start, -s.span_end, str(s.entity_id))):
+        previous = chosen[-1] if chosen else None
+        if previous and (span.span_start, span.span_end) == (
+            previous.span_start,
+            previous.span_end,
+        ):
+            chosen.append(span)
+        elif span.span_start >= last_end:
+            chosen.append(span)
+            last_end = span.span_end
+    return chosen
+
+
+class MentionExtractor:
+    """Finds every occurrence of a set of patterns in one pass over a text.
+
+    Patterns are matched case-insensitively as substrings (the same rule as
+    ``pattern in text.lower()``), but the cost of a scan is linear in the text
+    length plus the number of matches, independent of how many patterns were
+    compiled. Build one extractor per case and reuse it for every document.
+    """
+
+    def __init__(self, patterns: Iterable[tuple[str, UUID]]) -> None:
+        """Compile the automaton.
+
+        Args:
+            patterns: (pattern, entity_id) pairs; blank patterns are ignored
+        """
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Per state: (pattern length, entity_id) of every pattern ending there
+        self._out: list[list[tuple[int, UUID]]] = [[]]
+
+        for pattern, entity_id in patterns:
+            key = pattern.strip().casefold()
+            if not key:
+                continue
+            state = 0
+            for char in key:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    self._goto[state][char] = next_state
+                state = next_state
+            if (len(key), entity_id) not in self._out[state]:
+                self._out[state].append((len(key), entity_id))
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    @classmethod
+    def from_entities(cls, entities: Iterable[Entity]) -> "MentionExtractor":
+        """Compile an extractor for the names and emails of a case's entities."""
+        return cls(entity_patterns(entities))
+
+    def __bool__(self) -> bool:
+        """Whether any pattern was compiled."""
+        return bool(self._goto[0])
+
+    def find_all(self, text: str) -> list[MentionSpan]:
+        """Find every (possibly overlapping) match, with offsets into ``text``."""
+        spans: list[MentionSpan] = []
+        if not text or not self:
+            return spans
+
+        state = 0
+        # Offset in ``text`` of each casefolded character scanned so far
+        origins: list[int] = []
+        for index, original in enumerate(text):
+            for char in original.casefold():
+                origins.append(index)
+                while state and char not in self._goto[state]:
+                    state = self._fail[state]
+                state = self._goto[state].get(char, 0)
+                for length, entity_id in self._out[state]:
+                    start = origins[len(origins) - length]
+                    spans.append(MentionSpan(entity_id, start, index + 1, text[start : index + 1]))
+        return spans
+
+    def find_entities(self, *texts: str) -> set[UUID]:
+        """IDs of the entities mentioned anywhere in the texts."""
+        return {span.entity_id for text in texts for span in self.find_all(text)}
+
+    def first_match(self, text: str) -> UUID | None:
+        """Entity of the leftmost (then longest) match, if any."""
+        spans = self.find_all(text)
+        if not spans:
+            return None
+        return min(spans, key=lambda s: (s.span_start, -s.span_end)).entity_id
+
+    def mentions(self, text: str) -> list[MentionSpan]:
+        """Non-overlapping mentions, preferring the longest match at each position."""
+        return select_longest(self.find_all(text))
+
+    def mention_rows(self, doc: Document) -> list[dict[str, Any]]:
+        """``mentions`` rows for a document's body (spans index into ``doc.body``)."""
+        return [
+            {
+                "case_id": doc.case_id,
+                "doc_id": doc.doc_id,
+                "entity_id": span.entity_id,
+                "span_start": span.span_start,
+                "span_end": span.span_end,
+                "mention_text": span.mention_text,
+            }
+            for span in self.mentions(doc.body)
+        ]
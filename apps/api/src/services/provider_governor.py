@@ -0,0 +1,268 @@
+"""Concurrency limits, rate shaping and circuit breaking for outbound provider calls."""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import dataclass
+from enum import StrEnum
+from threading import Lock
+from time import monotonic
+
+from openai import APIConnectionError, APIStatusError, RateLimitError
+
+from src.config import settings
+
+# Governor name for the embedding endpoint; LLM governors use the provider name
+EMBEDDINGS = "embeddings"
+
+
+class ProviderUnavailableError(RuntimeError):
+    """Raised instead of calling a provider whose circuit breaker is open."""
+
+    def __init__(self, provider: str) -> None:
+        super().__init__(f"Provider {provider} is unavailable (circuit open)")
+        self.provider = provider
+
+
+def is_availability_error(exc: BaseException) -> bool:
+    """Whether an error means the provider is unavailable rather than the request bad.
+
+    Timeouts, connection errors, rate limiting (429) and server errors (5xx)
+    count against the provider; invalid requests (4xx) and errors raised by
+    the caller's own code do not.
+    """
+    if isinstance(exc, TimeoutError | APIConnectionError | RateLimitError):
+        return True
+    return isinstance(exc, APIStatusError) and exc.status_code >= 500
+
+
+class BreakerState(StrEnum):
+    """Circuit breaker states."""
+
+    closed = "closed"
+    open = "open"
+    half_open = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` failures in a row the breaker opens and calls
+    are refused for ``reset_seconds``. It then lets a single probe call
+    through (half open): a success closes it, a failure opens it again.
+    A threshold of 0 disables the breaker.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_seconds: float,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.consecutive_failures = 0
+        self.times_opened = 0
+        self._clock = clock
+        self._opened_at: float | None = None
+        self._probing = False
+        self._lock = Lock()
+
+    @property
+    def state(self) -> BreakerState:
+        """Current state (an open breaker becomes half open after the reset time)."""
+        if self._opened_at is None:
+            return BreakerState.closed
+        if self._clock() - self._opened_at >= self.reset_seconds:
+            return BreakerState.half_open
+        return BreakerState.open
+
+    def allow(self) -> bool:
+        """Whether a call may go out now (claims the probe when half open)."""
+        with self._lock:
+            state = self.state
+            if state is BreakerState.closed:
+                return True
+            if state is BreakerState.half_open and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        with self._lock:
+            self.consecutive_failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the breaker at the threshold."""
+        with self._lock:
+            self.consecutive_failures += 1
+            reopen = self._probing or self._opened_at is not None
+            self._probing = False
+            if self.failure_threshold > 0 and (
+                reopen or self.consecutive_failures >= self.failure_threshold
+            ):
+                if self._opened_at is None:
+                    self.times_opened += 1
+                self._opened_at = self._clock()
+
+    def release_probe(self) -> None:
+        """Give up a probe call that ended without a result (e.g. cancelled)."""
+        with self._lock:
+            self._probing = False
+
+
+class TokenBucket:
+    """Token bucket that spaces calls to a sustained rate with bounded bursts.
+
+    Callers reserve a token and sleep until it is due, so waiting callers are
+    served in arrival order without holding a lock across the sleep.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: float,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.rate_per_second = rate_per_second
+        self.burst = max(burst, 1.0)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated_at = clock()
+        self._lock = Lock()
+
+    def reserve(self) -> float:
+        """Take a token, returning the seconds to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self.rate_per_second
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate_per_second
+
+    async def acquire(self) -> None:
+        """Wait until a call may be made."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+@dataclass
+class GovernorStatus:
+    """Snapshot of a provider governor for health reporting."""
+
+    state: BreakerState
+    consecutive_failures: int
+    times_opened: int
+    in_flight: int
+    max_concurrency: int
+    requests_per_minute: float
+
+
+class ProviderGovernor:
+    """Shared gate for outbound calls to one provider.
+
+    Calls run inside ``slot()``, which fails fast with
+    ``ProviderUnavailableError`` while the breaker is open, waits for one of
+    ``max_concurrency`` slots and for the rate limiter, and records the
+    outcome on the breaker: only availability errors (see
+    ``is_availability_error``) count as failures, so malformed requests
+    cannot open the breaker for everyone. Zero concurrency or rate means
+    unlimited.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        requests_per_minute: float,
+        breaker: CircuitBreaker,
+    ) -> None:
+        self.name = name
+        self.max_concurrency = max(max_concurrency, 0)
+        self.requests_per_minute = max(requests_per_minute, 0.0)
+        self.breaker = breaker
+        self.in_flight = 0
+        self._semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        rate = self.requests_per_minute / 60
+        self._bucket = TokenBucket(rate, burst=rate) if rate else None
+
+    @property
+    def available(self) -> bool:
+        """Whether calls are currently let through (breaker not open)."""
+        return self.breaker.state is not BreakerState.open
+
+    def status(self) -> GovernorStatus:
+        """Snapshot for health reporting."""
+        return GovernorStatus(
+            state=self.breaker.state,
+            consecutive_failures=self.breaker.consecutive_failures,
+            times_opened=self.breaker.times_opened,
+            in_flight=self.in_flight,
+            max_concurrency=self.max_concurrency,
+            requests_per_minute=self.requests_per_minute,
+        )
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Run one outbound call under the provider's limits.
+
+        Raises:
+            ProviderUnavailableError: If the breaker is open
+        """
+        if not self.breaker.allow():
+            raise ProviderUnavailableError(self.name)
+        try:
+            async with self._semaphore or nullcontext():
+                if self._bucket is not None:
+                    await self._bucket.acquire()
+                self.in_flight += 1
+                try:
+                    yield
+                finally:
+                    self.in_flight -= 1
+        except Exception as exc:
+            if is_availability_error(exc):
+                self.breaker.record_failure()
+            else:
+                self.breaker.release_probe()
+            raise
+        except BaseException:
+            self.breaker.release_probe()
+            raise
+        self.breaker.record_success()
+
+
+_governors: dict[str, ProviderGovernor] = {}
+
+
+def get_provider_governor(name: str) -> ProviderGovernor:
+    """Get the process-wide governor for an LLM provider or ``EMBEDDINGS``."""
+    governor = _governors.get(name)
+    if governor is None:
+        if name == EMBEDDINGS:
+            max_concurrency = settings.embedding_provider_max_concurrency
+            requests_per_minute = settings.embedding_requests_per_minute
+        else:
+            max_concurrency = settings.llm_max_concurrency
+            requests_per_minute = settings.llm_requests_per_minute
+        governor = _governors[name] = ProviderGovernor(
+            name,
+            max_concurrency=max_concurrency,
+            requests_per_minute=requests_per_minute,
+            breaker=CircuitBreaker(
+                failure_threshold=settings.provider_breaker_failure_threshold,
+                reset_seconds=settings.provider_breaker_reset_seconds,
+            ),
+        )
+    return governor
+
+
+def reset_provider_governors() -> None:
+    """Drop all governors so they are rebuilt (closed) on next use."""
+    _governors.clear()
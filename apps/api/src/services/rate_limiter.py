@@ -1,60 +1,220 @@
-"""Simple in-memory sliding window rate limiter."""
+"""Rate limiting for API endpoints (GCRA, in memory or shared through Redis)."""
 
-from collections import deque
+import logging
+import math
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
 from threading import Lock
 from time import monotonic
+from typing import Protocol
 
+from src.config import settings
 
-class SlidingWindowRateLimiter:
-    """Thread-safe sliding window rate limiter for API endpoints."""
+logger = logging.getLogger(__name__)
 
-    def __init__(self) -> None:
-        self._events: dict[str, deque[float]] = {}
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Outcome of counting one request against a limit."""
+
+    allowed: bool
+    remaining: int
+    retry_after_seconds: int
+
+
+def _gcra(
+    tat: float, now: float, limit: int, window_seconds: int
+) -> tuple[RateLimitDecision, float]:
+    """Apply the generic cell rate algorithm to one request.
+
+    Each key keeps a single "theoretical arrival time" (TAT). A request
+    pushes it forward by ``window / limit`` and is allowed while the TAT
+    stays within one window of now, which permits ``limit`` requests per
+    window with bursts up to ``limit``.
+
+    Returns:
+        The decision and the key's new TAT (unchanged when denied)
+    """
+    interval = window_seconds / limit
+    new_tat = max(tat, now) + interval
+    allow_at = new_tat - window_seconds
+    if allow_at > now:
+        return (
+            RateLimitDecision(
+                allowed=False,
+                remaining=0,
+                retry_after_seconds=max(1, math.ceil(allow_at - now)),
+            ),
+            tat,
+        )
+    remaining = int((window_seconds - (new_tat - now)) / interval + 1e-9)
+    return RateLimitDecision(allowed=True, remaining=remaining, retry_after_seconds=0), new_tat
+
+
+class RateLimiter(Protocol):
+    """Counts requests per key against a limit per window."""
+
+    name: str
+
+    async def hit(self, key: str, limit: int, window_seconds: int) -> RateLimitDecision:
+        """Count a request, returning whether it is within the limit."""
+        ...
+
+    async def close(self) -> None:
+        """Release limiter resources."""
+        ...
+
+
+class InMemoryRateLimiter:
+    """Process-local GCRA limiter (limits are per API process).
+
+    State is one float per key. Keys are kept in update order and dropped
+    once idle long enough that their state is back to "no recent requests",
+    so memory is bounded by the keys active within a window (and by
+    ``max_keys``).
+    """
+
+    name = "memory"
+
+    def __init__(self, max_keys: int = 100_000, clock: Callable[[], float] = monotonic) -> None:
+        self.max_keys = max(max_keys, 1)
+        self._clock = clock
+        self._tats: OrderedDict[str, float] = OrderedDict()
         self._lock = Lock()
 
-    def allow(self, key: str, limit: int, window_seconds: int) -> bool:
-        """Check and record an event if within the configured limit."""
-        if limit <= 0 or window_seconds <= 0:
-            return True
+    def __len__(self) -> int:
+        return len(self._tats)
 
-        now = monotonic()
-        with self._lock:
-            bucket = self._events.setdefault(key, deque())
-            self._evict_old(bucket, now, window_seconds)
-            if len(bucket) >= limit:
-                return False
-            bucket.append(now)
-            return True
-
-    def retry_after_seconds(self, key: str, window_seconds: int) -> int:
-        """Return a conservative retry-after hint in whole seconds."""
-        if window_seconds <= 0:
-            return 1
-
-        now = monotonic()
-        with self._lock:
-            bucket = self._events.get(key)
-            if not bucket:
-                return 1
-            self._evict_old(bucket, now, window_seconds)
-            if not bucket:
-                return 1
-            oldest = bucket[0]
-            remaining = max(1.0, (oldest + window_seconds) - now)
-            return int(remaining) if remaining.is_integer() else int(remaining) + 1
-
-    def remaining(self, key: str, limit: int, window_seconds: int) -> int:
-        """Return remaining events for the current window."""
-        if limit <= 0:
-            return 0
-        now = monotonic()
+    async def hit(self, key: str, limit: int, window_seconds: int) -> RateLimitDecision:
+        """Count a request, returning whether it is within the limit."""
+        if limit <= 0 or window_seconds <= 0:
+            return RateLimitDecision(allowed=True, remaining=max(limit, 0), retry_after_seconds=0)
+        now = self._clock()
         with self._lock:
-            bucket = self._events.setdefault(key, deque())
-            self._evict_old(bucket, now, window_seconds)
-            return max(0, limit - len(bucket))
-
-    @staticmethod
-    def _evict_old(bucket: deque[float], now: float, window_seconds: int) -> None:
-        cutoff = now - window_seconds
-        while bucket and bucket[0] <= cutoff:
-            bucket.popleft()
+            decision, tat = _gcra(self._tats.get(key, now), now, limit, window_seconds)
+            if decision.allowed:
+                self._tats[key] = tat
+                self._tats.move_to_end(key)
+            self._evict(now)
+        return decision
+
+    async def close(self) -> None:
+        """Nothing to release."""
+
+    def _evict(self, now: float) -> None:
+        while self._tats:
+            key, tat = next(iter(self._tats.items()))
+            if tat > now and len(self._tats) <= self.max_keys:
+                break
+            del self._tats[key]
+
+
+# KEYS[1] = limiter key; ARGV = limit, window seconds.
+# Returns {allowed, remaining, retry-after milliseconds}.
+_GCRA_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local interval = window / limit
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+local new_tat = math.max(tat, now) + interval
+local allow_at = new_tat - window
+if allow_at > now then
+  return {0, 0, math.ceil((allow_at - now) * 1000)}
+end
+redis.call('SET', KEYS[1], string.format('%.6f', new_tat), 'PX', math.ceil((new_tat - now) * 1000))
+return {1, math.floor((window - (new_tat - now)) / interval + 0.000001), 0}
+"""
+
+
+class RedisRateLimiter:
+    """GCRA limiter shared by every API process through one Redis key per client.
+
+    The check-and-update runs as a Lua script, so it is atomic across
+    processes and uses the Redis server clock. Keys expire once idle. If
+    Redis is unreachable requests are allowed (and a warning logged) rather
+    than failing the endpoint.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, prefix: str = "office_detective:ratelimit:") -> None:
+        try:
+            from redis import asyncio as redis_asyncio
+            from redis.exceptions import RedisError
+        except ImportError as e:
+            msg = "RATE_LIMIT_BACKEND=redis requires the 'redis' package"
+            raise RuntimeError(msg) from e
+
+        self.prefix = prefix
+        self._client = redis_asyncio.from_url(url)
+        self._script = self._client.register_script(_GCRA_SCRIPT)
+        self._errors: tuple[type[Exception], ...] = (RedisError, OSError)
+
+    async def hit(self, key: str, limit: int, window_seconds: int) -> RateLimitDecision:
+        """Count a request, returning whether it is within the limit."""
+        if limit <= 0 or window_seconds <= 0:
+            return RateLimitDecision(allowed=True, remaining=max(limit, 0), retry_after_seconds=0)
+        try:
+            allowed, remaining, retry_after_ms = await self._script(
+                keys=[self.prefix + key], args=[limit, window_seconds]
+            )
+        except self._errors as e:
+            logger.warning("Rate limiter unavailable, allowing request: %s", e)
+            return RateLimitDecision(allowed=True, remaining=limit, retry_after_seconds=0)
+        retry_after = max(1, math.ceil(int(retry_after_ms) / 1000)) if not allowed else 0
+        return RateLimitDecision(
+            allowed=bool(allowed), remaining=int(remaining), retry_after_seconds=retry_after
+        )
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self._client.aclose()
+
+
+def build_rate_limiter(backend: str | None = None) -> RateLimiter:
+    """Build the rate limiter for a configured backend name.
+
+    Args:
+        backend: "memory" or "redis" (defaults to settings.rate_limit_backend)
+
+    Returns:
+        RateLimiter instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    selected = (backend or settings.rate_limit_backend).strip().lower()
+    if selected == "memory":
+        return InMemoryRateLimiter(max_keys=settings.rate_limit_max_keys)
+    if selected == "redis":
+        return RedisRateLimiter(settings.redis_url)
+    msg = f"Unknown rate limit backend: {selected}"
+    raise ValueError(msg)
+
+
+_rate_limiter: RateLimiter | None = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = build_rate_limiter()
+    return _rate_limiter
+
+
+async def close_rate_limiter() -> None:
+    """Close the process-wide rate limiter, if one was built."""
+    global _rate_limiter
+    if _rate_limiter is not None:
+        await _rate_limiter.close()
+        _rate_limiter = None
+
+
+def reset_rate_limiter() -> None:
+    """Drop the process-wide rate limiter so it is rebuilt (empty) on next use."""
+    global _rate_limiter
+    _rate_limiter = None
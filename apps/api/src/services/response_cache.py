@@ -0,0 +1,195 @@
+"""Semantic cache of ARIA answers to opening questions."""
+
+import math
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from operator import mul
+from threading import Lock
+from time import monotonic
+from uuid import UUID
+
+from src.config import settings
+from src.schemas.chat import ChatResponse
+from src.services.embedding_cache import normalize_query
+
+# (case_id, language, "provider/model", case ingest version)
+ResponseCacheScope = tuple[UUID, str, str, str]
+
+
+@dataclass
+class ResponseCacheStats:
+    """Counters for the chat response cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True)
+class _CachedResponse:
+    created_at: float
+    unit_embedding: tuple[float, ...]
+    response: ChatResponse
+
+
+def _unit(vector: Sequence[float]) -> tuple[float, ...]:
+    norm = math.sqrt(sum(map(mul, vector, vector)))
+    return tuple(value / norm for value in vector) if norm else tuple(vector)
+
+
+class ResponseCache:
+    """Process-wide LRU cache of chat answers, matched by question similarity.
+
+    Answers are grouped by scope (case, language, provider/model, ingest
+    version). A lookup
+    embeds the normalized question and returns the answer whose question has
+    the highest cosine similarity in the scope, if it reaches
+    ``similarity_threshold``; scopes are small (the opening questions asked
+    about one case), so they are scanned linearly. The ingest version is
+    the case's ``ingested_at``, so answers citing chunks replaced by a
+    re-ingest stop matching in every process; the re-ingesting process also
+    drops them right away.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        similarity_threshold: float,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.max_entries = max(max_entries, 0)
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.stats = ResponseCacheStats()
+        self._clock = clock
+        # Recency order of (scope, normalized question) across all scopes
+        self._lru: OrderedDict[tuple[ResponseCacheScope, str], None] = OrderedDict()
+        self._scopes: dict[ResponseCacheScope, dict[str, _CachedResponse]] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    @staticmethod
+    def scope(
+        case_id: UUID, language: str, provider: str, ingest_version: str
+    ) -> ResponseCacheScope:
+        """Cache scope for answers from a provider's configured model."""
+        return (
+            case_id,
+            language,
+            f"{provider}/{settings.provider_model_name(provider)}",
+            ingest_version,
+        )
+
+    def get(self, scope: ResponseCacheScope, embedding: Sequence[float]) -> ChatResponse | None:
+        """Return the answer to the most similar cached question, or None."""
+        query = _unit(embedding)
+        now = self._clock()
+        with self._lock:
+            entries = self._scopes.get(scope, {})
+            best: tuple[float, str] | None = None
+            for question, entry in list(entries.items()):
+                if self.ttl_seconds > 0 and now - entry.created_at >= self.ttl_seconds:
+                    self._remove(scope, question)
+                    self.stats.expirations += 1
+                    continue
+                similarity = sum(map(mul, query, entry.unit_embedding))
+                if similarity >= self.similarity_threshold and (
+                    best is None or similarity > best[0]
+                ):
+                    best = (similarity, question)
+            if best is None:
+                self.stats.misses += 1
+                return None
+            self._lru.move_to_end((scope, best[1]))
+            self.stats.hits += 1
+            return entries[best[1]].response
+
+    def set(
+        self,
+        scope: ResponseCacheScope,
+        question: str,
+        embedding: Sequence[float],
+        response: ChatResponse,
+    ) -> None:
+        """Cache an answer, evicting least recently used entries beyond capacity."""
+        if self.max_entries == 0:
+            return
+        normalized = normalize_query(question)
+        entry = _CachedResponse(self._clock(), _unit(embedding), response)
+        with self._lock:
+            self._scopes.setdefault(scope, {})[normalized] = entry
+            self._lru[(scope, normalized)] = None
+            self._lru.move_to_end((scope, normalized))
+            while len(self._lru) > self.max_entries:
+                oldest_scope, oldest_question = next(iter(self._lru))
+                self._remove(oldest_scope, oldest_question)
+                self.stats.evictions += 1
+
+    def invalidate_case(self, case_id: UUID) -> int:
+        """Drop every cached answer about a case.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        with self._lock:
+            for scope in [scope for scope in self._scopes if scope[0] == case_id]:
+                for question in list(self._scopes[scope]):
+                    self._remove(scope, question)
+                    removed += 1
+            self.stats.invalidations += removed
+        return removed
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._lru.clear()
+            self._scopes.clear()
+
+    def _remove(self, scope: ResponseCacheScope, question: str) -> None:
+        del self._lru[(scope, question)]
+        entries = self._scopes[scope]
+        del entries[question]
+        if not entries:
+            del self._scopes[scope]
+
+
+_response_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Get the process-wide chat response cache (None when disabled)."""
+    global _response_cache
+    if settings.chat_response_cache_max_entries <= 0:
+        return None
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            max_entries=settings.chat_response_cache_max_entries,
+            ttl_seconds=settings.chat_response_cache_ttl_seconds,
+            similarity_threshold=settings.chat_response_cache_similarity,
+        )
+    return _response_cache
+
+
+def invalidate_case_responses(case_id: UUID) -> None:
+    """Drop cached answers about a case from the process-wide cache, if any."""
+    if _response_cache is not None:
+        _response_cache.invalidate_case(case_id)
+
+
+def reset_response_cache() -> None:
+    """Drop the process-wide chat response cache so it is rebuilt on next use."""
+    global _response_cache
+    _response_cache = None
@@ -1,19 +1,41 @@
 """Search service for semantic similarity search over documents."""
 
 import logging
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import case, or_, select
+from sqlalchemy import (
+    Select,
+    String,
+    bindparam,
+    case,
+    cast,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+    true,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.document import DocChunk, DocType, Document
+from src.config import settings
+from src.models.document import TEXT_SEARCH_CONFIGS, DocChunk, DocType, Document
+from src.schemas.search import SearchMode
 from src.services.embedding_service import EmbeddingService
+from src.services.provider_governor import ProviderUnavailableError
 
 logger = logging.getLogger(__name__)
 
+# Whether the pg_trgm extension is installed; resolved on first keyword fallback
+_pg_trgm_installed: bool | None = None
+# Whether pgvector supports hnsw.iterative_scan (>= 0.8); resolved on first ANN search
+_iterative_scan_supported: bool | None = None
+
 
 @dataclass
 class SearchResult:
@@ -31,6 +53,38 @@ class SearchResult:
     ts: datetime
 
 
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[SearchResult]],
+    *,
+    rrf_k: int = 60,
+) -> list[SearchResult]:
+    """Fuse ranked result lists with reciprocal rank fusion.
+
+    Each chunk scores ``sum(1 / (rrf_k + rank))`` over the lists it appears
+    in. Scores are normalized by the best possible score (rank 1 in every
+    list), so they stay in the 0-1 range used by ``min_score``.
+
+    Args:
+        rankings: Result lists, each ordered best first
+        rrf_k: Rank damping constant (60 in the original RRF paper)
+
+    Returns:
+        Results ordered by fused score
+    """
+    if not rankings:
+        return []
+    fused: dict[UUID, float] = {}
+    first_seen: dict[UUID, SearchResult] = {}
+    for results in rankings:
+        for rank, result in enumerate(results, start=1):
+            fused[result.chunk_id] = fused.get(result.chunk_id, 0.0) + 1 / (rrf_k + rank)
+            first_seen.setdefault(result.chunk_id, result)
+
+    best = len(rankings) / (rrf_k + 1)
+    ordered = sorted(fused.items(), key=lambda item: item[1], reverse=True)
+    return [replace(first_seen[chunk_id], score=score / best) for chunk_id, score in ordered]
+
+
 class SearchService:
     """Service for semantic search over document chunks using pgvector."""
 
@@ -57,8 +111,10 @@ class SearchService:
         doc_types: list[DocType] | None = None,
         min_score: float = 0.0,
         language: str = "en",
+        ef_search: int | None = None,
+        mode: SearchMode = SearchMode.vector,
     ) -> list[SearchResult]:
-        """Perform semantic search within a case.
+        """Search within a case.
 
         Args:
             case_id: Case ID to search within
@@ -67,46 +123,41 @@ class SearchService:
             doc_types: Optional filter by document types
             min_score: Minimum similarity score (0-1, default 0)
             language: Language to filter results by (default "en")
+            ef_search: Optional HNSW candidate list size (higher = better
+                recall, slower); defaults to settings.hnsw_ef_search
+            mode: "vector" (semantic), "keyword" (full-text, ts_rank_cd) or
+                "hybrid" (both, fused with reciprocal rank fusion)
 
         Returns:
-            List of SearchResult objects sorted by similarity
+            List of SearchResult objects sorted by relevance
         """
-        try:
-            # Generate query embedding
-            query_embedding = await self.embedding.embed_query(query)
-
-            # Build query using pgvector cosine distance
-            # Score is 1 - distance (higher is better)
-            stmt = (
-                select(
-                    DocChunk.chunk_id,
-                    DocChunk.doc_id,
-                    DocChunk.text,
-                    DocChunk.chunk_index,
-                    DocChunk.meta_json,
-                    Document.doc_type,
-                    Document.subject,
-                    Document.ts,
-                    (1 - DocChunk.embedding.cosine_distance(query_embedding)).label("score"),
-                )
-                .join(Document, DocChunk.doc_id == Document.doc_id)
-                .where(DocChunk.case_id == case_id)
-                .where(DocChunk.language == language)
-                .where(DocChunk.embedding.isnot(None))
+        if mode is SearchMode.keyword:
+            results = await self._fulltext_search(
+                case_id, query, k=k, doc_types=doc_types, language=language
+            )
+            return [r for r in results if r.score >= min_score]
+        if mode is SearchMode.hybrid:
+            return await self._hybrid_search(
+                case_id,
+                query,
+                k=k,
+                doc_types=doc_types,
+                min_score=min_score,
+                language=language,
+                ef_search=ef_search,
             )
 
-            # Apply doc_type filter if provided
-            if doc_types:
-                stmt = stmt.where(Document.doc_type.in_(doc_types))
-
-            # Order by similarity (ascending distance = descending similarity)
-            stmt = stmt.order_by(DocChunk.embedding.cosine_distance(query_embedding)).limit(k)
-
-            result = await self.db.execute(stmt)
-            rows = result.all()
-            return self._rows_to_search_results(rows, min_score)
+        try:
+            results = await self._vector_search(
+                case_id, query, k=k, doc_types=doc_types, language=language, ef_search=ef_search
+            )
+            return [r for r in results if r.score >= min_score]
         except Exception as exc:
-            logger.warning("Semantic search failed, falling back to keyword search: %s", exc)
+            if isinstance(exc, ProviderUnavailableError):
+                # The embedding provider is being skipped; this is expected
+                logger.info("Embedding provider unavailable, using keyword search")
+            else:
+                logger.warning("Semantic search failed, falling back to keyword search: %s", exc)
             return await self._keyword_search(
                 case_id=case_id,
                 query=query,
@@ -130,6 +181,9 @@ class SearchService:
             k: Number of results to return
             same_document: If True, only search within the same document
 
+        Only chunks in the reference chunk's language are compared, so the
+        search can use that language's vector index.
+
         Returns:
             List of similar SearchResult objects
         """
@@ -140,29 +194,16 @@ class SearchService:
         if not ref_chunk or ref_chunk.embedding is None:
             return []
 
-        # Build similarity query
-        stmt = (
-            select(
-                DocChunk.chunk_id,
-                DocChunk.doc_id,
-                DocChunk.text,
-                DocChunk.chunk_index,
-                DocChunk.meta_json,
-                Document.doc_type,
-                Document.subject,
-                Document.ts,
-                (1 - DocChunk.embedding.cosine_distance(ref_chunk.embedding)).label("score"),
-            )
-            .join(Document, DocChunk.doc_id == Document.doc_id)
-            .where(DocChunk.case_id == ref_chunk.case_id)
-            .where(DocChunk.chunk_id != chunk_id)  # Exclude the reference chunk
-            .where(DocChunk.embedding.isnot(None))
-        )
-
-        if same_document:
-            stmt = stmt.where(DocChunk.doc_id == ref_chunk.doc_id)
+        await self._apply_ann_settings(k)
 
-        stmt = stmt.order_by(DocChunk.embedding.cosine_distance(ref_chunk.embedding)).limit(k)
+        stmt = await self._nearest_chunks_stmt(
+            ref_chunk.case_id,
+            ref_chunk.language,
+            list(ref_chunk.embedding),
+            k=k,
+            exclude_chunk_id=chunk_id,
+            doc_id=ref_chunk.doc_id if same_document else None,
+        )
 
         result = await self.db.execute(stmt)
         rows = result.all()
@@ -182,6 +223,229 @@ class SearchService:
             for row in rows
         ]
 
+    async def _vector_search(
+        self,
+        case_id: UUID,
+        query: str,
+        *,
+        k: int,
+        doc_types: list[DocType] | None,
+        language: str,
+        ef_search: int | None = None,
+    ) -> list[SearchResult]:
+        """Embed the query and return the k nearest chunks."""
+        query_embedding = await self.embedding.embed_query(query)
+        await self._apply_ann_settings(k, ef_search=ef_search)
+        stmt = await self._nearest_chunks_stmt(
+            case_id, language, query_embedding, k=k, doc_types=doc_types
+        )
+        result = await self.db.execute(stmt)
+        return self._rows_to_search_results(result.all(), 0.0)
+
+    async def _fulltext_search(
+        self,
+        case_id: UUID,
+        query: str,
+        *,
+        k: int,
+        doc_types: list[DocType] | None,
+        language: str,
+    ) -> list[SearchResult]:
+        """Rank chunks with Postgres full-text search.
+
+        The query is parsed with ``websearch_to_tsquery`` using the language's
+        text search configuration and matched against the generated
+        ``text_search`` column through the language's partial GIN index.
+        Scores are ``ts_rank_cd`` normalized to 0-1 (rank / (rank + 1)).
+        """
+        config = cast(TEXT_SEARCH_CONFIGS.get(language, "simple"), REGCONFIG)
+        tsquery = func.websearch_to_tsquery(config, query)
+        rank = func.ts_rank_cd(DocChunk.text_search, tsquery, 32).label("score")
+
+        stmt = (
+            select(
+                DocChunk.chunk_id,
+                DocChunk.doc_id,
+                DocChunk.text,
+                DocChunk.chunk_index,
+                DocChunk.meta_json,
+                Document.doc_type,
+                Document.subject,
+                Document.ts,
+                rank,
+            )
+            .join(Document, DocChunk.doc_id == Document.doc_id)
+            .where(DocChunk.case_id == case_id)
+            .where(DocChunk.language == bindparam("chunk_language", language, literal_execute=True))
+            .where(DocChunk.text_search.bool_op("@@")(tsquery))
+        )
+        if doc_types:
+            stmt = stmt.where(Document.doc_type.in_(doc_types))
+
+        stmt = stmt.order_by(rank.desc(), Document.ts.desc()).limit(k)
+        result = await self.db.execute(stmt)
+        return self._rows_to_search_results(result.all(), 0.0)
+
+    async def _hybrid_search(
+        self,
+        case_id: UUID,
+        query: str,
+        *,
+        k: int,
+        doc_types: list[DocType] | None,
+        min_score: float,
+        language: str,
+        ef_search: int | None,
+    ) -> list[SearchResult]:
+        """Fuse vector and full-text rankings with reciprocal rank fusion.
+
+        Both retrievers return ``search_hybrid_candidates`` results (at least
+        ``k``) before fusion. If the query cannot be embedded, the keyword
+        ranking is used on its own.
+        """
+        candidates = max(k, settings.search_hybrid_candidates)
+        rankings: list[list[SearchResult]] = []
+        try:
+            rankings.append(
+                await self._vector_search(
+                    case_id,
+                    query,
+                    k=candidates,
+                    doc_types=doc_types,
+                    language=language,
+                    ef_search=ef_search,
+                )
+            )
+        except Exception as exc:
+            logger.warning("Semantic search failed, hybrid search uses keyword results: %s", exc)
+        rankings.append(
+            await self._fulltext_search(
+                case_id, query, k=candidates, doc_types=doc_types, language=language
+            )
+        )
+
+        fused = reciprocal_rank_fusion(rankings, rrf_k=settings.search_rrf_k)
+        return [r for r in fused if r.score >= min_score][:k]
+
+    async def _nearest_chunks_stmt(
+        self,
+        case_id: UUID,
+        language: str,
+        embedding: list[float],
+        *,
+        k: int,
+        doc_types: list[DocType] | None = None,
+        exclude_chunk_id: UUID | None = None,
+        doc_id: UUID | None = None,
+    ) -> Select[Any]:
+        """Build the k-nearest-chunks query for one case and language.
+
+        Cases with at most ``vector_exact_search_max_chunks`` embedded chunks
+        in the language are searched exactly: their chunks are read through
+        the (case_id, language) index and sorted by distance, so the cost
+        follows the case size and recall is perfect. Larger cases use the
+        language's partial HNSW index; the language is rendered inline so the
+        planner can match the partial index predicate.
+        """
+        filters = [
+            DocChunk.case_id == case_id,
+            DocChunk.language == bindparam("chunk_language", language, literal_execute=True),
+            DocChunk.embedding.isnot(None),
+        ]
+        if exclude_chunk_id is not None:
+            filters.append(DocChunk.chunk_id != exclude_chunk_id)
+        if doc_id is not None:
+            filters.append(DocChunk.doc_id == doc_id)
+
+        distance = DocChunk.embedding.cosine_distance(embedding)
+        if await self._use_exact_search(case_id, language):
+            candidates = (
+                select(
+                    DocChunk.chunk_id,
+                    DocChunk.doc_id,
+                    DocChunk.text,
+                    DocChunk.chunk_index,
+                    DocChunk.meta_json,
+                    distance.label("distance"),
+                )
+                .where(*filters)
+                .cte("case_chunks")
+                .prefix_with("MATERIALIZED")
+            )
+            stmt = select(
+                candidates.c.chunk_id,
+                candidates.c.doc_id,
+                candidates.c.text,
+                candidates.c.chunk_index,
+                candidates.c.meta_json,
+                Document.doc_type,
+                Document.subject,
+                Document.ts,
+                (1 - candidates.c.distance).label("score"),
+            ).join(Document, candidates.c.doc_id == Document.doc_id)
+            order_by: Any = candidates.c.distance
+        else:
+            # Score is 1 - distance (higher is better)
+            stmt = (
+                select(
+                    DocChunk.chunk_id,
+                    DocChunk.doc_id,
+                    DocChunk.text,
+                    DocChunk.chunk_index,
+                    DocChunk.meta_json,
+                    Document.doc_type,
+                    Document.subject,
+                    Document.ts,
+                    (1 - distance).label("score"),
+                )
+                .join(Document, DocChunk.doc_id == Document.doc_id)
+                .where(*filters)
+            )
+            order_by = distance
+
+        if doc_types:
+            stmt = stmt.where(Document.doc_type.in_(doc_types))
+
+        # Ascending distance = descending similarity
+        return stmt.order_by(order_by).limit(k)
+
+    async def _use_exact_search(self, case_id: UUID, language: str) -> bool:
+        """Whether a case/language is small enough to search without the ANN index.
+
+        The count stops at the threshold, so it stays cheap for large cases.
+        """
+        limit = settings.vector_exact_search_max_chunks
+        if limit <= 0:
+            return False
+        candidates = (
+            select(DocChunk.chunk_id)
+            .where(
+                DocChunk.case_id == case_id,
+                DocChunk.language == language,
+                DocChunk.embedding.isnot(None),
+            )
+            .limit(limit + 1)
+            .subquery()
+        )
+        result = await self.db.execute(select(func.count()).select_from(candidates))
+        return int(result.scalar_one()) <= limit
+
+    async def _apply_ann_settings(self, k: int, *, ef_search: int | None = None) -> None:
+        """Set ANN search parameters for the current transaction.
+
+        ``hnsw.ef_search`` is the HNSW candidate list size and must be at
+        least ``k`` to return ``k`` rows. ``hnsw.iterative_scan`` keeps
+        scanning the index until ``k`` rows of the case survive the filters;
+        it is skipped on pgvector < 0.8, which rejects the setting.
+        """
+        ef = max(ef_search or settings.hnsw_ef_search, k)
+        configs = [func.set_config("hnsw.ef_search", str(ef), true())]
+        if settings.hnsw_iterative_scan and await self._iterative_scan_available():
+            configs.append(
+                func.set_config("hnsw.iterative_scan", settings.hnsw_iterative_scan, true())
+            )
+        await self.db.execute(select(*configs))
+
     async def _keyword_search(
         self,
         case_id: UUID,
@@ -192,17 +456,42 @@ class SearchService:
         min_score: float,
         language: str,
     ) -> list[SearchResult]:
-        """Fallback keyword search when vector embeddings are unavailable."""
+        """Fallback keyword search when vector embeddings are unavailable.
+
+        With pg_trgm installed, each term is matched with the ``<%`` word
+        similarity operator, which the trigram GIN index on ``doc_chunks.text``
+        serves, and scored with ``word_similarity``. Without it, terms are
+        matched with ``ILIKE '%term%'`` (sequential scan of the case's chunks).
+        """
         query_terms = [term.strip() for term in query.split() if len(term.strip()) > 1]
         query_terms = query_terms[:8] if query_terms else [query.strip()]
-
-        patterns = [f"%{term}%" for term in query_terms if term]
-        if not patterns:
+        query_terms = [term for term in query_terms if term]
+        if not query_terms:
             return []
 
-        match_expr: Any = case((DocChunk.text.ilike(patterns[0]), 1), else_=0)
-        for pattern in patterns[1:]:
-            match_expr = match_expr + case((DocChunk.text.ilike(pattern), 1), else_=0)
+        match_expr: Any
+        if await self._trigram_available():
+            await self.db.execute(
+                select(
+                    func.set_config(
+                        "pg_trgm.word_similarity_threshold",
+                        str(settings.keyword_trigram_threshold),
+                        true(),
+                    )
+                )
+            )
+            terms = [literal(term, String) for term in query_terms]
+            match_expr = sum(
+                (func.word_similarity(term, DocChunk.text) for term in terms[1:]),
+                func.word_similarity(terms[0], DocChunk.text),
+            )
+            term_filter = or_(*[term.op("<%")(DocChunk.text) for term in terms])
+        else:
+            patterns = [f"%{term}%" for term in query_terms]
+            match_expr = case((DocChunk.text.ilike(patterns[0]), 1), else_=0)
+            for pattern in patterns[1:]:
+                match_expr = match_expr + case((DocChunk.text.ilike(pattern), 1), else_=0)
+            term_filter = or_(*[DocChunk.text.ilike(pattern) for pattern in patterns])
         match_expr = match_expr.label("match_score")
 
         stmt = (
@@ -220,7 +509,7 @@ class SearchService:
             .join(Document, DocChunk.doc_id == Document.doc_id)
             .where(DocChunk.case_id == case_id)
             .where(DocChunk.language == language)
-            .where(or_(*[DocChunk.text.ilike(pattern) for pattern in patterns]))
+            .where(term_filter)
         )
 
         if doc_types:
@@ -230,7 +519,7 @@ class SearchService:
         result = await self.db.execute(stmt)
         rows = result.all()
 
-        max_score = float(len(patterns))
+        max_score = float(len(query_terms))
         normalized_rows: list[Any] = []
         for row in rows:
             normalized_score = float(row.match_score) / max_score if max_score > 0 else 0.0
@@ -250,6 +539,28 @@ class SearchService:
 
         return self._rows_to_search_results(normalized_rows, min_score)
 
+    async def _iterative_scan_available(self) -> bool:
+        """Whether pgvector supports ``hnsw.iterative_scan`` (checked once per process)."""
+        global _iterative_scan_supported
+        if _iterative_scan_supported is None:
+            result = await self.db.execute(
+                text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+            )
+            version = str(result.scalar() or "0")
+            parts = tuple(int(part) for part in version.split(".")[:2] if part.isdigit())
+            _iterative_scan_supported = parts >= (0, 8)
+        return _iterative_scan_supported
+
+    async def _trigram_available(self) -> bool:
+        """Whether pg_trgm is installed (checked once per process)."""
+        global _pg_trgm_installed
+        if _pg_trgm_installed is None:
+            result = await self.db.execute(
+                text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+            )
+            _pg_trgm_installed = bool(result.scalar())
+        return _pg_trgm_installed
+
     def _rows_to_search_results(self, rows: Any, min_score: float) -> list[SearchResult]:
         """Convert SQL rows into SearchResult objects."""
         results: list[SearchResult] = []
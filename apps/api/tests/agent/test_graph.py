@@ -1,6 +1,7 @@
 """Tests for ARIA agent graph."""
 
 import uuid
+from collections.abc import Generator
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -9,8 +10,14 @@ from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field
 
-from src.agent.graph import create_aria_graph, get_system_message
+from src.agent.graph import (
+    clear_aria_graph_cache,
+    create_aria_graph,
+    get_aria_graph,
+    get_system_message,
+)
 from src.agent.prompts import ARIA_SYSTEM_PROMPT
+from src.config import settings
 
 
 class SearchInput(BaseModel):
@@ -216,3 +223,51 @@ async def test_graph_invocation_with_tool_calls() -> None:
         # Last message should be from AI
         last_msg = result["messages"][-1]
         assert isinstance(last_msg, AIMessage)
+
+
+@pytest.fixture
+def graph_cache() -> Generator[None, None, None]:
+    """Start and end with an empty graph cache."""
+    clear_aria_graph_cache()
+    yield
+    clear_aria_graph_cache()
+
+
+@pytest.mark.usefixtures("graph_cache")
+def test_get_aria_graph_reuses_compiled_graph_and_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """get_aria_graph compiles once per key and shares the LLM client across tool sets."""
+    monkeypatch.setattr(settings, "deepseek_api_key", "deepseek-test-key")
+    tools = create_test_tools()
+
+    with patch("src.agent.graph.ChatOpenAI") as mock_llm_class:
+        first = get_aria_graph(tools, provider="openai")
+        second = get_aria_graph(create_test_tools(), provider="openai")
+        fewer_tools = get_aria_graph(tools[:1], provider="openai")
+        other_provider = get_aria_graph(tools, provider="deepseek")
+
+    assert first is second
+    assert fewer_tools is not first
+    assert other_provider is not first
+    # One client per provider, shared by both tool sets
+    assert mock_llm_class.call_count == 2
+
+
+@pytest.mark.usefixtures("graph_cache")
+def test_get_aria_graph_rebuilds_when_settings_change(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A changed API key or a cleared cache yields a new graph."""
+    tools = create_test_tools()
+
+    with patch("src.agent.graph.ChatOpenAI"):
+        monkeypatch.setattr(settings, "openai_api_key", "first-key")
+        first = get_aria_graph(tools, provider="openai")
+        monkeypatch.setattr(settings, "openai_api_key", "second-key")
+        rotated = get_aria_graph(tools, provider="openai")
+        clear_aria_graph_cache()
+        rebuilt = get_aria_graph(tools, provider="openai")
+
+    assert rotated is not first
+    assert rebuilt is not rotated
@@ -0,0 +1,85 @@
+"""Tests for conversation history compaction."""
+
+import json
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from src.agent.memory import (
+    SUMMARY_LIST_ITEMS,
+    SUMMARY_TEXT_CHARS,
+    compact_history,
+    history_tokens,
+    split_turns,
+    summarize_tool_message,
+)
+
+
+def _turn(question: str, doc_id: str, text_chars: int = 2000) -> list[object]:
+    """One user turn with a search call, its result and the answer."""
+    call_id = f"call-{doc_id}"
+    results = [
+        {"doc_id": doc_id, "chunk_id": f"chunk-{i}", "text": "x" * text_chars} for i in range(8)
+    ]
+    return [
+        HumanMessage(content=question),
+        AIMessage(
+            content="",
+            tool_calls=[{"name": "search_docs", "args": {"query": question}, "id": call_id}],
+        ),
+        ToolMessage(content=json.dumps(results), tool_call_id=call_id, name="search_docs"),
+        AIMessage(content=f"Answer about {doc_id}"),
+    ]
+
+
+def test_split_turns_starts_at_user_messages() -> None:
+    """Turns begin at each user message and system messages are dropped."""
+    messages = [SystemMessage(content="prompt"), *_turn("a", "d1"), *_turn("b", "d2")]
+
+    turns = split_turns(messages)
+
+    assert [len(turn) for turn in turns] == [4, 4]
+    assert all(isinstance(turn[0], HumanMessage) for turn in turns)
+
+
+def test_summarize_tool_message_keeps_ids() -> None:
+    """Summaries keep IDs, cut long texts and lists, and are idempotent."""
+    message = _turn("q", "d1")[2]
+    assert isinstance(message, ToolMessage)
+
+    summary = summarize_tool_message(message)
+    items = json.loads(summary.content)  # type: ignore[arg-type]
+
+    assert len(items) == SUMMARY_LIST_ITEMS
+    assert items[0]["doc_id"] == "d1"
+    assert len(items[0]["text"]) == SUMMARY_TEXT_CHARS + 3
+    assert summary.tool_call_id == message.tool_call_id
+    assert summarize_tool_message(summary).content == summary.content
+    plain = ToolMessage(content="y" * 1000, tool_call_id="c", name="graph_query")
+    assert len(summarize_tool_message(plain).content) == SUMMARY_TEXT_CHARS + 3
+
+
+def test_compact_history_keeps_recent_turns_verbatim() -> None:
+    """Older tool results are summarized while the latest turns stay intact."""
+    first, second, third = _turn("a", "d1"), _turn("b", "d2"), _turn("c", "d3")
+
+    compacted = compact_history([*first, *second, *third], max_tokens=100_000, recent_turns=2)
+
+    assert len(compacted) == 12
+    assert compacted[4:] == [*second, *third]
+    assert compacted[0] == first[0]
+    assert history_tokens(compacted[:4]) < history_tokens(first) // 5
+
+
+def test_compact_history_drops_oldest_turns_over_budget() -> None:
+    """Whole turns are dropped oldest first, always keeping the latest turn."""
+    turns = [_turn(question, f"d{i}") for i, question in enumerate("abcd")]
+    messages = [message for turn in turns for message in turn]
+    summarized = history_tokens(compact_history(turns[0], max_tokens=1, recent_turns=1))
+    budget = summarized * 2 + history_tokens(turns[3])
+
+    compacted = compact_history(messages, max_tokens=budget, recent_turns=1)
+
+    assert compacted[0] == turns[1][0]
+    assert compacted[-4:] == turns[3]
+    assert history_tokens(compacted) <= budget
+    assert compact_history(messages, max_tokens=1, recent_turns=2)[0] == turns[3][0]
@@ -0,0 +1,89 @@
+"""Tests for the per-conversation tool result cache."""
+
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.agent.tool_cache import ToolResultCache, get_tool_result_cache, reset_tool_result_cache
+from src.config import settings
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_tool_cache_keys_ignore_argument_order() -> None:
+    """Calls with the same arguments in any order share an entry."""
+    cache = ToolResultCache(max_entries=10, ttl_seconds=60)
+    conversation_id = uuid.uuid4()
+    cache.set(conversation_id, "search_docs", {"query": "wire", "k": 6}, ["hit"])
+
+    assert cache.get(conversation_id, "search_docs", {"k": 6, "query": "wire"}) == ["hit"]
+    assert cache.get(conversation_id, "search_docs", {"query": "wire", "k": 5}) is None
+    assert cache.get(uuid.uuid4(), "search_docs", {"query": "wire", "k": 6}) is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_tool_cache_expires_and_evicts() -> None:
+    """Entries expire after the TTL and the least recently used is evicted."""
+    clock = FakeClock()
+    cache = ToolResultCache(max_entries=2, ttl_seconds=10, clock=clock)
+    conversation_id = uuid.uuid4()
+    cache.set(conversation_id, "get_entity", {"entity_id": "a"}, {"name": "A"})
+    cache.set(conversation_id, "get_entity", {"entity_id": "b"}, {"name": "B"})
+    cache.get(conversation_id, "get_entity", {"entity_id": "a"})
+    cache.set(conversation_id, "get_entity", {"entity_id": "c"}, {"name": "C"})
+
+    assert cache.get(conversation_id, "get_entity", {"entity_id": "b"}) is None
+    assert cache.stats.evictions == 1
+
+    clock.now = 10.0
+    assert cache.get(conversation_id, "get_entity", {"entity_id": "a"}) is None
+    assert cache.stats.expirations == 1
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_tool_cache_get_or_call_runs_once() -> None:
+    """get_or_call runs the call on a miss and serves repeats from cache."""
+    cache = ToolResultCache(max_entries=10, ttl_seconds=60)
+    conversation_id = uuid.uuid4()
+    call = AsyncMock(return_value={"doc_id": "d1"})
+
+    first = await cache.get_or_call(conversation_id, "get_document", {"doc_id": "d1"}, call)
+    second = await cache.get_or_call(conversation_id, "get_document", {"doc_id": "d1"}, call)
+
+    assert first == second == {"doc_id": "d1"}
+    call.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_tool_cache_does_not_cache_errors() -> None:
+    """A failing call is retried on the next lookup."""
+    cache = ToolResultCache(max_entries=10, ttl_seconds=60)
+    conversation_id = uuid.uuid4()
+    call = AsyncMock(side_effect=[RuntimeError("db down"), ["ok"]])
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_call(conversation_id, "search_docs", {"query": "q"}, call)
+    assert await cache.get_or_call(conversation_id, "search_docs", {"query": "q"}, call) == ["ok"]
+
+
+def test_get_tool_result_cache_respects_setting(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Zero max entries disables the shared cache."""
+    reset_tool_result_cache()
+    monkeypatch.setattr(settings, "agent_tool_cache_max_entries", 0)
+    assert get_tool_result_cache() is None
+
+    monkeypatch.setattr(settings, "agent_tool_cache_max_entries", 100)
+    shared = get_tool_result_cache()
+    assert shared is not None
+    assert get_tool_result_cache() is shared
+    reset_tool_result_cache()
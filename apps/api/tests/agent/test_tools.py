@@ -1,18 +1,26 @@
 """Tests for ARIA agent tools."""
 
+import asyncio
 import uuid
+from collections.abc import Generator
+from dataclasses import replace
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from langchain_core.runnables import RunnableConfig
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
+from src.agent.tool_cache import ToolResultCache
 from src.agent.tools import (
-    create_get_document_tool,
-    create_get_entity_tool,
-    create_graph_query_tool,
-    create_search_docs_tool,
+    ToolContext,
+    get_aria_tools,
+    get_document_tool,
+    get_entity_tool,
+    graph_query_tool,
+    search_docs_tool,
 )
-from src.models import DocType, Document, Entity, EntityType
+from src.models import Case, DocType, Document, Entity, EntityType
 from src.services.document_service import DocumentService
 from src.services.entity_service import EntityService
 from src.services.graph_service import GraphService
@@ -26,31 +34,73 @@ def case_id() -> uuid.UUID:
 
 
 @pytest.fixture
-def mock_search_service() -> MagicMock:
-    """Create a mock search service."""
-    return MagicMock(spec=SearchService)
+def mock_search_service() -> Generator[MagicMock, None, None]:
+    """Create a mock search service (returned for every tool session)."""
+    service = MagicMock(spec=SearchService)
+    with patch("src.agent.tools.SearchService", return_value=service):
+        yield service
 
 
 @pytest.fixture
-def mock_document_service() -> MagicMock:
-    """Create a mock document service."""
-    return MagicMock(spec=DocumentService)
+def mock_document_service() -> Generator[MagicMock, None, None]:
+    """Create a mock document service (returned for every tool session)."""
+    service = MagicMock(spec=DocumentService)
+    with patch("src.agent.tools.DocumentService", return_value=service):
+        yield service
 
 
 @pytest.fixture
-def mock_entity_service() -> MagicMock:
-    """Create a mock entity service."""
-    return MagicMock(spec=EntityService)
+def mock_entity_service() -> Generator[MagicMock, None, None]:
+    """Create a mock entity service (returned for every tool session)."""
+    service = MagicMock(spec=EntityService)
+    with patch("src.agent.tools.EntityService", return_value=service):
+        yield service
 
 
 @pytest.fixture
-def mock_graph_service() -> MagicMock:
-    """Create a mock graph service."""
-    return MagicMock(spec=GraphService)
+def mock_graph_service() -> Generator[MagicMock, None, None]:
+    """Create a mock graph service (returned for every tool session)."""
+    service = MagicMock(spec=GraphService)
+    with patch("src.agent.tools.GraphService", return_value=service):
+        yield service
+
+
+def _session_factory() -> MagicMock:
+    """Callable returning async context managers, like a session maker or driver.session."""
+    session = MagicMock()
+    session.__aenter__ = AsyncMock(return_value=MagicMock())
+    session.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=session)
+
+
+@pytest.fixture
+def tool_context(
+    case_id: uuid.UUID,
+    mock_search_service: MagicMock,
+    mock_document_service: MagicMock,
+    mock_entity_service: MagicMock,
+    mock_graph_service: MagicMock,
+) -> ToolContext:
+    """Create a tool context backed by the mock services."""
+    driver = MagicMock()
+    driver.session = _session_factory()
+    return ToolContext(
+        case_id=case_id,
+        session_maker=_session_factory(),
+        embedding_service=MagicMock(),
+        neo4j_driver=driver,
+    )
+
+
+@pytest.fixture
+def config(tool_context: ToolContext) -> RunnableConfig:
+    """Run config carrying the tool context."""
+    return tool_context.as_config()
 
 
 @pytest.mark.asyncio
 async def test_search_docs_tool_returns_results(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_search_service: MagicMock,
 ) -> None:
@@ -83,10 +133,10 @@ async def test_search_docs_tool_returns_results(
     mock_search_service.search = AsyncMock(return_value=mock_results)
 
     # Create tool
-    tool = create_search_docs_tool(mock_search_service, case_id)
+    tool = search_docs_tool
 
     # Execute
-    result = await tool.ainvoke({"query": "fraud", "k": 6})
+    result = await tool.ainvoke({"query": "fraud", "k": 6}, config=config)
 
     # Assert
     assert len(result) == 2
@@ -97,20 +147,22 @@ async def test_search_docs_tool_returns_results(
 
 @pytest.mark.asyncio
 async def test_search_docs_tool_empty_results(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_search_service: MagicMock,
 ) -> None:
     """search_docs tool handles empty results."""
     mock_search_service.search = AsyncMock(return_value=[])
 
-    tool = create_search_docs_tool(mock_search_service, case_id)
-    result = await tool.ainvoke({"query": "nonexistent"})
+    tool = search_docs_tool
+    result = await tool.ainvoke({"query": "nonexistent"}, config=config)
 
     assert result == []
 
 
 @pytest.mark.asyncio
 async def test_get_document_tool_returns_document(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_document_service: MagicMock,
 ) -> None:
@@ -128,8 +180,8 @@ async def test_get_document_tool_returns_document(
 
     mock_document_service.get_by_id = AsyncMock(return_value=mock_doc)
 
-    tool = create_get_document_tool(mock_document_service, case_id)
-    result = await tool.ainvoke({"doc_id": str(doc_id)})
+    tool = get_document_tool
+    result = await tool.ainvoke({"doc_id": str(doc_id)}, config=config)
 
     assert result["doc_id"] == str(doc_id)
     assert result["doc_type"] == "email"
@@ -139,14 +191,15 @@ async def test_get_document_tool_returns_document(
 
 @pytest.mark.asyncio
 async def test_get_document_tool_not_found(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_document_service: MagicMock,
 ) -> None:
     """get_document tool handles document not found."""
     mock_document_service.get_by_id = AsyncMock(return_value=None)
 
-    tool = create_get_document_tool(mock_document_service, case_id)
-    result = await tool.ainvoke({"doc_id": str(uuid.uuid4())})
+    tool = get_document_tool
+    result = await tool.ainvoke({"doc_id": str(uuid.uuid4())}, config=config)
 
     assert "error" in result
     assert "not found" in result["error"]
@@ -154,6 +207,7 @@ async def test_get_document_tool_not_found(
 
 @pytest.mark.asyncio
 async def test_get_document_tool_wrong_case(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_document_service: MagicMock,
 ) -> None:
@@ -163,8 +217,8 @@ async def test_get_document_tool_wrong_case(
 
     mock_document_service.get_by_id = AsyncMock(return_value=mock_doc)
 
-    tool = create_get_document_tool(mock_document_service, case_id)
-    result = await tool.ainvoke({"doc_id": str(uuid.uuid4())})
+    tool = get_document_tool
+    result = await tool.ainvoke({"doc_id": str(uuid.uuid4())}, config=config)
 
     assert "error" in result
     assert "does not belong" in result["error"]
@@ -172,12 +226,13 @@ async def test_get_document_tool_wrong_case(
 
 @pytest.mark.asyncio
 async def test_get_document_tool_invalid_uuid(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_document_service: MagicMock,
 ) -> None:
     """get_document tool handles invalid UUID."""
-    tool = create_get_document_tool(mock_document_service, case_id)
-    result = await tool.ainvoke({"doc_id": "not-a-uuid"})
+    tool = get_document_tool
+    result = await tool.ainvoke({"doc_id": "not-a-uuid"}, config=config)
 
     assert "error" in result
     assert "Invalid document ID" in result["error"]
@@ -185,6 +240,7 @@ async def test_get_document_tool_invalid_uuid(
 
 @pytest.mark.asyncio
 async def test_get_entity_tool_returns_entity(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_entity_service: MagicMock,
 ) -> None:
@@ -199,8 +255,8 @@ async def test_get_entity_tool_returns_entity(
 
     mock_entity_service.get_by_id = AsyncMock(return_value=mock_entity)
 
-    tool = create_get_entity_tool(mock_entity_service, case_id)
-    result = await tool.ainvoke({"entity_id": str(entity_id)})
+    tool = get_entity_tool
+    result = await tool.ainvoke({"entity_id": str(entity_id)}, config=config)
 
     assert result["name"] == "John Doe"
     assert result["entity_type"] == "person"
@@ -209,14 +265,15 @@ async def test_get_entity_tool_returns_entity(
 
 @pytest.mark.asyncio
 async def test_get_entity_tool_not_found(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_entity_service: MagicMock,
 ) -> None:
     """get_entity tool handles entity not found."""
     mock_entity_service.get_by_id = AsyncMock(return_value=None)
 
-    tool = create_get_entity_tool(mock_entity_service, case_id)
-    result = await tool.ainvoke({"entity_id": str(uuid.uuid4())})
+    tool = get_entity_tool
+    result = await tool.ainvoke({"entity_id": str(uuid.uuid4())}, config=config)
 
     assert "error" in result
     assert "not found" in result["error"]
@@ -224,12 +281,13 @@ async def test_get_entity_tool_not_found(
 
 @pytest.mark.asyncio
 async def test_get_entity_tool_invalid_uuid(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_entity_service: MagicMock,
 ) -> None:
     """get_entity tool handles invalid UUID."""
-    tool = create_get_entity_tool(mock_entity_service, case_id)
-    result = await tool.ainvoke({"entity_id": "not-a-valid-uuid"})
+    tool = get_entity_tool
+    result = await tool.ainvoke({"entity_id": "not-a-valid-uuid"}, config=config)
 
     assert "error" in result
     assert "Invalid entity ID" in result["error"]
@@ -237,6 +295,7 @@ async def test_get_entity_tool_invalid_uuid(
 
 @pytest.mark.asyncio
 async def test_get_entity_tool_wrong_case(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_entity_service: MagicMock,
 ) -> None:
@@ -248,8 +307,8 @@ async def test_get_entity_tool_wrong_case(
 
     mock_entity_service.get_by_id = AsyncMock(return_value=mock_entity)
 
-    tool = create_get_entity_tool(mock_entity_service, case_id)
-    result = await tool.ainvoke({"entity_id": str(entity_id)})
+    tool = get_entity_tool
+    result = await tool.ainvoke({"entity_id": str(entity_id)}, config=config)
 
     assert "error" in result
     assert "does not belong" in result["error"]
@@ -257,6 +316,7 @@ async def test_get_entity_tool_wrong_case(
 
 @pytest.mark.asyncio
 async def test_graph_query_tool_hubs(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_graph_service: MagicMock,
 ) -> None:
@@ -273,8 +333,8 @@ async def test_graph_query_tool_hubs(
     ]
     mock_graph_service.query_hubs = AsyncMock(return_value=mock_hubs)
 
-    tool = create_graph_query_tool(mock_graph_service, case_id)
-    result = await tool.ainvoke({"query_type": "hubs"})
+    tool = graph_query_tool
+    result = await tool.ainvoke({"query_type": "hubs"}, config=config)
 
     assert result["query_type"] == "hubs"
     assert len(result["hubs"]) == 1
@@ -283,6 +343,7 @@ async def test_graph_query_tool_hubs(
 
 @pytest.mark.asyncio
 async def test_graph_query_tool_neighbors(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_graph_service: MagicMock,
 ) -> None:
@@ -310,12 +371,13 @@ async def test_graph_query_tool_neighbors(
     ]
     mock_graph_service.query_neighbors = AsyncMock(return_value=(mock_nodes, mock_edges))
 
-    tool = create_graph_query_tool(mock_graph_service, case_id)
+    tool = graph_query_tool
     result = await tool.ainvoke(
         {
             "query_type": "neighbors",
             "entity_id": str(entity_id),
-        }
+        },
+        config=config,
     )
 
     assert result["query_type"] == "neighbors"
@@ -325,6 +387,7 @@ async def test_graph_query_tool_neighbors(
 
 @pytest.mark.asyncio
 async def test_graph_query_tool_path(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_graph_service: MagicMock,
 ) -> None:
@@ -352,13 +415,14 @@ async def test_graph_query_tool_path(
     )
     mock_graph_service.query_path = AsyncMock(return_value=mock_path)
 
-    tool = create_graph_query_tool(mock_graph_service, case_id)
+    tool = graph_query_tool
     result = await tool.ainvoke(
         {
             "query_type": "path",
             "entity_id": str(entity_id),
             "target_id": str(target_id),
-        }
+        },
+        config=config,
     )
 
     assert result["query_type"] == "path"
@@ -368,16 +432,18 @@ async def test_graph_query_tool_path(
 
 @pytest.mark.asyncio
 async def test_graph_query_tool_invalid_query_type(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_graph_service: MagicMock,
 ) -> None:
     """graph_query tool handles invalid query type."""
-    tool = create_graph_query_tool(mock_graph_service, case_id)
+    tool = graph_query_tool
     result = await tool.ainvoke(
         {
             "query_type": "invalid",
             "entity_id": str(uuid.uuid4()),
-        }
+        },
+        config=config,
     )
 
     assert "error" in result
@@ -386,12 +452,13 @@ async def test_graph_query_tool_invalid_query_type(
 
 @pytest.mark.asyncio
 async def test_graph_query_tool_missing_entity_id(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_graph_service: MagicMock,
 ) -> None:
     """graph_query tool requires entity_id for neighbors."""
-    tool = create_graph_query_tool(mock_graph_service, case_id)
-    result = await tool.ainvoke({"query_type": "neighbors"})
+    tool = graph_query_tool
+    result = await tool.ainvoke({"query_type": "neighbors"}, config=config)
 
     assert "error" in result
     assert "entity_id is required" in result["error"]
@@ -399,16 +466,18 @@ async def test_graph_query_tool_missing_entity_id(
 
 @pytest.mark.asyncio
 async def test_graph_query_tool_path_missing_target(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_graph_service: MagicMock,
 ) -> None:
     """graph_query tool requires target_id for path."""
-    tool = create_graph_query_tool(mock_graph_service, case_id)
+    tool = graph_query_tool
     result = await tool.ainvoke(
         {
             "query_type": "path",
             "entity_id": str(uuid.uuid4()),
-        }
+        },
+        config=config,
     )
 
     assert "error" in result
@@ -417,16 +486,18 @@ async def test_graph_query_tool_path_missing_target(
 
 @pytest.mark.asyncio
 async def test_graph_query_tool_invalid_entity_id(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_graph_service: MagicMock,
 ) -> None:
     """graph_query tool handles invalid entity_id UUID."""
-    tool = create_graph_query_tool(mock_graph_service, case_id)
+    tool = graph_query_tool
     result = await tool.ainvoke(
         {
             "query_type": "neighbors",
             "entity_id": "not-a-valid-uuid",
-        }
+        },
+        config=config,
     )
 
     assert "error" in result
@@ -435,17 +506,19 @@ async def test_graph_query_tool_invalid_entity_id(
 
 @pytest.mark.asyncio
 async def test_graph_query_tool_path_invalid_target_id(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_graph_service: MagicMock,
 ) -> None:
     """graph_query tool handles invalid target_id UUID for path."""
-    tool = create_graph_query_tool(mock_graph_service, case_id)
+    tool = graph_query_tool
     result = await tool.ainvoke(
         {
             "query_type": "path",
             "entity_id": str(uuid.uuid4()),
             "target_id": "invalid-target-uuid",
-        }
+        },
+        config=config,
     )
 
     assert "error" in result
@@ -457,20 +530,22 @@ async def test_graph_query_tool_path_invalid_target_id(
 
 @pytest.mark.asyncio
 async def test_search_docs_tool_with_spanish(
+    tool_context: ToolContext,
     case_id: uuid.UUID,
     mock_search_service: MagicMock,
 ) -> None:
     """search_docs tool passes Spanish language to search service."""
     mock_search_service.search = AsyncMock(return_value=[])
 
-    tool = create_search_docs_tool(mock_search_service, case_id, language="es")
-    await tool.ainvoke({"query": "fraude", "k": 6})
+    context = replace(tool_context, language="es")
+    await search_docs_tool.ainvoke({"query": "fraude", "k": 6}, config=context.as_config())
 
     mock_search_service.search.assert_called_once_with(case_id, "fraude", k=6, language="es")
 
 
 @pytest.mark.asyncio
 async def test_search_docs_tool_defaults_to_english(
+    config: RunnableConfig,
     case_id: uuid.UUID,
     mock_search_service: MagicMock,
 ) -> None:
@@ -478,7 +553,149 @@ async def test_search_docs_tool_defaults_to_english(
     mock_search_service.search = AsyncMock(return_value=[])
 
     # Create tool without specifying language (should default to "en")
-    tool = create_search_docs_tool(mock_search_service, case_id)
-    await tool.ainvoke({"query": "fraud", "k": 6})
+    tool = search_docs_tool
+    await tool.ainvoke({"query": "fraud", "k": 6}, config=config)
 
     mock_search_service.search.assert_called_once_with(case_id, "fraud", k=6, language="en")
+
+
+@pytest.mark.asyncio
+async def test_graph_query_tool_without_graph_service(
+    tool_context: ToolContext,
+) -> None:
+    """graph_query tool reports an error when the context has no Neo4j driver."""
+    context = replace(tool_context, neo4j_driver=None)
+
+    result = await graph_query_tool.ainvoke({"query_type": "hubs"}, config=context.as_config())
+
+    assert result == {"error": "The knowledge graph is not available"}
+
+
+@pytest.mark.asyncio
+async def test_graph_query_tool_opens_sessions_per_call(
+    tool_context: ToolContext,
+    mock_graph_service: MagicMock,
+) -> None:
+    """Concurrent graph queries each get their own Neo4j and database sessions."""
+    mock_graph_service.query_hubs = AsyncMock(return_value=[])
+    config = tool_context.as_config()
+
+    await asyncio.gather(
+        graph_query_tool.ainvoke({"query_type": "hubs"}, config=config),
+        graph_query_tool.ainvoke({"query_type": "hubs"}, config=config),
+    )
+
+    assert tool_context.neo4j_driver is not None
+    assert tool_context.neo4j_driver.session.call_count == 2  # type: ignore[attr-defined]
+    assert tool_context.session_maker.call_count == 2  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_tools_require_tool_context() -> None:
+    """Tools invoked without a ToolContext in the config fail loudly."""
+    with pytest.raises(RuntimeError, match="ToolContext"):
+        await get_entity_tool.ainvoke({"entity_id": str(uuid.uuid4())})
+
+
+def test_get_aria_tools_includes_graph_only_when_requested() -> None:
+    """get_aria_tools offers graph_query only with a graph."""
+    assert [tool.name for tool in get_aria_tools(include_graph=False)] == [
+        "search_docs",
+        "get_document",
+        "get_entity",
+    ]
+    assert get_aria_tools(include_graph=True)[-1] is graph_query_tool
+
+
+@pytest.mark.asyncio
+async def test_tools_memoize_results_per_conversation(
+    tool_context: ToolContext,
+    mock_entity_service: MagicMock,
+    case_id: uuid.UUID,
+) -> None:
+    """Repeated calls in a conversation are served from the tool cache."""
+    entity = MagicMock(spec=Entity)
+    entity.entity_id = uuid.uuid4()
+    entity.case_id = case_id
+    entity.name = "Mallory"
+    entity.entity_type = EntityType.person
+    entity.attrs_json = {}
+    mock_entity_service.get_by_id = AsyncMock(return_value=entity)
+    context = replace(
+        tool_context,
+        conversation_id=uuid.uuid4(),
+        cache=ToolResultCache(max_entries=10, ttl_seconds=60),
+    )
+    args = {"entity_id": str(entity.entity_id)}
+
+    first = await get_entity_tool.ainvoke(args, config=context.as_config())
+    second = await get_entity_tool.ainvoke(args, config=context.as_config())
+    other_conversation = replace(context, conversation_id=uuid.uuid4())
+    await get_entity_tool.ainvoke(args, config=other_conversation.as_config())
+
+    assert first == second
+    assert mock_entity_service.get_by_id.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_tool_cache_is_scoped_to_the_case(
+    tool_context: ToolContext,
+    mock_entity_service: MagicMock,
+    case_id: uuid.UUID,
+) -> None:
+    """A conversation ID reused on another case does not get the first case's results."""
+    entity = MagicMock(spec=Entity)
+    entity.entity_id = uuid.uuid4()
+    entity.case_id = case_id
+    entity.name = "Mallory"
+    entity.entity_type = EntityType.person
+    entity.attrs_json = {}
+    mock_entity_service.get_by_id = AsyncMock(return_value=entity)
+    context = replace(
+        tool_context,
+        conversation_id=uuid.uuid4(),
+        cache=ToolResultCache(max_entries=10, ttl_seconds=60),
+    )
+    args = {"entity_id": str(entity.entity_id)}
+
+    first = await get_entity_tool.ainvoke(args, config=context.as_config())
+    other_case = replace(context, case_id=uuid.uuid4())
+    second = await get_entity_tool.ainvoke(args, config=other_case.as_config())
+
+    assert first["name"] == "Mallory"
+    assert "does not belong" in second["error"]
+
+
+@pytest.mark.asyncio
+async def test_tools_run_concurrently_with_own_sessions(
+    db_engine: AsyncEngine,
+    db_session: AsyncSession,
+    sample_case: Case,
+) -> None:
+    """Tool calls of one turn run in parallel, each on its own pooled session."""
+    documents = [
+        Document(
+            case_id=sample_case.case_id,
+            doc_type=DocType.email,
+            subject=f"Memo {index}",
+            body=f"Body {index}",
+            ts=datetime.now(UTC),
+        )
+        for index in range(2)
+    ]
+    db_session.add_all(documents)
+    await db_session.commit()
+
+    context = ToolContext(
+        case_id=sample_case.case_id,
+        session_maker=async_sessionmaker(db_engine, expire_on_commit=False),
+        embedding_service=MagicMock(),
+    )
+    results = await asyncio.gather(
+        *(
+            get_document_tool.ainvoke({"doc_id": str(doc.doc_id)}, config=context.as_config())
+            for doc in documents
+        )
+    )
+
+    assert [result["subject"] for result in results] == ["Memo 0", "Memo 1"]
@@ -1,13 +1,14 @@
 """Tests for cases API endpoints."""
 
 import uuid
+from datetime import UTC, datetime
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import delete, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, event, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
-from src.models import Case, Document, Entity, EntityType, ScenarioType
+from src.models import Case, DocType, Document, Entity, EntityType, ScenarioType
 
 
 @pytest.fixture
@@ -121,6 +122,61 @@ async def test_list_cases_pagination(
     assert len(data["cases"]) == 2  # 5 total, skip 3 = 2 remaining
 
 
+@pytest.mark.asyncio
+async def test_list_cases_query_count_is_constant(
+    client: AsyncClient, db_session: AsyncSession, db_engine: AsyncEngine, clean_cases: None
+) -> None:
+    """GET /api/cases issues the same number of queries for any page size."""
+    for i in range(6):
+        case = Case(
+            case_id=uuid.uuid4(),
+            title=f"Count Case {i}",
+            scenario_type=ScenarioType.vendor_fraud,
+            difficulty=2,
+            seed=i,
+            ground_truth_json={"culprits": [], "mechanism": "test"},
+        )
+        db_session.add(case)
+        db_session.add(
+            Entity(case_id=case.case_id, entity_type=EntityType.person, name=f"Person {i}")
+        )
+        for j in range(i):
+            db_session.add(
+                Document(
+                    case_id=case.case_id,
+                    doc_type=DocType.email,
+                    ts=datetime.now(UTC),
+                    subject=f"Email {j}",
+                    body="Body",
+                )
+            )
+    await db_session.commit()
+
+    statements: list[str] = []
+
+    def record(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        query_counts = []
+        for limit in (1, 3, 6):
+            statements.clear()
+            response = await client.get(f"/api/cases?limit={limit}")
+            assert response.status_code == 200
+            assert len(response.json()["cases"]) == limit
+            query_counts.append(len(statements))
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+    # One total count plus one page query, regardless of page size
+    assert query_counts == [2, 2, 2]
+    counts = {
+        c["title"]: (c["document_count"], c["entity_count"]) for c in response.json()["cases"]
+    }
+    assert counts == {f"Count Case {i}": (i, 1) for i in range(6)}
+
+
 @pytest.mark.asyncio
 async def test_get_case_found(client: AsyncClient, test_case: Case) -> None:
     """GET /api/cases/{id} returns case with counts when found."""
@@ -1,18 +1,20 @@
 """Tests for chat API endpoints."""
 
+import json
 import uuid
-from collections.abc import Generator
+from collections.abc import AsyncIterator, Generator
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from httpx import AsyncClient
-from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessage, AIMessageChunk
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.routes import chat as chat_routes
 from src.api.routes.chat import _collect_case_hints, _pick_hint
 from src.config import settings
 from src.models import Case, ScenarioType
+from src.services.rate_limiter import reset_rate_limiter
 
 
 @pytest.fixture
@@ -39,7 +41,7 @@ async def chat_test_case(db_session: AsyncSession) -> Case:
 @pytest.fixture
 def mock_agent_graph() -> Generator[MagicMock, None, None]:
     """Mock the ARIA agent graph."""
-    with patch("src.services.agent_service.create_aria_graph") as mock_create:
+    with patch("src.services.agent_service.get_aria_graph") as mock_create:
         mock_graph = MagicMock()
         mock_graph.ainvoke = AsyncMock(
             return_value={
@@ -71,7 +73,7 @@ def mock_embedding_service() -> Generator[MagicMock, None, None]:
 @pytest.fixture(autouse=True)
 def reset_chat_rate_limiter() -> None:
     """Reset in-memory chat limiter between tests."""
-    chat_routes.rate_limiter = chat_routes.SlidingWindowRateLimiter()
+    reset_rate_limiter()
 
 
 @pytest.mark.asyncio
@@ -147,6 +149,35 @@ async def test_chat_with_conversation_id(
     assert data["conversation_id"] == str(conv_id)
 
 
+@pytest.mark.asyncio
+async def test_chat_follow_up_sends_conversation_history(
+    client: AsyncClient,
+    chat_test_case: Case,
+    mock_agent_graph: MagicMock,
+    mock_embedding_service: MagicMock,
+) -> None:
+    """A follow-up turn carries the stored question and answer of earlier turns."""
+    conv_id = str(uuid.uuid4())
+    url = f"/api/cases/{chat_test_case.case_id}/chat"
+    await client.post(
+        url, json={"message": "Who approved the invoice?", "conversation_id": conv_id}
+    )
+    response = await client.post(
+        url, json={"message": "And who paid it?", "conversation_id": conv_id}
+    )
+
+    assert response.status_code == 200
+    graph = mock_agent_graph.return_value
+    first_state = graph.ainvoke.call_args_list[0].args[0]
+    second_state = graph.ainvoke.call_args_list[1].args[0]
+    assert len(first_state["messages"]) == 2
+    assert [m.content for m in second_state["messages"][1:]] == [
+        "Who approved the invoice?",
+        "Based on my analysis, I found suspicious activity.",
+        "And who paid it?",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_hint_endpoint_success(
     client: AsyncClient,
@@ -325,6 +356,123 @@ async def test_chat_rate_limit_returns_429(
     assert "retry-after" in {key.lower() for key in second.headers.keys()}
 
 
+def _parse_sse(body: str) -> list[tuple[str, dict[str, Any]]]:
+    """Split a text/event-stream body into (event, data) pairs."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_sends_events(
+    client: AsyncClient,
+    chat_test_case: Case,
+    mock_embedding_service: MagicMock,
+) -> None:
+    """POST /cases/{case_id}/chat/stream streams tokens and ends with the full response."""
+    answer = AIMessage(content="Suspicious transfer found")
+
+    async def astream_events(*_args: object, **_kwargs: object) -> AsyncIterator[dict[str, Any]]:
+        for token in ("Suspicious", " transfer", " found"):
+            yield {
+                "event": "on_chat_model_stream",
+                "name": "ChatOpenAI",
+                "run_id": "run-1",
+                "parent_ids": ["graph"],
+                "metadata": {"langgraph_node": "agent"},
+                "data": {"chunk": AIMessageChunk(content=token)},
+            }
+        yield {
+            "event": "on_chain_end",
+            "name": "LangGraph",
+            "run_id": "graph",
+            "parent_ids": [],
+            "metadata": {},
+            "data": {"output": {"messages": [answer]}},
+        }
+
+    with patch("src.services.agent_service.get_aria_graph") as mock_create:
+        mock_create.return_value.astream_events = astream_events
+        response = await client.post(
+            f"/api/cases/{chat_test_case.case_id}/chat/stream",
+            json={"message": "What happened?"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse(response.text)
+    assert [name for name, _ in events] == ["start", "token", "token", "token", "done"]
+    assert "".join(data["content"] for name, data in events if name == "token") == (
+        "Suspicious transfer found"
+    )
+    assert events[-1][1]["message"] == "Suspicious transfer found"
+    assert events[-1][1]["conversation_id"] == events[0][1]["conversation_id"]
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_reports_provider_error_event(
+    client: AsyncClient,
+    chat_test_case: Case,
+    mock_embedding_service: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A provider failure after the stream started is sent as an error event."""
+    monkeypatch.setattr(settings, "llm_fallback_provider", "")
+
+    async def astream_events(*_args: object, **_kwargs: object) -> AsyncIterator[dict[str, Any]]:
+        raise TimeoutError
+        yield {}
+
+    with patch("src.services.agent_service.get_aria_graph") as mock_create:
+        mock_create.return_value.astream_events = astream_events
+        response = await client.post(
+            f"/api/cases/{chat_test_case.case_id}/chat/stream",
+            json={"message": "What happened?"},
+        )
+
+    assert response.status_code == 200
+    events = _parse_sse(response.text)
+    assert [name for name, _ in events] == ["start", "error"]
+    assert events[1][1]["status_code"] == 504
+
+
+@pytest.mark.asyncio
+async def test_chat_returns_503_while_provider_breaker_is_open(
+    client: AsyncClient,
+    chat_test_case: Case,
+    mock_agent_graph: MagicMock,
+    mock_embedding_service: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """With no fallback, an open breaker fails the request fast with 503."""
+    from src.services.provider_governor import ProviderUnavailableError
+
+    monkeypatch.setattr(settings, "llm_fallback_provider", "")
+    graph = mock_agent_graph.return_value
+    graph.ainvoke = AsyncMock(side_effect=ProviderUnavailableError("openai"))
+
+    response = await client.post(
+        f"/api/cases/{chat_test_case.case_id}/chat",
+        json={"message": "What happened?"},
+    )
+
+    assert response.status_code == 503
+    assert "temporarily unavailable" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_case_not_found(client: AsyncClient) -> None:
+    """POST /cases/{case_id}/chat/stream returns 404 before streaming for a missing case."""
+    response = await client.post(
+        f"/api/cases/{uuid.uuid4()}/chat/stream",
+        json={"message": "Test message"},
+    )
+
+    assert response.status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_hint_rate_limit_returns_429(
     client: AsyncClient,
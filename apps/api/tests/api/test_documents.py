@@ -1,12 +1,12 @@
 """Tests for documents API endpoints."""
 
 import uuid
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import delete, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, event, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from src.models import Case, DocChunk, DocType, Document, Entity, EntityType, ScenarioType
 
@@ -189,6 +189,131 @@ async def test_list_documents_pagination(
     assert len(data["documents"]) == 2
 
 
+@pytest.mark.asyncio
+async def test_list_documents_keyset_pagination(
+    client: AsyncClient, test_case: Case, db_session: AsyncSession, clean_documents: None
+) -> None:
+    """Following next_cursor walks every document once, ties on ts included."""
+    shared_ts = datetime(2024, 5, 1, tzinfo=UTC)
+    for i in range(7):
+        db_session.add(
+            Document(
+                case_id=test_case.case_id,
+                doc_type=DocType.note,
+                ts=shared_ts if i < 4 else shared_ts + timedelta(days=i),
+                body=f"Document {i}",
+            )
+        )
+    await db_session.commit()
+    url = f"/api/cases/{test_case.case_id}/documents"
+
+    full = (await client.get(url, params={"limit": 50})).json()
+    assert full["next_cursor"] is None
+    expected = [doc["doc_id"] for doc in full["documents"]]
+
+    seen: list[str] = []
+    params: dict[str, str | int] = {"limit": 3}
+    while True:
+        response = await client.get(url, params=params)
+        assert response.status_code == 200
+        data = response.json()
+        seen.extend(doc["doc_id"] for doc in data["documents"])
+        if data["next_cursor"] is None:
+            break
+        params = {"limit": 3, "cursor": data["next_cursor"]}
+
+    assert seen == expected
+    assert len(seen) == 7
+
+
+@pytest.mark.asyncio
+async def test_list_documents_includes_chunk_counts(
+    client: AsyncClient,
+    test_case: Case,
+    test_document_with_chunks: tuple[Document, list[DocChunk]],
+    db_session: AsyncSession,
+) -> None:
+    """Chunk counts come back with the page."""
+    document, chunks = test_document_with_chunks
+    other = Document(
+        case_id=test_case.case_id,
+        doc_type=DocType.note,
+        ts=datetime.now(UTC),
+        body="No chunks",
+    )
+    db_session.add(other)
+    await db_session.commit()
+
+    response = await client.get(f"/api/cases/{test_case.case_id}/documents")
+    assert response.status_code == 200
+    counts = {doc["doc_id"]: doc["chunk_count"] for doc in response.json()["documents"]}
+    assert counts[str(document.doc_id)] == len(chunks)
+    assert counts[str(other.doc_id)] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params",
+    [{"cursor": "not-a-cursor"}, {"cursor": "", "skip": 0}, {"cursor": "x", "skip": 2}],
+)
+async def test_list_documents_rejects_bad_cursor(
+    client: AsyncClient, test_case: Case, params: dict[str, str | int]
+) -> None:
+    """Malformed cursors, or a cursor combined with skip, are rejected."""
+    response = await client.get(f"/api/cases/{test_case.case_id}/documents", params=params)
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_documents_summary_view(
+    client: AsyncClient,
+    test_case: Case,
+    test_document_with_chunks: tuple[Document, list[DocChunk]],
+    db_session: AsyncSession,
+    db_engine: AsyncEngine,
+) -> None:
+    """view=summary returns a server-cut snippet and never loads body or metadata."""
+    document, chunks = test_document_with_chunks
+    long_doc = Document(
+        case_id=test_case.case_id,
+        doc_type=DocType.csv,
+        ts=datetime(2020, 1, 1, tzinfo=UTC),
+        subject="Ledger",
+        body="col_a,   col_b\n\n" + "1,2\n" * 5000,
+        metadata_json={"rows": 5000},
+    )
+    db_session.add(long_doc)
+    await db_session.commit()
+
+    statements: list[str] = []
+
+    def record(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        response = await client.get(
+            f"/api/cases/{test_case.case_id}/documents", params={"view": "summary"}
+        )
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    summaries = {doc["doc_id"]: doc for doc in response.json()["documents"]}
+    ledger = summaries[str(long_doc.doc_id)]
+    assert "body" not in ledger
+    assert "metadata_json" not in ledger
+    assert ledger["subject"] == "Ledger"
+    assert ledger["snippet"].startswith("col_a, col_b 1,2 1,2")
+    assert len(ledger["snippet"]) == 200
+    assert summaries[str(document.doc_id)]["chunk_count"] == len(chunks)
+    assert summaries[str(document.doc_id)]["author_entity_id"] == str(document.author_entity_id)
+
+    page_query = next(sql for sql in statements if "chunk_counts" in sql)
+    assert "documents.body AS" not in page_query
+    assert "documents.metadata_json" not in page_query
+
+
 @pytest.mark.asyncio
 async def test_get_document_found(
     client: AsyncClient, test_case: Case, test_document: Document
@@ -109,6 +109,46 @@ async def test_list_entities_with_data(
     assert entity_data["attrs_json"]["email"] == "test@example.com"
 
 
+@pytest.mark.asyncio
+async def test_list_entities_includes_counts(
+    client: AsyncClient,
+    test_case: Case,
+    test_entity_with_documents: tuple[Entity, list[Document]],
+    db_session: AsyncSession,
+) -> None:
+    """Listed entities carry document and mention counts from per-case aggregates."""
+    entity, documents = test_entity_with_documents
+    other = Entity(
+        entity_id=uuid.uuid4(),
+        case_id=test_case.case_id,
+        entity_type=EntityType.org,
+        name="Quiet Org",
+        attrs_json={},
+    )
+    db_session.add(other)
+    for start in (0, 10, 20):
+        db_session.add(
+            Mention(
+                case_id=test_case.case_id,
+                doc_id=documents[0].doc_id,
+                entity_id=entity.entity_id,
+                span_start=start,
+                span_end=start + 5,
+                mention_text=entity.name,
+            )
+        )
+    await db_session.commit()
+
+    response = await client.get(f"/api/cases/{test_case.case_id}/entities")
+    assert response.status_code == 200
+    counts = {
+        e["entity_id"]: (e["document_count"], e["mention_count"])
+        for e in response.json()["entities"]
+    }
+    assert counts[str(entity.entity_id)] == (2, 3)
+    assert counts[str(other.entity_id)] == (0, 0)
+
+
 @pytest.mark.asyncio
 async def test_list_entities_filter_by_type(
     client: AsyncClient, test_case: Case, test_entity: Entity, db_session: AsyncSession
@@ -1,5 +1,6 @@
 """Health endpoint tests."""
 
+import uuid
 from unittest.mock import AsyncMock
 
 import pytest
@@ -132,3 +133,134 @@ async def test_dependency_health_check_degraded(
     assert data["dependencies"]["neo4j"]["status"] == "degraded"
     assert data["dependencies"]["llm"]["status"] == "missing"
     assert data["dependencies"]["embeddings"]["status"] == "missing"
+
+
+@pytest.mark.asyncio
+async def test_cache_health_reports_embedding_counters(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Cache endpoint exposes embedding cache hit/miss counters."""
+    from src.services.embedding_cache import EmbeddingCache, InMemoryEmbeddingCacheBackend
+
+    cache = EmbeddingCache([InMemoryEmbeddingCacheBackend()])
+    await cache.set_many("m", 1, ["a"], [[1.0]])
+    await cache.get_many("m", 1, ["a", "b"])
+    monkeypatch.setattr(health_routes, "get_embedding_cache", lambda: cache)
+
+    response = await client.get("/health/caches")
+
+    assert response.status_code == 200
+    stats = response.json()["caches"]["embeddings"]
+    assert stats["enabled"] is True
+    assert (stats["hits"], stats["misses"], stats["writes"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_cache_health_reports_disabled_cache(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Cache endpoint reports disabled caches."""
+    monkeypatch.setattr(health_routes, "get_embedding_cache", lambda: None)
+    monkeypatch.setattr(health_routes, "get_query_embedding_cache", lambda: None)
+
+    response = await client.get("/health/caches")
+
+    assert response.status_code == 200
+    caches = response.json()["caches"]
+    assert caches["embeddings"]["enabled"] is False
+    assert caches["query_embeddings"]["enabled"] is False
+
+
+@pytest.mark.asyncio
+async def test_cache_health_reports_query_cache_metrics(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Cache endpoint exposes query cache size and eviction metrics."""
+    from src.services.embedding_cache import QueryEmbeddingCache
+
+    query_cache = QueryEmbeddingCache(max_bytes=8 * 1536, ttl_seconds=60)
+    query_cache.set("m", "invoice approvals", [0.1] * 1536)
+    query_cache.set("m", "vendor payments", [0.2] * 1536)
+    query_cache.get("m", "vendor payments")
+    monkeypatch.setattr(health_routes, "get_query_embedding_cache", lambda: query_cache)
+
+    response = await client.get("/health/caches")
+
+    stats = response.json()["caches"]["query_embeddings"]
+    assert stats["enabled"] is True
+    assert stats["hits"] == 1
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 1
+    assert stats["size_bytes"] == 8 * 1536
+
+
+@pytest.mark.asyncio
+async def test_cache_health_reports_agent_tool_cache(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Cache endpoint exposes agent tool result cache counters."""
+    from src.agent.tool_cache import ToolResultCache
+
+    tool_cache = ToolResultCache(max_entries=10, ttl_seconds=60)
+    conversation_id = uuid.uuid4()
+    tool_cache.set(conversation_id, "get_entity", {"entity_id": "e1"}, {"name": "Mallory"})
+    tool_cache.get(conversation_id, "get_entity", {"entity_id": "e1"})
+    tool_cache.get(conversation_id, "get_entity", {"entity_id": "e2"})
+    monkeypatch.setattr(health_routes, "get_tool_result_cache", lambda: tool_cache)
+
+    response = await client.get("/health/caches")
+
+    stats = response.json()["caches"]["agent_tools"]
+    assert stats["enabled"] is True
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_cache_health_reports_chat_response_cache(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Cache endpoint exposes chat response cache counters."""
+    from src.schemas.chat import ChatResponse
+    from src.services.response_cache import ResponseCache
+
+    response_cache = ResponseCache(max_entries=10, ttl_seconds=60, similarity_threshold=0.9)
+    scope = (uuid.uuid4(), "en", "openai/gpt-4o")
+    answer = ChatResponse(message="Mallory", citations=[], conversation_id=uuid.uuid4())
+    response_cache.set(scope, "Who is the culprit?", [1.0, 0.0], answer)
+    response_cache.get(scope, [1.0, 0.1])
+    response_cache.get(scope, [0.0, 1.0])
+    monkeypatch.setattr(health_routes, "get_response_cache", lambda: response_cache)
+
+    response = await client.get("/health/caches")
+
+    stats = response.json()["caches"]["chat_responses"]
+    assert stats["enabled"] is True
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_dependency_health_reports_open_breaker(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Dependency endpoint shows breaker state and degrades the LLM while it is open."""
+    from src.services.provider_governor import get_provider_governor
+
+    monkeypatch.setattr(settings, "llm_provider", "openai")
+    monkeypatch.setattr(settings, "openai_api_key", "test-openai-key")
+    monkeypatch.setattr(settings, "llm_fallback_provider", "deepseek")
+    monkeypatch.setattr(settings, "deepseek_api_key", "test-deepseek-key")
+    monkeypatch.setattr(settings, "provider_breaker_failure_threshold", 1)
+    monkeypatch.setattr(health_routes, "verify_neo4j_connection", AsyncMock(return_value=True))
+    get_provider_governor("openai").breaker.record_failure()
+
+    response = await client.get("/health/dependencies")
+
+    data = response.json()
+    assert data["status"] == "degraded"
+    assert data["dependencies"]["llm"]["status"] == "degraded"
+    assert "fallback" in data["dependencies"]["llm"]["detail"]
+    assert data["breakers"]["openai"]["state"] == "open"
+    assert data["breakers"]["openai"]["times_opened"] == 1
+    assert data["breakers"]["deepseek"]["state"] == "closed"
+    assert data["breakers"]["embeddings"]["state"] == "closed"
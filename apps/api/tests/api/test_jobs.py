@@ -0,0 +1,68 @@
+"""Tests for background job API endpoints."""
+
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+from src.models import Case
+from src.services.job_service import JobWorkerPool
+
+
+@pytest.mark.asyncio
+async def test_create_graph_sync_job(
+    client: AsyncClient, sample_case: Case, job_workers: JobWorkerPool
+) -> None:
+    """POST /cases/{case_id}/jobs enqueues a job."""
+    response = await client.post(
+        f"/api/cases/{sample_case.case_id}/jobs",
+        json={"job_type": "graph_sync"},
+    )
+
+    assert response.status_code == 202
+    data = response.json()
+    assert data["job_type"] == "graph_sync"
+    assert data["status"] == "queued"
+    assert await job_workers.queue.get() == uuid.UUID(data["job_id"])
+
+
+@pytest.mark.asyncio
+async def test_create_job_case_not_found(client: AsyncClient, job_workers: JobWorkerPool) -> None:
+    """POST /cases/{case_id}/jobs returns 404 for unknown cases."""
+    response = await client.post(f"/api/cases/{uuid.uuid4()}/jobs", json={"job_type": "ingest"})
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_create_job_invalid_type(client: AsyncClient, sample_case: Case) -> None:
+    """POST /cases/{case_id}/jobs validates the job type."""
+    response = await client.post(
+        f"/api/cases/{sample_case.case_id}/jobs", json={"job_type": "reindex"}
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_job(client: AsyncClient, sample_case: Case, job_workers: JobWorkerPool) -> None:
+    """GET /jobs/{job_id} returns job state."""
+    created = await client.post(
+        f"/api/cases/{sample_case.case_id}/jobs",
+        json={"job_type": "ingest", "force": True},
+    )
+    job_id = created.json()["job_id"]
+
+    response = await client.get(f"/api/jobs/{job_id}")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["job_id"] == job_id
+    assert data["case_id"] == str(sample_case.case_id)
+    assert data["params_json"] == {"generate_embeddings": True, "force": True, "full": False}
+    assert data["progress_json"] == {}
+
+
+@pytest.mark.asyncio
+async def test_get_job_not_found(client: AsyncClient) -> None:
+    """GET /jobs/{job_id} returns 404 for unknown jobs."""
+    response = await client.get(f"/api/jobs/{uuid.uuid4()}")
+    assert response.status_code == 404
@@ -9,6 +9,7 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models import Case, DocChunk, DocType, Document, ScenarioType
+from src.services.job_service import InMemoryJobQueue, JobWorkerPool
 
 
 @pytest.fixture
@@ -143,8 +144,13 @@ async def test_search_validation_error(client: AsyncClient, test_case: Case) ->
 
 
 @pytest.mark.asyncio
-async def test_ingest_case(client: AsyncClient, test_case: Case, test_document: Document) -> None:
-    """POST /ingest creates chunks for case documents."""
+async def test_ingest_case(
+    client: AsyncClient,
+    test_case: Case,
+    test_document: Document,
+    job_workers: JobWorkerPool,
+) -> None:
+    """POST /ingest enqueues a job that creates chunks for case documents."""
     with (
         patch("src.services.ingestion_service.EmbeddingService") as mock_embedding_class,
         patch("src.services.ingestion_service.ChunkingService") as mock_chunking_class,
@@ -170,14 +176,29 @@ async def test_ingest_case(client: AsyncClient, test_case: Case, test_document:
         assert response.status_code == 202
         data = response.json()
         assert data["case_id"] == str(test_case.case_id)
-        assert "documents_processed" in data
-        assert "total_chunks" in data
-        assert "total_embeddings" in data
+        assert data["job_type"] == "ingest"
+        assert data["status"] == "queued"
+        assert data["params_json"] == {"generate_embeddings": True, "force": False}
+
+        await job_workers.run_job(uuid.UUID(data["job_id"]))
+
+    response = await client.get(f"/api/jobs/{data['job_id']}")
+    assert response.status_code == 200
+    job = response.json()
+    assert job["status"] == "succeeded"
+    assert job["documents_total"] == job["documents_done"] == 1
+    assert job["progress_json"] == {str(test_document.doc_id): "written"}
+    assert job["result_json"]["documents_processed"] == 1
+    assert job["result_json"]["total_chunks"] == 1
+    assert job["result_json"]["total_embeddings"] == 1
 
 
 @pytest.mark.asyncio
 async def test_ingest_case_no_embeddings(
-    client: AsyncClient, test_case: Case, test_document: Document
+    client: AsyncClient,
+    test_case: Case,
+    test_document: Document,
+    job_workers: JobWorkerPool,
 ) -> None:
     """POST /ingest with generate_embeddings=false skips embedding generation."""
     with patch("src.services.ingestion_service.ChunkingService") as mock_chunking_class:
@@ -195,8 +216,20 @@ async def test_ingest_case_no_embeddings(
             json={"generate_embeddings": False},
         )
         assert response.status_code == 202
-        data = response.json()
-        assert data["total_embeddings"] == 0
+        job_id = response.json()["job_id"]
+        await job_workers.run_job(uuid.UUID(job_id))
+
+    response = await client.get(f"/api/jobs/{job_id}")
+    assert response.json()["result_json"]["total_embeddings"] == 0
+
+
+@pytest.mark.asyncio
+async def test_ingest_case_not_found(client: AsyncClient, job_workers: JobWorkerPool) -> None:
+    """POST /ingest returns 404 for non-existent case and enqueues nothing."""
+    response = await client.post(f"/api/cases/{uuid.uuid4()}/ingest")
+    assert response.status_code == 404
+    assert isinstance(job_workers.queue, InMemoryJobQueue)
+    assert len(job_workers.queue) == 0
 
 
 @pytest.mark.asyncio
@@ -296,3 +329,34 @@ async def test_search_defaults_to_english(client: AsyncClient, test_case: Case)
             json={"query": "test query"},  # No language field
         )
         assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_search_keyword_mode(
+    client: AsyncClient,
+    test_case: Case,
+    test_document_with_chunks: tuple[Document, list[DocChunk]],
+) -> None:
+    """POST /search with mode=keyword ranks chunks by full-text match without embeddings."""
+    with patch("src.services.search_service.EmbeddingService") as mock_embedding_class:
+        mock_embedding = AsyncMock()
+        mock_embedding_class.return_value = mock_embedding
+
+        response = await client.post(
+            f"/api/cases/{test_case.case_id}/search",
+            json={"query": "project", "k": 5, "mode": "keyword"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["total"] >= 1
+        mock_embedding.embed_query.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_search_invalid_mode_rejected(client: AsyncClient, test_case: Case) -> None:
+    """POST /search rejects unknown modes."""
+    response = await client.post(
+        f"/api/cases/{test_case.case_id}/search",
+        json={"query": "project", "mode": "fuzzy"},
+    )
+    assert response.status_code == 422
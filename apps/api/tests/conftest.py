@@ -6,7 +6,7 @@ import re
 import subprocess
 import sys
 import uuid
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -25,6 +25,10 @@ from src.config import settings
 from src.dependencies import get_db
 from src.main import app
 from src.models import Case, DocType, Document, Entity, EntityType, ScenarioType, User
+from src.services import job_service
+from src.services.job_service import InMemoryJobQueue, JobWorkerPool
+from src.services.provider_governor import reset_provider_governors
+from src.services.response_cache import reset_response_cache
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -181,6 +185,22 @@ def _split_sql_statements(sql: str) -> list[str]:
     return statements
 
 
+@pytest.fixture(autouse=True)
+def fresh_response_cache() -> Iterator[None]:
+    """Keep cached chat answers from leaking between tests."""
+    reset_response_cache()
+    yield
+    reset_response_cache()
+
+
+@pytest.fixture(autouse=True)
+def fresh_provider_governors() -> Iterator[None]:
+    """Start every test with closed circuit breakers and idle call slots."""
+    reset_provider_governors()
+    yield
+    reset_provider_governors()
+
+
 @pytest.fixture
 async def db_engine() -> AsyncGenerator[AsyncEngine, None]:
     """Create a test-specific async engine per test function."""
@@ -211,6 +231,18 @@ async def db_session(db_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, Non
         await session.rollback()
 
 
+@pytest.fixture
+def job_workers(db_engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch) -> JobWorkerPool:
+    """Job worker pool bound to the test engine (workers not started).
+
+    Tests run queued jobs explicitly with ``job_workers.run_job(job_id)``.
+    """
+    session_maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    workers = JobWorkerPool(InMemoryJobQueue(), session_maker, concurrency=1)
+    monkeypatch.setattr(job_service, "_workers", workers)
+    return workers
+
+
 @pytest.fixture
 async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """Create async test client with overridden database dependency."""
@@ -308,6 +340,7 @@ async def sample_document(
 async def clean_db(db_session: AsyncSession) -> None:
     """Clean all test data from database (use with caution)."""
     # Delete in reverse dependency order
+    await db_session.execute(text("DELETE FROM jobs"))
     await db_session.execute(text("DELETE FROM doc_chunks"))
     await db_session.execute(text("DELETE FROM mentions"))
     await db_session.execute(text("DELETE FROM documents"))
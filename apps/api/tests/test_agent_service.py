@@ -3,10 +3,18 @@
 import asyncio
 import json
 import uuid
+from collections.abc import AsyncIterator, Callable
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
 
 from src.config import settings
 from src.schemas.chat import ChatRequest
@@ -16,13 +24,18 @@ from src.services.agent_service import AgentService
 
 @pytest.fixture
 def mock_db() -> MagicMock:
-    """Create a mock database session."""
-    return MagicMock()
+    """Create a mock database session with no stored conversations."""
+    db = MagicMock()
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = None
+    db.execute = AsyncMock(return_value=result)
+    db.commit = AsyncMock()
+    return db
 
 
 @pytest.fixture
 def mock_neo4j() -> MagicMock:
-    """Create a mock Neo4j session."""
+    """Create a mock Neo4j driver."""
     return MagicMock()
 
 
@@ -43,7 +56,7 @@ def agent_service(
     """Create an AgentService instance with mocks."""
     return AgentService(
         db=mock_db,
-        neo4j=mock_neo4j,
+        neo4j_driver=mock_neo4j,
         embedding_service=mock_embedding_service,
     )
 
@@ -56,7 +69,7 @@ def agent_service_no_neo4j(
     """Create an AgentService without Neo4j."""
     return AgentService(
         db=mock_db,
-        neo4j=None,
+        neo4j_driver=None,
         embedding_service=mock_embedding_service,
     )
 
@@ -340,7 +353,7 @@ async def test_chat_falls_back_to_secondary_provider(
     monkeypatch.setattr(settings, "openai_api_key", "openai-test-key")
     monkeypatch.setattr(settings, "llm_request_timeout_seconds", 15.0)
 
-    with patch("src.services.agent_service.create_aria_graph") as mock_create_graph:
+    with patch("src.services.agent_service.get_aria_graph") as mock_create_graph:
         mock_create_graph.side_effect = [primary_graph, fallback_graph]
         response = await agent_service_no_neo4j.chat(
             case_id=uuid.uuid4(),
@@ -352,3 +365,278 @@ async def test_chat_falls_back_to_secondary_provider(
     assert mock_create_graph.call_count == 2
     assert mock_create_graph.call_args_list[0].kwargs["provider"] == "deepseek"
     assert mock_create_graph.call_args_list[1].kwargs["provider"] == "openai"
+
+
+def _stream_events(answer: str, doc_id: str) -> list[dict[str, object]]:
+    """LangGraph v2 events for one search_docs call followed by an answer."""
+    tool_message = ToolMessage(
+        content=json.dumps([{"doc_id": doc_id, "text": "Wire transfer", "score": 0.9}]),
+        tool_call_id="call-1",
+        name="search_docs",
+    )
+    final = AIMessage(content=answer)
+    events: list[dict[str, object]] = [
+        {
+            "event": "on_tool_start",
+            "name": "search_docs",
+            "run_id": "run-1",
+            "parent_ids": ["graph"],
+            "metadata": {"langgraph_node": "tools"},
+            "data": {"input": {"query": "transfer"}},
+        },
+        {
+            "event": "on_tool_end",
+            "name": "search_docs",
+            "run_id": "run-1",
+            "parent_ids": ["graph"],
+            "metadata": {"langgraph_node": "tools"},
+            "data": {"output": tool_message},
+        },
+    ]
+    events.extend(
+        {
+            "event": "on_chat_model_stream",
+            "name": "ChatOpenAI",
+            "run_id": "run-2",
+            "parent_ids": ["graph"],
+            "metadata": {"langgraph_node": "agent"},
+            "data": {"chunk": AIMessageChunk(content=token)},
+        }
+        for token in answer.split(" ")
+    )
+    events.append(
+        {
+            "event": "on_chain_end",
+            "name": "LangGraph",
+            "run_id": "graph",
+            "parent_ids": [],
+            "metadata": {},
+            "data": {"output": {"messages": [tool_message, final]}},
+        }
+    )
+    return events
+
+
+def _fake_stream(
+    events: list[dict[str, object]], error: Exception | None = None
+) -> Callable[..., AsyncIterator[dict[str, object]]]:
+    async def astream_events(*_args: object, **_kwargs: object) -> AsyncIterator[dict[str, object]]:
+        if error is not None:
+            raise error
+        for event in events:
+            yield event
+
+    return astream_events
+
+
+@pytest.mark.asyncio
+async def test_stream_chat_yields_tokens_tools_and_citations(
+    agent_service_no_neo4j: AgentService,
+) -> None:
+    """stream_chat translates graph events into incremental chat events."""
+    doc_id = str(uuid.uuid4())
+    conversation_id = uuid.uuid4()
+    graph = MagicMock()
+    graph.astream_events = _fake_stream(_stream_events("Funds moved", doc_id))
+
+    with patch("src.services.agent_service.get_aria_graph", return_value=graph):
+        events = [
+            event
+            async for event in agent_service_no_neo4j.stream_chat(
+                uuid.uuid4(),
+                ChatRequest(message="Follow the money", conversation_id=conversation_id),
+            )
+        ]
+
+    assert [event.event for event in events] == [
+        "start",
+        "tool_start",
+        "tool_end",
+        "citation",
+        "token",
+        "token",
+        "done",
+    ]
+    assert events[0].data == {"conversation_id": str(conversation_id)}
+    assert events[1].data["input"] == {"query": "transfer"}
+    assert events[3].data["doc_id"] == doc_id
+    assert "".join(e.data["content"] for e in events if e.event == "token") == "Fundsmoved"
+    assert events[-1].data["message"] == "Funds moved"
+    assert events[-1].data["conversation_id"] == str(conversation_id)
+    assert [c["doc_id"] for c in events[-1].data["citations"]] == [doc_id]
+
+
+@pytest.mark.asyncio
+async def test_stream_chat_falls_back_before_output(
+    agent_service_no_neo4j: AgentService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """stream_chat retries with the fallback provider if the primary fails first."""
+    primary_graph = MagicMock()
+    primary_graph.astream_events = _fake_stream([], error=TimeoutError())
+    fallback_graph = MagicMock()
+    fallback_graph.astream_events = _fake_stream(_stream_events("Fallback", str(uuid.uuid4())))
+
+    monkeypatch.setattr(settings, "llm_provider", "deepseek")
+    monkeypatch.setattr(settings, "llm_fallback_provider", "openai")
+    monkeypatch.setattr(settings, "deepseek_api_key", "deepseek-test-key")
+    monkeypatch.setattr(settings, "openai_api_key", "openai-test-key")
+
+    with patch("src.services.agent_service.get_aria_graph") as mock_create_graph:
+        mock_create_graph.side_effect = [primary_graph, fallback_graph]
+        events = [
+            event
+            async for event in agent_service_no_neo4j.stream_chat(
+                uuid.uuid4(), ChatRequest(message="Who is suspicious?")
+            )
+        ]
+
+    assert events[-1].event == "done"
+    assert events[-1].data["message"] == "Fallback"
+    assert mock_create_graph.call_args_list[1].kwargs["provider"] == "openai"
+
+
+def _answer(content: str) -> dict[str, object]:
+    return {"messages": [AIMessage(content=content)], "retrieved_chunks": [], "citations": []}
+
+
+@pytest.mark.asyncio
+async def test_chat_answers_repeated_opening_question_from_cache(
+    agent_service_no_neo4j: AgentService,
+) -> None:
+    """A near-duplicate opening question about a case skips the model."""
+    case_id = uuid.uuid4()
+    graph = MagicMock()
+    graph.ainvoke = AsyncMock(return_value=_answer("Mallory approved it"))
+    second_conversation = uuid.uuid4()
+
+    with patch("src.services.agent_service.get_aria_graph", return_value=graph):
+        first = await agent_service_no_neo4j.chat(
+            case_id, ChatRequest(message="Who approved the invoice?")
+        )
+        second = await agent_service_no_neo4j.chat(
+            case_id,
+            ChatRequest(message="who approved the  invoice", conversation_id=second_conversation),
+        )
+        other_case = await agent_service_no_neo4j.chat(
+            uuid.uuid4(), ChatRequest(message="Who approved the invoice?")
+        )
+
+    assert graph.ainvoke.await_count == 2
+    assert second.message == first.message == other_case.message
+    assert second.conversation_id == second_conversation
+    agent_service_no_neo4j.embedding_service.embed_query.assert_awaited_with(  # type: ignore[attr-defined]
+        "who approved the invoice?"
+    )
+
+
+@pytest.mark.asyncio
+async def test_chat_cache_is_scoped_to_case_ingest_version(
+    agent_service_no_neo4j: AgentService,
+) -> None:
+    """After the case is re-ingested (in any process) earlier answers are not served."""
+    case_id = uuid.uuid4()
+    graph = MagicMock()
+    graph.ainvoke = AsyncMock(side_effect=[_answer("Old chunks"), _answer("New chunks")])
+    ingested_at = datetime(2026, 10, 18, tzinfo=UTC)
+    versions = AsyncMock(side_effect=["", ingested_at.isoformat()])
+
+    with (
+        patch("src.services.agent_service.get_aria_graph", return_value=graph),
+        patch.object(agent_service_no_neo4j, "_ingest_version", versions),
+    ):
+        await agent_service_no_neo4j.chat(case_id, ChatRequest(message="Who paid?"))
+        response = await agent_service_no_neo4j.chat(case_id, ChatRequest(message="Who paid?"))
+
+    assert response.message == "New chunks"
+    assert graph.ainvoke.await_count == 2
+
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = ingested_at
+    agent_service_no_neo4j.db.execute = AsyncMock(return_value=result)  # type: ignore[method-assign]
+    assert await agent_service_no_neo4j._ingest_version(case_id, [1.0]) == ingested_at.isoformat()
+    assert await agent_service_no_neo4j._ingest_version(case_id, None) == ""
+
+
+@pytest.mark.asyncio
+async def test_chat_follow_up_bypasses_response_cache(
+    agent_service_no_neo4j: AgentService,
+) -> None:
+    """Questions asked after earlier turns are not answered from the cache."""
+    case_id = uuid.uuid4()
+    graph = MagicMock()
+    graph.ainvoke = AsyncMock(side_effect=[_answer("First"), _answer("Second")])
+    history = [HumanMessage(content="Hi"), AIMessage(content="Hello")]
+
+    with patch("src.services.agent_service.get_aria_graph", return_value=graph):
+        await agent_service_no_neo4j.chat(case_id, ChatRequest(message="Who paid?"))
+        with patch.object(
+            agent_service_no_neo4j.conversations,
+            "load_history",
+            AsyncMock(return_value=history),
+        ):
+            response = await agent_service_no_neo4j.chat(
+                case_id, ChatRequest(message="Who paid?", conversation_id=uuid.uuid4())
+            )
+
+    assert response.message == "Second"
+    assert graph.ainvoke.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_chat_replays_cached_answer(
+    agent_service_no_neo4j: AgentService,
+) -> None:
+    """A cached answer streams as citations, one token and done."""
+    case_id = uuid.uuid4()
+    doc_id = str(uuid.uuid4())
+    graph = MagicMock()
+    graph.astream_events = _fake_stream(_stream_events("Funds moved", doc_id))
+
+    with patch("src.services.agent_service.get_aria_graph", return_value=graph) as get_graph:
+        for _ in range(2):
+            events = [
+                event
+                async for event in agent_service_no_neo4j.stream_chat(
+                    case_id, ChatRequest(message="Follow the money")
+                )
+            ]
+
+    assert get_graph.call_count == 1
+    assert [event.event for event in events] == ["start", "citation", "token", "done"]
+    assert events[1].data["doc_id"] == doc_id
+    assert events[2].data == {"content": "Funds moved"}
+    assert events[3].data["conversation_id"] == events[0].data["conversation_id"]
+
+
+@pytest.mark.asyncio
+async def test_chat_skips_provider_with_open_breaker(
+    agent_service_no_neo4j: AgentService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Timeouts open the primary's breaker, after which chat goes straight to the fallback."""
+    monkeypatch.setattr(settings, "llm_provider", "deepseek")
+    monkeypatch.setattr(settings, "llm_fallback_provider", "openai")
+    monkeypatch.setattr(settings, "deepseek_api_key", "deepseek-test-key")
+    monkeypatch.setattr(settings, "openai_api_key", "openai-test-key")
+    monkeypatch.setattr(settings, "provider_breaker_failure_threshold", 1)
+    primary_graph = MagicMock()
+    primary_graph.ainvoke = AsyncMock(side_effect=TimeoutError())
+    fallback_graph = MagicMock()
+    fallback_graph.ainvoke = AsyncMock(return_value=_answer("Fallback response"))
+    graphs = {"deepseek": primary_graph, "openai": fallback_graph}
+
+    with patch(
+        "src.services.agent_service.get_aria_graph",
+        side_effect=lambda _tools, provider: graphs[provider],
+    ) as mock_create_graph:
+        await agent_service_no_neo4j.chat(uuid.uuid4(), ChatRequest(message="First"))
+        response = await agent_service_no_neo4j.chat(uuid.uuid4(), ChatRequest(message="Next"))
+
+    assert response.message == "Fallback response"
+    assert [c.kwargs["provider"] for c in mock_create_graph.call_args_list] == [
+        "deepseek",
+        "openai",
+        "openai",
+    ]
+    assert primary_graph.ainvoke.await_count == 1
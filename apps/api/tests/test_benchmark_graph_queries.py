@@ -0,0 +1,84 @@
+"""Tests for the graph query benchmark helpers."""
+
+from unittest.mock import AsyncMock
+
+from src.scripts.benchmark_graph_queries import (
+    LEGACY_PATH_QUERY,
+    QueryResult,
+    delete_graph,
+    format_results,
+    generate_graph,
+    sample_queries,
+    time_queries,
+)
+
+
+def test_generate_graph_splits_nodes_across_cases() -> None:
+    """Every case gets an equal share of entities and documents."""
+    graph = generate_graph(1000, 10, degree=2, document_ratio=0.2)
+
+    assert len(graph) == 10
+    assert len({case.case_id for case in graph}) == 10
+    for case in graph:
+        entity_ids = set(case.entity_ids)
+        assert len(entity_ids) == 80
+        assert len(case.documents) == 20
+        assert set(case.entities) == {"Person", "Org", "Account"}
+        assert all(edge["source_id"] != edge["target_id"] for edge in case.edges)
+        assert {edge["target_id"] for edge in case.edges} <= entity_ids
+        assert {doc["author_id"] for doc in case.documents} <= entity_ids
+
+
+def test_generate_graph_is_reproducible() -> None:
+    """The same seed yields the same graph."""
+    assert generate_graph(100, 2) == generate_graph(100, 2)
+
+
+def test_sample_queries_stay_within_a_case() -> None:
+    """Path endpoints always belong to the sampled case."""
+    graph = generate_graph(200, 4)
+    ids_by_case = {case.case_id: set(case.entity_ids) for case in graph}
+
+    samples = sample_queries(graph, 20)
+
+    assert len(samples) == 20
+    for case_id, from_id, to_id in samples:
+        assert from_id != to_id
+        assert {from_id, to_id} <= ids_by_case[case_id]
+
+
+async def test_time_queries_reports_latency() -> None:
+    """Each call is timed once."""
+    call = AsyncMock()
+    result = await time_queries("legacy", "query_path", [call, call, call])
+
+    assert call.await_count == 3
+    assert result.query == "query_path"
+    assert result.p95_ms >= result.p50_ms >= 0
+
+
+async def test_delete_graph_uses_labelled_matches() -> None:
+    """Cleanup deletes only the synthetic cases, through the case_id indexes."""
+    graph = generate_graph(20, 2)
+    session = AsyncMock()
+
+    await delete_graph(session, graph)
+
+    queries = [call.args[0] for call in session.run.call_args_list]
+    assert len(queries) == 4
+    assert all("DETACH DELETE" in query for query in queries)
+    assert {call.kwargs["case_id"] for call in session.run.call_args_list} == {
+        case.case_id for case in graph
+    }
+
+
+def test_legacy_query_is_unlabelled() -> None:
+    """The baseline query matches nodes by property only."""
+    assert ":Entity" not in LEGACY_PATH_QUERY
+
+
+def test_format_results() -> None:
+    """Results render as a Markdown table."""
+    table = format_results([QueryResult("query_path", "legacy", 12.345, 20.0)], 100000, 100)
+    assert "100000 nodes across 100 cases" in table
+    assert "| query_path | legacy | 12.35 | 20.00 |" in table
@@ -0,0 +1,74 @@
+"""Tests for the search mode benchmark helpers."""
+
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from src.models import DocType
+from src.scripts.benchmark_hybrid_search import (
+    LabelledQuery,
+    ModeResult,
+    evaluate,
+    format_results,
+    load_queries,
+    reciprocal_rank,
+)
+from src.services.search_service import SearchResult
+
+
+def _result(doc_id: uuid.UUID) -> SearchResult:
+    return SearchResult(
+        chunk_id=uuid.uuid4(),
+        doc_id=doc_id,
+        text="",
+        score=1.0,
+        chunk_index=0,
+        meta_json={},
+        doc_type=DocType.email,
+        subject=None,
+        ts=datetime.now(UTC),
+    )
+
+
+def test_reciprocal_rank() -> None:
+    """The first relevant result determines the reciprocal rank."""
+    relevant = uuid.uuid4()
+    other = uuid.uuid4()
+
+    assert reciprocal_rank({relevant}, [_result(other), _result(relevant)]) == 0.5
+    assert reciprocal_rank({relevant}, [_result(other)]) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_evaluate_reports_hit_rate_and_mrr() -> None:
+    """Hit rate and MRR are averaged over all queries."""
+    found = uuid.uuid4()
+    missing = uuid.uuid4()
+
+    async def search(query: str) -> list[SearchResult]:
+        return [_result(uuid.uuid4()), _result(found)]
+
+    result = await evaluate(
+        "keyword",
+        search,
+        [LabelledQuery("a", {found}), LabelledQuery("b", {missing})],
+    )
+
+    assert result.hit_rate == 0.5
+    assert result.mrr == 0.25
+    assert result.p95_ms >= result.p50_ms >= 0
+
+
+def test_load_queries_and_format(tmp_path: Path) -> None:
+    """Labelled queries load from JSONL and results render as a table."""
+    doc_id = uuid.uuid4()
+    path = tmp_path / "queries.jsonl"
+    path.write_text(f'{{"query": "invoices", "doc_ids": ["{doc_id}"]}}\n\n', encoding="utf-8")
+
+    assert load_queries(path) == [LabelledQuery("invoices", {doc_id})]
+
+    table = format_results([ModeResult("hybrid", 1.0, 0.75, 2.0, 3.0)], k=6, queries=1)
+    assert "| hybrid | 1.000 | 0.750 | 2.00 | 3.00 |" in table
+    assert "hit@6" in table
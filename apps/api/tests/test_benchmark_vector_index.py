@@ -0,0 +1,58 @@
+"""Tests for the vector index benchmark script."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.scripts.benchmark_vector_index import (
+    BenchmarkResult,
+    format_results,
+    percentile,
+    recall_at_k,
+    run_benchmark,
+)
+
+
+def test_recall_at_k() -> None:
+    """Recall counts overlap with the exact neighbours regardless of order."""
+    assert recall_at_k([1, 2, 3, 4], [4, 3, 9, 8]) == 0.5
+    assert recall_at_k([1, 2], [2, 1]) == 1.0
+    assert recall_at_k([], [1]) == 1.0
+
+
+def test_percentile() -> None:
+    """Nearest-rank percentile."""
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 95) == 0.0
+
+
+def test_format_results() -> None:
+    """Results render as a Markdown table."""
+    table = format_results([BenchmarkResult("hnsw", "ef_search=40", 0.9876, 1.234, 2.5, 0.5)], 6)
+    assert "| index | setting | recall@6 |" in table
+    assert "| hnsw | ef_search=40 | 0.988 | 1.23 | 2.50 | 0.50 |" in table
+
+
+@pytest.mark.asyncio
+async def test_run_benchmark_small(db_engine: AsyncEngine) -> None:
+    """A tiny benchmark runs every index type and leaves no tables behind."""
+    async with db_engine.connect() as conn:
+        results = await run_benchmark(
+            conn,
+            rows=200,
+            dim=8,
+            queries=5,
+            k=5,
+            lists=4,
+            probes_values=[4],
+            ef_search_values=[40],
+        )
+        await conn.rollback()
+
+    assert [r.index for r in results] == ["exact", "ivfflat", "hnsw"]
+    assert results[0].recall == 1.0
+    # Probing every IVFFlat list is exhaustive
+    assert results[1].recall == 1.0
+    assert all(0.0 <= r.recall <= 1.0 and r.p95_ms >= r.p50_ms for r in results)
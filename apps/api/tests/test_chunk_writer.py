@@ -0,0 +1,150 @@
+"""Tests for the bulk chunk writer."""
+
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models import Case, DocChunk, DocType, Document, ScenarioType
+from src.services.chunk_writer import ChunkRow, ChunkWriter
+from src.services.chunking_service import ChunkingService
+from src.services.ingestion_service import IngestionService
+
+
+@pytest.fixture
+async def writer_document(db_session: AsyncSession) -> Document:
+    """Create a case with one document to attach chunks to."""
+    case = Case(
+        case_id=uuid.uuid4(),
+        title="Chunk Writer Case",
+        scenario_type=ScenarioType.vendor_fraud,
+        difficulty=1,
+        seed=4242,
+        briefing="Briefing",
+        ground_truth_json={},
+    )
+    doc = Document(
+        doc_id=uuid.uuid4(),
+        case_id=case.case_id,
+        doc_type=DocType.note,
+        ts=datetime.now(UTC),
+        subject="Note",
+        body="Body text",
+        language="es",
+    )
+    db_session.add_all([case, doc])
+    await db_session.commit()
+    return doc
+
+
+def _rows(doc: Document, count: int) -> list[ChunkRow]:
+    return [
+        ChunkRow(
+            doc_id=doc.doc_id,
+            case_id=doc.case_id,
+            chunk_index=i,
+            text=f"chunk {i}",
+            embedding=[float(i)] * 1536 if i % 2 == 0 else None,
+            language=doc.language,
+            meta_json={"start": i},
+        )
+        for i in range(count)
+    ]
+
+
+async def _stored(db_session: AsyncSession, doc: Document) -> list[DocChunk]:
+    result = await db_session.execute(
+        select(DocChunk).where(DocChunk.doc_id == doc.doc_id).order_by(DocChunk.chunk_index)
+    )
+    return list(result.scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_write_uses_copy_for_large_batches(
+    db_session: AsyncSession, writer_document: Document
+) -> None:
+    """Rows at or above the threshold are copied and read back intact."""
+    writer = ChunkWriter(db_session, bulk_threshold=3)
+    with patch.object(db_session, "add_all", wraps=db_session.add_all) as add_all:
+        written = await writer.write(_rows(writer_document, 4))
+
+    assert written == 4
+    add_all.assert_not_called()
+
+    chunks = await _stored(db_session, writer_document)
+    assert [c.chunk_index for c in chunks] == [0, 1, 2, 3]
+    assert all(c.chunk_id is not None for c in chunks)
+    assert chunks[1].embedding is None
+    assert chunks[2].embedding is not None
+    assert list(chunks[2].embedding) == [2.0] * 1536
+    assert chunks[3].meta_json == {"start": 3}
+    assert chunks[0].language == "es"
+
+
+@pytest.mark.asyncio
+async def test_write_restores_default_vector_codec(
+    db_session: AsyncSession, writer_document: Document
+) -> None:
+    """ORM vector binds keep working on the connection after a COPY."""
+    await ChunkWriter(db_session, bulk_threshold=1).write(_rows(writer_document, 1))
+
+    db_session.add(
+        DocChunk(
+            doc_id=writer_document.doc_id,
+            case_id=writer_document.case_id,
+            chunk_index=9,
+            text="orm chunk",
+            embedding=[0.5] * 1536,
+            meta_json={},
+        )
+    )
+    await db_session.flush()
+
+    chunks = await _stored(db_session, writer_document)
+    assert [c.chunk_index for c in chunks] == [0, 9]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("threshold", [0, 10])
+async def test_write_small_or_disabled_batches_use_orm(
+    db_session: AsyncSession, writer_document: Document, threshold: int
+) -> None:
+    """Batches below the threshold, or with COPY disabled, go through the ORM."""
+    writer = ChunkWriter(db_session, bulk_threshold=threshold)
+    with patch.object(writer, "_copy", AsyncMock()) as copy:
+        written = await writer.write(_rows(writer_document, 2))
+
+    assert written == 2
+    copy.assert_not_awaited()
+    assert len(await _stored(db_session, writer_document)) == 2
+
+
+@pytest.mark.asyncio
+async def test_write_empty_batch(db_session: AsyncSession) -> None:
+    """Writing nothing is a no-op."""
+    assert await ChunkWriter(db_session, bulk_threshold=1).write([]) == 0
+
+
+@pytest.mark.asyncio
+async def test_ingest_case_replaces_chunks_via_copy(
+    db_session: AsyncSession, writer_document: Document
+) -> None:
+    """Case ingestion with the COPY path deletes old chunks before copying new ones."""
+    mock_embedding = AsyncMock()
+    mock_embedding.embed_texts = AsyncMock(side_effect=lambda texts: [[0.3] * 1536 for _ in texts])
+    service = IngestionService(
+        db=db_session,
+        chunking=ChunkingService(),
+        embedding=mock_embedding,
+        writer=ChunkWriter(db_session, bulk_threshold=1),
+    )
+
+    first = await service.ingest_case(writer_document.case_id)
+    second = await service.ingest_case(writer_document.case_id, force=True)
+
+    chunks = await _stored(db_session, writer_document)
+    assert first.total_chunks == second.total_chunks == len(chunks) > 0
+    assert all(c.embedding is not None for c in chunks)
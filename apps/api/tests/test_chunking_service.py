@@ -6,7 +6,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from src.models.document import DocType
-from src.services.chunking_service import ChunkConfig, ChunkingService
+from src.services.chunking_service import ChunkConfig, ChunkingService, estimate_tokens
 
 
 @pytest.fixture
@@ -173,3 +173,10 @@ def test_empty_document() -> None:
 
     # Empty body should still produce at least one chunk (possibly empty)
     assert isinstance(chunks, list)
+
+
+def test_estimate_tokens() -> None:
+    """Token estimate is ~4 characters per token and never zero."""
+    assert estimate_tokens("") == 1
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
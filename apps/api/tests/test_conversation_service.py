@@ -0,0 +1,133 @@
+"""Tests for ConversationService."""
+
+import uuid
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.models import Case, Conversation, ScenarioType, User
+from src.services.conversation_service import ConversationService
+
+
+@pytest.fixture
+async def conversation_case(db_session: AsyncSession) -> Case:
+    """Create a case for conversation tests."""
+    case = Case(
+        case_id=uuid.uuid4(),
+        title="Conversation Test Case",
+        scenario_type=ScenarioType.vendor_fraud,
+        difficulty=2,
+        seed=22222,
+        briefing="Conversation briefing",
+        ground_truth_json={"culprits": [], "mechanism": "test"},
+    )
+    db_session.add(case)
+    await db_session.commit()
+    return case
+
+
+def _messages(question: str) -> list[object]:
+    """A user turn with one tool call."""
+    return [
+        HumanMessage(content=question),
+        AIMessage(
+            content="",
+            tool_calls=[{"name": "search_docs", "args": {"query": question}, "id": "call-1"}],
+        ),
+        ToolMessage(content='[{"doc_id": "d1"}]', tool_call_id="call-1", name="search_docs"),
+        AIMessage(content="Found it"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_save_and_load_history_round_trip(
+    db_session: AsyncSession,
+    conversation_case: Case,
+) -> None:
+    """Saved messages load back with their tool calls, and saves replace history."""
+    service = ConversationService(db_session)
+    conversation_id = uuid.uuid4()
+
+    await service.save_history(conversation_id, conversation_case.case_id, _messages("first"))
+    await service.save_history(
+        conversation_id,
+        conversation_case.case_id,
+        [*_messages("first"), *_messages("second")],
+    )
+    history = await service.load_history(conversation_id, conversation_case.case_id)
+
+    assert len(history) == 8
+    assert isinstance(history[2], ToolMessage)
+    assert history[4].content == "second"
+    assert isinstance(history[1], AIMessage)
+    assert history[1].tool_calls[0]["args"] == {"query": "first"}
+    stored = await db_session.get(Conversation, conversation_id)
+    assert stored is not None
+    await db_session.delete(stored)
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_history_is_scoped_to_the_case(
+    db_session: AsyncSession,
+    conversation_case: Case,
+) -> None:
+    """A conversation ID is neither read nor overwritten from another case."""
+    service = ConversationService(db_session)
+    conversation_id = uuid.uuid4()
+    other_case_id = uuid.uuid4()
+    await service.save_history(conversation_id, conversation_case.case_id, _messages("mine"))
+
+    assert await service.load_history(conversation_id, other_case_id) == []
+    assert await service.load_history(uuid.uuid4(), conversation_case.case_id) == []
+
+    await service.save_history(conversation_id, other_case_id, _messages("theirs"))
+    history = await service.load_history(conversation_id, conversation_case.case_id)
+    assert history[0].content == "mine"
+
+
+@pytest.mark.asyncio
+async def test_history_is_private_to_its_owner(
+    db_session: AsyncSession,
+    conversation_case: Case,
+    sample_user: User,
+) -> None:
+    """Another player (or an anonymous client) can neither read nor append to it."""
+    other_user = User(
+        user_id=uuid.uuid4(),
+        email=f"other-{uuid.uuid4()}@example.com",
+        password_hash="not-a-real-hash",
+        name="Other Player",
+    )
+    db_session.add(other_user)
+    await db_session.commit()
+    service = ConversationService(db_session)
+    conversation_id = uuid.uuid4()
+    case_id = conversation_case.case_id
+    await service.save_history(conversation_id, case_id, _messages("mine"), sample_user.user_id)
+
+    assert await service.load_history(conversation_id, case_id, other_user.user_id) == []
+    assert await service.load_history(conversation_id, case_id) == []
+
+    await service.save_history(conversation_id, case_id, _messages("theirs"), other_user.user_id)
+    await service.save_history(conversation_id, case_id, _messages("anonymous"))
+    history = await service.load_history(conversation_id, case_id, sample_user.user_id)
+    assert history[0].content == "mine"
+
+
+@pytest.mark.asyncio
+async def test_history_disabled_with_zero_budget(
+    db_session: AsyncSession,
+    conversation_case: Case,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A zero token budget neither stores nor loads history."""
+    monkeypatch.setattr(settings, "chat_history_max_tokens", 0)
+    service = ConversationService(db_session)
+    conversation_id = uuid.uuid4()
+
+    assert await service.save_history(conversation_id, conversation_case.case_id, []) == []
+    assert await service.load_history(conversation_id, conversation_case.case_id) == []
+    assert await db_session.get(Conversation, conversation_id) is None
@@ -19,6 +19,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models import DocChunk, Document, Entity
+from src.services.job_service import JobWorkerPool
 
 
 def make_ground_truth() -> dict[str, Any]:
@@ -200,6 +201,7 @@ async def test_ingestion_and_search_flow(
     client: AsyncClient,
     db_session: AsyncSession,
     mock_embedding_service: MagicMock,
+    job_workers: JobWorkerPool,
 ) -> None:
     """Ingest documents and verify search works.
 
@@ -240,7 +242,11 @@ async def test_ingestion_and_search_flow(
     # 3. Ingest all documents
     response = await client.post(f"/api/cases/{case_id}/ingest")
     assert response.status_code == 202
-    ingest_result = response.json()
+    job_id = response.json()["job_id"]
+    await job_workers.run_job(uuid.UUID(job_id))
+    response = await client.get(f"/api/jobs/{job_id}")
+    assert response.json()["status"] == "succeeded"
+    ingest_result = response.json()["result_json"]
     assert ingest_result["documents_processed"] == 2
     assert ingest_result["total_chunks"] > 0
 
@@ -423,6 +429,7 @@ async def test_complete_investigation_workflow(
     client: AsyncClient,
     db_session: AsyncSession,
     mock_embedding_service: MagicMock,
+    job_workers: JobWorkerPool,
     mock_neo4j_driver: MagicMock,
 ) -> None:
     """Full workflow: create -> ingest -> search -> graph.
@@ -499,7 +506,11 @@ async def test_complete_investigation_workflow(
     # 4. Ingest all documents
     response = await client.post(f"/api/cases/{case_id}/ingest")
     assert response.status_code == 202
-    ingest_result = response.json()
+    job_id = response.json()["job_id"]
+    await job_workers.run_job(uuid.UUID(job_id))
+    response = await client.get(f"/api/jobs/{job_id}")
+    assert response.json()["status"] == "succeeded"
+    ingest_result = response.json()["result_json"]
     assert ingest_result["documents_processed"] == 3
     assert ingest_result["total_chunks"] > 0
 
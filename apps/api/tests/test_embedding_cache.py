@@ -0,0 +1,226 @@
+"""Tests for the content-addressed embedding cache."""
+
+import uuid
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.models import EmbeddingCacheEntry
+from src.services.embedding_cache import (
+    EmbeddingCache,
+    InMemoryEmbeddingCacheBackend,
+    PostgresEmbeddingCacheBackend,
+    QueryEmbeddingCache,
+    build_embedding_cache,
+    get_embedding_cache,
+    get_query_embedding_cache,
+    hash_text,
+    normalize_query,
+    reset_embedding_cache,
+)
+
+
+def test_hash_text_is_sha256() -> None:
+    """Content address is the sha256 hex digest of the text."""
+    assert hash_text("abc") == ("ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad")
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_evicts_least_recently_used() -> None:
+    """LRU backend keeps at most max_entries and evicts the oldest unused key."""
+    backend = InMemoryEmbeddingCacheBackend(max_entries=2)
+    await backend.set_many("m", 3, {"a": [1.0], "b": [2.0]})
+    await backend.get_many("m", 3, ["a"])  # touch "a"
+    await backend.set_many("m", 3, {"c": [3.0]})
+
+    assert len(backend) == 2
+    assert await backend.get_many("m", 3, ["a", "b", "c"]) == {"a": [1.0], "c": [3.0]}
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_keys_include_model_and_dimension() -> None:
+    """Same text hash under a different model/dimension is a miss."""
+    backend = InMemoryEmbeddingCacheBackend()
+    await backend.set_many("model-a", 3, {"h": [1.0]})
+
+    assert await backend.get_many("model-b", 3, ["h"]) == {}
+    assert await backend.get_many("model-a", 4, ["h"]) == {}
+
+
+@pytest.mark.asyncio
+async def test_cache_counts_hits_and_misses() -> None:
+    """Lookups update hit/miss counters per requested text."""
+    cache = EmbeddingCache([InMemoryEmbeddingCacheBackend()])
+    await cache.set_many("m", 2, ["known"], [[0.1, 0.2]])
+
+    results = await cache.get_many("m", 2, ["known", "unknown", "known"])
+
+    assert results == [[0.1, 0.2], None, [0.1, 0.2]]
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 1
+    assert cache.stats.writes == 1
+    assert cache.stats.hit_rate == pytest.approx(2 / 3)
+
+    cache.reset_stats()
+    assert cache.stats.hits == 0
+    assert cache.stats.hit_rate == 0.0
+
+
+@pytest.mark.asyncio
+async def test_cache_promotes_hits_from_slower_backend() -> None:
+    """Hits found in a later backend are copied into earlier backends."""
+    fast = InMemoryEmbeddingCacheBackend()
+    slow = InMemoryEmbeddingCacheBackend()
+    await slow.set_many("m", 1, {hash_text("text"): [0.5]})
+    cache = EmbeddingCache([fast, slow])
+
+    assert await cache.get_many("m", 1, ["text"]) == [[0.5]]
+    assert await fast.get_many("m", 1, [hash_text("text")]) == {hash_text("text"): [0.5]}
+
+
+@pytest.mark.asyncio
+async def test_postgres_backend_round_trip(db_engine: AsyncEngine) -> None:
+    """Postgres backend persists embeddings and ignores duplicate writes."""
+    session_maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    backend = PostgresEmbeddingCacheBackend(session_maker)
+    model = f"test-model-{uuid.uuid4()}"
+    embedding = [0.25] * 8
+
+    try:
+        await backend.set_many(model, 8, {"h1": embedding})
+        await backend.set_many(model, 8, {"h1": [0.0] * 8})  # conflict is ignored
+
+        found = await backend.get_many(model, 8, ["h1", "h2"])
+        assert list(found) == ["h1"]
+        assert found["h1"] == pytest.approx(embedding)
+        assert await backend.get_many(model, 16, ["h1"]) == {}
+    finally:
+        async with session_maker() as session:
+            await session.execute(
+                delete(EmbeddingCacheEntry).where(EmbeddingCacheEntry.model == model)
+            )
+            await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_postgres_backend_swallows_errors() -> None:
+    """Backend failures degrade to cache misses instead of raising."""
+
+    def broken_session_maker() -> AsyncSession:
+        raise RuntimeError("db down")
+
+    backend = PostgresEmbeddingCacheBackend(broken_session_maker)  # type: ignore[arg-type]
+
+    assert await backend.get_many("m", 1, ["h"]) == {}
+    await backend.set_many("m", 1, {"h": [1.0]})
+    assert await backend.get_many("m", 1, []) == {}
+
+
+def test_build_embedding_cache_backends() -> None:
+    """Configured backend names map to the expected backend stack."""
+    assert build_embedding_cache("none") is None
+
+    memory = build_embedding_cache("memory")
+    assert memory is not None
+    assert [b.name for b in memory.backends] == ["memory"]
+
+    persistent = build_embedding_cache("postgres")
+    assert persistent is not None
+    assert [b.name for b in persistent.backends] == ["memory", "postgres"]
+
+
+def test_get_embedding_cache_is_shared() -> None:
+    """Process-wide cache is reused until reset."""
+    reset_embedding_cache()
+    first = get_embedding_cache()
+    assert get_embedding_cache() is first
+    reset_embedding_cache()
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_normalize_query() -> None:
+    """Normalization ignores case and repeated whitespace."""
+    assert normalize_query("  Invoice   APPROVALS \n") == "invoice approvals"
+
+
+def test_query_cache_hits_on_normalized_query() -> None:
+    """Queries differing only by case/whitespace share one entry."""
+    cache = QueryEmbeddingCache(max_bytes=1_000_000, ttl_seconds=60)
+    cache.set("model", "Invoice approvals", [0.1, 0.2])
+
+    assert cache.get("model", "invoice   APPROVALS") == [0.1, 0.2]
+    assert cache.get("other-model", "invoice approvals") is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_query_cache_expires_entries_after_ttl() -> None:
+    """Entries older than the TTL are dropped and counted as expirations."""
+    clock = FakeClock()
+    cache = QueryEmbeddingCache(max_bytes=1_000_000, ttl_seconds=10, clock=clock)
+    cache.set("model", "q", [1.0])
+
+    clock.now = 9.0
+    assert cache.get("model", "q") == [1.0]
+    clock.now = 10.0
+    assert cache.get("model", "q") is None
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+def test_query_cache_evicts_lru_within_byte_budget() -> None:
+    """Byte budget evicts least recently used vectors first."""
+    entry_bytes = 1536 * QueryEmbeddingCache.BYTES_PER_FLOAT
+    cache = QueryEmbeddingCache(max_bytes=2 * entry_bytes, ttl_seconds=0)
+    cache.set("m", "a", [0.0] * 1536)
+    cache.set("m", "b", [0.0] * 1536)
+    cache.get("m", "a")
+    cache.set("m", "c", [0.0] * 1536)
+
+    assert cache.get("m", "b") is None
+    assert cache.get("m", "a") is not None
+    assert cache.get("m", "c") is not None
+    assert cache.stats.evictions == 1
+    assert cache.size_bytes == 2 * entry_bytes
+
+
+def test_query_cache_replaces_and_skips_oversized_entries() -> None:
+    """Re-setting a key replaces it; vectors larger than the budget are not cached."""
+    cache = QueryEmbeddingCache(max_bytes=16, ttl_seconds=0)
+    cache.set("m", "q", [1.0])
+    cache.set("m", "q", [2.0, 3.0])
+    cache.set("m", "big", [0.0] * 3)
+
+    assert cache.get("m", "q") == [2.0, 3.0]
+    assert cache.get("m", "big") is None
+    assert cache.size_bytes == 16
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+def test_get_query_embedding_cache_respects_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A zero byte budget disables the shared query cache."""
+    from src.config import settings
+
+    reset_embedding_cache()
+    monkeypatch.setattr(settings, "query_embedding_cache_max_bytes", 0)
+    assert get_query_embedding_cache() is None
+
+    monkeypatch.setattr(settings, "query_embedding_cache_max_bytes", 1024)
+    shared = get_query_embedding_cache()
+    assert shared is not None
+    assert get_query_embedding_cache() is shared
+    reset_embedding_cache()
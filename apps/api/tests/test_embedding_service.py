@@ -4,9 +4,21 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.services.embedding_cache import (
+    EmbeddingCache,
+    InMemoryEmbeddingCacheBackend,
+    QueryEmbeddingCache,
+    reset_embedding_cache,
+)
 from src.services.embedding_service import EmbeddingService, get_embedding_service
 
 
+@pytest.fixture(autouse=True)
+def fresh_embedding_cache() -> None:
+    """Start each test with an empty process-wide embedding cache."""
+    reset_embedding_cache()
+
+
 @pytest.mark.asyncio
 async def test_embed_texts_empty_list() -> None:
     """Embed texts with empty list returns empty list."""
@@ -58,3 +70,93 @@ def test_embedding_service_dimension() -> None:
     with patch("src.services.embedding_service.OpenAIEmbeddings"):
         service = EmbeddingService()
         assert service.dimension == 1536  # Default from settings
+
+
+@pytest.mark.asyncio
+async def test_embed_texts_only_sends_cache_misses() -> None:
+    """Cached texts are served locally; only misses reach the provider."""
+    with patch("src.services.embedding_service.OpenAIEmbeddings") as mock_class:
+        mock_embedder = MagicMock()
+        mock_embedder.aembed_documents = AsyncMock(
+            side_effect=lambda texts: [[float(len(t))] * 3 for t in texts]
+        )
+        mock_class.return_value = mock_embedder
+
+        cache = EmbeddingCache([InMemoryEmbeddingCacheBackend()])
+        service = EmbeddingService(cache=cache)
+
+        first = await service.embed_texts(["aa", "bbb"])
+        second = await service.embed_texts(["bbb", "cccc", "cccc"])
+
+        assert first == [[2.0] * 3, [3.0] * 3]
+        assert second == [[3.0] * 3, [4.0] * 3, [4.0] * 3]
+        assert mock_embedder.aembed_documents.call_args_list[1].args == (["cccc"],)
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 4
+
+
+@pytest.mark.asyncio
+async def test_embed_texts_fully_cached_skips_provider() -> None:
+    """A batch of previously embedded texts makes no provider call."""
+    with patch("src.services.embedding_service.OpenAIEmbeddings") as mock_class:
+        mock_embedder = MagicMock()
+        mock_embedder.aembed_documents = AsyncMock(return_value=[[0.1] * 3])
+        mock_class.return_value = mock_embedder
+
+        service = EmbeddingService(cache=EmbeddingCache([InMemoryEmbeddingCacheBackend()]))
+        await service.embed_texts(["same"])
+        result = await service.embed_texts(["same"])
+
+        assert result == [[0.1] * 3]
+        mock_embedder.aembed_documents.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_embed_texts_without_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Disabled cache sends every text to the provider."""
+    monkeypatch.setattr("src.services.embedding_service.get_embedding_cache", lambda: None)
+    with patch("src.services.embedding_service.OpenAIEmbeddings") as mock_class:
+        mock_embedder = MagicMock()
+        mock_embedder.aembed_documents = AsyncMock(return_value=[[0.1] * 3, [0.1] * 3])
+        mock_class.return_value = mock_embedder
+
+        service = EmbeddingService()
+        assert service.cache is None
+        await service.embed_texts(["a", "a"])
+
+        mock_embedder.aembed_documents.assert_called_once_with(["a", "a"])
+
+
+@pytest.mark.asyncio
+async def test_embed_query_uses_query_cache() -> None:
+    """Repeated (normalized) queries skip the provider round trip."""
+    with patch("src.services.embedding_service.OpenAIEmbeddings") as mock_class:
+        mock_embedder = MagicMock()
+        mock_embedder.aembed_query = AsyncMock(return_value=[0.3] * 1536)
+        mock_class.return_value = mock_embedder
+
+        query_cache = QueryEmbeddingCache(max_bytes=1_000_000, ttl_seconds=60)
+        service = EmbeddingService(query_cache=query_cache)
+
+        first = await service.embed_query("Vendor payments")
+        second = await service.embed_query("  vendor   payments ")
+
+        assert first == second
+        mock_embedder.aembed_query.assert_called_once_with("Vendor payments")
+        assert query_cache.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_embed_query_without_query_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Disabled query cache always calls the provider."""
+    monkeypatch.setattr("src.services.embedding_service.get_query_embedding_cache", lambda: None)
+    with patch("src.services.embedding_service.OpenAIEmbeddings") as mock_class:
+        mock_embedder = MagicMock()
+        mock_embedder.aembed_query = AsyncMock(return_value=[0.3] * 3)
+        mock_class.return_value = mock_embedder
+
+        service = EmbeddingService()
+        await service.embed_query("q")
+        await service.embed_query("q")
+
+        assert mock_embedder.aembed_query.call_count == 2
@@ -9,8 +9,9 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
 from src.models import Case, DocType, Document, Entity, EntityType, ScenarioType
-from src.services.graph_service import GraphService
+from src.services.graph_service import GraphService, GraphState
 
 
 @pytest.fixture
@@ -109,15 +110,249 @@ async def test_sync_case_clears_existing(
     mock_neo4j_session: AsyncMock,
     graph_case: Case,
 ) -> None:
-    """Sync case clears existing graph data first."""
+    """A full sync clears existing graph data first."""
     service = GraphService(mock_neo4j_session, db_session)
-    await service.sync_case(graph_case.case_id)
+    await service.sync_case(graph_case.case_id, full=True)
 
     # First call should be the DETACH DELETE query
     first_call = mock_neo4j_session.run.call_args_list[0]
     assert "DETACH DELETE" in first_call[0][0]
 
 
+def _writes(session: AsyncMock, fragment: str) -> list[list[dict[str, Any]]]:
+    """Row batches passed to the UNWIND writes whose query contains ``fragment``."""
+    return [
+        call.kwargs["rows"]
+        for call in session.run.call_args_list
+        if fragment in call.args[0] and "rows" in call.kwargs
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sync_case_writes_in_batches(
+    db_session: AsyncSession,
+    mock_neo4j_session: AsyncMock,
+    graph_case: Case,
+    graph_entities: list[Entity],
+    graph_documents: list[Document],
+) -> None:
+    """Sync writes each label / relationship type with one UNWIND statement."""
+    service = GraphService(mock_neo4j_session, db_session)
+    await service.sync_case(graph_case.case_id)
+
+    calls = mock_neo4j_session.run.call_args_list
+    writes = _write_calls(mock_neo4j_session)
+    # Two sync-state reads, everything else is a batched write
+    assert len(calls) == 2 + len(writes)
+    assert all("UNWIND $rows" in query for query in writes)
+    person_rows = _writes(mock_neo4j_session, "SET e:Person")
+    assert len(person_rows) == 1
+    assert len(person_rows[0]) == 2
+    document_rows = _writes(mock_neo4j_session, "MERGE (d:Document")
+    assert [len(rows) for rows in document_rows] == [len(graph_documents)]
+    sent_rows = _writes(mock_neo4j_session, "MERGE (p)-[r:SENT]->(d)")
+    assert {row["author_id"] for row in sent_rows[0]} == {
+        str(doc.author_entity_id) for doc in graph_documents
+    }
+
+
+@pytest.mark.asyncio
+async def test_sync_case_chunks_batches_by_configured_size(
+    db_session: AsyncSession,
+    mock_neo4j_session: AsyncMock,
+    graph_case: Case,
+    graph_entities: list[Entity],
+    graph_documents: list[Document],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Each write transaction holds at most graph_sync_batch_size rows."""
+    monkeypatch.setattr(settings, "graph_sync_batch_size", 1)
+    service = GraphService(mock_neo4j_session, db_session)
+    await service.sync_case(graph_case.case_id)
+
+    document_rows = _writes(mock_neo4j_session, "MERGE (d:Document")
+    assert [len(rows) for rows in document_rows] == [1] * len(graph_documents)
+
+
+@pytest.mark.asyncio
+async def test_sync_case_aggregates_repeated_entity_edges(
+    db_session: AsyncSession,
+    mock_neo4j_session: AsyncMock,
+    graph_case: Case,
+    graph_entities: list[Entity],
+) -> None:
+    """An edge inferred from several documents is written once with its count."""
+    author, mentioned = graph_entities[0], graph_entities[1]
+    docs = [
+        Document(
+            doc_id=uuid.uuid4(),
+            case_id=graph_case.case_id,
+            doc_type=DocType.email,
+            ts=datetime(2026, 1, day, tzinfo=UTC),
+            subject=f"Note {day}",
+            body=f"Message for {mentioned.name}",
+            author_entity_id=author.entity_id,
+        )
+        for day in (1, 2)
+    ]
+    db_session.add_all(docs)
+    await db_session.commit()
+
+    service = GraphService(mock_neo4j_session, db_session)
+    result = await service.sync_case(graph_case.case_id)
+
+    mention_rows = _writes(mock_neo4j_session, "MERGE (a)-[r:MENTIONS]->(b)")
+    assert len(mention_rows) == 1
+    assert len(mention_rows[0]) == 1
+    assert mention_rows[0][0] | {"sync_hash": None} == {
+        "source_id": str(author.entity_id),
+        "target_id": str(mentioned.entity_id),
+        "type": "MENTIONS",
+        "count": 2,
+        "last_doc_id": str(docs[1].doc_id),
+        "last_doc_type": "email",
+        "last_ts": docs[1].ts.isoformat(),
+        "sync_hash": None,
+    }
+    # 2 SENT document edges + one MENTIONS and one CO_OCCURS edge
+    assert result.relationships_created == 4
+
+
+def _stored_graph(state: GraphState) -> AsyncMock:
+    """Neo4j session mock whose sync state reads return ``state``."""
+    node_records = [
+        {"entity_id": entity_id, "doc_id": None, "labels": [row["label"]], **row}
+        for entity_id, row in state.entities.items()
+    ] + [
+        {"entity_id": None, "doc_id": doc_id, "labels": ["Document"], **row}
+        for doc_id, row in state.documents.items()
+    ]
+    edge_records = [
+        {"source_id": source, "target_id": target, "type": rel_type, **row}
+        for (source, target, rel_type), row in state.edges.items()
+    ]
+
+    async def run(query: str, **params: Any) -> MagicMock:
+        result = MagicMock()
+        result.consume = AsyncMock()
+        if "RETURN n.entity_id" in query:
+            result.__aiter__.return_value = node_records
+        elif "RETURN a.entity_id" in query:
+            result.__aiter__.return_value = edge_records
+        else:
+            result.__aiter__.return_value = []
+        return result
+
+    session = AsyncMock()
+    session.run = AsyncMock(side_effect=run)
+    return session
+
+
+def _write_calls(session: AsyncMock) -> list[str]:
+    return [call.args[0] for call in session.run.call_args_list if "rows" in call.kwargs]
+
+
+@pytest.mark.asyncio
+async def test_sync_case_skips_unchanged_graph(
+    db_session: AsyncSession,
+    graph_case: Case,
+    graph_entities: list[Entity],
+    graph_documents: list[Document],
+) -> None:
+    """A sync against an up-to-date graph only reads sync state."""
+    desired = await GraphService(AsyncMock(), db_session)._build_graph_state(graph_case.case_id)
+    neo4j = _stored_graph(desired)
+
+    result = await GraphService(neo4j, db_session).sync_case(graph_case.case_id)
+
+    assert not any("DETACH DELETE" in call.args[0] for call in neo4j.run.call_args_list)
+    assert all(
+        not call.kwargs["rows"] for call in neo4j.run.call_args_list if "rows" in call.kwargs
+    )
+    assert result.nodes_created == 0
+    assert result.relationships_created == 0
+    assert result.nodes_unchanged == len(graph_entities) + len(graph_documents)
+
+
+@pytest.mark.asyncio
+async def test_sync_case_writes_only_changes(
+    db_session: AsyncSession,
+    graph_case: Case,
+    graph_entities: list[Entity],
+    graph_documents: list[Document],
+) -> None:
+    """Changed nodes are upserted, and removed nodes and stale edges deleted."""
+    desired = await GraphService(AsyncMock(), db_session)._build_graph_state(graph_case.case_id)
+    stale_doc = str(uuid.uuid4())
+    stale_edge = (str(graph_entities[0].entity_id), str(graph_entities[2].entity_id), "MENTIONS")
+    desired.documents[stale_doc] = {"sync_hash": "old"}
+    desired.edges[stale_edge] = {"sync_hash": "old"}
+    neo4j = _stored_graph(desired)
+
+    graph_entities[1].name = "Renamed org"
+    await db_session.commit()
+
+    result = await GraphService(neo4j, db_session).sync_case(graph_case.case_id)
+
+    assert _writes(neo4j, "SET e:Org")[0][0]["name"] == "Renamed org"
+    assert not any(rows for rows in _writes(neo4j, "SET e:Person"))
+    assert not any(rows for rows in _writes(neo4j, "MERGE (d:Document"))
+    assert _writes(neo4j, "n:Document {doc_id: row.id")[0] == [{"id": stale_doc}]
+    assert _writes(neo4j, "DELETE r")[0] == [
+        {"source_id": stale_edge[0], "target_id": stale_edge[1], "type": "MENTIONS"}
+    ]
+    assert result.nodes_created == 1
+    assert result.nodes_deleted == 1
+    assert result.relationships_deleted == 1
+    assert result.nodes_unchanged == len(graph_entities) - 1 + len(graph_documents)
+
+
+@pytest.mark.asyncio
+async def test_sync_case_replaces_removed_entity_attributes(
+    db_session: AsyncSession,
+    graph_case: Case,
+    graph_entities: list[Entity],
+    graph_documents: list[Document],
+) -> None:
+    """An attribute removed from attrs_json is dropped from the node, not merged over."""
+    desired = await GraphService(AsyncMock(), db_session)._build_graph_state(graph_case.case_id)
+    neo4j = _stored_graph(desired)
+    graph_entities[1].attrs_json = {}
+    await db_session.commit()
+
+    await GraphService(neo4j, db_session).sync_case(graph_case.case_id)
+
+    query = next(call.args[0] for call in neo4j.run.call_args_list if "SET e:Org" in call.args[0])
+    assert "SET e = row.attrs" in query
+    assert "+=" not in query
+    assert _writes(neo4j, "SET e:Org")[0][0]["attrs"] == {}
+
+
+@pytest.mark.asyncio
+async def test_sync_case_recreates_relabelled_entities(
+    db_session: AsyncSession,
+    graph_case: Case,
+    graph_entities: list[Entity],
+    graph_documents: list[Document],
+) -> None:
+    """An entity whose type changed is recreated and its documents re-linked."""
+    desired = await GraphService(AsyncMock(), db_session)._build_graph_state(graph_case.case_id)
+    neo4j = _stored_graph(desired)
+    author = graph_entities[0]
+    author.entity_type = EntityType.account
+    await db_session.commit()
+
+    await GraphService(neo4j, db_session).sync_case(graph_case.case_id)
+
+    assert _writes(neo4j, "n:Entity {entity_id: row.id")[0] == [{"id": str(author.entity_id)}]
+    assert [row["entity_id"] for row in _writes(neo4j, "SET e:Account")[0]] == [
+        str(author.entity_id)
+    ]
+    assert [row["doc_id"] for row in _writes(neo4j, "MERGE (d:Document")[0]] == [
+        str(graph_documents[0].doc_id)
+    ]
+
+
 @pytest.mark.asyncio
 async def test_query_path_found(
     db_session: AsyncSession,
@@ -190,6 +425,10 @@ async def test_query_path_found(
     assert len(result.nodes) == 2
     assert len(result.edges) == 1
     assert result.length == 1
+    # Endpoints are looked up through the :Entity(entity_id) constraint index
+    query = mock_neo4j.run.call_args.args[0]
+    assert "(a:Entity {entity_id: $from_id" in query
+    assert "(b:Entity {entity_id: $to_id" in query
 
 
 @pytest.mark.asyncio
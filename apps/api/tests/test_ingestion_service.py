@@ -1,14 +1,24 @@
 """Tests for ingestion service."""
 
+import asyncio
 import uuid
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models import Case, DocChunk, DocType, Document, ScenarioType
-from src.services.ingestion_service import IngestionService
+from src.config import settings
+from src.models import Case, DocChunk, DocType, Document, Entity, EntityType, Mention, ScenarioType
+from src.schemas.chat import ChatResponse
+from src.services.chunking_service import ChunkingService, ChunkResult
+from src.services.ingestion_service import (
+    IngestionService,
+    document_fingerprint,
+    pack_embedding_batches,
+)
+from src.services.response_cache import get_response_cache
 
 
 @pytest.fixture
@@ -232,6 +242,56 @@ async def test_ingest_case(
     assert result.total_embeddings == 1
 
 
+@pytest.mark.asyncio
+async def test_ingest_case_invalidates_cached_answers(
+    db_session: AsyncSession,
+    ingestion_case: Case,
+    ingestion_document: Document,
+) -> None:
+    """Re-ingesting a case drops its cached chat answers and bumps its ingest version."""
+    cache = get_response_cache()
+    assert cache is not None
+    response = ChatResponse(message="Cached", citations=[], conversation_id=uuid.uuid4())
+    cache.set((ingestion_case.case_id, "en", "openai/gpt-4o", ""), "Who?", [1.0], response)
+    cache.set((uuid.uuid4(), "en", "openai/gpt-4o", ""), "Who?", [1.0], response)
+
+    await IngestionService(db=db_session).ingest_case(
+        ingestion_case.case_id, generate_embeddings=False
+    )
+
+    assert len(cache) == 1
+    assert cache.get((ingestion_case.case_id, "en", "openai/gpt-4o", ""), [1.0]) is None
+    # Other processes stop matching the old answers through the new ingest version
+    await db_session.refresh(ingestion_case)
+    assert ingestion_case.ingested_at is not None
+
+
+@pytest.mark.asyncio
+async def test_unchanged_reingest_keeps_cached_answers(
+    db_session: AsyncSession,
+    ingestion_case: Case,
+    ingestion_document: Document,
+) -> None:
+    """A re-ingest that skips every document neither bumps the version nor drops answers."""
+    service = IngestionService(db=db_session)
+    await service.ingest_case(ingestion_case.case_id, generate_embeddings=False)
+    await db_session.commit()
+    await db_session.refresh(ingestion_case)
+    ingested_at = ingestion_case.ingested_at
+    cache = get_response_cache()
+    assert cache is not None
+    scope = (ingestion_case.case_id, "en", "openai/gpt-4o", "")
+    response = ChatResponse(message="Cached", citations=[], conversation_id=uuid.uuid4())
+    cache.set(scope, "Who?", [1.0], response)
+
+    result = await service.ingest_case(ingestion_case.case_id, generate_embeddings=False)
+
+    assert result.documents_skipped == 1
+    assert cache.get(scope, [1.0]) is not None
+    await db_session.refresh(ingestion_case)
+    assert ingestion_case.ingested_at == ingested_at
+
+
 @pytest.mark.asyncio
 async def test_ingest_case_empty(
     db_session: AsyncSession,
@@ -252,3 +312,289 @@ async def test_ingest_case_empty(
     assert result.documents_processed == 0
     assert result.total_chunks == 0
     assert result.total_embeddings == 0
+
+
+def test_pack_embedding_batches_by_count() -> None:
+    """Batches are closed when they reach max_items."""
+    batches = pack_embedding_batches(["a"] * 5, max_items=2, max_tokens=1000)
+    assert batches == [[0, 1], [2, 3], [4]]
+
+
+def test_pack_embedding_batches_by_token_budget() -> None:
+    """Batches are closed before exceeding the token budget."""
+    texts = ["x" * 40, "x" * 40, "x" * 40, "x" * 400]  # 10, 10, 10, 100 tokens
+    batches = pack_embedding_batches(texts, max_items=100, max_tokens=25)
+    assert batches == [[0, 1], [2], [3]]  # oversized text still gets its own batch
+    assert pack_embedding_batches([], max_items=10, max_tokens=10) == []
+
+
+@pytest.mark.asyncio
+async def test_ingest_case_batches_embeddings_concurrently(
+    db_session: AsyncSession,
+    ingestion_case: Case,
+    ingestion_document: Document,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Chunks from all documents are packed into bounded concurrent batches."""
+    second_doc = Document(
+        doc_id=uuid.uuid4(),
+        case_id=ingestion_case.case_id,
+        doc_type=DocType.note,
+        ts=datetime.now(UTC),
+        subject="Second",
+        body="Second document body.",
+    )
+    db_session.add(second_doc)
+    await db_session.commit()
+
+    def chunk_document(doc: Document) -> list[ChunkResult]:
+        return [
+            ChunkResult(chunk_index=i, text=f"{doc.subject}-{i}", meta_json={}) for i in range(3)
+        ]
+
+    mock_chunking = MagicMock()
+    mock_chunking.chunk_document = MagicMock(side_effect=chunk_document)
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def embed_texts(texts: list[str]) -> list[list[float]]:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [[float(len(text))] * 1536 for text in texts]
+
+    mock_embedding = AsyncMock()
+    mock_embedding.embed_texts = AsyncMock(side_effect=embed_texts)
+
+    monkeypatch.setattr(settings, "embedding_batch_size", 2)
+    monkeypatch.setattr(settings, "embedding_max_concurrency", 2)
+
+    service = IngestionService(db=db_session, chunking=mock_chunking, embedding=mock_embedding)
+    result = await service.ingest_case(ingestion_case.case_id)
+
+    assert result.documents_processed == 2
+    assert result.total_chunks == 6
+    assert result.total_embeddings == 6
+    assert mock_embedding.embed_texts.await_count == 3
+    assert max_in_flight == 2
+
+    rows = await db_session.execute(
+        select(DocChunk.text, DocChunk.embedding).where(DocChunk.case_id == ingestion_case.case_id)
+    )
+    for text, embedding in rows.all():
+        assert embedding is not None
+        assert embedding[0] == pytest.approx(float(len(text)))
+
+
+@pytest.mark.asyncio
+async def test_ingest_case_embedding_failure_keeps_existing_chunks(
+    db_session: AsyncSession,
+    ingestion_case: Case,
+    ingestion_document_with_chunks: tuple[Document, list[DocChunk]],
+) -> None:
+    """A provider failure aborts before existing chunks are deleted."""
+    mock_chunking = MagicMock()
+    mock_chunking.chunk_document = MagicMock(
+        return_value=[ChunkResult(chunk_index=0, text="new", meta_json={})]
+    )
+    mock_embedding = AsyncMock()
+    mock_embedding.embed_texts = AsyncMock(side_effect=RuntimeError("provider down"))
+
+    service = IngestionService(db=db_session, chunking=mock_chunking, embedding=mock_embedding)
+    with pytest.raises(RuntimeError, match="provider down"):
+        await service.ingest_case(ingestion_case.case_id)
+
+    remaining = await db_session.execute(
+        select(func.count(DocChunk.chunk_id)).where(DocChunk.case_id == ingestion_case.case_id)
+    )
+    assert remaining.scalar() == 3
+
+
+def _counting_embedding() -> AsyncMock:
+    """Embedding mock returning one vector per input text."""
+    mock_embedding = AsyncMock()
+    mock_embedding.embed_texts = AsyncMock(side_effect=lambda texts: [[0.2] * 1536 for _ in texts])
+    return mock_embedding
+
+
+def test_document_fingerprint_tracks_content_and_config(ingestion_document: Document) -> None:
+    """Fingerprint changes with content, language, chunk config and embedding setup."""
+    base = document_fingerprint(ingestion_document, "512:64", "model:1536")
+
+    assert base == document_fingerprint(ingestion_document, "512:64", "model:1536")
+    assert base != document_fingerprint(ingestion_document, "256:64", "model:1536")
+    assert base != document_fingerprint(ingestion_document, "512:64", "no-embeddings")
+
+    ingestion_document.body = "Changed body"
+    assert base != document_fingerprint(ingestion_document, "512:64", "model:1536")
+    ingestion_document.body = "This is a test email for ingestion."
+    ingestion_document.language = "es"
+    assert base != document_fingerprint(ingestion_document, "512:64", "model:1536")
+
+
+@pytest.mark.asyncio
+async def test_ingest_case_skips_unchanged_documents(
+    db_session: AsyncSession,
+    ingestion_case: Case,
+    ingestion_document: Document,
+) -> None:
+    """Second ingestion of an unchanged case does no chunking or embedding work."""
+    mock_embedding = _counting_embedding()
+    service = IngestionService(db=db_session, chunking=ChunkingService(), embedding=mock_embedding)
+
+    first = await service.ingest_case(ingestion_case.case_id)
+    second = await service.ingest_case(ingestion_case.case_id)
+
+    assert first.documents_skipped == 0
+    assert first.total_embeddings == first.total_chunks > 0
+    assert second.documents_processed == 1
+    assert second.documents_skipped == 1
+    assert second.total_chunks == 0
+    assert second.total_embeddings == 0
+    assert mock_embedding.embed_texts.await_count == 1
+
+    stored = await db_session.execute(
+        select(func.count(DocChunk.chunk_id)).where(DocChunk.doc_id == ingestion_document.doc_id)
+    )
+    assert stored.scalar() == first.total_chunks
+
+    forced = await service.ingest_case(ingestion_case.case_id, force=True)
+    assert forced.documents_skipped == 0
+    assert forced.embeddings_reused == first.total_chunks
+    assert forced.total_embeddings == 0
+
+
+@pytest.mark.asyncio
+async def test_ingest_case_reuses_embeddings_for_unchanged_chunks(
+    db_session: AsyncSession,
+    ingestion_case: Case,
+    ingestion_document: Document,
+) -> None:
+    """Only chunk texts that changed are re-embedded within a changed document."""
+    chunking = ChunkingService()
+    chunking.splitter._chunk_size = 40  # Force several chunks
+    chunking.splitter._chunk_overlap = 0
+    ingestion_document.body = "First paragraph stays.\n\nSecond paragraph stays."
+    await db_session.commit()
+
+    mock_embedding = _counting_embedding()
+    service = IngestionService(db=db_session, chunking=chunking, embedding=mock_embedding)
+    first = await service.ingest_case(ingestion_case.case_id)
+
+    ingestion_document.body = "First paragraph stays.\n\nSecond paragraph CHANGED."
+    await db_session.commit()
+    second = await service.ingest_case(ingestion_case.case_id)
+
+    assert first.total_chunks == second.total_chunks == 3
+    assert second.documents_skipped == 0
+    assert second.embeddings_reused == 2
+    assert second.total_embeddings == 1
+    assert mock_embedding.embed_texts.await_args_list[-1].args == (["Second paragraph CHANGED."],)
+
+    reusable = await service._load_reusable_embeddings(
+        [ingestion_document.doc_id], ["First paragraph stays.", "Not stored"]
+    )
+    assert list(reusable) == ["First paragraph stays."]
+
+
+@pytest.mark.asyncio
+async def test_ingest_case_does_not_reuse_embeddings_across_models(
+    db_session: AsyncSession,
+    ingestion_case: Case,
+    ingestion_document: Document,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Changing the embedding model re-embeds every chunk instead of copying old vectors."""
+    mock_embedding = _counting_embedding()
+    service = IngestionService(db=db_session, chunking=ChunkingService(), embedding=mock_embedding)
+    first = await service.ingest_case(ingestion_case.case_id)
+    assert ingestion_document.embedding_key == f"{settings.embedding_model}:1536"
+
+    monkeypatch.setattr(settings, "embedding_model", "text-embedding-3-large")
+    second = await service.ingest_case(ingestion_case.case_id)
+
+    assert second.documents_skipped == 0
+    assert second.embeddings_reused == 0
+    assert second.total_embeddings == first.total_chunks
+    assert ingestion_document.embedding_key == "text-embedding-3-large:1536"
+
+
+@pytest.mark.asyncio
+async def test_ingest_case_reingests_when_embeddings_requested(
+    db_session: AsyncSession,
+    ingestion_case: Case,
+    ingestion_document: Document,
+) -> None:
+    """Documents ingested without embeddings are not skipped once embeddings are requested."""
+    mock_embedding = _counting_embedding()
+    service = IngestionService(db=db_session, chunking=ChunkingService(), embedding=mock_embedding)
+
+    without = await service.ingest_case(ingestion_case.case_id, generate_embeddings=False)
+    with_embeddings = await service.ingest_case(ingestion_case.case_id)
+
+    assert without.total_embeddings == 0
+    assert with_embeddings.documents_skipped == 0
+    assert with_embeddings.total_embeddings == with_embeddings.total_chunks
+
+
+@pytest.mark.asyncio
+async def test_ingest_document_sets_fingerprint(
+    db_session: AsyncSession,
+    ingestion_case: Case,
+    ingestion_document: Document,
+) -> None:
+    """Single-document ingestion records the fingerprint so case ingest can skip it."""
+    mock_embedding = _counting_embedding()
+    service = IngestionService(db=db_session, chunking=ChunkingService(), embedding=mock_embedding)
+
+    await service.ingest_document(ingestion_document.doc_id)
+    assert ingestion_document.content_fingerprint is not None
+
+    result = await service.ingest_case(ingestion_case.case_id)
+    assert result.documents_skipped == 1
+
+
+@pytest.mark.asyncio
+async def test_ingest_case_indexes_entity_mentions(
+    db_session: AsyncSession,
+    ingestion_case: Case,
+    ingestion_document: Document,
+) -> None:
+    """Mentions follow document bodies and entity names without rewriting unchanged rows."""
+    entity = Entity(
+        entity_id=uuid.uuid4(),
+        case_id=ingestion_case.case_id,
+        entity_type=EntityType.person,
+        name="Dana Reyes",
+        attrs_json={"email": "dana@example.com"},
+    )
+    db_session.add(entity)
+    ingestion_document.body = "Dana Reyes forwarded this to dana@example.com."
+    await db_session.commit()
+
+    service = IngestionService(db=db_session, chunking=ChunkingService())
+    first = await service.ingest_case(ingestion_case.case_id, generate_embeddings=False)
+    second = await service.ingest_case(ingestion_case.case_id, generate_embeddings=False)
+
+    async def stored_mentions() -> list[tuple[int, int, str]]:
+        result = await db_session.execute(
+            select(Mention.span_start, Mention.span_end, Mention.mention_text)
+            .where(Mention.entity_id == entity.entity_id)
+            .order_by(Mention.span_start)
+        )
+        return [tuple(row) for row in result.all()]
+
+    assert first.mentions_indexed == 2
+    assert second.documents_skipped == 1
+    assert second.mentions_indexed == 0
+    assert await stored_mentions() == [(0, 10, "Dana Reyes"), (29, 45, "dana@example.com")]
+
+    # Renaming the entity re-indexes the unchanged document
+    entity.name = "Dana"
+    await db_session.commit()
+    third = await service.ingest_case(ingestion_case.case_id, generate_embeddings=False)
+    assert third.mentions_indexed == 1
+    assert await stored_mentions() == [(0, 4, "Dana"), (29, 45, "dana@example.com")]
@@ -0,0 +1,338 @@
+"""Tests for the background job queue and worker pool."""
+
+import asyncio
+import uuid
+from collections.abc import AsyncGenerator
+from contextlib import AbstractContextManager
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.models import Case, DocChunk, DocType, Document, Job, JobStatus, JobType, ScenarioType
+from src.services.job_service import (
+    InMemoryJobQueue,
+    JobProgress,
+    JobService,
+    JobWorkerPool,
+    build_job_queue,
+)
+
+
+@pytest.fixture
+async def job_case(db_session: AsyncSession) -> AsyncGenerator[Case, None]:
+    """Create a case with two documents (deleted with its jobs afterwards)."""
+    case = Case(
+        case_id=uuid.uuid4(),
+        title="Job Test Case",
+        scenario_type=ScenarioType.vendor_fraud,
+        difficulty=1,
+        seed=31337,
+        briefing="Briefing",
+        ground_truth_json={},
+    )
+    db_session.add(case)
+    db_session.add_all(
+        [
+            Document(
+                doc_id=uuid.uuid4(),
+                case_id=case.case_id,
+                doc_type=DocType.email,
+                ts=datetime.now(UTC),
+                subject=f"Email {i}",
+                body=f"Body of email {i}.",
+            )
+            for i in range(2)
+        ]
+    )
+    await db_session.commit()
+
+    yield case
+
+    case_id = case.case_id
+    await db_session.rollback()
+    await db_session.execute(delete(Case).where(Case.case_id == case_id))
+    await db_session.commit()
+
+
+async def _job(db_session: AsyncSession, job_id: uuid.UUID) -> Job:
+    result = await db_session.execute(
+        select(Job).where(Job.job_id == job_id).execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+def _embedding_patch() -> AbstractContextManager[Any]:
+    mock_embedding = AsyncMock()
+    mock_embedding.embed_texts = AsyncMock(side_effect=lambda texts: [[0.1] * 1536 for _ in texts])
+    return patch("src.services.ingestion_service.EmbeddingService", return_value=mock_embedding)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_persists_and_submits(
+    db_session: AsyncSession, job_case: Case, job_workers: JobWorkerPool
+) -> None:
+    """Enqueued jobs are committed as queued and handed to the queue."""
+    job = await JobService(db_session).enqueue(job_case.case_id, JobType.ingest, {"force": True})
+
+    assert job.status == JobStatus.queued
+    assert job.params_json == {"force": True}
+    assert await job_workers.queue.get() == job.job_id
+
+
+@pytest.mark.asyncio
+async def test_enqueue_unknown_case(db_session: AsyncSession, job_workers: JobWorkerPool) -> None:
+    """Enqueueing for a missing case raises ValueError."""
+    with pytest.raises(ValueError, match="not found"):
+        await JobService(db_session).enqueue(uuid.uuid4(), JobType.ingest)
+
+
+@pytest.mark.asyncio
+async def test_run_ingest_job_records_progress_and_result(
+    db_session: AsyncSession, job_case: Case, job_workers: JobWorkerPool
+) -> None:
+    """Ingest jobs run the pipeline and persist per-document progress."""
+    job = await JobService(db_session).enqueue(job_case.case_id, JobType.ingest)
+
+    with _embedding_patch():
+        await job_workers.run_job(job.job_id)
+
+    stored = await _job(db_session, job.job_id)
+    assert stored.status == JobStatus.succeeded
+    assert stored.started_at is not None
+    assert stored.finished_at is not None
+    assert stored.documents_total == stored.documents_done == 2
+    assert set(stored.progress_json.values()) == {"written"}
+    assert stored.result_json is not None
+    assert stored.result_json["documents_processed"] == 2
+    assert stored.result_json["total_embeddings"] == stored.result_json["total_chunks"]
+
+    chunks = await db_session.execute(select(DocChunk).where(DocChunk.case_id == job_case.case_id))
+    assert len(chunks.scalars().all()) == 2
+
+    # Re-running the unchanged case marks every document as skipped
+    rerun = await JobService(db_session).enqueue(job_case.case_id, JobType.ingest)
+    with _embedding_patch():
+        await job_workers.run_job(rerun.job_id)
+    stored = await _job(db_session, rerun.job_id)
+    assert set(stored.progress_json.values()) == {"skipped"}
+    assert stored.result_json is not None
+    assert stored.result_json["documents_skipped"] == 2
+
+
+@pytest.mark.asyncio
+async def test_run_job_failure_is_recorded(
+    db_session: AsyncSession, job_case: Case, job_workers: JobWorkerPool
+) -> None:
+    """Handler exceptions mark the job failed with the error message."""
+    job = await JobService(db_session).enqueue(job_case.case_id, JobType.ingest)
+
+    failing = AsyncMock()
+    failing.embed_texts = AsyncMock(side_effect=RuntimeError("provider down"))
+    with patch("src.services.ingestion_service.EmbeddingService", return_value=failing):
+        await job_workers.run_job(job.job_id)
+
+    stored = await _job(db_session, job.job_id)
+    assert stored.status == JobStatus.failed
+    assert stored.error == "provider down"
+    assert stored.result_json is None
+    assert set(stored.progress_json.values()) == {"chunked"}
+
+
+@pytest.mark.asyncio
+async def test_run_job_only_claims_queued_jobs(
+    db_session: AsyncSession, job_case: Case, job_workers: JobWorkerPool
+) -> None:
+    """Duplicate deliveries of a finished job are ignored."""
+    job = await JobService(db_session).enqueue(job_case.case_id, JobType.graph_sync)
+    handler = AsyncMock(return_value={"nodes_created": 0})
+    job_workers._handlers[JobType.graph_sync] = handler
+
+    await job_workers.run_job(job.job_id)
+    await job_workers.run_job(job.job_id)
+    await job_workers.run_job(uuid.uuid4())
+
+    handler.assert_awaited_once()
+    assert (await _job(db_session, job.job_id)).result_json == {"nodes_created": 0}
+
+
+@pytest.mark.asyncio
+async def test_run_graph_sync_job(
+    db_session: AsyncSession, job_case: Case, job_workers: JobWorkerPool
+) -> None:
+    """Graph sync jobs open their own Neo4j session and store sync counts."""
+    job = await JobService(db_session).enqueue(job_case.case_id, JobType.graph_sync)
+
+    mock_session = AsyncMock()
+    mock_session.run = AsyncMock(return_value=AsyncMock())
+    mock_ctx = AsyncMock(__aenter__=AsyncMock(return_value=mock_session))
+    mock_ctx.__aexit__ = AsyncMock(return_value=None)
+    mock_driver = MagicMock()
+    mock_driver.session = MagicMock(return_value=mock_ctx)
+    with patch("src.services.job_service.get_neo4j_driver", AsyncMock(return_value=mock_driver)):
+        await job_workers.run_job(job.job_id)
+
+    stored = await _job(db_session, job.job_id)
+    assert stored.status == JobStatus.succeeded
+    assert stored.result_json is not None
+    assert stored.result_json["case_id"] == str(job_case.case_id)
+    assert "relationships_created" in stored.result_json
+
+
+@pytest.mark.asyncio
+async def test_workers_process_submitted_jobs(
+    db_session: AsyncSession, job_case: Case, job_workers: JobWorkerPool
+) -> None:
+    """Started workers recover queued jobs and process new submissions."""
+    recovered = await JobService(db_session).enqueue(job_case.case_id, JobType.graph_sync)
+    job_workers.queue = InMemoryJobQueue()  # Simulate a restart losing the queue
+    seen: list[uuid.UUID] = []
+    done = asyncio.Event()
+    submitted_ids: list[uuid.UUID] = []
+
+    async def handler(job: Job) -> dict[str, str]:
+        seen.append(job.job_id)
+        if job.job_id in submitted_ids:
+            done.set()
+        return {}
+
+    # Other queued jobs left in the test database are recovered too
+    job_workers._handlers = dict.fromkeys(JobType, handler)
+    await job_workers.start()
+    try:
+        submitted = await JobService(db_session).enqueue(job_case.case_id, JobType.graph_sync)
+        submitted_ids.append(submitted.job_id)
+        await asyncio.wait_for(done.wait(), timeout=5)
+    finally:
+        await job_workers.stop()
+
+    assert seen.index(recovered.job_id) < seen.index(submitted.job_id)
+    assert not job_workers.running
+    assert (await _job(db_session, submitted.job_id)).status == JobStatus.succeeded
+
+
+@pytest.mark.asyncio
+async def test_recover_only_requeues_jobs_with_expired_leases(
+    db_session: AsyncSession, job_case: Case, job_workers: JobWorkerPool
+) -> None:
+    """Jobs still heartbeating in another process are not taken over."""
+    service = JobService(db_session)
+    live = await service.enqueue(job_case.case_id, JobType.graph_sync)
+    abandoned = await service.enqueue(job_case.case_id, JobType.graph_sync)
+    now = datetime.now(UTC)
+    for job_id, heartbeat_at in (
+        (live.job_id, now),
+        (abandoned.job_id, now - timedelta(seconds=settings.job_lease_seconds + 1)),
+    ):
+        await db_session.execute(
+            update(Job)
+            .where(Job.job_id == job_id)
+            .values(status=JobStatus.running, worker_id="other:1", heartbeat_at=heartbeat_at)
+        )
+    await db_session.commit()
+    job_workers.queue = InMemoryJobQueue()
+
+    await job_workers.recover()
+
+    assert (await _job(db_session, live.job_id)).status == JobStatus.running
+    recovered = await _job(db_session, abandoned.job_id)
+    assert recovered.status == JobStatus.queued
+    assert recovered.worker_id is None
+    queued = [job_workers.queue._queue.get_nowait() for _ in range(len(job_workers.queue))]
+    assert abandoned.job_id in queued
+    assert live.job_id not in queued
+
+
+class _SharedQueue:
+    """Stand-in for a queue shared between processes, such as Redis."""
+
+    name = "shared"
+
+    def __init__(self) -> None:
+        self.items: list[uuid.UUID] = []
+
+    async def put(self, job_id: uuid.UUID) -> None:
+        self.items.append(job_id)
+
+    async def get(self) -> uuid.UUID:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_recover_requeues_long_queued_jobs_from_shared_queue(
+    db_session: AsyncSession, job_case: Case, job_workers: JobWorkerPool
+) -> None:
+    """A job popped by a worker that died before claiming it is delivered again."""
+    service = JobService(db_session)
+    fresh = await service.enqueue(job_case.case_id, JobType.graph_sync)
+    lost = await service.enqueue(job_case.case_id, JobType.graph_sync)
+    await db_session.execute(
+        update(Job)
+        .where(Job.job_id == lost.job_id)
+        .values(created_at=datetime.now(UTC) - timedelta(seconds=settings.job_lease_seconds + 1))
+    )
+    await db_session.commit()
+    queue = _SharedQueue()
+    job_workers.queue = queue
+
+    await job_workers.recover()
+
+    assert lost.job_id in queue.items
+    assert fresh.job_id not in queue.items
+
+
+@pytest.mark.asyncio
+async def test_running_job_refreshes_its_heartbeat(
+    db_session: AsyncSession,
+    job_case: Case,
+    job_workers: JobWorkerPool,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A claimed job records its worker and keeps its heartbeat fresh while it runs."""
+    monkeypatch.setattr(settings, "job_heartbeat_seconds", 0.01)
+    job = await JobService(db_session).enqueue(job_case.case_id, JobType.graph_sync)
+
+    async def handler(running: Job) -> dict[str, str]:
+        await asyncio.sleep(0.1)
+        return {}
+
+    job_workers._handlers[JobType.graph_sync] = handler
+    await job_workers.run_job(job.job_id)
+
+    stored = await _job(db_session, job.job_id)
+    assert stored.worker_id == job_workers.worker_id
+    assert stored.started_at is not None
+    assert stored.heartbeat_at is not None
+    assert stored.heartbeat_at > stored.started_at
+
+
+@pytest.mark.asyncio
+async def test_job_progress_counts_done_stages(
+    db_session: AsyncSession, job_case: Case, job_workers: JobWorkerPool
+) -> None:
+    """Only skipped and written documents count as done."""
+    job = await JobService(db_session).enqueue(job_case.case_id, JobType.ingest)
+    doc_ids = [uuid.uuid4() for _ in range(3)]
+    progress = JobProgress(job.job_id, job_workers.session_maker, doc_ids)
+
+    await progress(doc_ids[:1], "skipped")
+    await progress(doc_ids[1:2], "embedded")
+
+    stored = await _job(db_session, job.job_id)
+    assert stored.documents_total == 3
+    assert stored.documents_done == 1
+    assert stored.progress_json[str(doc_ids[2])] == "queued"
+
+
+def test_build_job_queue() -> None:
+    """Known backends build queues; unknown names are rejected."""
+    assert isinstance(build_job_queue("memory"), InMemoryJobQueue)
+    with pytest.raises(ValueError, match="Unknown job queue backend"):
+        build_job_queue("kafka")
@@ -0,0 +1,113 @@
+"""Tests for the Aho-Corasick mention extractor."""
+
+import uuid
+
+from src.models import Document, Entity, EntityType
+from src.services.mention_extractor import MentionExtractor, MentionSpan, select_longest
+
+ALICE = uuid.uuid4()
+ALICE_SMITH = uuid.uuid4()
+BOB = uuid.uuid4()
+
+
+def test_find_all_matches_overlapping_patterns_case_insensitively() -> None:
+    """Every occurrence is reported with offsets into the original text."""
+    extractor = MentionExtractor([("Alice", ALICE), ("alice smith", ALICE_SMITH), ("Bob", BOB)])
+    text = "ALICE SMITH emailed bob; Alice replied."
+
+    spans = extractor.find_all(text)
+
+    assert {(s.entity_id, s.span_start, s.span_end) for s in spans} == {
+        (ALICE, 0, 5),
+        (ALICE_SMITH, 0, 11),
+        (BOB, 20, 23),
+        (ALICE, 25, 30),
+    }
+    assert all(text[s.span_start : s.span_end] == s.mention_text for s in spans)
+
+
+def test_find_all_follows_failure_links() -> None:
+    """Matches that start inside a failed partial match are still found."""
+    she, he, hers = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    extractor = MentionExtractor([("she", she), ("he", he), ("hers", hers)])
+
+    spans = extractor.find_all("ushers")
+
+    assert {(s.mention_text, s.entity_id) for s in spans} == {
+        ("she", she),
+        ("he", he),
+        ("hers", hers),
+    }
+
+
+def test_offsets_survive_case_folding_that_changes_length() -> None:
+    """Characters that fold to several characters keep spans aligned."""
+    extractor = MentionExtractor([("strasse", ALICE), ("bob", BOB)])
+    text = "Straße 1, Bob"
+
+    spans = {s.entity_id: s for s in extractor.find_all(text)}
+
+    assert spans[ALICE].mention_text == "Straße"
+    assert spans[BOB].mention_text == "Bob"
+
+
+def test_blank_patterns_are_ignored() -> None:
+    """An empty name does not match every text."""
+    extractor = MentionExtractor([("  ", ALICE)])
+    assert not extractor
+    assert extractor.find_all("anything") == []
+    assert extractor.first_match("anything") is None
+
+
+def test_first_match_prefers_leftmost_then_longest() -> None:
+    """Reference resolution picks the earliest, most specific match."""
+    extractor = MentionExtractor([("Alice", ALICE), ("Alice Smith", ALICE_SMITH), ("Bob", BOB)])
+    assert extractor.first_match("cc: Alice Smith, Bob") == ALICE_SMITH
+    assert extractor.first_match("Bob and Alice") == BOB
+    assert extractor.find_entities("Bob", "nobody") == {BOB}
+
+
+def test_select_longest_drops_nested_mentions() -> None:
+    """Mention rows keep the longest match and shared spans for every entity."""
+    twin = uuid.uuid4()
+    spans = [
+        MentionSpan(ALICE, 0, 5, "Alice"),
+        MentionSpan(ALICE_SMITH, 0, 11, "Alice Smith"),
+        MentionSpan(BOB, 20, 23, "Bob"),
+        MentionSpan(twin, 20, 23, "Bob"),
+    ]
+
+    chosen = select_longest(spans)
+
+    assert [(s.entity_id, s.span_start) for s in chosen[:1]] == [(ALICE_SMITH, 0)]
+    assert {s.entity_id for s in chosen[1:]} == {BOB, twin}
+
+
+def test_mention_rows_from_entities() -> None:
+    """Entity names and emails yield mention rows over the document body."""
+    case_id = uuid.uuid4()
+    entities = [
+        Entity(
+            entity_id=ALICE,
+            case_id=case_id,
+            entity_type=EntityType.person,
+            name="Alice Smith",
+            attrs_json={"email": "alice@example.com"},
+        ),
+        Entity(entity_id=BOB, case_id=case_id, entity_type=EntityType.person, name="Bob"),
+    ]
+    doc = Document(
+        doc_id=uuid.uuid4(),
+        case_id=case_id,
+        subject="Bob",
+        body="Write to alice@example.com about Alice Smith.",
+    )
+
+    rows = MentionExtractor.from_entities(entities).mention_rows(doc)
+
+    assert [(row["entity_id"], row["mention_text"]) for row in rows] == [
+        (ALICE, "alice@example.com"),
+        (ALICE, "Alice Smith"),
+    ]
+    assert all(row["case_id"] == case_id and row["doc_id"] == doc.doc_id for row in rows)
+    assert all(doc.body[row["span_start"] : row["span_end"]] == row["mention_text"] for row in rows)
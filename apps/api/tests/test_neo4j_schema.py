@@ -0,0 +1,36 @@
+"""Tests for the Neo4j schema bootstrap."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from neo4j.exceptions import ServiceUnavailable
+
+from src.db.neo4j_schema import GRAPH_SCHEMA_STATEMENTS, ensure_graph_schema
+
+
+def _driver(session: AsyncMock) -> MagicMock:
+    driver = MagicMock()
+    driver.session.return_value.__aenter__.return_value = session
+    return driver
+
+
+async def test_ensure_graph_schema_runs_every_statement() -> None:
+    """Constraints and indexes are created idempotently, in order."""
+    session = AsyncMock()
+    assert await ensure_graph_schema(_driver(session)) is True
+
+    queries = [call.args[0] for call in session.run.call_args_list]
+    assert queries == list(GRAPH_SCHEMA_STATEMENTS)
+    assert all("IF NOT EXISTS" in query for query in queries[1:])
+    assert "SET n:Entity" in queries[0]
+    assert "MATCH (n:`Person`|`Org`|" in queries[0]
+    assert any("(e:Entity) REQUIRE e.entity_id IS UNIQUE" in query for query in queries)
+    assert any("(d:Document) REQUIRE d.doc_id IS UNIQUE" in query for query in queries)
+    assert any("(e:Entity) ON (e.case_id)" in query for query in queries)
+    assert any("(d:Document) ON (d.case_id)" in query for query in queries)
+
+
+async def test_ensure_graph_schema_tolerates_unavailable_neo4j() -> None:
+    """A Neo4j outage does not prevent the API from starting."""
+    session = AsyncMock()
+    session.run.side_effect = ServiceUnavailable("down")
+    assert await ensure_graph_schema(_driver(session)) is False
@@ -0,0 +1,192 @@
+"""Tests for the outbound provider call governor."""
+
+import asyncio
+
+import httpx
+import pytest
+from openai import APIConnectionError, APIStatusError, APITimeoutError, RateLimitError
+
+from src.config import settings
+from src.services.provider_governor import (
+    EMBEDDINGS,
+    BreakerState,
+    CircuitBreaker,
+    ProviderGovernor,
+    ProviderUnavailableError,
+    TokenBucket,
+    get_provider_governor,
+    is_availability_error,
+    reset_provider_governors,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_circuit_breaker_opens_and_probes() -> None:
+    """The breaker opens at the threshold and lets one probe through after the reset."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30, clock=clock)
+    breaker.record_failure()
+    assert breaker.state is BreakerState.closed
+    breaker.record_failure()
+    assert breaker.state is BreakerState.open
+    assert not breaker.allow()
+
+    clock.now = 30.0
+    assert breaker.state is BreakerState.half_open
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state is BreakerState.open
+
+    clock.now = 60.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state is BreakerState.closed
+    assert (breaker.consecutive_failures, breaker.times_opened) == (0, 1)
+
+
+def test_circuit_breaker_disabled_with_zero_threshold() -> None:
+    """A zero threshold never opens the breaker."""
+    breaker = CircuitBreaker(failure_threshold=0, reset_seconds=30)
+    for _ in range(10):
+        breaker.record_failure()
+    assert breaker.allow()
+
+
+def test_token_bucket_spaces_calls_after_burst() -> None:
+    """Calls beyond the burst wait for tokens at the sustained rate."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate_per_second=2.0, burst=2.0, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    clock.now = 10.0
+    assert bucket.reserve() == 0.0
+
+
+@pytest.mark.asyncio
+async def test_governor_bounds_concurrent_calls() -> None:
+    """No more than max_concurrency calls run at once."""
+    governor = ProviderGovernor(
+        "openai",
+        max_concurrency=2,
+        requests_per_minute=0,
+        breaker=CircuitBreaker(failure_threshold=5, reset_seconds=30),
+    )
+    peak = 0
+
+    async def call() -> None:
+        nonlocal peak
+        async with governor.slot():
+            peak = max(peak, governor.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(call() for _ in range(6)))
+
+    assert peak == 2
+    assert governor.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_governor_fails_fast_while_open() -> None:
+    """Failures open the breaker, after which calls are refused without running."""
+    governor = ProviderGovernor(
+        "openai",
+        max_concurrency=0,
+        requests_per_minute=0,
+        breaker=CircuitBreaker(failure_threshold=2, reset_seconds=30),
+    )
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            async with governor.slot():
+                raise TimeoutError
+
+    assert not governor.available
+    with pytest.raises(ProviderUnavailableError, match="openai"):
+        async with governor.slot():
+            pytest.fail("call ran while the breaker was open")
+    assert governor.status().state is BreakerState.open
+
+
+def _status_error(status_code: int) -> APIStatusError:
+    request = httpx.Request("POST", "https://api.example.com/v1/chat/completions")
+    response = httpx.Response(status_code, request=request)
+    return APIStatusError(f"HTTP {status_code}", response=response, body=None)
+
+
+def test_is_availability_error() -> None:
+    """Timeouts, connection errors, 429 and 5xx count; client errors and bugs do not."""
+    request = httpx.Request("POST", "https://api.example.com/v1/chat/completions")
+    assert is_availability_error(TimeoutError())
+    assert is_availability_error(APIConnectionError(request=request))
+    assert is_availability_error(APITimeoutError(request=request))
+    assert is_availability_error(
+        RateLimitError("slow down", response=httpx.Response(429, request=request), body=None)
+    )
+    assert is_availability_error(_status_error(503))
+    assert not is_availability_error(_status_error(400))
+    assert not is_availability_error(ValueError("bad tool arguments"))
+
+
+@pytest.mark.asyncio
+async def test_governor_ignores_client_errors() -> None:
+    """Invalid requests propagate without opening the breaker or holding the probe."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=5, clock=clock)
+    governor = ProviderGovernor("openai", 0, 0, breaker)
+    for error in (_status_error(400), KeyError("bug")):
+        with pytest.raises(type(error)):
+            async with governor.slot():
+                raise error
+    assert governor.status().state is BreakerState.closed
+
+    breaker.record_failure()
+    clock.now = 5.0
+    with pytest.raises(APIStatusError):
+        async with governor.slot():
+            raise _status_error(400)
+    assert breaker.state is BreakerState.half_open
+    assert breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_governor_releases_probe_on_cancellation() -> None:
+    """A cancelled probe does not leave the breaker stuck half open."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=5, clock=clock)
+    breaker.record_failure()
+    clock.now = 5.0
+    governor = ProviderGovernor("openai", 0, 0, breaker)
+
+    async def probe() -> None:
+        async with governor.slot():
+            await asyncio.sleep(10)
+
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(probe(), 0.01)
+
+    assert breaker.allow()
+    assert breaker.consecutive_failures == 1
+
+
+def test_get_provider_governor_uses_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Governors are shared per name, with separate limits for embeddings."""
+    reset_provider_governors()
+    monkeypatch.setattr(settings, "llm_max_concurrency", 3)
+    monkeypatch.setattr(settings, "embedding_provider_max_concurrency", 7)
+
+    governor = get_provider_governor("openai")
+
+    assert get_provider_governor("openai") is governor
+    assert governor.max_concurrency == 3
+    assert get_provider_governor(EMBEDDINGS).max_concurrency == 7
+    reset_provider_governors()
+    assert get_provider_governor("openai") is not governor
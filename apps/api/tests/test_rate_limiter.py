@@ -0,0 +1,95 @@
+"""Tests for the API rate limiter backends."""
+
+import pytest
+
+from src.services.rate_limiter import (
+    InMemoryRateLimiter,
+    RateLimitDecision,
+    build_rate_limiter,
+    get_rate_limiter,
+    reset_rate_limiter,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_memory_limiter_allows_burst_then_denies() -> None:
+    """A full window's worth of requests is allowed at once, then the next is denied."""
+    limiter = InMemoryRateLimiter(clock=FakeClock())
+    decisions = [await limiter.hit("client", limit=3, window_seconds=60) for _ in range(4)]
+
+    assert [decision.remaining for decision in decisions[:3]] == [2, 1, 0]
+    assert all(decision.allowed for decision in decisions[:3])
+    assert decisions[3] == RateLimitDecision(allowed=False, remaining=0, retry_after_seconds=20)
+
+
+@pytest.mark.asyncio
+async def test_memory_limiter_recovers_gradually() -> None:
+    """Capacity comes back one request per window / limit, and keys are independent."""
+    clock = FakeClock()
+    limiter = InMemoryRateLimiter(clock=clock)
+    for _ in range(3):
+        await limiter.hit("client", limit=3, window_seconds=60)
+    assert (await limiter.hit("other", limit=3, window_seconds=60)).allowed
+
+    clock.now = 19.0
+    denied = await limiter.hit("client", limit=3, window_seconds=60)
+    assert not denied.allowed
+    assert denied.retry_after_seconds == 1
+
+    clock.now = 20.0
+    assert (await limiter.hit("client", limit=3, window_seconds=60)).allowed
+    assert not (await limiter.hit("client", limit=3, window_seconds=60)).allowed
+
+    clock.now = 200.0
+    assert (await limiter.hit("client", limit=3, window_seconds=60)).remaining == 2
+
+
+@pytest.mark.asyncio
+async def test_memory_limiter_evicts_idle_keys() -> None:
+    """Keys whose limit has fully recovered are dropped, and the key count is capped."""
+    clock = FakeClock()
+    limiter = InMemoryRateLimiter(max_keys=3, clock=clock)
+    for index in range(5):
+        await limiter.hit(f"client-{index}", limit=10, window_seconds=60)
+    assert len(limiter) == 3
+
+    clock.now = 7.0
+    await limiter.hit("fresh", limit=10, window_seconds=60)
+    assert len(limiter) == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_limiter_disabled_limits() -> None:
+    """Non-positive limits or windows never deny or store anything."""
+    limiter = InMemoryRateLimiter(clock=FakeClock())
+    for _ in range(5):
+        assert (await limiter.hit("client", limit=0, window_seconds=60)).allowed
+        assert (await limiter.hit("client", limit=1, window_seconds=0)).allowed
+    assert len(limiter) == 0
+
+
+def test_build_rate_limiter() -> None:
+    """Known backends build limiters; unknown names are rejected."""
+    assert isinstance(build_rate_limiter("memory"), InMemoryRateLimiter)
+    with pytest.raises(ValueError, match="Unknown rate limit backend"):
+        build_rate_limiter("memcached")
+
+
+def test_get_rate_limiter_is_shared_until_reset() -> None:
+    """The process-wide limiter is built once and rebuilt after a reset."""
+    reset_rate_limiter()
+    limiter = get_rate_limiter()
+    assert get_rate_limiter() is limiter
+    reset_rate_limiter()
+    assert get_rate_limiter() is not limiter
+    reset_rate_limiter()
@@ -0,0 +1,112 @@
+"""Tests for the semantic chat response cache."""
+
+import uuid
+
+import pytest
+
+from src.config import settings
+from src.schemas.chat import ChatResponse
+from src.services.response_cache import (
+    ResponseCache,
+    get_response_cache,
+    invalidate_case_responses,
+    reset_response_cache,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _response(message: str) -> ChatResponse:
+    return ChatResponse(message=message, citations=[], conversation_id=uuid.uuid4())
+
+
+def test_response_cache_matches_similar_questions() -> None:
+    """The closest question above the threshold wins; others miss."""
+    cache = ResponseCache(max_entries=10, ttl_seconds=60, similarity_threshold=0.9)
+    scope = (uuid.uuid4(), "en", "openai/gpt-4o", "v1")
+    cache.set(scope, "Who is Mallory?", [1.0, 0.0, 0.0], _response("Mallory is the CFO"))
+    cache.set(scope, "What happened?", [0.0, 1.0, 0.0], _response("Funds moved"))
+
+    hit = cache.get(scope, [2.0, 0.3, 0.0])
+    assert hit is not None
+    assert hit.message == "Mallory is the CFO"
+    assert cache.get(scope, [0.7, 0.7, 0.0]) is None
+    assert cache.get((scope[0], "es", scope[2], scope[3]), [1.0, 0.0, 0.0]) is None
+    # A re-ingest of the case (new ingest version) stops old answers matching
+    assert cache.get((*scope[:3], "v2"), [1.0, 0.0, 0.0]) is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 3)
+
+
+def test_response_cache_same_question_replaces_entry() -> None:
+    """Questions equal after normalization share one entry."""
+    cache = ResponseCache(max_entries=10, ttl_seconds=60, similarity_threshold=0.9)
+    scope = (uuid.uuid4(), "en", "openai/gpt-4o", "v1")
+    cache.set(scope, "Who is  Mallory?", [1.0, 0.0], _response("first"))
+    cache.set(scope, "who is mallory?", [1.0, 0.0], _response("second"))
+
+    assert len(cache) == 1
+    hit = cache.get(scope, [1.0, 0.0])
+    assert hit is not None
+    assert hit.message == "second"
+
+
+def test_response_cache_expires_and_evicts() -> None:
+    """Entries expire after the TTL and the least recently used is evicted."""
+    clock = FakeClock()
+    cache = ResponseCache(max_entries=2, ttl_seconds=10, similarity_threshold=0.9, clock=clock)
+    scope = (uuid.uuid4(), "en", "openai/gpt-4o", "v1")
+    cache.set(scope, "a", [1.0, 0.0, 0.0], _response("A"))
+    cache.set(scope, "b", [0.0, 1.0, 0.0], _response("B"))
+    cache.get(scope, [1.0, 0.0, 0.0])
+    cache.set(scope, "c", [0.0, 0.0, 1.0], _response("C"))
+
+    assert cache.get(scope, [0.0, 1.0, 0.0]) is None
+    assert cache.stats.evictions == 1
+
+    clock.now = 10.0
+    assert cache.get(scope, [1.0, 0.0, 0.0]) is None
+    assert cache.stats.expirations == 2
+    assert len(cache) == 0
+
+
+def test_response_cache_invalidates_case() -> None:
+    """Invalidating a case drops its answers in every language and model."""
+    reset_response_cache()
+    cache = get_response_cache()
+    assert cache is not None
+    case_id, other_case_id = uuid.uuid4(), uuid.uuid4()
+    cache.set((case_id, "en", "openai/gpt-4o", "v1"), "q", [1.0], _response("en"))
+    cache.set((case_id, "es", "deepseek/deepseek-chat", "v1"), "q", [1.0], _response("es"))
+    cache.set((other_case_id, "en", "openai/gpt-4o", "v1"), "q", [1.0], _response("other"))
+
+    invalidate_case_responses(case_id)
+
+    assert len(cache) == 1
+    assert cache.stats.invalidations == 2
+    assert cache.get((other_case_id, "en", "openai/gpt-4o", "v1"), [1.0]) is not None
+    reset_response_cache()
+
+
+def test_get_response_cache_respects_setting(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Zero max entries disables the shared cache."""
+    reset_response_cache()
+    monkeypatch.setattr(settings, "chat_response_cache_max_entries", 0)
+    assert get_response_cache() is None
+    invalidate_case_responses(uuid.uuid4())
+
+    monkeypatch.setattr(settings, "chat_response_cache_max_entries", 100)
+    shared = get_response_cache()
+    assert shared is not None
+    assert get_response_cache() is shared
+    scope = ResponseCache.scope(uuid.UUID(int=1), "en", "openai", "v1")
+    assert scope[2].startswith("openai/")
+    assert scope[3] == "v1"
+    reset_response_cache()
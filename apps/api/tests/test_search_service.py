@@ -2,13 +2,24 @@
 
 import uuid
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
 from src.models import Case, DocChunk, DocType, Document, ScenarioType
-from src.services.search_service import SearchService
+from src.schemas.search import SearchMode
+from src.services import search_service
+from src.services.embedding_cache import QueryEmbeddingCache
+from src.services.embedding_service import EmbeddingService
+from src.services.provider_governor import EMBEDDINGS, get_provider_governor
+from src.services.search_service import (
+    SearchResult,
+    SearchService,
+    reciprocal_rank_fusion,
+)
 
 
 @pytest.fixture
@@ -383,3 +394,332 @@ async def test_search_language_scopes_are_independent(
     es_chunk_ids = {r.chunk_id for r in es_results}
 
     assert en_chunk_ids.isdisjoint(es_chunk_ids)
+
+
+@pytest.mark.asyncio
+async def test_search_sets_ann_parameters(
+    db_session: AsyncSession, search_case: Case, search_chunks: list[DocChunk]
+) -> None:
+    """Vector search sets ef_search (at least k) for its transaction."""
+    mock_embedding = AsyncMock()
+    mock_embedding.embed_query = AsyncMock(return_value=[0.1] * 1536)
+    service = SearchService(db=db_session, embedding=mock_embedding)
+
+    await service.search(search_case.case_id, "project", k=5, ef_search=80)
+    result = await db_session.execute(text("SELECT current_setting('hnsw.ef_search')"))
+    assert result.scalar() == "80"
+
+    await service.search(search_case.case_id, "project", k=15, ef_search=4)
+    result = await db_session.execute(text("SELECT current_setting('hnsw.ef_search')"))
+    assert result.scalar() == "15"
+
+
+@pytest.mark.asyncio
+async def test_iterative_scan_only_set_when_pgvector_supports_it(
+    db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """hnsw.iterative_scan is applied on pgvector >= 0.8 and skipped on older versions."""
+    monkeypatch.setattr(search_service, "_iterative_scan_supported", None)
+    version = (
+        await db_session.execute(
+            text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+        )
+    ).scalar()
+    expected = tuple(int(part) for part in str(version).split(".")[:2]) >= (0, 8)
+    assert await SearchService(db=db_session)._iterative_scan_available() is expected
+
+    monkeypatch.setattr(settings, "hnsw_iterative_scan", "relaxed_order")
+    for supported, config_count in ((True, 2), (False, 1)):
+        monkeypatch.setattr(search_service, "_iterative_scan_supported", supported)
+        db = MagicMock()
+        db.execute = AsyncMock()
+        await SearchService(db=db, embedding=AsyncMock())._apply_ann_settings(5)
+        statement = str(db.execute.call_args.args[0])
+        assert statement.count("set_config(") == config_count
+
+
+@pytest.fixture
+async def ranked_chunks(
+    db_session: AsyncSession, search_case: Case, search_documents: list[Document]
+) -> list[DocChunk]:
+    """Chunks whose embeddings are increasingly far from the query [1, 0, ...]."""
+    chunks = []
+    for i in range(5):
+        embedding = [0.0] * 1536
+        embedding[0] = 1.0
+        embedding[1] = float(i)
+        chunk = DocChunk(
+            chunk_id=uuid.uuid4(),
+            doc_id=search_documents[0].doc_id,
+            case_id=search_case.case_id,
+            chunk_index=10 + i,
+            text=f"Ranked chunk {i}",
+            embedding=embedding,
+        )
+        chunks.append(chunk)
+        db_session.add(chunk)
+    await db_session.commit()
+    return chunks
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("exact_max_chunks", [20000, 0])
+async def test_search_exact_and_ann_paths_rank_by_distance(
+    db_session: AsyncSession,
+    search_case: Case,
+    ranked_chunks: list[DocChunk],
+    monkeypatch: pytest.MonkeyPatch,
+    exact_max_chunks: int,
+) -> None:
+    """Both the exact (small case) and the ANN path return the nearest chunks in order."""
+    monkeypatch.setattr(settings, "vector_exact_search_max_chunks", exact_max_chunks)
+    query = [0.0] * 1536
+    query[0] = 1.0
+    mock_embedding = AsyncMock()
+    mock_embedding.embed_query = AsyncMock(return_value=query)
+    service = SearchService(db=db_session, embedding=mock_embedding)
+    monkeypatch.setattr(service, "_keyword_search", AsyncMock(side_effect=AssertionError))
+
+    results = await service.search(search_case.case_id, "ranked", k=3)
+
+    assert [r.chunk_id for r in results] == [c.chunk_id for c in ranked_chunks[:3]]
+    assert results[0].score == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_use_exact_search_follows_case_size(
+    db_session: AsyncSession,
+    search_case: Case,
+    search_chunks: list[DocChunk],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Cases at or below the chunk threshold are searched exactly."""
+    service = SearchService(db=db_session, embedding=AsyncMock())
+
+    monkeypatch.setattr(settings, "vector_exact_search_max_chunks", len(search_chunks))
+    assert await service._use_exact_search(search_case.case_id, "en") is True
+
+    monkeypatch.setattr(settings, "vector_exact_search_max_chunks", len(search_chunks) - 1)
+    assert await service._use_exact_search(search_case.case_id, "en") is False
+
+    monkeypatch.setattr(settings, "vector_exact_search_max_chunks", 0)
+    assert await service._use_exact_search(search_case.case_id, "en") is False
+
+
+@pytest.mark.asyncio
+async def test_chunk_vector_indexes_are_scoped_by_language(db_session: AsyncSession) -> None:
+    """Migrations leave per-language partial HNSW indexes and one case index."""
+    result = await db_session.execute(
+        text("SELECT indexname, indexdef FROM pg_indexes WHERE tablename = 'doc_chunks'")
+    )
+    indexes: dict[str, str] = dict(result.tuples().all())
+
+    assert "idx_chunks_case_lang" in indexes
+    assert "idx_chunks_case_language" not in indexes
+    assert "idx_chunks_embedding_hnsw" not in indexes
+    for language in ("en", "es"):
+        definition = indexes[f"idx_chunks_embedding_hnsw_{language}"]
+        assert "hnsw" in definition
+        assert f"'{language}'" in definition
+
+
+def _unit_vector(*values: float) -> list[float]:
+    embedding = [0.0] * 1536
+    embedding[: len(values)] = values
+    return embedding
+
+
+def _result(chunk_id: uuid.UUID, score: float = 0.5) -> SearchResult:
+    return SearchResult(
+        chunk_id=chunk_id,
+        doc_id=uuid.uuid4(),
+        text="",
+        score=score,
+        chunk_index=0,
+        meta_json={},
+        doc_type=DocType.email,
+        subject=None,
+        ts=datetime.now(UTC),
+    )
+
+
+def test_reciprocal_rank_fusion_rewards_agreement() -> None:
+    """Chunks ranked well by both lists beat chunks ranked first by only one."""
+    a, b, c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    fused = reciprocal_rank_fusion([[_result(a), _result(b)], [_result(c), _result(b)]], rrf_k=60)
+
+    assert fused[0].chunk_id == b
+    assert {r.chunk_id for r in fused} == {a, b, c}
+    assert fused[0].score == pytest.approx((2 / 62) / (2 / 61))
+    assert reciprocal_rank_fusion([[_result(a)]])[0].score == pytest.approx(1.0)
+    assert reciprocal_rank_fusion([]) == []
+
+
+@pytest.fixture
+async def hybrid_chunks(
+    db_session: AsyncSession, search_case: Case, search_documents: list[Document]
+) -> dict[str, DocChunk]:
+    """Chunks that vector and keyword retrieval rank differently."""
+    specs = {
+        # Closest to the query vector, but no keyword match
+        "semantic": ("Payments were routed through an offshore shell company.", (1.0, 0.0)),
+        # Keyword match, far from the query vector
+        "keyword": ("The vendor invoices were approved twice.", (0.0, 1.0)),
+        # Strongest keyword match and close to the query vector
+        "both": ("Vendor invoices, duplicate vendor invoices, went offshore.", (1.0, 0.3)),
+        "spanish": ("Las facturas del proveedor se aprobaron dos veces.", (0.0, 1.0)),
+    }
+    chunks = {}
+    for i, (name, (text_value, vector)) in enumerate(specs.items()):
+        chunk = DocChunk(
+            chunk_id=uuid.uuid4(),
+            doc_id=search_documents[0].doc_id,
+            case_id=search_case.case_id,
+            chunk_index=20 + i,
+            text=text_value,
+            embedding=_unit_vector(*vector),
+            language="es" if name == "spanish" else "en",
+        )
+        chunks[name] = chunk
+        db_session.add(chunk)
+    await db_session.commit()
+    return chunks
+
+
+@pytest.mark.asyncio
+async def test_keyword_mode_uses_full_text_ranking(
+    db_session: AsyncSession, search_case: Case, hybrid_chunks: dict[str, DocChunk]
+) -> None:
+    """Keyword mode matches stemmed terms per language and never embeds the query."""
+    mock_embedding = AsyncMock()
+    service = SearchService(db=db_session, embedding=mock_embedding)
+
+    results = await service.search(
+        search_case.case_id, "vendor invoice", k=5, mode=SearchMode.keyword
+    )
+    spanish = await service.search(
+        search_case.case_id, "factura", k=5, language="es", mode=SearchMode.keyword
+    )
+
+    assert {r.chunk_id for r in results} == {
+        hybrid_chunks["keyword"].chunk_id,
+        hybrid_chunks["both"].chunk_id,
+    }
+    assert all(0 < r.score < 1 for r in results)
+    assert [r.chunk_id for r in spanish] == [hybrid_chunks["spanish"].chunk_id]
+    mock_embedding.embed_query.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_hybrid_mode_fuses_vector_and_keyword_rankings(
+    db_session: AsyncSession, search_case: Case, hybrid_chunks: dict[str, DocChunk]
+) -> None:
+    """Hybrid search ranks chunks found by both retrievers first."""
+    mock_embedding = AsyncMock()
+    mock_embedding.embed_query = AsyncMock(return_value=_unit_vector(1.0, 0.0))
+    service = SearchService(db=db_session, embedding=mock_embedding)
+
+    results = await service.search(
+        search_case.case_id, "vendor invoices", k=3, mode=SearchMode.hybrid
+    )
+
+    assert results[0].chunk_id == hybrid_chunks["both"].chunk_id
+    assert {r.chunk_id for r in results} >= {
+        hybrid_chunks["semantic"].chunk_id,
+        hybrid_chunks["keyword"].chunk_id,
+    }
+    assert results[0].score > results[1].score
+
+
+@pytest.mark.asyncio
+async def test_hybrid_mode_uses_keyword_ranking_when_embedding_fails(
+    db_session: AsyncSession, search_case: Case, hybrid_chunks: dict[str, DocChunk]
+) -> None:
+    """Hybrid search degrades to full-text results if the query cannot be embedded."""
+    mock_embedding = AsyncMock()
+    mock_embedding.embed_query = AsyncMock(side_effect=RuntimeError("provider down"))
+    service = SearchService(db=db_session, embedding=mock_embedding)
+
+    results = await service.search(
+        search_case.case_id, "vendor invoices", k=3, mode=SearchMode.hybrid
+    )
+
+    assert {r.chunk_id for r in results} == {
+        hybrid_chunks["keyword"].chunk_id,
+        hybrid_chunks["both"].chunk_id,
+    }
+
+
+async def _pg_trgm_installed(db_session: AsyncSession) -> bool:
+    result = await db_session.execute(
+        text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+    )
+    return bool(result.scalar())
+
+
+@pytest.mark.asyncio
+async def test_keyword_fallback_when_embedding_fails(
+    db_session: AsyncSession,
+    search_case: Case,
+    hybrid_chunks: dict[str, DocChunk],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Vector search falls back to term matching (trigram or ILIKE) on provider errors."""
+    monkeypatch.setattr(search_service, "_pg_trgm_installed", None)
+    mock_embedding = AsyncMock()
+    mock_embedding.embed_query = AsyncMock(side_effect=RuntimeError("provider down"))
+    service = SearchService(db=db_session, embedding=mock_embedding)
+
+    results = await service.search(search_case.case_id, "vendor invoices", k=5)
+
+    assert await service._trigram_available() is await _pg_trgm_installed(db_session)
+    assert results[0].chunk_id in {
+        hybrid_chunks["keyword"].chunk_id,
+        hybrid_chunks["both"].chunk_id,
+    }
+    assert hybrid_chunks["semantic"].chunk_id not in {r.chunk_id for r in results}
+    assert all(0 < r.score <= 1 for r in results)
+
+
+@pytest.mark.asyncio
+async def test_open_embedding_breaker_goes_straight_to_keyword_search(
+    db_session: AsyncSession,
+    search_case: Case,
+    hybrid_chunks: dict[str, DocChunk],
+) -> None:
+    """While the embedding provider's breaker is open, no embedding call is made."""
+    breaker = get_provider_governor(EMBEDDINGS).breaker
+    for _ in range(max(settings.provider_breaker_failure_threshold, 1)):
+        breaker.record_failure()
+    embedding = EmbeddingService(query_cache=QueryEmbeddingCache(max_bytes=0, ttl_seconds=0))
+    embedding.embedder = MagicMock(aembed_query=AsyncMock(side_effect=AssertionError))
+    service = SearchService(db=db_session, embedding=embedding)
+
+    results = await service.search(search_case.case_id, "vendor invoices", k=5)
+
+    assert results[0].chunk_id in {
+        hybrid_chunks["keyword"].chunk_id,
+        hybrid_chunks["both"].chunk_id,
+    }
+
+
+@pytest.mark.asyncio
+async def test_keyword_fallback_uses_trigram_operators(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """With pg_trgm, terms are matched with the index-backed word similarity operator."""
+    monkeypatch.setattr(search_service, "_pg_trgm_installed", True)
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+    service = SearchService(db=db, embedding=AsyncMock())
+
+    await service._keyword_search(
+        uuid.uuid4(), "vendor invoices", k=5, doc_types=None, min_score=0.0, language="en"
+    )
+
+    statements = [str(call.args[0]) for call in db.execute.call_args_list]
+    assert "set_config" in statements[0]
+    assert "<%" in statements[1]
+    assert "word_similarity" in statements[1]
+    assert "ILIKE" not in statements[1].upper()
@@ -124,9 +124,8 @@ CREATE INDEX IF NOT EXISTS idx_mentions_entity ON mentions(entity_id);
 CREATE INDEX IF NOT EXISTS idx_player_state_user ON player_state(user_id);
 CREATE INDEX IF NOT EXISTS idx_submissions_user_case ON submissions(user_id, case_id);
 
--- Vector index for semantic search (IVFFlat for smaller datasets)
-CREATE INDEX IF NOT EXISTS idx_chunks_embedding ON doc_chunks
-USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100);
+-- Indexes and tables added since (vector and text search indexes, jobs,
+-- conversations, ...) are created by the Alembic migrations in apps/api/alembic.
 
 -- Function to update updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()